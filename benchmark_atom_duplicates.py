@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+🔬 ATOM DUPLICATE DETECTION BENCHMARK
+Blocked, vectorized duplicate detection vs. the all-pairs scan
+
+Run with: python3 benchmark_atom_duplicates.py [--pairwise-limit N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.justice_league.atom_component_analysis import AtomComponentAnalysis
+from core.justice_league.component_similarity import find_similar_pairs
+
+SIZES = [1_000, 5_000, 20_000]
+THRESHOLD = 0.85
+
+TYPES = ['button', 'input', 'card', 'badge', 'avatar', 'chip', 'toggle', 'tab', 'tooltip', 'modal']
+COLORS = ['#FFFFFF', '#000000', '#1A73E8', '#D93025', '#188038', '#F9AB00', '#5F6368', '#E8EAED']
+
+
+def generate_library(count: int, seed: int = 42) -> dict:
+    """Synthetic component library with realistic near-duplicates"""
+    rng = random.Random(seed)
+    components = {}
+    for index in range(count):
+        components[f'component-{index}'] = {
+            'type': rng.choice(TYPES),
+            'foreground_color': rng.choice(COLORS),
+            'background_color': rng.choice(COLORS),
+            'width': rng.choice([24, 32, 40, 48, 64, 96, 120, 160, 240, 320]) + rng.randint(0, 8),
+            'height': rng.choice([16, 24, 32, 40, 48, 56]),
+            'children': [{}] * rng.randint(0, 4)
+        }
+    return components
+
+
+def pairwise_scan(atom: AtomComponentAnalysis, component_list: list, threshold: float) -> list:
+    """The original all-pairs scan"""
+    pairs = []
+    for i, comp1 in enumerate(component_list):
+        for j in range(i + 1, len(component_list)):
+            similarity = atom._calculate_component_similarity(comp1, component_list[j])
+            if similarity >= threshold:
+                pairs.append((i, j, similarity))
+    return pairs
+
+
+def benchmark_size(atom: AtomComponentAnalysis, count: int, pairwise_limit: int) -> dict:
+    print("\n" + "="*80)
+    print(f"BENCHMARK: {count:,} components (threshold {THRESHOLD})")
+    print("="*80)
+
+    component_list = list(generate_library(count).values())
+
+    start = time.time()
+    pairs, stats = find_similar_pairs(component_list, THRESHOLD)
+    blocked_time = time.time() - start
+
+    print(f"\n📊 Blocked engine: {blocked_time:.3f}s")
+    print(f"   Pairs scored: {stats['pairs_scored']:,} of {stats['pairs_total']:,} "
+          f"({stats['pairs_scored'] / max(stats['pairs_total'], 1) * 100:.2f}%)")
+    print(f"   Blocks: {stats['blocks_scanned']:,}")
+    print(f"   Duplicate pairs: {len(pairs):,}")
+
+    result = {'components': count, 'blocked_time': blocked_time, 'pairs': len(pairs)}
+
+    if count <= pairwise_limit:
+        start = time.time()
+        reference = pairwise_scan(atom, component_list, THRESHOLD)
+        pairwise_time = time.time() - start
+        identical = reference == pairs
+        print(f"\n⚙️  All-pairs scan: {pairwise_time:.3f}s")
+        print(f"   Speedup: {pairwise_time / blocked_time:.1f}x")
+        print(f"   {'✅' if identical else '❌'} Results {'identical' if identical else 'DIFFER'}")
+        result.update(pairwise_time=pairwise_time, identical=identical)
+    else:
+        print(f"\n⏭️  All-pairs scan skipped (> {pairwise_limit:,} components)")
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Atom duplicate detection")
+    parser.add_argument('--pairwise-limit', type=int, default=5_000,
+                        help="Largest library to also scan pairwise (default: 5000)")
+    args = parser.parse_args()
+
+    print("\n" + "="*80)
+    print("🔬 ATOM DUPLICATE DETECTION BENCHMARK")
+    print("="*80)
+
+    atom = AtomComponentAnalysis()
+    results = [benchmark_size(atom, count, args.pairwise_limit) for count in SIZES]
+
+    print("\n" + "="*80)
+    print("SUMMARY")
+    print("="*80)
+    for result in results:
+        line = f"   {result['components']:>6,} components: {result['blocked_time']:.3f}s blocked"
+        if 'pairwise_time' in result:
+            line += f", {result['pairwise_time']:.3f}s pairwise"
+        print(line)
+
+    return 0 if all(result.get('identical', True) for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+⚡ TRACE VITALS BENCHMARK
+Streaming trace parser vs. json.load of the whole trace
+
+Run with: python3 benchmark_trace_vitals.py [trace.json[.gz] ...] [--events N]
+
+Recorded DevTools traces (Performance panel "Save profile") are benchmarked
+as given; without arguments synthetic gzip traces are generated.
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from core.justice_league.trace_vitals import compute_trace_vitals
+
+SIZES = [100_000, 500_000]
+METRICS = ['fcp', 'lcp', 'cls', 'tti', 'tbt', 'inp', 'fid']
+
+NOISE = ['ParseHTML', 'FunctionCall', 'Layout', 'Paint', 'UpdateLayoutTree', 'v8.compile', 'ResourceSendRequest']
+
+
+def generate_trace(path: Path, count: int, seed: int = 42):
+    """Synthetic SPA trace: navigation, paints, shifts, tasks and interactions among noise events"""
+    rng = random.Random(seed)
+    nav = 10_000_000
+    main = {'pid': 1, 'tid': 1}
+
+    def event(name, ts, ph='I', dur=None, data=None):
+        built = {'name': name, 'ph': ph, 'ts': ts, 'cat': 'devtools.timeline', **main,
+                 'args': {'frame': 'F1', 'data': data or {}}}
+        if dur is not None:
+            built['dur'] = dur
+        return built
+
+    with gzip.open(path, 'wt') as f:
+        f.write('{"metadata": {"source": "DevTools"}, "traceEvents": [\n')
+        f.write(json.dumps({'name': 'thread_name', 'ph': 'M', 'ts': 0, **main, 'args': {'name': 'CrRendererMain'}}))
+        f.write(',\n' + json.dumps(event('navigationStart', nav, data={
+            'documentLoaderURL': 'https://app.example.com/', 'isLoadingMainFrame': True})))
+        f.write(',\n' + json.dumps(event('firstContentfulPaint', nav + 900_000)))
+        interaction = 0
+        for i in range(count):
+            ts = nav + i * 200
+            roll = rng.random()
+            if roll < 0.002:
+                item = event('RunTask', ts, ph='X', dur=rng.randint(10_000, 180_000))
+            elif roll < 0.003:
+                item = event('LayoutShift', ts, data={'weighted_score_delta': rng.random() / 50,
+                                                      'had_recent_input': False})
+            elif roll < 0.0035:
+                item = event('largestContentfulPaint::Candidate', ts, data={'candidateIndex': i})
+            elif roll < 0.004:
+                interaction += 1
+                item = event('EventTiming', ts, ph='b', data={
+                    'interactionId': interaction, 'type': 'pointerdown', 'duration': rng.randint(16, 400),
+                    'timeStamp': ts / 1000, 'processingStart': ts / 1000 + rng.randint(1, 50)})
+            else:
+                item = event(rng.choice(NOISE), ts, ph='X', dur=rng.randint(1, 2_000),
+                             data={'url': f'https://app.example.com/chunk-{i % 500}.js', 'lineNumber': i % 9_000})
+            f.write(',\n' + json.dumps(item))
+        f.write('\n]}\n')
+
+
+def measure(func):
+    """(result, seconds, peak bytes) of func()"""
+    tracemalloc.start()
+    start = time.time()
+    result = func()
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def load_whole(path: Path):
+    opener = gzip.open if path.read_bytes()[:2] == b'\x1f\x8b' else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return compute_trace_vitals(json.load(f))
+
+
+def benchmark_trace(path: Path) -> dict:
+    print("\n" + "="*80)
+    print(f"BENCHMARK: {path.name} ({path.stat().st_size / 1e6:.1f}MB on disk)")
+    print("="*80)
+
+    streamed, stream_time, stream_peak = measure(lambda: compute_trace_vitals(path))
+    events = streamed['events_parsed']
+    print(f"\n📊 Streaming parser: {stream_time:.2f}s, {events / stream_time:,.0f} events/s, "
+          f"peak {stream_peak / 1e6:.1f}MB")
+    print("   " + ", ".join(f"{key}={streamed[key]}" for key in METRICS))
+
+    loaded, load_time, load_peak = measure(lambda: load_whole(path))
+    identical = all(loaded[key] == streamed[key] for key in METRICS)
+    print(f"\n⚙️  json.load: {load_time:.2f}s, peak {load_peak / 1e6:.1f}MB")
+    print(f"   Memory: {load_peak / max(stream_peak, 1):.0f}x less when streaming")
+    print(f"   {'✅' if identical else '❌'} Metrics {'identical' if identical else 'DIFFER'}")
+
+    return {'trace': path.name, 'events': events, 'stream_time': stream_time, 'stream_peak': stream_peak,
+            'load_time': load_time, 'load_peak': load_peak, 'identical': identical}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming trace vitals parser")
+    parser.add_argument('traces', nargs='*', type=Path, help="Recorded trace files (.json or .json.gz)")
+    parser.add_argument('--events', type=int, nargs='+', default=SIZES,
+                        help="Synthetic trace sizes when no traces are given (default: 100000 500000)")
+    args = parser.parse_args()
+
+    print("\n" + "="*80)
+    print("⚡ TRACE VITALS BENCHMARK")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        traces = args.traces
+        if not traces:
+            traces = []
+            for count in args.events:
+                path = Path(tmp) / f'synthetic-{count}.json.gz'
+                generate_trace(path, count)
+                traces.append(path)
+        results = [benchmark_trace(path) for path in traces]
+
+    print("\n" + "="*80)
+    print("SUMMARY")
+    print("="*80)
+    for result in results:
+        print(f"   {result['trace']}: {result['events']:,} events, "
+              f"stream {result['stream_time']:.2f}s / {result['stream_peak'] / 1e6:.1f}MB, "
+              f"json.load {result['load_time']:.2f}s / {result['load_peak'] / 1e6:.1f}MB")
+
+    return 0 if all(result['identical'] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
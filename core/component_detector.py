@@ -70,12 +70,14 @@ class ComponentDetector:
             'layout': ['header', 'footer', 'sidebar', 'container', 'section']
         }
 
-    def detect_components(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    def detect_components(self, extracted_data: Any) -> Dict[str, Any]:
         """
         Main component detection entry point
 
         Args:
-            extracted_data: Data from PenpotExtractor
+            extracted_data: Data from PenpotExtractor, or the
+                (file_id, page_id, object_id, object) stream from
+                PenpotExtractor.iter_objects()
 
         Returns:
             Comprehensive component analysis
@@ -172,23 +174,31 @@ class ComponentDetector:
             )
         }
 
-    def _collect_all_objects(self, extracted_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Collect all objects from extracted data"""
+    def _collect_all_objects(self, extracted_data: Any) -> List[Dict[str, Any]]:
+        """Collect all objects from extracted data (or a PenpotExtractor.iter_objects() stream)"""
         all_objects = []
 
-        for file_id, file_data in extracted_data.get('files', {}).items():
-            for page_id, page_data in file_data.get('pages', {}).items():
-                for object_id, object_data in page_data.get('objects', {}).items():
-                    # Enrich object with context
-                    enriched_object = {
-                        **object_data,
-                        'context': {
-                            'file_id': file_id,
-                            'page_id': page_id,
-                            'object_id': object_id
-                        }
-                    }
-                    all_objects.append(enriched_object)
+        if isinstance(extracted_data, dict):
+            object_stream = (
+                (file_id, page_id, object_id, object_data)
+                for file_id, file_data in extracted_data.get('files', {}).items()
+                for page_id, page_data in file_data.get('pages', {}).items()
+                for object_id, object_data in page_data.get('objects', {}).items()
+            )
+        else:
+            object_stream = extracted_data
+
+        for file_id, page_id, object_id, object_data in object_stream:
+            # Enrich object with context
+            enriched_object = {
+                **object_data,
+                'context': {
+                    'file_id': file_id,
+                    'page_id': page_id,
+                    'object_id': object_id
+                }
+            }
+            all_objects.append(enriched_object)
 
         return all_objects
 
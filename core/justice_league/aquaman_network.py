@@ -22,10 +22,14 @@ MCP Tools Used:
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
-from collections import defaultdict
-import re
+
+import numpy as np
+
+from .network_request_store import (
+    NetworkRequestStore, descending, extract_domain, get_request_store, group_codes, group_sum
+)
 
 # Mission Control Narrator for coordinated communication
 try:
@@ -37,6 +41,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+RequestLog = Union[NetworkRequestStore, List[Dict]]
+
 
 class AquamanNetwork:
     """
@@ -125,6 +131,9 @@ class AquamanNetwork:
                     'list_network_requests': mcp__chrome-devtools__list_network_requests,
                     'get_network_request': mcp__chrome-devtools__get_network_request
                 }
+                The request log is collected once and shared under
+                'network_store'; a stored log (e.g. load_har_tools) works
+                without list_network_requests.
             resource_types: Optional filter for resource types
                 ['document', 'stylesheet', 'script', 'image', 'font', 'xhr', 'fetch', etc.]
 
@@ -155,45 +164,41 @@ class AquamanNetwork:
         try:
             # Step 1: List all network requests
             logger.info("🌊 Aquaman commanding the network seas...")
-            list_func = mcp_tools.get('list_network_requests')
-
-            all_requests = []
+            store = get_request_store(mcp_tools)
 
-            if list_func:
-                # Get all requests (paginated if needed)
-                requests = list_func(resourceTypes=resource_types or [])
-                all_requests.extend(requests.get('requests', []))
-
-                logger.info(f"  ✓ Aquaman found {len(all_requests)} network requests")
+            if store is not None:
+                # All pages, shared with the other analyses
+                store = store.filter_types(resource_types)
+                logger.info(f"  ✓ Aquaman found {len(store)} network requests")
             else:
                 logger.warning("  ⚠️ list_network_requests function not provided")
-                all_requests = []
+                store = NetworkRequestStore()
 
-            results['total_requests'] = len(all_requests)
-            results['all_requests'] = all_requests
+            results['total_requests'] = len(store)
+            results['all_requests'] = store.requests
 
             # Step 2: Analyze Request Types
-            type_analysis = self._analyze_request_types(all_requests)
+            type_analysis = self._analyze_request_types(store)
             results['request_types'] = type_analysis
 
             # Step 3: Analyze Timing (Waterfall)
-            timing_analysis = self._analyze_timing_waterfall(all_requests)
+            timing_analysis = self._analyze_timing_waterfall(store)
             results['timing_analysis'] = timing_analysis
 
             # Step 4: Detect Blocking Resources
-            blocking_resources = self._detect_blocking_resources(all_requests)
+            blocking_resources = self._detect_blocking_resources(store)
             results['blocking_resources'] = blocking_resources
 
             # Step 5: Identify Critical Path
-            critical_path = self._identify_critical_path(all_requests)
+            critical_path = self._identify_critical_path(store)
             results['critical_path'] = critical_path
 
             # Step 6: Analyze Cache Efficiency
-            cache_analysis = self._analyze_cache_efficiency(all_requests)
+            cache_analysis = self._analyze_cache_efficiency(store)
             results['cache_analysis'] = cache_analysis
 
             # Step 7: Track Third-Party Resources
-            third_party = self._track_third_party_resources(all_requests)
+            third_party = self._track_third_party_resources(store)
             results['third_party_analysis'] = third_party
 
             # Step 8: Calculate Aquaman Network Score
@@ -215,34 +220,30 @@ class AquamanNetwork:
 
         return results
 
-    def _analyze_request_types(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _analyze_request_types(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🌊 Analyze distribution of resource types
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Resource type analysis
         """
-        type_counts = defaultdict(int)
-        type_sizes = defaultdict(int)
-
-        for req in requests:
-            res_type = req.get('resourceType', 'other')
-            size = req.get('size', 0)
-
-            type_counts[res_type] += 1
-            type_sizes[res_type] += size
+        store = NetworkRequestStore.coerce(requests)
+        types, codes = group_codes(store.column('resourceType', 'other'))
+        counts = np.bincount(codes, minlength=len(types))
+        sizes = group_sum(codes, store.column('size', 0), len(types))
 
+        type_sizes = dict(zip(types, sizes.tolist()))
         return {
-            'type_counts': dict(type_counts),
-            'type_sizes': dict(type_sizes),
+            'type_counts': dict(zip(types, counts.tolist())),
+            'type_sizes': type_sizes,
             'total_size': sum(type_sizes.values()),
-            'aquaman_observation': f'Aquaman sees {len(type_counts)} different resource types'
+            'aquaman_observation': f'Aquaman sees {len(types)} different resource types'
         }
 
-    def _analyze_timing_waterfall(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _analyze_timing_waterfall(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🌊 Analyze request timing waterfall
 
@@ -255,46 +256,31 @@ class AquamanNetwork:
         - Content download
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Waterfall timing analysis
         """
-        total_time = 0
-        slowest_requests = []
-
-        for req in requests:
-            timing = req.get('timing', {})
-
-            # Calculate total request time
-            request_time = (
-                timing.get('dns', 0) +
-                timing.get('connect', 0) +
-                timing.get('ssl', 0) +
-                timing.get('send', 0) +
-                timing.get('wait', 0) +
-                timing.get('receive', 0)
-            )
-
-            total_time += request_time
-
-            slowest_requests.append({
-                'url': req.get('url', ''),
-                'time': request_time,
-                'resource_type': req.get('resourceType', 'unknown')
-            })
-
-        # Sort by time (slowest first)
-        slowest_requests.sort(key=lambda x: x['time'], reverse=True)
+        store = NetworkRequestStore.coerce(requests)
+        request_times = store.total_time()
+        total_time = request_times.sum().item() if len(store) else 0
+
+        urls = store.column('url', '')
+        types = store.column('resourceType', 'unknown')
+        times = request_times.tolist()
+        slowest_requests = [
+            {'url': urls[i], 'time': times[i], 'resource_type': types[i]}
+            for i in descending(request_times)[:5].tolist()
+        ]
 
         return {
             'total_time_ms': total_time,
-            'average_time_ms': total_time / len(requests) if requests else 0,
-            'slowest_5_requests': slowest_requests[:5],
+            'average_time_ms': total_time / len(store) if len(store) else 0,
+            'slowest_5_requests': slowest_requests,
             'aquaman_verdict': 'Waters are calm' if total_time < 5000 else 'Stormy seas ahead!'
         }
 
-    def _detect_blocking_resources(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _detect_blocking_resources(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🌊 Detect render-blocking resources
 
@@ -304,45 +290,52 @@ class AquamanNetwork:
         - Large critical resources
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Blocking resource analysis
         """
-        blocking = []
+        store = NetworkRequestStore.coerce(requests)
+        urls = store.column('url', '')
+
+        # Scripts in head are typically blocking unless async/defer
+        sync_scripts = store.type_is(['script']) & ~store.contains(urls, ['async', 'defer'])
+        stylesheets = store.type_is(['stylesheet'])
+        blocking_indices = np.flatnonzero(sync_scripts | stylesheets)
 
-        for req in requests:
-            res_type = req.get('resourceType', '')
-            url = req.get('url', '')
-
-            # Check for blocking scripts
-            if res_type == 'script':
-                # Scripts in head are typically blocking
-                if not ('async' in url or 'defer' in url):
-                    blocking.append({
-                        'url': url,
-                        'type': 'script',
-                        'reason': 'Synchronous script - blocks parsing',
-                        'aquaman_says': 'This script is a whirlpool - blocking the flow!'
-                    })
-
-            # Check for blocking stylesheets
-            elif res_type == 'stylesheet':
+        blocking = []
+        for i in blocking_indices[:10].tolist():  # Top 10
+            if sync_scripts[i]:
+                blocking.append({
+                    'url': urls[i],
+                    'type': 'script',
+                    'reason': 'Synchronous script - blocks parsing',
+                    'aquaman_says': 'This script is a whirlpool - blocking the flow!'
+                })
+            else:
                 blocking.append({
-                    'url': url,
+                    'url': urls[i],
                     'type': 'stylesheet',
                     'reason': 'CSS blocks rendering',
                     'aquaman_says': 'Stylesheet creating currents - consider critical CSS!'
                 })
 
+        blocking_count = len(blocking_indices)
         return {
-            'blocking_count': len(blocking),
-            'blocking_resources': blocking[:10],  # Top 10
-            'severity': 'high' if len(blocking) > 5 else 'moderate' if len(blocking) > 2 else 'low',
+            'blocking_count': blocking_count,
+            'blocking_resources': blocking,
+            'severity': 'high' if blocking_count > 5 else 'moderate' if blocking_count > 2 else 'low',
             'aquaman_command': 'Use async/defer for scripts! Use critical CSS!'
         }
 
-    def _identify_critical_path(self, requests: List[Dict]) -> Dict[str, Any]:
+    # Critical resource types: (priority, Aquaman's remark)
+    CRITICAL_RESOURCE_TYPES = {
+        'document': ('highest', 'The main vessel - foundation of all!'),
+        'stylesheet': ('high', 'These styles shape the waters!'),
+        'font': ('medium', 'Font treasures from the deep!')
+    }
+
+    def _identify_critical_path(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🌊 Identify critical rendering path
 
@@ -353,143 +346,122 @@ class AquamanNetwork:
         - Above-the-fold images
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Critical path analysis
         """
-        critical_resources = []
+        store = NetworkRequestStore.coerce(requests)
+        urls = store.column('url', '')
+        types = store.column('resourceType', '')
+        critical_indices = np.flatnonzero(store.type_is(list(self.CRITICAL_RESOURCE_TYPES)))
 
-        for req in requests:
-            res_type = req.get('resourceType', '')
-            url = req.get('url', '')
-
-            # Document is always critical
-            if res_type == 'document':
-                critical_resources.append({
-                    'url': url,
-                    'type': 'document',
-                    'priority': 'highest',
-                    'aquaman_says': 'The main vessel - foundation of all!'
-                })
-
-            # CSS is critical
-            elif res_type == 'stylesheet':
-                critical_resources.append({
-                    'url': url,
-                    'type': 'stylesheet',
-                    'priority': 'high',
-                    'aquaman_says': 'These styles shape the waters!'
-                })
-
-            # Fonts can be critical
-            elif res_type == 'font':
-                critical_resources.append({
-                    'url': url,
-                    'type': 'font',
-                    'priority': 'medium',
-                    'aquaman_says': 'Font treasures from the deep!'
-                })
+        critical_resources = []
+        for i in critical_indices[:10].tolist():
+            priority, remark = self.CRITICAL_RESOURCE_TYPES[types[i]]
+            critical_resources.append({
+                'url': urls[i],
+                'type': types[i],
+                'priority': priority,
+                'aquaman_says': remark
+            })
 
         return {
-            'critical_resource_count': len(critical_resources),
-            'critical_resources': critical_resources[:10],
+            'critical_resource_count': len(critical_indices),
+            'critical_resources': critical_resources,
             'optimization_opportunity': 'Minimize critical path length for faster render',
             'aquaman_strategy': 'Reduce critical resources, inline critical CSS, preload fonts'
         }
 
-    def _analyze_cache_efficiency(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _analyze_cache_efficiency(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🌊 Analyze cache efficiency
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Cache analysis
         """
-        cached_count = 0
-        not_cached_count = 0
-        cacheable_but_not_cached = []
-
-        for req in requests:
-            from_cache = req.get('fromCache', False)
-            res_type = req.get('resourceType', '')
-
-            if from_cache:
-                cached_count += 1
-            else:
-                not_cached_count += 1
-
-                # Check if should be cached
-                if res_type in ['stylesheet', 'script', 'font', 'image']:
-                    cacheable_but_not_cached.append({
-                        'url': req.get('url', ''),
-                        'type': res_type,
-                        'aquaman_says': f'This {res_type} should swim in the cache!'
-                    })
+        store = NetworkRequestStore.coerce(requests)
+        from_cache = store.column('fromCache', False).astype(bool)
+        cached_count = int(from_cache.sum())
+        not_cached_count = len(store) - cached_count
+
+        urls = store.column('url', '')
+        types = store.column('resourceType', '')
+        should_cache = ~from_cache & store.type_is(['stylesheet', 'script', 'font', 'image'])
+        cacheable_but_not_cached = [
+            {
+                'url': urls[i],
+                'type': types[i],
+                'aquaman_says': f'This {types[i]} should swim in the cache!'
+            }
+            for i in np.flatnonzero(should_cache)[:10].tolist()
+        ]
 
-        cache_hit_rate = (cached_count / len(requests) * 100) if requests else 0
+        cache_hit_rate = (cached_count / len(store) * 100) if len(store) else 0
 
         return {
-            'total_requests': len(requests),
+            'total_requests': len(store),
             'cached_requests': cached_count,
             'not_cached_requests': not_cached_count,
             'cache_hit_rate_percent': round(cache_hit_rate, 1),
-            'cacheable_but_not_cached': cacheable_but_not_cached[:10],
+            'cacheable_but_not_cached': cacheable_but_not_cached,
             'aquaman_verdict': 'Excellent caching!' if cache_hit_rate > 70 else 'Cache needs improvement!'
         }
 
-    def _track_third_party_resources(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _track_third_party_resources(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🌊 Track third-party resources
 
         Third-party = different domain from main site
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Third-party analysis
         """
-        # Get primary domain (from first request)
-        primary_domain = None
-        if requests:
-            first_url = requests[0].get('url', '')
-            primary_domain = self._extract_domain(first_url)
-
-        third_party_domains = defaultdict(int)
-        third_party_requests = []
-
-        for req in requests:
-            url = req.get('url', '')
-            domain = self._extract_domain(url)
-
-            if domain and domain != primary_domain:
-                third_party_domains[domain] += 1
-                third_party_requests.append({
-                    'url': url,
-                    'domain': domain,
-                    'type': req.get('resourceType', 'unknown')
-                })
+        store = NetworkRequestStore.coerce(requests)
+        domains = store.domains()
+
+        # Primary domain comes from the first request
+        primary_domain = domains[0] if len(store) else None
+        third_party = self._third_party_mask(domains, primary_domain)
+
+        third_party_domains, codes = group_codes(domains[third_party])
+        counts = np.bincount(codes, minlength=len(third_party_domains))
 
         return {
             'third_party_domain_count': len(third_party_domains),
-            'third_party_request_count': len(third_party_requests),
-            'third_party_domains': dict(third_party_domains),
-            'top_third_parties': sorted(
-                third_party_domains.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:5],
+            'third_party_request_count': len(codes),
+            'third_party_domains': dict(zip(third_party_domains, counts.tolist())),
+            'top_third_parties': [
+                (third_party_domains[i], counts[i].item()) for i in descending(counts)[:5].tolist()
+            ],
             'aquaman_warning': 'Too many third-party ships in these waters!' if len(third_party_domains) > 10 else 'Third-party traffic acceptable'
         }
 
+    @staticmethod
+    def _third_party_mask(domains: np.ndarray, primary_domain: Optional[str]) -> np.ndarray:
+        """Requests with a domain other than the primary one"""
+        return np.fromiter(
+            (bool(domain) and domain != primary_domain for domain in domains.tolist()),
+            dtype=bool, count=len(domains)
+        )
+
+    @staticmethod
+    def _domain_resource_types(store: NetworkRequestStore, indices: np.ndarray) -> Dict[str, int]:
+        """Resource type counts of the given requests"""
+        types = store.column('resourceType', 'unknown')[indices]
+        names, codes = group_codes(types)
+        return dict(zip(names, np.bincount(codes, minlength=len(names)).tolist()))
+
     def _extract_domain(self, url: str) -> Optional[str]:
         """Extract domain from URL"""
         try:
-            match = re.search(r'https?://([^/]+)', url)
-            return match.group(1) if match else None
+            return extract_domain(url)
         except:
             return None
 
@@ -700,55 +672,32 @@ class AquamanNetwork:
 
         try:
             # Get all network requests
-            list_func = mcp_tools.get('list_network_requests')
-            if not list_func:
+            store = get_request_store(mcp_tools)
+            if store is None:
                 return {**results, 'status': 'error', 'message': 'list_network_requests not available'}
-
-            all_requests = list_func().get('requests', [])
-            self.think(f"Found {len(all_requests)} network requests", category="Analyzing")
-
-            # Extract primary domain
-            primary_domain = None
-            if all_requests:
-                first_url = all_requests[0].get('url', '')
-                primary_domain = self._extract_domain(first_url)
-
-            # Analyze third-party domains
-            third_party_domains = defaultdict(lambda: {
-                'count': 0,
-                'total_size': 0,
-                'resource_types': defaultdict(int),
-                'urls': []
-            })
-
-            first_party_count = 0
-            third_party_count = 0
-
-            for req in all_requests:
-                url = req.get('url', '')
-                domain = self._extract_domain(url)
-                size = req.get('size', 0)
-                res_type = req.get('resourceType', 'unknown')
-
-                if domain == primary_domain:
-                    first_party_count += 1
-                elif domain:
-                    third_party_count += 1
-                    third_party_domains[domain]['count'] += 1
-                    third_party_domains[domain]['total_size'] += size
-                    third_party_domains[domain]['resource_types'][res_type] += 1
-                    third_party_domains[domain]['urls'].append(url)
-
-            # Sort domains by request count
-            sorted_domains = sorted(
-                third_party_domains.items(),
-                key=lambda x: x[1]['count'],
-                reverse=True
-            )
+            self.think(f"Found {len(store)} network requests", category="Analyzing")
+
+            # Primary domain comes from the first request
+            domains = store.domains()
+            primary_domain = domains[0] if len(store) else None
+
+            first_party = np.fromiter((domain == primary_domain for domain in domains.tolist()),
+                                      dtype=bool, count=len(store))
+            third_party = self._third_party_mask(domains, primary_domain)
+            third_party_indices = np.flatnonzero(third_party)
+            first_party_count = int(first_party.sum())
+            third_party_count = len(third_party_indices)
+
+            # Group third-party requests by domain, sorted by request count
+            domain_names, codes = group_codes(domains[third_party_indices])
+            domain_counts = np.bincount(codes, minlength=len(domain_names))
+            domain_sizes = group_sum(codes, store.column('size', 0)[third_party_indices], len(domain_names)).tolist()
+            domain_order = descending(domain_counts).tolist()
+            sorted_domains = [domain_names[i] for i in domain_order]
 
             # Calculate metrics
-            total_third_party_size = sum(d['total_size'] for d in third_party_domains.values())
-            total_requests = len(all_requests)
+            total_third_party_size = sum(domain_sizes)
+            total_requests = len(store)
             third_party_percentage = (third_party_count / total_requests * 100) if total_requests > 0 else 0
 
             self.think("Mapping third-party domain distribution", category="Investigating")
@@ -759,7 +708,7 @@ class AquamanNetwork:
             analytics_domains = []
             other_domains = []
 
-            for domain, data in sorted_domains:
+            for domain in sorted_domains:
                 domain_lower = domain.lower()
                 if any(keyword in domain_lower for keyword in ['track', 'analytics', 'metric', 'telemetry']):
                     analytics_domains.append(domain)
@@ -775,17 +724,17 @@ class AquamanNetwork:
                 'first_party_count': first_party_count,
                 'third_party_count': third_party_count,
                 'third_party_percentage': round(third_party_percentage, 1),
-                'third_party_domain_count': len(third_party_domains),
+                'third_party_domain_count': len(domain_names),
                 'total_third_party_size_bytes': total_third_party_size,
                 'primary_domain': primary_domain,
                 'top_10_domains': [
                     {
-                        'domain': domain,
-                        'request_count': data['count'],
-                        'total_size_bytes': data['total_size'],
-                        'resource_types': dict(data['resource_types'])
+                        'domain': domain_names[i],
+                        'request_count': domain_counts[i].item(),
+                        'total_size_bytes': domain_sizes[i],
+                        'resource_types': self._domain_resource_types(store, third_party_indices[codes == i])
                     }
-                    for domain, data in sorted_domains[:10]
+                    for i in domain_order[:10]
                 ],
                 'domain_categories': {
                     'tracking_domains': tracking_domains,
@@ -857,67 +806,58 @@ class AquamanNetwork:
 
         try:
             # Get all network requests
-            list_func = mcp_tools.get('list_network_requests')
-            if not list_func:
+            store = get_request_store(mcp_tools)
+            if store is None:
                 return {**results, 'status': 'error', 'message': 'list_network_requests not available'}
+            # Headers come from get_network_request when the listing lacks them
+            get_func = mcp_tools.get('get_network_request')
+            if get_func:
+                store.fetch_details(get_func, missing='responseHeaders')
 
-            all_requests = list_func().get('requests', [])
-            self.think(f"Scanning {len(all_requests)} resources for compression", category="Analyzing")
+            self.think(f"Scanning {len(store)} resources for compression", category="Analyzing")
 
-            # Analyze compression
-            compressed_count = 0
-            uncompressed_count = 0
+            # Analyze compression (content-encoding header)
             compressible_types = ['script', 'stylesheet', 'document', 'xhr', 'fetch', 'font']
-
+            content_encoding = store.header('content-encoding')
+            compressed = content_encoding != ''
+            brotli = compressed & store.contains(content_encoding, ['br'])
+            gzip = compressed & ~brotli & store.contains(content_encoding, ['gzip'])
+            deflate = compressed & ~brotli & ~gzip & store.contains(content_encoding, ['deflate'])
+
+            compressed_count = int(compressed.sum())
+            uncompressed_count = len(store) - compressed_count
             compression_stats = {
-                'gzip': 0,
-                'br': 0,  # brotli
-                'deflate': 0,
-                'none': 0
+                'gzip': int(gzip.sum()),
+                'br': int(brotli.sum()),  # brotli
+                'deflate': int(deflate.sum()),
+                'none': uncompressed_count
             }
 
-            uncompressed_opportunities = []
-            total_uncompressed_size = 0
-
-            for req in all_requests:
-                url = req.get('url', '')
-                headers = req.get('responseHeaders', {})
-                res_type = req.get('resourceType', 'unknown')
-                size = req.get('size', 0)
-
-                # Check content-encoding header
-                content_encoding = headers.get('content-encoding', '').lower()
-
-                if content_encoding:
-                    compressed_count += 1
-                    if 'br' in content_encoding:
-                        compression_stats['br'] += 1
-                    elif 'gzip' in content_encoding:
-                        compression_stats['gzip'] += 1
-                    elif 'deflate' in content_encoding:
-                        compression_stats['deflate'] += 1
-                else:
-                    uncompressed_count += 1
-                    compression_stats['none'] += 1
-
-                    # Check if resource should be compressed
-                    if res_type in compressible_types and size > 1024:  # > 1KB
-                        uncompressed_opportunities.append({
-                            'url': url,
-                            'type': res_type,
-                            'size_bytes': size,
-                            'size_kb': round(size / 1024, 1),
-                            'aquaman_says': f'This {res_type} should be compressed!'
-                        })
-                        total_uncompressed_size += size
+            # Uncompressed text resources over 1KB, largest first
+            sizes = store.column('size', 0)
+            should_compress = ~compressed & store.type_is(compressible_types, 'unknown') & (sizes > 1024)
+            opportunity_indices = np.flatnonzero(should_compress)
+            opportunity_count = len(opportunity_indices)
+            total_uncompressed_size = sum(sizes[opportunity_indices].tolist())
+
+            urls = store.column('url', '')
+            types = store.column('resourceType', 'unknown')
+            size_list = sizes.tolist()
+            uncompressed_opportunities = [
+                {
+                    'url': urls[i],
+                    'type': types[i],
+                    'size_bytes': size_list[i],
+                    'size_kb': round(size_list[i] / 1024, 1),
+                    'aquaman_says': f'This {types[i]} should be compressed!'
+                }
+                for i in opportunity_indices[descending(sizes[opportunity_indices])[:10]].tolist()
+            ]
 
             # Calculate metrics
-            total_resources = len(all_requests)
+            total_resources = len(store)
             compression_rate = (compressed_count / total_resources * 100) if total_resources > 0 else 0
 
-            # Sort uncompressed opportunities by size
-            uncompressed_opportunities.sort(key=lambda x: x['size_bytes'], reverse=True)
-
             self.think("Calculating compression efficiency", category="Investigating")
 
             results['compression_analysis'] = {
@@ -926,7 +866,7 @@ class AquamanNetwork:
                 'uncompressed_count': uncompressed_count,
                 'compression_rate_percent': round(compression_rate, 1),
                 'compression_types': compression_stats,
-                'uncompressed_opportunities': uncompressed_opportunities[:10],
+                'uncompressed_opportunities': uncompressed_opportunities,
                 'total_uncompressed_size_bytes': total_uncompressed_size,
                 'total_uncompressed_size_mb': round(total_uncompressed_size / (1024 * 1024), 2),
                 'potential_savings_estimate_mb': round(total_uncompressed_size * 0.7 / (1024 * 1024), 2)  # ~70% compression
@@ -954,12 +894,12 @@ class AquamanNetwork:
             results['recommendations'] = []
 
             # Generate recommendations
-            if len(uncompressed_opportunities) > 0:
+            if opportunity_count > 0:
                 self.think("Generating compression recommendations", category="Result")
                 results['recommendations'].append({
                     'priority': 'high',
                     'area': 'Text Compression',
-                    'issue': f'{len(uncompressed_opportunities)} uncompressed resources ({total_uncompressed_size / (1024 * 1024):.2f} MB)',
+                    'issue': f'{opportunity_count} uncompressed resources ({total_uncompressed_size / (1024 * 1024):.2f} MB)',
                     'aquaman_says': 'These resources are leaking bandwidth like a damaged hull!',
                     'actions': [
                         'Enable gzip or brotli compression on server',
@@ -969,7 +909,7 @@ class AquamanNetwork:
                     ]
                 })
 
-            self.say(verdict, style="tactical", technical_info=f"{compression_rate:.1f}% compression rate, {len(uncompressed_opportunities)} opportunities")
+            self.say(verdict, style="tactical", technical_info=f"{compression_rate:.1f}% compression rate, {opportunity_count} opportunities")
 
         except Exception as e:
             logger.error(f"🌊 Aquaman encountered turbulence: {e}")
@@ -1014,82 +954,63 @@ class AquamanNetwork:
 
         try:
             # Get all network requests
-            list_func = mcp_tools.get('list_network_requests')
-            if not list_func:
+            store = get_request_store(mcp_tools)
+            if store is None:
                 return {**results, 'status': 'error', 'message': 'list_network_requests not available'}
 
-            all_requests = list_func().get('requests', [])
-
             # Filter for API/XHR/Fetch requests
-            api_requests = [req for req in all_requests if req.get('resourceType') in ['xhr', 'fetch']]
+            api = store.select(store.type_is(['xhr', 'fetch'], None))
+            api_count = len(api)
 
-            self.think(f"Scanning {len(api_requests)} API/XHR requests", category="Analyzing")
+            self.think(f"Scanning {api_count} API/XHR requests", category="Analyzing")
+
+            # Total response time = TTFB (wait) + download (receive)
+            wait_times = api.phase('wait')
+            receive_times = api.phase('receive')
+            response_times = wait_times + receive_times
 
-            slow_responses = []
-            fast_responses = []
             timing_distribution = {
-                '0-100ms': 0,
-                '100-500ms': 0,
-                '500-1000ms': 0,
-                '1000-3000ms': 0,
-                '3000ms+': 0
+                '0-100ms': int((response_times < 100).sum()),
+                '100-500ms': int(((response_times >= 100) & (response_times < 500)).sum()),
+                '500-1000ms': int(((response_times >= 500) & (response_times < 1000)).sum()),
+                '1000-3000ms': int(((response_times >= 1000) & (response_times < 3000)).sum()),
+                '3000ms+': int((response_times >= 3000).sum())
             }
 
-            for req in api_requests:
-                timing = req.get('timing', {})
-
-                # Calculate total response time (TTFB + download)
-                wait_time = timing.get('wait', 0)  # Time to first byte
-                receive_time = timing.get('receive', 0)  # Download time
-                total_time = wait_time + receive_time
-
-                url = req.get('url', '')
-                method = req.get('method', 'GET')
-                status = req.get('status', 0)
-
-                # Categorize timing
-                if total_time < 100:
-                    timing_distribution['0-100ms'] += 1
-                    fast_responses.append({'url': url, 'time_ms': total_time})
-                elif total_time < 500:
-                    timing_distribution['100-500ms'] += 1
-                    fast_responses.append({'url': url, 'time_ms': total_time})
-                elif total_time < 1000:
-                    timing_distribution['500-1000ms'] += 1
-                elif total_time < 3000:
-                    timing_distribution['1000-3000ms'] += 1
-                else:
-                    timing_distribution['3000ms+'] += 1
-
-                # Check if slow
-                if total_time >= threshold_ms:
-                    slow_responses.append({
-                        'url': url,
-                        'method': method,
-                        'status': status,
-                        'total_time_ms': round(total_time, 2),
-                        'ttfb_ms': round(wait_time, 2),
-                        'download_ms': round(receive_time, 2),
-                        'severity': 'critical' if total_time > 3000 else 'high' if total_time > 2000 else 'moderate',
-                        'aquaman_says': self._get_slow_response_message(total_time)
-                    })
-
-            # Sort slow responses by time (slowest first)
-            slow_responses.sort(key=lambda x: x['total_time_ms'], reverse=True)
+            urls = api.column('url', '')
+            methods = api.column('method', 'GET')
+            statuses = api.column('status', 0).tolist()
+            times, waits, receives = response_times.tolist(), wait_times.tolist(), receive_times.tolist()
+
+            # Slow responses, slowest first
+            slow_indices = np.flatnonzero(response_times >= threshold_ms)
+            slow_count = len(slow_indices)
+            slow_responses = [
+                {
+                    'url': urls[i],
+                    'method': methods[i],
+                    'status': statuses[i],
+                    'total_time_ms': round(times[i], 2),
+                    'ttfb_ms': round(waits[i], 2),
+                    'download_ms': round(receives[i], 2),
+                    'severity': 'critical' if times[i] > 3000 else 'high' if times[i] > 2000 else 'moderate',
+                    'aquaman_says': self._get_slow_response_message(times[i])
+                }
+                for i in slow_indices[descending(response_times[slow_indices])[:10]].tolist()
+            ]
+
+            fast_indices = np.flatnonzero(response_times < 500)
+            fastest = fast_indices[np.argsort(response_times[fast_indices], kind='stable')[:5]].tolist()
+            fast_responses = [{'url': urls[i], 'time_ms': times[i]} for i in fastest]
 
             self.think("Calculating response time statistics", category="Investigating")
 
             # Calculate statistics
-            if api_requests:
-                all_times = []
-                for req in api_requests:
-                    timing = req.get('timing', {})
-                    total = timing.get('wait', 0) + timing.get('receive', 0)
-                    all_times.append(total)
-
-                avg_response_time = sum(all_times) / len(all_times)
-                median_response_time = sorted(all_times)[len(all_times) // 2]
-                p95_response_time = sorted(all_times)[int(len(all_times) * 0.95)]
+            if api_count:
+                sorted_times = np.sort(response_times).tolist()
+                avg_response_time = sum(times) / api_count
+                median_response_time = sorted_times[api_count // 2]
+                p95_response_time = sorted_times[int(api_count * 0.95)]
             else:
                 avg_response_time = 0
                 median_response_time = 0
@@ -1097,21 +1018,21 @@ class AquamanNetwork:
 
             results['slow_response_analysis'] = {
                 'threshold_ms': threshold_ms,
-                'total_api_requests': len(api_requests),
-                'slow_response_count': len(slow_responses),
-                'slow_response_percentage': round(len(slow_responses) / len(api_requests) * 100, 1) if api_requests else 0,
+                'total_api_requests': api_count,
+                'slow_response_count': slow_count,
+                'slow_response_percentage': round(slow_count / api_count * 100, 1) if api_count else 0,
                 'timing_distribution': timing_distribution,
                 'statistics': {
                     'avg_response_time_ms': round(avg_response_time, 2),
                     'median_response_time_ms': round(median_response_time, 2),
                     'p95_response_time_ms': round(p95_response_time, 2)
                 },
-                'slowest_10_responses': slow_responses[:10],
-                'fastest_5_responses': sorted(fast_responses, key=lambda x: x['time_ms'])[:5]
+                'slowest_10_responses': slow_responses,
+                'fastest_5_responses': fast_responses
             }
 
             # Aquaman's verdict
-            slow_percentage = len(slow_responses) / len(api_requests) * 100 if api_requests else 0
+            slow_percentage = slow_count / api_count * 100 if api_count else 0
 
             if slow_percentage == 0:
                 verdict = "🌊 CRYSTAL CLEAR WATERS - All responses fast!"
@@ -1134,12 +1055,12 @@ class AquamanNetwork:
             results['recommendations'] = []
 
             # Generate recommendations
-            if len(slow_responses) > 0:
+            if slow_count > 0:
                 self.think("Generating optimization recommendations", category="Result")
                 results['recommendations'].append({
                     'priority': 'high',
                     'area': 'API Response Time',
-                    'issue': f'{len(slow_responses)} slow API responses detected',
+                    'issue': f'{slow_count} slow API responses detected',
                     'aquaman_says': 'These API calls are stuck in deep ocean currents!',
                     'actions': [
                         'Optimize database queries for slow endpoints',
@@ -1151,7 +1072,7 @@ class AquamanNetwork:
                     ]
                 })
 
-            self.say(verdict, style="tactical", technical_info=f"{len(slow_responses)}/{len(api_requests)} slow responses, avg {avg_response_time:.0f}ms")
+            self.say(verdict, style="tactical", technical_info=f"{slow_count}/{api_count} slow responses, avg {avg_response_time:.0f}ms")
 
         except Exception as e:
             logger.error(f"🌊 Aquaman encountered a whirlpool: {e}")
@@ -11,6 +11,7 @@ Status: Production Ready
 """
 
 import json
+import os
 import subprocess
 import sys
 import logging
@@ -18,6 +19,10 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime
 
+import requests
+
+from .figma_client import get_figma_client
+
 # Import Mission Control Narrator
 try:
     from .mission_control_narrator import get_narrator
@@ -59,6 +64,9 @@ class ArtemisCodeSmith:
         """
         self.atc_path = atc_orchestrator_path or self._find_atc_orchestrator()
         self.figma_token = figma_token or "<FIGMA_ACCESS_TOKEN>"
+        # Shared Figma client, only with a real token (None: placeholder extraction)
+        real_token = figma_token or os.getenv('FIGMA_ACCESS_TOKEN')
+        self.figma_client = get_figma_client(real_token) if real_token else None
         self.expert_mode = expert_mode
 
         # Hero identity
@@ -328,8 +336,28 @@ class ArtemisCodeSmith:
         if node_id:
             logger.debug(f"Targeting node: {node_id}")
 
-        # TODO: Integrate with actual Figma API
-        # For now, return mock data structure
+        document = None
+        if self.figma_client:
+            try:
+                document = self.figma_client.get_document(file_id, node_id.replace('-', ':') if node_id else None)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"Figma API unavailable, using mock data: {e}")
+
+        if document is not None:
+            return {
+                'file_id': file_id,
+                'node_id': node_id,
+                'name': document.get('name'),
+                'type': document.get('type'),
+                'children': document.get('children', []),
+                'styles': document.get('styles', {}),
+                'components': {
+                    child['id']: child.get('name') for child in document.get('children', [])
+                    if child.get('type') in ('COMPONENT', 'COMPONENT_SET', 'INSTANCE')
+                }
+            }
+
+        # No token or API error: mock data structure
         return {
             'file_id': file_id,
             'node_id': node_id,
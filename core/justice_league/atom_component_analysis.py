@@ -27,7 +27,7 @@ Analysis Capabilities:
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 from collections import defaultdict
 import re
@@ -40,6 +40,13 @@ except ImportError:
     NARRATOR_AVAILABLE = False
     logging.warning("Mission Control Narrator not available - Atom will operate without narrator")
 
+# Vectorized duplicate detection (falls back to pairwise scoring without NumPy)
+try:
+    from .component_similarity import find_similar_pairs
+    SIMILARITY_ENGINE_AVAILABLE = True
+except ImportError:
+    SIMILARITY_ENGINE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -832,35 +839,27 @@ class AtomComponentAnalysis:
         }
 
         duplicate_groups = []
-        checked_pairs = set()
 
         comp_ids = list(components.keys())
 
         self.think(f"Examining {len(comp_ids)} components for similarity", category="Analyzing")
 
-        for i, comp_id_1 in enumerate(comp_ids):
-            for comp_id_2 in comp_ids[i+1:]:
-                # Skip if already checked
-                pair_key = tuple(sorted([comp_id_1, comp_id_2]))
-                if pair_key in checked_pairs:
-                    continue
-                checked_pairs.add(pair_key)
-
-                # Calculate similarity
-                similarity = self._calculate_component_similarity(
-                    components[comp_id_1],
-                    components[comp_id_2]
-                )
-
-                if similarity >= similarity_threshold:
-                    duplicate_groups.append({
-                        'component_1': comp_id_1,
-                        'component_2': comp_id_2,
-                        'similarity_score': round(similarity * 100, 1),
-                        'severity': 'critical' if similarity >= 0.95 else 'high' if similarity >= 0.90 else 'moderate',
-                        'atom_says': self._get_similarity_message(similarity),
-                        'recommendation': self._get_duplicate_recommendation(comp_id_1, comp_id_2, similarity)
-                    })
+        # Block by type, color and size, then score only the surviving pairs
+        similar_pairs, engine_stats = self._find_similar_pairs(
+            [components[comp_id] for comp_id in comp_ids], similarity_threshold
+        )
+
+        for i, j, similarity in similar_pairs:
+            comp_id_1 = comp_ids[i]
+            comp_id_2 = comp_ids[j]
+            duplicate_groups.append({
+                'component_1': comp_id_1,
+                'component_2': comp_id_2,
+                'similarity_score': round(similarity * 100, 1),
+                'severity': 'critical' if similarity >= 0.95 else 'high' if similarity >= 0.90 else 'moderate',
+                'atom_says': self._get_similarity_message(similarity),
+                'recommendation': self._get_duplicate_recommendation(comp_id_1, comp_id_2, similarity)
+            })
 
         # Sort by similarity (highest first)
         duplicate_groups.sort(key=lambda x: x['similarity_score'], reverse=True)
@@ -896,7 +895,9 @@ class AtomComponentAnalysis:
             'high_duplicates': high_count,
             'avg_similarity': round(avg_similarity, 1),
             'duplicate_groups': duplicate_groups[:20],  # Top 20
-            'consolidation_opportunities': critical_count + high_count
+            'consolidation_opportunities': critical_count + high_count,
+            'pairs_compared': engine_stats['pairs_scored'],
+            'pairs_total': engine_stats['pairs_total']
         }
 
         results['atom_verdict'] = verdict
@@ -907,6 +908,28 @@ class AtomComponentAnalysis:
 
         return results
 
+    def _find_similar_pairs(self, component_list: List[Dict],
+                            similarity_threshold: float) -> Tuple[List[Tuple[int, int, float]], Dict[str, int]]:
+        """
+        Pairs (i, j, similarity) with i < j scoring at or above the threshold
+
+        Uses the blocked, vectorized engine when NumPy is available; otherwise
+        scores every pair with _calculate_component_similarity. Both return
+        the same pairs and scores.
+        """
+        if SIMILARITY_ENGINE_AVAILABLE:
+            return find_similar_pairs(component_list, similarity_threshold)
+
+        pairs = []
+        for i, comp1 in enumerate(component_list):
+            for j in range(i + 1, len(component_list)):
+                similarity = self._calculate_component_similarity(comp1, component_list[j])
+                if similarity >= similarity_threshold:
+                    pairs.append((i, j, similarity))
+
+        total = len(component_list) * (len(component_list) - 1) // 2
+        return pairs, {'pairs_total': total, 'pairs_scored': total, 'blocks_scanned': 1}
+
     def _calculate_component_similarity(self, comp1: Dict, comp2: Dict) -> float:
         """
         Calculate similarity between two components (0.0-1.0)
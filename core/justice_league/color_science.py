@@ -0,0 +1,254 @@
+"""
+⚡ COLOR SCIENCE - Batched Contrast & Delta E Engine
+
+Vectorized color math behind Wonder Woman's Bracers of Submission.
+
+Design systems repeat the same foreground/background pairs thousands of
+times, so pairs are deduplicated first, then WCAG relative luminance,
+contrast ratios, CIELAB and CIEDE2000 are computed as NumPy arrays over the
+unique pairs only. Results are memoized in a process-wide LRU (optionally
+persisted to JSON) so repeated analyses reuse them.
+
+The formulas reproduce the scalar implementation step for step:
+- WCAG 2.x relative luminance with the 0.03928 sRGB threshold
+- colormath's sRGB -> XYZ (D65, clamped at 0) -> CIELAB conversion
+- colormath's CIEDE2000 (including its hue-difference convention), so
+  Delta E values match delta_e_cie2000(convert_color(...)) to float precision
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+RGB = Tuple[int, int, int]
+ColorPair = Tuple[RGB, RGB]
+
+# colormath sRGB working space (rgb_to_xyz) and D65 / 2° reference white
+SRGB_TO_XYZ = np.array((
+    (0.412424, 0.357579, 0.180464),
+    (0.212656, 0.715158, 0.0721856),
+    (0.0193324, 0.119193, 0.950444)))
+D65_WHITE = np.array((0.95047, 1.00000, 1.08883))
+CIE_E = 216.0 / 24389.0
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance of (N, 3) 0-255 RGB rows"""
+    channels = rgb / 255.0
+    linear = np.where(channels <= 0.03928, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4)
+    return 0.2126 * linear[:, 0] + 0.7152 * linear[:, 1] + 0.0722 * linear[:, 2]
+
+
+def contrast_ratio(luminance1: np.ndarray, luminance2: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratio of two luminance arrays"""
+    lighter = np.maximum(luminance1, luminance2)
+    darker = np.minimum(luminance1, luminance2)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def srgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """CIELAB (D65) of (N, 3) 0-255 RGB rows"""
+    channels = rgb / 255.0
+    linear = np.where(channels <= 0.04045, channels / 12.92, np.power((channels + 0.055) / 1.055, 2.4))
+
+    # Same summation order as the per-color matrix product, clamped like colormath
+    xyz = np.stack([
+        SRGB_TO_XYZ[row, 0] * linear[:, 0] + SRGB_TO_XYZ[row, 1] * linear[:, 1] + SRGB_TO_XYZ[row, 2] * linear[:, 2]
+        for row in range(3)
+    ], axis=1)
+    xyz = np.maximum(xyz, 0.0)
+
+    scaled = xyz / D65_WHITE
+    f = np.where(scaled > CIE_E, np.power(scaled, 1.0 / 3.0), (7.787 * scaled) + (16.0 / 116.0))
+
+    lab = np.empty_like(f)
+    lab[:, 0] = (116.0 * f[:, 1]) - 16.0
+    lab[:, 1] = 500.0 * (f[:, 0] - f[:, 1])
+    lab[:, 2] = 200.0 * (f[:, 1] - f[:, 2])
+    return lab
+
+
+def delta_e_cie2000(lab1: np.ndarray, lab2: np.ndarray, Kl: float = 1, Kc: float = 1, Kh: float = 1) -> np.ndarray:
+    """CIEDE2000 between matching rows of two (N, 3) CIELAB arrays"""
+    L1, a1, b1 = lab1[:, 0], lab1[:, 1], lab1[:, 2]
+    L2, a2, b2 = lab2[:, 0], lab2[:, 1], lab2[:, 2]
+
+    avg_Lp = (L1 + L2) / 2.0
+
+    C1 = np.sqrt(np.power(a1, 2) + np.power(b1, 2))
+    C2 = np.sqrt(np.power(a2, 2) + np.power(b2, 2))
+    avg_C1_C2 = (C1 + C2) / 2.0
+
+    G = 0.5 * (1 - np.sqrt(np.power(avg_C1_C2, 7.0) / (np.power(avg_C1_C2, 7.0) + np.power(25.0, 7.0))))
+
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+
+    C1p = np.sqrt(np.power(a1p, 2) + np.power(b1, 2))
+    C2p = np.sqrt(np.power(a2p, 2) + np.power(b2, 2))
+    avg_C1p_C2p = (C1p + C2p) / 2.0
+
+    h1p = np.degrees(np.arctan2(b1, a1p))
+    h1p += (h1p < 0) * 360
+    h2p = np.degrees(np.arctan2(b2, a2p))
+    h2p += (h2p < 0) * 360
+
+    avg_Hp = (((np.fabs(h1p - h2p) > 180) * 360) + h1p + h2p) / 2.0
+
+    T = 1 - 0.17 * np.cos(np.radians(avg_Hp - 30)) + \
+        0.24 * np.cos(np.radians(2 * avg_Hp)) + \
+        0.32 * np.cos(np.radians(3 * avg_Hp + 6)) - \
+        0.2 * np.cos(np.radians(4 * avg_Hp - 63))
+
+    diff_h2p_h1p = h2p - h1p
+    delta_hp = diff_h2p_h1p + (np.fabs(diff_h2p_h1p) > 180) * 360
+    delta_hp -= (h2p > h1p) * 720
+
+    delta_Lp = L2 - L1
+    delta_Cp = C2p - C1p
+    delta_Hp = 2 * np.sqrt(C2p * C1p) * np.sin(np.radians(delta_hp) / 2.0)
+
+    S_L = 1 + ((0.015 * np.power(avg_Lp - 50, 2)) / np.sqrt(20 + np.power(avg_Lp - 50, 2.0)))
+    S_C = 1 + 0.045 * avg_C1p_C2p
+    S_H = 1 + 0.015 * avg_C1p_C2p * T
+
+    delta_ro = 30 * np.exp(-(np.power(((avg_Hp - 275) / 25), 2.0)))
+    R_C = np.sqrt((np.power(avg_C1p_C2p, 7.0)) / (np.power(avg_C1p_C2p, 7.0) + np.power(25.0, 7.0)))
+    R_T = -2 * R_C * np.sin(2 * np.radians(delta_ro))
+
+    return np.sqrt(
+        np.power(delta_Lp / (S_L * Kl), 2) +
+        np.power(delta_Cp / (S_C * Kc), 2) +
+        np.power(delta_Hp / (S_H * Kh), 2) +
+        R_T * (delta_Cp / (S_C * Kc)) * (delta_Hp / (S_H * Kh)))
+
+
+class ColorPairAnalyzer:
+    """
+    ⚡ Memoized contrast / Delta E for (foreground, background) RGB pairs
+
+    Thread-safe. Results are kept in an LRU of `cache_size` pairs; with a
+    `cache_path` they are also loaded from that JSON file and written back
+    by save() - once at exit, not after every analysis.
+    """
+
+    def __init__(self, cache_size: int = 65536, cache_path: Optional[Union[str, Path]] = None):
+        self.cache_size = cache_size
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._results: 'OrderedDict[ColorPair, Tuple[float, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Results computed since the last save()
+        self._unsaved = 0
+
+        if self.cache_path:
+            if self.cache_path.exists():
+                self._load()
+            atexit.register(self.save)
+
+    def analyze(self, pairs: Iterable[ColorPair]) -> Dict[ColorPair, Tuple[float, float]]:
+        """
+        (contrast_ratio, delta_e) for each distinct pair
+
+        Args:
+            pairs: (fg_rgb, bg_rgb) tuples - duplicates are computed once
+        """
+        unique = list(dict.fromkeys(pairs))
+        results: Dict[ColorPair, Tuple[float, float]] = {}
+        missing: List[ColorPair] = []
+
+        with self._lock:
+            for pair in unique:
+                cached = self._results.get(pair)
+                if cached is None:
+                    missing.append(pair)
+                else:
+                    self._results.move_to_end(pair)
+                    results[pair] = cached
+            self.hits += len(unique) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            computed = self._compute(missing)
+            results.update(computed)
+            with self._lock:
+                self._results.update(computed)
+                self._unsaved += len(computed)
+                while len(self._results) > self.cache_size:
+                    self._results.popitem(last=False)
+
+        return results
+
+    @staticmethod
+    def _compute(pairs: List[ColorPair]) -> Dict[ColorPair, Tuple[float, float]]:
+        fg = np.array([pair[0] for pair in pairs], dtype=np.float64)
+        bg = np.array([pair[1] for pair in pairs], dtype=np.float64)
+
+        contrasts = contrast_ratio(relative_luminance(fg), relative_luminance(bg))
+        delta_es = delta_e_cie2000(srgb_to_lab(fg), srgb_to_lab(bg))
+
+        return {
+            pair: (contrast, delta_e)
+            for pair, contrast, delta_e in zip(pairs, contrasts.tolist(), delta_es.tolist())
+        }
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+            self._unsaved = 0
+
+    def _load(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                stored = json.load(f).get('pairs', {})
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable color cache {self.cache_path}: {e}")
+            return
+        for key, (contrast, delta_e) in stored.items():
+            fg, bg = key.split('|')
+            pair = (tuple(int(v) for v in fg.split(',')), tuple(int(v) for v in bg.split(',')))
+            self._results[pair] = (contrast, delta_e)
+
+    def save(self):
+        """Persist the memoized results (no-op without cache_path or new results)"""
+        if not self.cache_path:
+            return
+        with self._lock:
+            if not self._unsaved:
+                return
+            self._unsaved = 0
+            pairs = {
+                f"{','.join(map(str, fg))}|{','.join(map(str, bg))}": list(values)
+                for (fg, bg), values in self._results.items()
+            }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': 1, 'pairs': pairs}, f)
+        os.replace(tmp_path, self.cache_path)
+
+
+# Shared analyzer so repeated analyses in the process reuse results
+_color_analyzer: Optional[ColorPairAnalyzer] = None
+_color_analyzer_lock = threading.Lock()
+
+
+def get_color_analyzer() -> ColorPairAnalyzer:
+    """Get the process-wide color pair analyzer (cache file from WONDER_WOMAN_COLOR_CACHE, if set)"""
+    global _color_analyzer
+    with _color_analyzer_lock:
+        if _color_analyzer is None:
+            _color_analyzer = ColorPairAnalyzer(cache_path=os.environ.get('WONDER_WOMAN_COLOR_CACHE'))
+        return _color_analyzer
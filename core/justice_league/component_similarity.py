@@ -0,0 +1,277 @@
+"""
+🔬 COMPONENT SIMILARITY - Blocked Duplicate Detection
+
+Vectorized engine behind AtomComponentAnalysis.detect_duplicate_components.
+
+Atom's similarity score is a fixed sum of weighted factors:
+
+    0.4  same (non-empty) type
+    0.1  same (non-empty) foreground color
+    0.1  same (non-empty) background color
+    0.2  size similarity      (only when both components have width and height)
+    0.2  children similarity  (only when either component has children)
+
+Because every factor has a known maximum, most pairs can be ruled out from
+their keys alone. Components are blocked level by level, and a level is only
+used when the threshold makes it exact:
+
+1. Type      - above 0.6 only same-type pairs can reach the threshold
+2. Colors    - above 0.8 a pair must share a foreground or background
+               color; above 0.9 it must share both
+3. Size      - the remaining headroom bounds the width ratio, so each block
+               is sorted by width and only a sliding window is compared
+               (components without a size drop out once size is required)
+
+Surviving candidate pairs are scored in chunks over a NumPy feature matrix
+using the same float64 operations, in the same order, as the pairwise scorer,
+so the matching pairs and their scores are identical to a full O(n²) scan.
+"""
+
+import json
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TYPE_WEIGHT = 0.4
+COLOR_WEIGHT = 0.1
+SIZE_WEIGHT = 0.2
+CHILDREN_WEIGHT = 0.2
+
+# Candidate pairs scored per vectorized batch
+PAIR_CHUNK_SIZE = 1_000_000
+# Keeps the width window conservative against float rounding
+_WINDOW_SLACK = 1e-9
+
+
+def _color_key(value: Any) -> Optional[Hashable]:
+    """Hashable stand-in for a color value (None if the color is unset)"""
+    if not value:
+        return None
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value) if value else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class ComponentFeatureMatrix:
+    """
+    Columnar features for a list of components
+
+    Categorical fields are interned to integer codes (-1 = unset) so equality
+    checks vectorize; sizes and children counts are float64 columns.
+    """
+
+    def __init__(self, components: Sequence[Dict[str, Any]]):
+        self.count = len(components)
+        interned: Dict[str, Dict[Hashable, int]] = {'type': {}, 'fg': {}, 'bg': {}}
+
+        def code(field: str, key: Optional[Hashable]) -> int:
+            if key is None:
+                return -1
+            return interned[field].setdefault(key, len(interned[field]))
+
+        self.type_code = np.fromiter(
+            (code('type', str(c.get('type') or '').lower() or None) for c in components), dtype=np.int64, count=self.count)
+        self.fg_code = np.fromiter(
+            (code('fg', _color_key(c.get('foreground_color'))) for c in components), dtype=np.int64, count=self.count)
+        self.bg_code = np.fromiter(
+            (code('bg', _color_key(c.get('background_color'))) for c in components), dtype=np.int64, count=self.count)
+        self.width = np.fromiter((_number(c.get('width')) for c in components), dtype=np.float64, count=self.count)
+        self.height = np.fromiter((_number(c.get('height')) for c in components), dtype=np.float64, count=self.count)
+        self.children = np.fromiter(
+            (len(c.get('children') or []) for c in components), dtype=np.float64, count=self.count)
+
+        self.sized = (self.width != 0) & (self.height != 0)
+        # The width window assumes positive sizes
+        self.size_windowing = not ((self.width < 0).any() or (self.height < 0).any())
+
+    def score_pairs(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Similarity of pairs (i[k], j[k]) - same arithmetic as the pairwise scorer"""
+        score = np.zeros(len(i), dtype=np.float64)
+
+        same_type = (self.type_code[i] == self.type_code[j]) & (self.type_code[i] >= 0)
+        score[same_type] += TYPE_WEIGHT
+
+        same_fg = (self.fg_code[i] == self.fg_code[j]) & (self.fg_code[i] >= 0)
+        score[same_fg] += COLOR_WEIGHT
+        same_bg = (self.bg_code[i] == self.bg_code[j]) & (self.bg_code[i] >= 0)
+        score[same_bg] += COLOR_WEIGHT
+
+        sized = self.sized[i] & self.sized[j]
+        if sized.any():
+            w1, w2 = self.width[i[sized]], self.width[j[sized]]
+            h1, h2 = self.height[i[sized]], self.height[j[sized]]
+            width_diff = self._relative_diff(w1, w2)
+            height_diff = self._relative_diff(h1, h2)
+            size_similarity = 1.0 - ((width_diff + height_diff) / 2)
+            score[sized] += size_similarity * SIZE_WEIGHT
+
+        c1, c2 = self.children[i], self.children[j]
+        has_children = (c1 > 0) | (c2 > 0)
+        if has_children.any():
+            c1, c2 = c1[has_children], c2[has_children]
+            max_children = np.maximum(c1, c2)
+            child_similarity = 1.0 - (np.abs(c1 - c2) / max_children)
+            score[has_children] += child_similarity * CHILDREN_WEIGHT
+
+        return score
+
+    @staticmethod
+    def _relative_diff(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        largest = np.maximum(a, b)
+        diff = np.zeros_like(a)
+        positive = largest > 0
+        diff[positive] = np.abs(a[positive] - b[positive]) / largest[positive]
+        return diff
+
+
+class DuplicateBlocker:
+    """
+    🔬 Generates candidate pairs for a threshold without visiting every pair
+
+    Every generated pair has i < j, and every pair that can score at or above
+    the threshold is generated exactly once.
+    """
+
+    def __init__(self, features: ComponentFeatureMatrix, threshold: float,
+                 chunk_size: int = PAIR_CHUNK_SIZE):
+        self.features = features
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.blocks_scanned = 0
+
+    def candidate_pairs(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yield (i, j) index arrays of at most chunk_size candidate pairs"""
+        f = self.features
+        everything = np.arange(f.count)
+
+        # Level 1: type - a cross-type pair scores at most 0.6
+        if self.threshold > 1.0 - TYPE_WEIGHT:
+            groups = self._group(everything, f.type_code[everything])
+        else:
+            groups = [everything]
+
+        for group in groups:
+            # Level 2: colors - what the pair still needs beyond type, size and children
+            color_needed = self.threshold - (TYPE_WEIGHT + SIZE_WEIGHT + CHILDREN_WEIGHT)
+            if color_needed > COLOR_WEIGHT:
+                keys = f.fg_code[group] * (int(f.bg_code.max(initial=0)) + 2) + f.bg_code[group]
+                usable = (f.fg_code[group] >= 0) & (f.bg_code[group] >= 0)
+                for block in self._group(group[usable], keys[usable]):
+                    yield from self._size_window(block)
+            elif color_needed > 0:
+                for block in self._group(group, f.fg_code[group]):
+                    yield from self._size_window(block)
+                # Pairs sharing a background but not a foreground
+                for block in self._group(group, f.bg_code[group]):
+                    yield from self._size_window(block, skip_same_fg=True)
+            else:
+                yield from self._size_window(group)
+
+    def _size_window(self, block: np.ndarray, skip_same_fg: bool = False) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Level 3: compare each component only with components of similar width"""
+        f = self.features
+        if len(block) < 2:
+            return
+        self.blocks_scanned += 1
+
+        size_needed = self.threshold - (TYPE_WEIGHT + 2 * COLOR_WEIGHT + CHILDREN_WEIGHT)
+        max_ratio = np.inf
+        if size_needed > 0:
+            # Unsized pairs get no size credit and cannot reach the threshold
+            block = block[f.sized[block]]
+            if f.size_windowing:
+                # size_similarity >= size_needed / SIZE_WEIGHT  =>  width_diff <= max_diff
+                max_diff = 2 * (1.0 - size_needed / SIZE_WEIGHT)
+                if max_diff < 1.0:
+                    max_ratio = 1.0 / (1.0 - max_diff) * (1 + _WINDOW_SLACK)
+
+        order = block[np.argsort(f.width[block], kind='stable')]
+        widths = f.width[order]
+        if np.isinf(max_ratio):
+            ends = np.full(len(order), len(order))
+        else:
+            ends = np.searchsorted(widths, widths * max_ratio, side='right')
+
+        starts = np.arange(len(order)) + 1
+        counts = np.maximum(ends - starts, 0)
+        row = 0
+        while row < len(order):
+            # Rows whose windows fit in one chunk (always at least one row)
+            cumulative = np.cumsum(counts[row:])
+            stop = row + max(int(np.searchsorted(cumulative, self.chunk_size, side='right')), 1)
+            rows = np.arange(row, stop)
+            row_counts = counts[rows]
+            total = int(row_counts.sum())
+            if total:
+                left = np.repeat(rows, row_counts)
+                offsets = np.arange(total) - np.repeat(np.cumsum(row_counts) - row_counts, row_counts)
+                right = np.repeat(starts[rows], row_counts) + offsets
+                a, b = order[left], order[right]
+                i, j = np.minimum(a, b), np.maximum(a, b)
+                if skip_same_fg:
+                    keep = ~((f.fg_code[i] == f.fg_code[j]) & (f.fg_code[i] >= 0))
+                    i, j = i[keep], j[keep]
+                if len(i):
+                    yield i, j
+            row = stop
+
+    @staticmethod
+    def _group(indices: np.ndarray, keys: np.ndarray) -> List[np.ndarray]:
+        """Split indices by key, dropping unset (-1) keys and singletons"""
+        buckets = defaultdict(list)
+        for index, key in zip(indices.tolist(), keys.tolist()):
+            if key >= 0:
+                buckets[key].append(index)
+        return [np.array(members, dtype=np.int64) for members in buckets.values() if len(members) > 1]
+
+
+def find_similar_pairs(components: Sequence[Dict[str, Any]], threshold: float,
+                       chunk_size: int = PAIR_CHUNK_SIZE) -> Tuple[List[Tuple[int, int, float]], Dict[str, int]]:
+    """
+    Find component pairs scoring at or above `threshold`
+
+    Args:
+        components: Component dicts (positions are used as ids)
+        threshold: Minimum similarity (0.0-1.0)
+        chunk_size: Candidate pairs scored per vectorized batch
+
+    Returns:
+        ([(i, j, score), ...] with i < j in (i, j) order, stats)
+    """
+    features = ComponentFeatureMatrix(components)
+    blocker = DuplicateBlocker(features, threshold, chunk_size)
+
+    matches_i, matches_j, matches_score = [], [], []
+    pairs_scored = 0
+    for i, j in blocker.candidate_pairs():
+        pairs_scored += len(i)
+        score = features.score_pairs(i, j)
+        hit = score >= threshold
+        matches_i.append(i[hit])
+        matches_j.append(j[hit])
+        matches_score.append(score[hit])
+
+    pairs: List[Tuple[int, int, float]] = []
+    if matches_i:
+        i = np.concatenate(matches_i)
+        j = np.concatenate(matches_j)
+        score = np.concatenate(matches_score)
+        order = np.lexsort((j, i))
+        pairs = list(zip(i[order].tolist(), j[order].tolist(), score[order].tolist()))
+
+    stats = {
+        'pairs_total': features.count * (features.count - 1) // 2,
+        'pairs_scored': pairs_scored,
+        'blocks_scanned': blocker.blocks_scanned
+    }
+    return pairs, stats
@@ -0,0 +1,226 @@
+"""
+💨 EXPORT MANIFEST - Single-Pass PNG Post-Processing
+
+Quicksilver flattens each frame's alpha channel onto white while the frame is
+downloaded (PDF viewers otherwise draw transparent areas black) and records
+the result in an export manifest next to the exported pages:
+
+    <export_dir>/export_manifest.json
+    {
+      "version": 1,
+      "frames": {
+        "Page-1/Frame_0:1.png": {"width": 1440, "height": 900, "mode": "RGB",
+                                 "flattened": true, "bytes": 48213}
+      }
+    }
+
+PDFCompiler reads frame dimensions from the manifest instead of re-opening
+every PNG. An entry is trusted only while the file still has the recorded
+byte size, so frames edited after export are decoded again.
+
+An optional "meta" object records what the export was made from (e.g.
+Hawkman's file version and scale) so an interrupted export can be resumed
+by skipping frames already on disk.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "export_manifest.json"
+ALPHA_MODES = ('RGBA', 'LA', 'PA')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# IHDR colour type -> PIL mode
+_PNG_COLOR_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+
+def read_png_header(content: bytes) -> Optional[Tuple[int, int, str]]:
+    """(width, height, mode) from a PNG's IHDR chunk, without decoding pixels"""
+    if len(content) < 26 or not content.startswith(_PNG_SIGNATURE) or content[12:16] != b'IHDR':
+        return None
+    width, height = struct.unpack('>II', content[16:24])
+    return width, height, _PNG_COLOR_MODES.get(content[25], 'unknown')
+
+
+def flatten_png(content: bytes) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Composite a PNG with an alpha channel onto white
+
+    Returns:
+        (png_bytes, info) where info has width, height, mode and flattened.
+        Opaque images and undecodable content are returned unchanged.
+    """
+    header = read_png_header(content)
+    info = {
+        'width': header[0] if header else 0,
+        'height': header[1] if header else 0,
+        'mode': header[2] if header else 'unknown',
+        'flattened': False
+    }
+
+    if not PIL_AVAILABLE or info['mode'] not in ALPHA_MODES + ('unknown',):
+        return content, info
+
+    try:
+        with Image.open(BytesIO(content)) as img:
+            info['width'], info['height'] = img.size
+            info['mode'] = img.mode
+            if img.mode not in ALPHA_MODES:
+                return content, info
+
+            rgba = img.convert('RGBA')
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.getchannel('A'))
+
+            buffer = BytesIO()
+            background.save(buffer, 'PNG')
+    except Exception as e:
+        logger.debug(f"Could not flatten PNG: {e}")
+        return content, info
+
+    info['mode'] = 'RGB'
+    info['flattened'] = True
+    return buffer.getvalue(), info
+
+
+def flatten_png_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """Flatten a PNG file in place (process-pool friendly); returns its manifest info"""
+    path = Path(path)
+    content = path.read_bytes()
+    flattened, info = flatten_png(content)
+    if info['flattened']:
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(flattened)
+        os.replace(tmp_path, path)
+    info['bytes'] = len(flattened)
+    return info
+
+
+class ExportManifest:
+    """
+    💨 Per-export record of frame dimensions and colour mode
+
+    Thread-safe; frames are keyed by their path relative to the manifest's
+    directory so an export can be moved as a whole.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_FILENAME
+        self.frames: Dict[str, Dict[str, Any]] = {}
+        self.meta: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                self.frames = data.get('frames', {})
+                self.meta = data.get('meta', {})
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"⚠️ Ignoring unreadable export manifest {self.path}: {e}")
+
+    def _key(self, image_path: Union[str, Path]) -> Optional[str]:
+        try:
+            return Path(image_path).resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return None
+
+    def record(self, image_path: Union[str, Path], info: Dict[str, Any]):
+        """Record (or replace) the entry for an image inside this export"""
+        key = self._key(image_path)
+        if key is None:
+            return
+        entry = {
+            'width': info.get('width', 0),
+            'height': info.get('height', 0),
+            'mode': info.get('mode', 'unknown'),
+            'flattened': info.get('flattened', False),
+            'bytes': info['bytes'] if 'bytes' in info else Path(image_path).stat().st_size
+        }
+        with self._lock:
+            self.frames[key] = entry
+
+    def get(self, image_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Entry for an image, or None if missing or the file changed since it was recorded"""
+        key = self._key(image_path)
+        with self._lock:
+            entry = self.frames.get(key) if key else None
+        if entry is None:
+            return None
+        try:
+            if Path(image_path).stat().st_size != entry.get('bytes'):
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def clear(self):
+        """Forget every recorded frame (the export is being redone)"""
+        with self._lock:
+            self.frames.clear()
+
+    def save(self):
+        """Write the manifest atomically"""
+        with self._lock:
+            data = {'version': 1, 'frames': dict(sorted(self.frames.items()))}
+            if self.meta:
+                data['meta'] = dict(self.meta)
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class ManifestIndex:
+    """
+    Finds the manifest that covers an image: the nearest export_manifest.json
+    in the image's directory or any ancestor up to `root`. Manifests are
+    loaded once per directory.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root).resolve()
+        self._by_dir: Dict[Path, Optional[ExportManifest]] = {}
+
+    def manifest_for(self, image_path: Union[str, Path]) -> Optional[ExportManifest]:
+        directory = Path(image_path).resolve().parent
+        visited = []
+        manifest = None
+        while True:
+            if directory in self._by_dir:
+                manifest = self._by_dir[directory]
+                break
+            visited.append(directory)
+            if (directory / MANIFEST_FILENAME).exists():
+                manifest = ExportManifest(directory)
+                break
+            if directory == self.root or directory.parent == directory or self.root not in directory.parents:
+                break
+            directory = directory.parent
+        for path in visited:
+            self._by_dir[path] = manifest
+        return manifest
+
+    def entry_for(self, image_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        manifest = self.manifest_for(image_path)
+        return manifest.get(image_path) if manifest else None
+
+    def manifests(self):
+        """Every manifest loaded so far"""
+        return {id(m): m for m in self._by_dir.values() if m is not None}.values()
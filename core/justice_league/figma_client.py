@@ -0,0 +1,448 @@
+"""
+🎨 FIGMA CLIENT - One Pooled Figma REST API Client for the Whole League
+
+Every hero that reads Figma files (Quicksilver, Hawkman, Green Arrow, Artemis,
+Superman's Figma integration) goes through one client per access token:
+
+- Keep-alive session: one pooled requests.Session shared by API and CDN calls
+- Response cache: file and node JSON is kept in memory and on disk under
+  (file_key, node_ids, depth); each entry records the file `version` and
+  `lastModified` it was fetched at and is served only while the file still
+  has that version
+- Revalidation: the current version comes from a cheap depth=1 file request,
+  made at most once per REVALIDATE_AFTER seconds per file
+- Coalescing: concurrent callers asking for the same response share one fetch
+- Rate limiting: a token bucket shared by every request made with the token;
+  a 429 pauses all callers for the Retry-After period
+
+Responses are shared between callers - treat returned dicts as read-only.
+
+Configuration (environment):
+    FIGMA_CACHE_DIR: On-disk cache directory (default ~/.cache/justice_league/figma)
+    FIGMA_API_RATE: Sustained requests per second (default 10)
+    FIGMA_API_BURST: Requests allowed back to back (default 20)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+FIGMA_API_BASE = "https://api.figma.com/v1"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "justice_league" / "figma"
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+REVALIDATE_AFTER = 60.0
+MEMORY_ENTRIES = 8
+CACHE_FORMAT = 1
+
+
+class FigmaRateLimiter:
+    """
+    🎨 Shared token bucket for Figma API requests
+
+    Every caller acquires a token before calling the API. When any request
+    gets a 429, pause() closes the gate for the Retry-After period so all
+    callers back off together, instead of one thread sleeping while the
+    others keep hitting the limit.
+    """
+
+    def __init__(self, min_interval: float = 0.0, rate: Optional[float] = None, burst: int = 1):
+        """
+        Args:
+            min_interval: Minimum seconds between consecutive requests (rate=1/min_interval, burst=1)
+            rate: Sustained requests per second (None: unlimited unless min_interval is set)
+            burst: Requests that may be sent back to back after an idle period
+        """
+        if rate is None and min_interval > 0:
+            rate, burst = 1.0 / min_interval, 1
+        self.min_interval = min_interval
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self.rate_limit_hits = 0
+        self.total_wait = 0.0
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self.rate:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                start = self._resume_at
+                if start <= now:
+                    if not self.rate or self._tokens >= 1:
+                        if self.rate:
+                            self._tokens -= 1
+                        self.total_wait += waited
+                        return waited
+                    start = now + (1 - self._tokens) / self.rate
+            # Re-check after sleeping: another caller may have taken the token or extended the pause
+            time.sleep(start - now)
+            waited += start - now
+
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds` (e.g. a Retry-After header)"""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+            self.rate_limit_hits += 1
+
+    @property
+    def paused(self) -> bool:
+        with self._lock:
+            return time.monotonic() < self._resume_at
+
+
+def parse_retry_after(value: Optional[str], default: float = 60.0) -> float:
+    """Retry-After header in seconds (delta-seconds form; anything else -> default)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class FigmaClient:
+    """
+    🎨 Pooled, cached, rate-limited Figma REST API client
+
+    Thread-safe; use get_figma_client() to share one instance per token.
+
+    Args:
+        token: Figma personal access token
+        cache_dir: On-disk cache directory (None: FIGMA_CACHE_DIR or the default)
+        rate_limiter: Shared limiter (default: token bucket from FIGMA_API_RATE/BURST)
+        timeout: Seconds per API request
+        max_retries: Attempts per request (429, 5xx and connection errors are retried)
+        pool_size: Keep-alive connections per host
+        revalidate_after: Seconds a file's known version is trusted before re-checking
+        memory_entries: Responses kept in memory (file JSON can be several MB each)
+        backoff: Base seconds of the exponential backoff after 5xx/connection errors
+    """
+
+    def __init__(self, token: str,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 rate_limiter: Optional[FigmaRateLimiter] = None,
+                 timeout: float = 60,
+                 max_retries: int = 5,
+                 pool_size: int = 32,
+                 revalidate_after: float = REVALIDATE_AFTER,
+                 memory_entries: int = MEMORY_ENTRIES,
+                 backoff: float = 1.0):
+        if not token:
+            raise ValueError("Figma token not set")
+        self.token = token
+        self.headers = {"X-Figma-Token": token}
+        self.cache_dir = Path(cache_dir or os.getenv('FIGMA_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self.rate_limiter = rate_limiter or FigmaRateLimiter(
+            rate=float(os.getenv('FIGMA_API_RATE', DEFAULT_RATE)),
+            burst=int(os.getenv('FIGMA_API_BURST', DEFAULT_BURST))
+        )
+        self.timeout = timeout
+        self.max_retries = max(1, max_retries)
+        self.revalidate_after = revalidate_after
+        self.memory_entries = memory_entries
+        self.backoff = backoff
+
+        # Keep-alive connection pool shared by every hero using this token
+        self.session = requests.Session()
+        # No adapter-level retries: request_json() retries with backoff and the shared limiter
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._memory: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        # file_key -> (version, lastModified, checked_at)
+        self._versions: Dict[str, Tuple[Optional[str], Optional[str], float]] = {}
+        self._stats = {
+            'requests': 0,
+            'retries': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'revalidations': 0,
+            'coalesced': 0,
+            'stale_served': 0
+        }
+
+    # ==================== PUBLIC API ====================
+
+    def get_file(self, file_key: str, depth: Optional[int] = None) -> Dict[str, Any]:
+        """
+        GET /files/{file_key} (cached by version)
+
+        Raises:
+            requests.RequestException: If the request fails after retries
+        """
+        params = {'depth': depth} if depth is not None else {}
+        return self._cached((file_key, None, depth), f"/files/{file_key}", params)
+
+    def get_nodes(self, file_key: str, node_ids: Iterable[str], depth: Optional[int] = None) -> Dict[str, Any]:
+        """
+        GET /files/{file_key}/nodes?ids=... (cached by version)
+
+        Raises:
+            requests.RequestException: If the request fails after retries
+        """
+        ids = tuple(sorted(set(node_ids)))
+        params: Dict[str, Any] = {'ids': ','.join(ids)}
+        if depth is not None:
+            params['depth'] = depth
+        return self._cached((file_key, ids, depth), f"/files/{file_key}/nodes", params)
+
+    def get_document(self, file_key: str, node_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Document tree of a file, or of one node when node_id is given
+
+        Raises:
+            ValueError: If the node is not in the file
+            requests.RequestException: If the request fails after retries
+        """
+        if not node_id:
+            return self.get_file(file_key).get('document', {})
+        node = (self.get_nodes(file_key, [node_id]).get('nodes') or {}).get(node_id)
+        if not node:
+            raise ValueError(f"Node {node_id} not found in file")
+        return node['document']
+
+    def get_images(self, file_key: str, node_ids: Iterable[str],
+                   scale: float = 2.0, format: str = 'png') -> Dict[str, Optional[str]]:
+        """
+        Render URLs for nodes: {node_id: image_url}. Never cached (URLs expire).
+
+        Raises:
+            requests.RequestException: If the request fails after retries
+        """
+        params = {'ids': ','.join(node_ids), 'format': format, 'scale': scale}
+        return self.request_json(f"/images/{file_key}", params).get('images') or {}
+
+    def request_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Uncached GET of an API path with rate limiting and retries
+
+        429 responses pause the shared limiter for Retry-After; 5xx and
+        connection errors back off exponentially; other errors raise at once.
+        """
+        url = f"{FIGMA_API_BASE}{path}"
+        if params:
+            # Query in the URL itself: ids stay readable in logs
+            url += '?' + urlencode(params, safe=',:')
+
+        last = self.max_retries - 1
+        for attempt in range(self.max_retries):
+            self.rate_limiter.acquire()
+            with self._lock:
+                self._stats['requests'] += 1
+                if attempt:
+                    self._stats['retries'] += 1
+            try:
+                response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == last:
+                    raise
+                logger.warning(f"⚠️ Figma request failed ({e}), retrying")
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            if response.status_code == 429 and attempt < last:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                logger.warning(f"⚠️ Figma rate limit hit, pausing API requests for {retry_after}s")
+                self.rate_limiter.pause(retry_after)
+                continue
+            if response.status_code >= 500 and attempt < last:
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    def stats(self) -> Dict[str, Any]:
+        """Request, cache and coalescing counters"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        stats['rate_limit_hits'] = self.rate_limiter.rate_limit_hits
+        stats['rate_limit_wait'] = round(self.rate_limiter.total_wait, 3)
+        return stats
+
+    def invalidate(self, file_key: Optional[str] = None):
+        """Forget known versions (all files, or one) so the next read revalidates"""
+        with self._lock:
+            if file_key is None:
+                self._versions.clear()
+            else:
+                self._versions.pop(file_key, None)
+
+    # ==================== CACHE ====================
+
+    def _cached(self, key: Tuple, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._coalesce(key, lambda: self._fetch_cached(key, path, params))
+
+    def _fetch_cached(self, key: Tuple, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        file_key = key[0]
+        entry = self._memory_get(key)
+        source = 'memory_hits'
+        if entry is None:
+            entry = self._read_disk(key)
+            source = 'disk_hits'
+
+        if entry is not None:
+            try:
+                current = self._current_version(file_key)
+            except requests.RequestException as e:
+                # Offline or Figma down: the last known copy beats failing the mission
+                logger.warning(f"⚠️ Could not revalidate Figma file {file_key} ({e}); serving cached copy")
+                self._count('stale_served')
+                return entry['data']
+            if current == (entry['version'], entry['lastModified']):
+                self._count(source)
+                if source == 'disk_hits':
+                    self._memory_put(key, entry)
+                return entry['data']
+
+        self._count('misses')
+        data = self.request_json(path, params)
+        version = data.get('version')
+        if version:
+            entry = {'version': version, 'lastModified': data.get('lastModified'), 'data': data}
+            with self._lock:
+                self._versions[file_key] = (version, entry['lastModified'], time.monotonic())
+            self._memory_put(key, entry)
+            self._write_disk(key, entry)
+        return data
+
+    def _current_version(self, file_key: str) -> Tuple[Optional[str], Optional[str]]:
+        """(version, lastModified) of a file, re-checked at most every revalidate_after seconds"""
+        with self._lock:
+            known = self._versions.get(file_key)
+        if known and time.monotonic() - known[2] < self.revalidate_after:
+            return known[0], known[1]
+        return self._coalesce(('version', file_key), lambda: self._fetch_version(file_key))
+
+    def _fetch_version(self, file_key: str) -> Tuple[Optional[str], Optional[str]]:
+        self._count('revalidations')
+        data = self.request_json(f"/files/{file_key}", {'depth': 1})
+        current = (data.get('version'), data.get('lastModified'))
+        with self._lock:
+            self._versions[file_key] = (current[0], current[1], time.monotonic())
+        return current
+
+    def _coalesce(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """Run fetch() once for concurrent callers of the same key"""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self._stats['coalesced'] += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _memory_get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: Tuple, entry: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: Tuple) -> Path:
+        file_key, node_ids, depth = key
+        digest = hashlib.sha256(json.dumps([node_ids, depth]).encode()).hexdigest()[:24]
+        return self.cache_dir / file_key / f"{digest}.json.gz"
+
+    def _read_disk(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        path = self._disk_path(key)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable Figma cache entry {path}: {e}")
+            return None
+        if entry.get('format') != CACHE_FORMAT or 'data' not in entry:
+            return None
+        return entry
+
+    def _write_disk(self, key: Tuple, entry: Dict[str, Any]):
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            os.close(fd)
+            try:
+                with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=3) as f:
+                    json.dump(dict(entry, format=CACHE_FORMAT), f, separators=(',', ':'))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # The cache is an optimization - a read-only home must not fail the fetch
+            logger.warning(f"⚠️ Could not write Figma cache entry {path}: {e}")
+
+
+_clients: Dict[str, FigmaClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_figma_client(token: Optional[str] = None, **kwargs) -> FigmaClient:
+    """
+    The shared client for a token (default: FIGMA_ACCESS_TOKEN)
+
+    Keyword arguments only apply when the token's client is first created.
+
+    Raises:
+        ValueError: If no token is given or set in the environment
+    """
+    token = token or os.getenv('FIGMA_ACCESS_TOKEN')
+    if not token:
+        raise ValueError("Figma token not set. Set FIGMA_ACCESS_TOKEN env var")
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = _clients[token] = FigmaClient(token, **kwargs)
+        return client
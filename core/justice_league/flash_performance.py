@@ -8,7 +8,7 @@ Powers:
 - Performance Profiling Integration (Chrome DevTools Performance API)
 - Core Web Vitals Measurement (LCP, FID, CLS, FCP, TTI, TBT)
 - Lighthouse Performance Audits
-- Performance Regression Detection
+- Performance Regression Detection (rolling median ± MAD over run history)
 - Speed Index Calculation
 - Frame Rate Monitoring
 - JavaScript Execution Analysis
@@ -28,6 +28,9 @@ from datetime import datetime
 from pathlib import Path
 import json
 
+from .trace_vitals import resolve_vitals
+from .performance_history import PerformanceHistory, DEFAULT_DB_NAME
+
 # Mission Control Narrator for coordinated communication
 try:
     from .mission_control_narrator import get_narrator
@@ -63,6 +66,14 @@ class FlashPerformance:
         self.baseline_dir = Path(baseline_dir or '/tmp/aldo-vision-performance-baselines')
         self.baseline_dir.mkdir(parents=True, exist_ok=True)
 
+        # Run history shared with Superman; existing Flash baselines seed it.
+        # Every run rewrites its baseline file and is recorded directly, so a
+        # baseline only seeds tests the history has no runs for yet
+        self.history = PerformanceHistory(self.baseline_dir / DEFAULT_DB_NAME)
+        legacy_baselines = list(self.baseline_dir.glob('*_baseline.json'))
+        if legacy_baselines:
+            self.history.migrate_json_files(legacy_baselines, hero='flash', only_new_tests=True)
+
         # Initialize narrator for enhanced UX
         self.narrator = narrator if narrator else (get_narrator() if NARRATOR_AVAILABLE else None)
 
@@ -187,6 +198,8 @@ class FlashPerformance:
                 # Extract Core Web Vitals
                 core_vitals = self._extract_core_web_vitals(trace_results)
                 results['core_web_vitals'] = core_vitals
+                if trace_results.get('trace_vitals'):
+                    results['trace_metrics'] = trace_results['trace_vitals']
 
                 # Extract Performance Insights
                 insights = trace_results.get('insights', [])
@@ -222,6 +235,9 @@ class FlashPerformance:
             regression_check = self._check_performance_regression(test_name, results)
             results['regression_check'] = regression_check
 
+            # Archive after the check so the run is judged against earlier ones
+            results['history_run_id'] = self.history.record(test_name, results, hero='flash')
+
             # Step 7: Generate Flash Recommendations
             recommendations = self._generate_flash_recommendations(results)
             results['flash_recommendations'] = recommendations
@@ -254,47 +270,57 @@ class FlashPerformance:
         Returns:
             Extracted Core Web Vitals
         """
-        # Extract metrics from trace data
-        # In real implementation, this would parse Chrome trace format
+        # Reported metrics first; anything missing is computed from the raw
+        # Chrome trace events (streamed). Still missing: value None, status 'unknown'
+        resolved = resolve_vitals(trace_data)
+
+        def metric_value(metric):
+            return resolved[metric][0]
 
         core_vitals = {
             'LCP': {
-                'value': trace_data.get('lcp', 0),
+                'value': metric_value('lcp'),
+                'source': resolved['lcp'][1],
                 'unit': 'ms',
                 'threshold_good': 2500,
                 'threshold_needs_improvement': 4000,
                 'status': 'unknown'
             },
             'FID': {
-                'value': trace_data.get('fid', 0),
+                'value': metric_value('fid'),
+                'source': resolved['fid'][1],
                 'unit': 'ms',
                 'threshold_good': 100,
                 'threshold_needs_improvement': 300,
                 'status': 'unknown'
             },
             'CLS': {
-                'value': trace_data.get('cls', 0),
+                'value': metric_value('cls'),
+                'source': resolved['cls'][1],
                 'unit': 'score',
                 'threshold_good': 0.1,
                 'threshold_needs_improvement': 0.25,
                 'status': 'unknown'
             },
             'FCP': {
-                'value': trace_data.get('fcp', 0),
+                'value': metric_value('fcp'),
+                'source': resolved['fcp'][1],
                 'unit': 'ms',
                 'threshold_good': 1800,
                 'threshold_needs_improvement': 3000,
                 'status': 'unknown'
             },
             'TTI': {
-                'value': trace_data.get('tti', 0),
+                'value': metric_value('tti'),
+                'source': resolved['tti'][1],
                 'unit': 'ms',
                 'threshold_good': 3800,
                 'threshold_needs_improvement': 7300,
                 'status': 'unknown'
             },
             'TBT': {
-                'value': trace_data.get('tbt', 0),
+                'value': metric_value('tbt'),
+                'source': resolved['tbt'][1],
                 'unit': 'ms',
                 'threshold_good': 200,
                 'threshold_needs_improvement': 600,
@@ -305,6 +331,8 @@ class FlashPerformance:
         # Determine status for each metric
         for metric, data in core_vitals.items():
             value = data['value']
+            if value is None:
+                continue
             good = data['threshold_good']
             needs_improvement = data['threshold_needs_improvement']
 
@@ -348,7 +376,7 @@ class FlashPerformance:
         core_vitals = results.get('core_web_vitals', {})
         insights = results.get('performance_insights', [])
 
-        # Deduct points for poor Core Web Vitals
+        # Deduct points for poor Core Web Vitals (unknown ones are not scored)
         for metric, data in core_vitals.items():
             status = data.get('status', 'unknown')
             if status == 'poor':
@@ -388,7 +416,7 @@ class FlashPerformance:
             'grade': grade,
             'verdict': verdict,
             'core_vitals_passed': sum(1 for v in core_vitals.values() if v.get('status') == 'good'),
-            'core_vitals_total': len(core_vitals),
+            'core_vitals_total': sum(1 for v in core_vitals.values() if v.get('status', 'unknown') != 'unknown'),
             'critical_issues': len(critical_insights) if 'critical_insights' in locals() else 0,
             'warning_issues': len(warning_insights) if 'warning_insights' in locals() else 0
         }
@@ -427,12 +455,18 @@ class FlashPerformance:
         Returns:
             Regression analysis
         """
+        # Rolling median ± MAD of earlier runs, per metric
+        history_check = self.history.check_run(test_name, results, hero='flash')
+        history_regression = history_check.get('score', {}).get('is_regression', False)
+
         baseline_path = self.baseline_dir / f"{test_name}_baseline.json"
 
         if not baseline_path.exists():
             return {
-                'status': 'no_baseline',
-                'message': 'No baseline exists - this IS the baseline!'
+                'status': 'regression_detected' if history_regression else 'no_baseline',
+                'message': 'No baseline exists - this IS the baseline!',
+                'is_regression': history_regression,
+                'history_check': history_check
             }
 
         # Load baseline
@@ -444,7 +478,8 @@ class FlashPerformance:
 
         score_diff = current_score - baseline_score
 
-        is_regression = score_diff < -5  # 5 point drop = regression
+        # 5 point drop, or a score outside the run history's spread = regression
+        is_regression = score_diff < -5 or history_regression
 
         return {
             'status': 'regression_detected' if is_regression else 'no_regression',
@@ -452,6 +487,7 @@ class FlashPerformance:
             'baseline_score': baseline_score,
             'score_difference': score_diff,
             'is_regression': is_regression,
+            'history_check': history_check,
             'flash_verdict': '⚠️ PERFORMANCE REGRESSION!' if is_regression else '✓ No regression detected'
         }
 
@@ -23,11 +23,14 @@ Integration: Works after Artemis generation, validates before approval
 
 import logging
 import json
+import os
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import re
 
+import requests
+
 # Import Mission Control Narrator
 try:
     from .mission_control_narrator import get_narrator
@@ -36,6 +39,8 @@ except ImportError:
     NARRATOR_AVAILABLE = False
     logging.warning("Mission Control Narrator not available for Green Arrow")
 
+from .figma_client import get_figma_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,13 +66,16 @@ class GreenArrowVisualValidator:
     - shadcn-ui: Verify component library compliance
     """
 
-    def __init__(self, validation_data_dir: Optional[str] = None, narrator: Optional[Any] = None):
+    def __init__(self, validation_data_dir: Optional[str] = None, narrator: Optional[Any] = None,
+                 figma_token: Optional[str] = None):
         """
         Initialize Green Arrow's validation arsenal
 
         Args:
             validation_data_dir: Directory for validation reports
             narrator: Optional Mission Control Narrator for team dialogue
+            figma_token: Figma personal access token (or FIGMA_ACCESS_TOKEN env var)
+                used to fill in extracted specs
         """
         self.validation_data_dir = Path(validation_data_dir) if validation_data_dir else Path('/Users/admin/Documents/claudecode/Projects/aldo-vision/data/validation')
         self.validation_data_dir.mkdir(parents=True, exist_ok=True)
@@ -79,6 +87,10 @@ class GreenArrowVisualValidator:
         # Narrator integration
         self.narrator = narrator if narrator else (get_narrator() if NARRATOR_AVAILABLE else None)
 
+        # Shared Figma client for spec extraction (None: specs are returned unfilled)
+        self.figma_token = figma_token or os.getenv('FIGMA_ACCESS_TOKEN')
+        self.figma_client = get_figma_client(self.figma_token) if self.figma_token else None
+
         # Validation reports database
         self.reports_db = self.validation_data_dir / 'validation_reports.json'
         self.discrepancies_db = self.validation_data_dir / 'discrepancies.json'
@@ -205,9 +217,45 @@ class GreenArrowVisualValidator:
             'children': []
         }
 
+        if self.figma_client:
+            try:
+                self._fill_figma_specs(figma_specs, self.figma_client.get_document(file_key, node_id))
+            except (requests.RequestException, ValueError) as e:
+                # Keep the empty spec structure, as without a token
+                logger.warning(f"Could not fetch Figma node {node_id}: {e}")
+
         logger.debug(f"Figma specs extracted for node {node_id}")
         return figma_specs
 
+    @staticmethod
+    def _fill_figma_specs(figma_specs: Dict[str, Any], node: Dict[str, Any]):
+        """Copy a Figma node's properties into the spec structure"""
+        box = node.get('absoluteBoundingBox') or {}
+        for key in ('width', 'height', 'x', 'y'):
+            figma_specs['measurements'][key] = box.get(key)
+
+        figma_specs['colors']['fills'] = [fill for fill in node.get('fills', []) if fill.get('visible', True)]
+        figma_specs['colors']['strokes'] = [stroke for stroke in node.get('strokes', []) if stroke.get('visible', True)]
+        figma_specs['colors']['effects'] = [effect for effect in node.get('effects', []) if effect.get('visible', True)]
+
+        style = node.get('style') or {}
+        typography = figma_specs['typography']
+        typography['fontSize'] = style.get('fontSize')
+        typography['fontWeight'] = style.get('fontWeight')
+        typography['fontFamily'] = style.get('fontFamily')
+        typography['lineHeight'] = style.get('lineHeightPx')
+        typography['letterSpacing'] = style.get('letterSpacing')
+
+        for key in figma_specs['spacing']:
+            figma_specs['spacing'][key] = node.get(key)
+        for key in figma_specs['layout']:
+            figma_specs['layout'][key] = node.get(key)
+
+        figma_specs['children'] = [
+            {'id': child.get('id'), 'name': child.get('name'), 'type': child.get('type')}
+            for child in node.get('children', [])
+        ]
+
     def parse_figma_design_tokens(self, figma_specs: Dict[str, Any]) -> Dict[str, Any]:
         """
         🎯 Parse Figma specs into design tokens
@@ -24,6 +24,10 @@ Libraries:
 import logging
 import os
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
@@ -67,13 +71,24 @@ class GreenLanternVisual:
     6. Report visual regressions (alert the Justice League)
     """
 
-    def __init__(self, baseline_dir: Optional[str] = None, narrator: Optional[Any] = None):
+    # Tiled comparison: screenshots taller than this are scanned in bands
+    TILED_AUTO_HEIGHT = 4096
+    DEFAULT_TILE_HEIGHT = 512
+    # skimage's default SSIM window is 7x7 - bands overlap by half a window
+    SSIM_WINDOW = 7
+
+    def __init__(self, baseline_dir: Optional[str] = None, narrator: Optional[Any] = None,
+                 baseline_cache_size: int = 32, use_npy_cache: bool = False):
         """
         Initialize Green Lantern's visual regression system
 
         Args:
             baseline_dir: Directory to store baseline images (Green Lantern's vault)
             narrator: Mission Control Narrator for coordinated communication
+            baseline_cache_size: Decoded baselines kept in the in-memory LRU cache
+            use_npy_cache: Also keep each decoded baseline as <test_name>.npy next
+                to its PNG and memory-map it, so every process (and every later
+                run) skips PNG decoding
         """
         self.baseline_dir = Path(baseline_dir or '/tmp/aldo-vision-baselines')
         self.baseline_dir.mkdir(parents=True, exist_ok=True)
@@ -91,6 +106,13 @@ class GreenLanternVisual:
         # Initialize narrator for enhanced UX
         self.narrator = narrator if narrator else (get_narrator() if NARRATOR_AVAILABLE else None)
 
+        # Decoded baseline constructs: test_name -> {'stat', 'array'}
+        self.baseline_cache_size = baseline_cache_size
+        self.use_npy_cache = use_npy_cache
+        self._baseline_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._baseline_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._cache_lock = threading.Lock()
+
         logger.info(f"💚 Green Lantern Visual Guard initialized: {self.baseline_dir}")
 
     def say(self, message: str, style: str = "protective", technical_info: Optional[str] = None):
@@ -166,6 +188,7 @@ class GreenLanternVisual:
 
             # Save as PNG (lossless - perfect construct)
             img.save(baseline_path, 'PNG')
+            self._invalidate_baseline(test_name)
 
             # Store metadata
             meta = metadata or {}
@@ -198,15 +221,36 @@ class GreenLanternVisual:
             return {'error': str(e)}
 
     def compare_to_baseline(self, new_image_path: str, test_name: str,
-                           threshold: float = 0.95) -> Dict[str, Any]:
+                           threshold: float = 0.95, pixel_precheck: bool = True,
+                           tiled: Optional[bool] = None, tile_height: Optional[int] = None,
+                           early_exit: bool = True) -> Dict[str, Any]:
         """
         💚 Compare new screenshot to stored baseline
         (Green Lantern scans for visual threats)
 
+        Cheap checks run before SSIM: a byte-identical screenshot is accepted
+        without decoding, and (with pixel_precheck) a re-encoded screenshot
+        with exactly the baseline's pixels skips SSIM and scores 1.0
+        ('precheck' names which check decided). Anything short of identical
+        pixels always gets SSIM.
+
+        Tiled mode streams horizontal bands through SSIM so float
+        intermediates stay bounded by the band size, not the screenshot
+        height. Bands overlap by half an SSIM window, so the combined score
+        equals the whole-image score. Per-band scores are reported under
+        'tiles' and only changed bands are rendered into the diff image.
+
         Args:
             new_image_path: Path to new screenshot
             test_name: Name of test to compare against
             threshold: Similarity threshold (0-1, default 0.95 = 95% similar)
+            pixel_precheck: Skip SSIM when the decoded pixels are identical
+            tiled: Band-by-band comparison (default: only for screenshots
+                taller than TILED_AUTO_HEIGHT)
+            tile_height: Band height in pixels (default: DEFAULT_TILE_HEIGHT)
+            early_exit: In tiled mode, stop at the first band scoring below
+                threshold. The comparison is then a regression graded by that
+                band; the score covers only the bands scanned so far
 
         Returns:
             Comparison results with diff image and scores
@@ -226,68 +270,292 @@ class GreenLanternVisual:
             }
 
         try:
-            # Load images
-            baseline_img = Image.open(baseline_path)
+            # Byte-identical screenshot - nothing to decode
+            if self._files_identical(baseline_path, new_image_path):
+                return self._build_comparison_result(
+                    test_name, 1.0, threshold, 0.0, None, baseline_path, new_image_path, 'byte_identical'
+                )
+
+            # Load images (baseline comes decoded from the construct cache)
+            baseline_entry = self._get_baseline_entry(test_name)
+            baseline_array = baseline_entry['array']
+            baseline_size = (baseline_array.shape[1], baseline_array.shape[0])
             new_img = Image.open(new_image_path)
 
             # Ensure same size (resize if needed)
-            if baseline_img.size != new_img.size:
-                logger.warning(f"  ⚠️ Size mismatch: baseline {baseline_img.size} vs new {new_img.size}")
-                new_img = new_img.resize(baseline_img.size, Image.Resampling.LANCZOS)
+            if new_img.size != baseline_size:
+                logger.warning(f"  ⚠️ Size mismatch: baseline {baseline_size} vs new {new_img.size}")
+                new_img = new_img.resize(baseline_size, Image.Resampling.LANCZOS)
 
             # Convert to RGB if needed
-            if baseline_img.mode != 'RGB':
-                baseline_img = baseline_img.convert('RGB')
             if new_img.mode != 'RGB':
                 new_img = new_img.convert('RGB')
 
-            # Convert to numpy arrays (Green Lantern's analytical power)
-            baseline_array = np.array(baseline_img)
-            new_array = np.array(new_img)
+            new_array = np.asarray(new_img)
+
+            height = baseline_array.shape[0]
+            band_height = max(tile_height or self.DEFAULT_TILE_HEIGHT, self.SSIM_WINDOW)
+            use_tiles = tiled if tiled is not None else height > self.TILED_AUTO_HEIGHT
+
+            # Pixel-level difference in int16 bands - no float64 copies of the images
+            pixel_diff_percentage = self._pixel_difference_percent(baseline_array, new_array, band_height)
+
+            precheck = None
+            use_ssim = True
+            if pixel_precheck and pixel_diff_percentage == 0:
+                # Identical pixels - skip the full SSIM scan
+                precheck = 'pixel_identical'
+                use_ssim = False
+                ssim_score = 1.0
+
+            tiles = None
+            baseline_img = Image.fromarray(np.asarray(baseline_array))
+            if use_tiles:
+                tiles = self._scan_tiles(baseline_array, new_array, band_height, threshold,
+                                         early_exit, use_ssim)
+                if use_ssim:
+                    ssim_score = tiles['score']
+
+                # Render only the bands that changed
+                diff_image_path = self._generate_diff_image(
+                    baseline_img, new_img, None, test_name,
+                    regions=tiles['changed_regions'],
+                    region_map=lambda top, bottom: self._band_map(
+                        baseline_array, new_array, top, bottom, use_ssim)
+                )
+            else:
+                if use_ssim:
+                    # Calculate SSIM (Structural Similarity Index) - Ring's scanner
+                    ssim_score, ssim_diff = ssim(baseline_array, new_array,
+                                                channel_axis=2, full=True)
+                else:
+                    ssim_diff = self._band_map(baseline_array, new_array, 0, height, use_ssim=False)
+
+                # Generate diff image (Visual construct of changes)
+                diff_image_path = self._generate_diff_image(
+                    baseline_img, new_img, ssim_diff, test_name
+                )
+
+            # A band below threshold stopped the scan: the partial mean over the
+            # bands before it can still clear the threshold, the page cannot
+            failing_band = tiles['tile_scores'][-1]['score'] if tiles and tiles['early_exit'] else None
+            results = self._build_comparison_result(
+                test_name, ssim_score, threshold, pixel_diff_percentage,
+                diff_image_path, baseline_path, new_image_path, precheck, failing_band
+            )
+            if tiles is not None:
+                results['tiles'] = {key: value for key, value in tiles.items() if key != 'score'}
+            return results
 
-            # Calculate SSIM (Structural Similarity Index) - Ring's scanner
-            ssim_score, ssim_diff = ssim(baseline_array, new_array,
-                                        channel_axis=2, full=True)
+        except Exception as e:
+            logger.error(f"Comparison failed: {e}")
+            return {'error': str(e)}
 
-            # Calculate pixel-level difference
-            pixel_diff = np.abs(baseline_array.astype(float) - new_array.astype(float))
-            pixel_diff_percentage = (np.sum(pixel_diff) / (pixel_diff.size * 255)) * 100
+    def _build_comparison_result(self, test_name: str, ssim_score: float, threshold: float,
+                                 pixel_diff_percentage: float, diff_image_path: Optional[str],
+                                 baseline_path: Path, new_image_path: str,
+                                 precheck: Optional[str],
+                                 failing_band: Optional[float] = None) -> Dict[str, Any]:
+        """Assemble compare_to_baseline's result and log the verdict"""
+        # Determine if regression (Visual threat detected)
+        is_regression = ssim_score < threshold or failing_band is not None
+        verdict_score = ssim_score if failing_band is None else min(ssim_score, failing_band)
+
+        results = {
+            'test_name': test_name,
+            'comparison_time': datetime.now().isoformat(),
+            'similarity_score': float(ssim_score),
+            'threshold': threshold,
+            'is_regression': is_regression,
+            'pixel_difference_percent': float(pixel_diff_percentage),
+            'diff_image_path': diff_image_path,
+            'baseline_path': str(baseline_path),
+            'new_image_path': new_image_path,
+            'precheck': precheck,
+            'verdict': self._get_verdict(verdict_score, threshold),
+            'guardian': '💚 Green Lantern'
+        }
 
-            # Generate diff image (Visual construct of changes)
-            diff_image_path = self._generate_diff_image(
-                baseline_img, new_img, ssim_diff, test_name
-            )
+        if is_regression:
+            logger.warning(f"  ⚠️ VISUAL REGRESSION DETECTED! Green Lantern alerts the League! Similarity: {ssim_score:.2%}")
+        else:
+            logger.info(f"  ✓ No visual threats detected. Similarity: {ssim_score:.2%}")
 
-            # Determine if regression (Visual threat detected)
-            is_regression = ssim_score < threshold
+        return results
 
-            results = {
-                'test_name': test_name,
-                'comparison_time': datetime.now().isoformat(),
-                'similarity_score': float(ssim_score),
-                'threshold': threshold,
-                'is_regression': is_regression,
-                'pixel_difference_percent': float(pixel_diff_percentage),
-                'diff_image_path': diff_image_path,
-                'baseline_path': str(baseline_path),
-                'new_image_path': new_image_path,
-                'verdict': self._get_verdict(ssim_score, threshold),
-                'guardian': '💚 Green Lantern'
-            }
+    # ==================== BASELINE CONSTRUCT CACHE ====================
+
+    def _get_baseline_entry(self, test_name: str) -> Dict[str, Any]:
+        """
+        Decoded RGB uint8 baseline array for a test (LRU cached)
+
+        Entries are keyed by the PNG's mtime and size, so a re-stored baseline
+        is decoded again. With use_npy_cache the array is memory-mapped from
+        <test_name>.npy, written on first decode.
+        """
+        baseline_path = self.baseline_dir / f"{test_name}.png"
+        stat = baseline_path.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._cache_lock:
+            entry = self._baseline_cache.get(test_name)
+            if entry is not None and entry['stat'] == stat_key:
+                self._baseline_cache.move_to_end(test_name)
+                return entry
+
+        array = None
+        npy_path = baseline_path.with_suffix('.npy')
+        if self.use_npy_cache and npy_path.exists():
+            try:
+                if npy_path.stat().st_mtime_ns >= stat.st_mtime_ns:
+                    array = np.load(npy_path, mmap_mode='r')
+            except (OSError, ValueError) as e:
+                logger.warning(f"  ⚠️ Ignoring unreadable baseline cache {npy_path.name}: {e}")
+
+        if array is None:
+            with Image.open(baseline_path) as img:
+                array = np.asarray(img.convert('RGB'))
+            if self.use_npy_cache:
+                tmp_path = npy_path.with_name(f"{npy_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, array)
+                os.replace(tmp_path, npy_path)
+                array = np.load(npy_path, mmap_mode='r')
+
+        entry = {'stat': stat_key, 'array': array}
+        with self._cache_lock:
+            self._baseline_cache[test_name] = entry
+            self._baseline_cache.move_to_end(test_name)
+            while len(self._baseline_cache) > self.baseline_cache_size:
+                self._baseline_cache.popitem(last=False)
+        return entry
+
+    def _invalidate_baseline(self, test_name: str):
+        """Drop cached data for a baseline that was re-stored or deleted"""
+        baseline_path = self.baseline_dir / f"{test_name}.png"
+        with self._cache_lock:
+            self._baseline_cache.pop(test_name, None)
+            self._baseline_digests.pop(str(baseline_path), None)
+        npy_path = baseline_path.with_suffix('.npy')
+        if npy_path.exists():
+            npy_path.unlink()
+
+    def _files_identical(self, baseline_path: Path, new_image_path: str) -> bool:
+        """Byte-level equality check (baseline digests are cached)"""
+        new_stat = os.stat(new_image_path)
+        baseline_stat = baseline_path.stat()
+        if new_stat.st_size != baseline_stat.st_size:
+            return False
+
+        stat_key = (baseline_stat.st_mtime_ns, baseline_stat.st_size)
+        with self._cache_lock:
+            cached = self._baseline_digests.get(str(baseline_path))
+        if cached is None or cached[0] != stat_key:
+            cached = (stat_key, self._file_digest(baseline_path))
+            with self._cache_lock:
+                self._baseline_digests[str(baseline_path)] = cached
+
+        return cached[1] == self._file_digest(new_image_path)
+
+    @staticmethod
+    def _file_digest(path) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    # ==================== TILED COMPARISON ====================
+
+    def _band_bounds(self, top: int, bottom: int, height: int) -> Tuple[int, int]:
+        """Rows to feed SSIM so rows top..bottom get the same values as a whole-image scan"""
+        pad = self.SSIM_WINDOW // 2
+        hi = min(height, bottom + pad)
+        lo = max(0, min(top - pad, hi - self.SSIM_WINDOW))
+        return lo, hi
+
+    def _scan_tiles(self, baseline_array: np.ndarray, new_array: np.ndarray, tile_height: int,
+                    threshold: float, early_exit: bool, use_ssim: bool = True) -> Dict[str, Any]:
+        """
+        💚 Stream horizontal bands through SSIM
+
+        The whole-image SSIM is the mean of the SSIM map with a half-window
+        border cropped; summing each band's share of that cropped map gives
+        the same score while only one band's float maps exist at a time.
 
-            if is_regression:
-                logger.warning(f"  ⚠️ VISUAL REGRESSION DETECTED! Green Lantern alerts the League! Similarity: {ssim_score:.2%}")
+        Returns:
+            score, tile_scores, changed_regions, tiles_total, tiles_scanned, early_exit
+        """
+        height, width = baseline_array.shape[:2]
+        pad = self.SSIM_WINDOW // 2
+        bands = [(top, min(top + tile_height, height)) for top in range(0, height, tile_height)]
+
+        total = 0.0
+        count = 0
+        tile_scores = []
+        changed_regions = []
+        stopped_early = False
+
+        for top, bottom in bands:
+            if use_ssim:
+                lo, hi = self._band_bounds(top, bottom, height)
+                _, band_map = ssim(baseline_array[lo:hi], new_array[lo:hi], channel_axis=2, full=True)
+                core = band_map[max(top, pad) - lo:min(bottom, height - pad) - lo, pad:width - pad]
+                band_sum = float(core.sum(dtype=np.float64))
+                band_count = core.size
+                del band_map, core
+                tile_score = band_sum / band_count if band_count else 1.0
+                total += band_sum
+                count += band_count
+                changed = tile_score < 1.0
             else:
-                logger.info(f"  ✓ No visual threats detected. Similarity: {ssim_score:.2%}")
+                changed = not np.array_equal(baseline_array[top:bottom], new_array[top:bottom])
+                tile_score = None
 
-            return results
+            tile_scores.append({'top': top, 'bottom': bottom, 'score': tile_score})
+            if changed:
+                changed_regions.append((top, bottom))
 
-        except Exception as e:
-            logger.error(f"Comparison failed: {e}")
-            return {'error': str(e)}
+            if use_ssim and early_exit and tile_score < threshold:
+                stopped_early = True
+                logger.info(f"  💚 Band {top}-{bottom} scored {tile_score:.2%} - stopping scan early")
+                break
+
+        return {
+            'score': total / count if count else 1.0,
+            'tile_height': tile_height,
+            'tiles_total': len(bands),
+            'tiles_scanned': len(tile_scores),
+            'early_exit': stopped_early,
+            'tile_scores': tile_scores,
+            'changed_regions': changed_regions
+        }
+
+    def _band_map(self, baseline_array: np.ndarray, new_array: np.ndarray,
+                  top: int, bottom: int, use_ssim: bool = True) -> np.ndarray:
+        """2D similarity map (1 = unchanged) for rows top..bottom"""
+        if use_ssim:
+            lo, hi = self._band_bounds(top, bottom, baseline_array.shape[0])
+            _, band_map = ssim(baseline_array[lo:hi], new_array[lo:hi], channel_axis=2, full=True)
+            return band_map[top - lo:bottom - lo].mean(axis=2)
+
+        band_diff = np.abs(baseline_array[top:bottom].astype(np.int16) - new_array[top:bottom].astype(np.int16))
+        return 1.0 - band_diff.max(axis=2).astype(np.float32) / 255
+
+    @staticmethod
+    def _pixel_difference_percent(baseline_array: np.ndarray, new_array: np.ndarray, band_height: int) -> float:
+        """Mean absolute pixel difference (% of 255), accumulated band by band in int16"""
+        total = 0
+        for top in range(0, baseline_array.shape[0], band_height):
+            band_diff = np.abs(baseline_array[top:top + band_height].astype(np.int16)
+                               - new_array[top:top + band_height].astype(np.int16))
+            total += int(band_diff.sum(dtype=np.int64))
+        return (total / (baseline_array.size * 255)) * 100
 
     def _generate_diff_image(self, baseline: Image.Image, new: Image.Image,
-                            ssim_diff: np.ndarray, test_name: str) -> str:
+                            ssim_diff: Optional[np.ndarray], test_name: str,
+                            regions: Optional[List[Tuple[int, int]]] = None,
+                            region_map: Optional[Any] = None) -> str:
         """
         💚 Generate visual diff image highlighting differences
         (Create Green Lantern construct showing changes)
@@ -295,44 +563,66 @@ class GreenLanternVisual:
         Args:
             baseline: Baseline PIL Image
             new: New PIL Image
-            ssim_diff: SSIM difference matrix
+            ssim_diff: SSIM difference matrix (None when region_map is given)
             test_name: Test name for filename
+            regions: Row ranges (top, bottom) to render; default is the whole image.
+                Each region becomes one baseline/current/diff strip.
+            region_map: region_map(top, bottom) -> 2D similarity map, used
+                instead of slicing ssim_diff
 
         Returns:
-            Path to generated diff image
+            Path to generated diff image ("" if there is nothing to render)
         """
         try:
-            # Create diff highlight image (Green energy constructs)
-            diff_highlight = (ssim_diff * 255).astype(np.uint8)
-            diff_highlight = 255 - diff_highlight  # Invert (dark = different)
-
-            # Apply colormap (green for differences - Green Lantern style!)
-            diff_colored = np.zeros((*diff_highlight.shape, 3), dtype=np.uint8)
-            diff_colored[:, :, 0] = 255 - diff_highlight  # Red channel (inverse)
-            diff_colored[:, :, 1] = diff_highlight  # Green channel (GL power!)
-            diff_colored[:, :, 2] = 255 - diff_highlight  # Blue channel (inverse)
-
-            diff_img = Image.fromarray(diff_colored)
-
-            # Create side-by-side comparison (GL construct triptych)
             width, height = baseline.size
-            comparison = Image.new('RGB', (width * 3, height))
-
-            # Paste images
-            comparison.paste(baseline, (0, 0))
-            comparison.paste(new, (width, 0))
-            comparison.paste(diff_img, (width * 2, 0))
-
-            # Add labels with Green Lantern flair
+            whole_image = regions is None
+            if whole_image:
+                regions = [(0, height)]
+            if not regions:
+                return ""
+
+            # Create side-by-side comparison (GL construct triptych), one strip per region
+            label_height = 0 if whole_image else 30
+            canvas_height = sum(bottom - top for top, bottom in regions) + label_height * len(regions)
+            comparison = Image.new('RGB', (width * 3, canvas_height))
             draw = ImageDraw.Draw(comparison)
             try:
                 font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
             except:
                 font = ImageFont.load_default()
 
-            draw.text((10, 10), "BASELINE (Protected)", fill=(0, 255, 0), font=font)
-            draw.text((width + 10, 10), "CURRENT (Scanned)", fill=(0, 255, 0), font=font)
-            draw.text((width * 2 + 10, 10), "DIFF (Green=Changed)", fill=(0, 255, 0), font=font)
+            y = 0
+            for top, bottom in regions:
+                similarity_map = region_map(top, bottom) if region_map else ssim_diff[top:bottom]
+                if similarity_map.ndim == 3:
+                    similarity_map = similarity_map.mean(axis=2)
+
+                # Create diff highlight image (Green energy constructs)
+                diff_highlight = (np.clip(similarity_map, 0, 1) * 255).astype(np.uint8)
+                diff_highlight = 255 - diff_highlight  # Invert (dark = different)
+
+                # Apply colormap (green for differences - Green Lantern style!)
+                diff_colored = np.zeros((*diff_highlight.shape, 3), dtype=np.uint8)
+                diff_colored[:, :, 0] = 255 - diff_highlight  # Red channel (inverse)
+                diff_colored[:, :, 1] = diff_highlight  # Green channel (GL power!)
+                diff_colored[:, :, 2] = 255 - diff_highlight  # Blue channel (inverse)
+
+                if not whole_image:
+                    draw.text((10, y + 3), f"Rows {top}-{bottom}", fill=(0, 255, 0), font=font)
+                    y += label_height
+
+                # Paste images
+                box = (0, top, width, bottom)
+                comparison.paste(baseline.crop(box), (0, y))
+                comparison.paste(new.crop(box), (width, y))
+                comparison.paste(Image.fromarray(diff_colored), (width * 2, y))
+                y += bottom - top
+
+            # Add labels with Green Lantern flair
+            label_y = 10 if whole_image else 3
+            draw.text((width // 2, label_y), "BASELINE (Protected)", fill=(0, 255, 0), font=font)
+            draw.text((width + width // 2, label_y), "CURRENT (Scanned)", fill=(0, 255, 0), font=font)
+            draw.text((width * 2 + width // 2, label_y), "DIFF (Green=Changed)", fill=(0, 255, 0), font=font)
 
             # Save diff image
             diff_path = self.diff_dir / f"{test_name}_diff_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
@@ -414,6 +704,7 @@ class GreenLanternVisual:
             baseline_path.unlink()
             if meta_path.exists():
                 meta_path.unlink()
+            self._invalidate_baseline(test_name)
 
             logger.info(f"💚 Green Lantern deleted construct: {test_name}")
 
@@ -480,31 +771,91 @@ class GreenLanternVisual:
         """Alias for store_baseline"""
         return self.store_baseline(image_path, test_name, metadata)
 
-    def batch_compare(self, image_paths: List[tuple], threshold: float = 0.95) -> Dict[str, Any]:
+    def batch_compare(self, image_paths: List[tuple], threshold: float = 0.95,
+                      max_workers: Optional[int] = None, pixel_precheck: bool = True) -> Dict[str, Any]:
         """
         💚 Batch compare multiple screenshots to their baselines
 
+        Byte-identical screenshots are settled in this process; the rest are
+        compared in a process pool (each worker keeps its own baseline cache;
+        combine with use_npy_cache so workers share memory-mapped baselines).
+
         Args:
             image_paths: List of tuples [(image_path, test_name), ...]
             threshold: Similarity threshold
+            max_workers: SSIM worker processes (default: CPU count; 1 = in-process)
+            pixel_precheck: Skip SSIM when the decoded pixels are identical
 
         Returns:
             Batch comparison results
         """
-        results = []
-        for image_path, test_name in image_paths:
+        jobs = list(image_paths)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        remaining = []
+        prechecked = 0
+
+        for position, (image_path, test_name) in enumerate(jobs):
+            baseline_path = self.baseline_dir / f"{test_name}.png"
+            try:
+                if PIL_AVAILABLE and NUMPY_AVAILABLE and baseline_path.exists() \
+                        and self._files_identical(baseline_path, image_path):
+                    results[position] = {
+                        'test_name': test_name,
+                        'comparison': self._build_comparison_result(
+                            test_name, 1.0, threshold, 0.0, None, baseline_path, image_path, 'byte_identical'
+                        )
+                    }
+                    prechecked += 1
+                    continue
+            except OSError:
+                pass  # compare_to_baseline reports the problem
+            remaining.append(position)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(remaining))
+        if workers > 1:
             try:
-                comparison = self.compare_to_baseline(image_path, test_name, threshold)
-                results.append({
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_batch_worker,
+                    initargs=(str(self.baseline_dir), self.baseline_cache_size, self.use_npy_cache)
+                ) as executor:
+                    futures = {
+                        executor.submit(_batch_compare_worker, jobs[position][0], jobs[position][1],
+                                        threshold, pixel_precheck): position
+                        for position in remaining
+                    }
+                    for future in as_completed(futures):
+                        position = futures[future]
+                        test_name = jobs[position][1]
+                        try:
+                            results[position] = {'test_name': test_name, 'comparison': future.result()}
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            results[position] = {'test_name': test_name, 'error': str(e)}
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"  ⚠️ SSIM process pool unavailable, comparing in-process: {e}")
+
+        for position in remaining:
+            if results[position] is not None:
+                continue
+            image_path, test_name = jobs[position]
+            try:
+                comparison = self.compare_to_baseline(image_path, test_name, threshold, pixel_precheck)
+                results[position] = {
                     'test_name': test_name,
                     'comparison': comparison
-                })
+                }
             except Exception as e:
-                results.append({
+                results[position] = {
                     'test_name': test_name,
                     'error': str(e)
-                })
+                }
 
+        prechecked += sum(
+            1 for position in remaining
+            if results[position].get('comparison', {}).get('precheck')
+        )
         passed = sum(1 for r in results if not r.get('comparison', {}).get('is_regression', True))
         total = len(results)
 
@@ -513,6 +864,7 @@ class GreenLanternVisual:
             'passed': passed,
             'failed': total - passed,
             'pass_rate': (passed / total * 100) if total > 0 else 0,
+            'prechecked': prechecked,
             'results': results
         }
 
@@ -657,6 +1009,25 @@ class GreenLanternVisual:
             logger.error(f"Failed to save baseline metadata {test_name}: {e}")
 
 
+# Process-pool workers for batch_compare - one Green Lantern (and baseline cache) per process
+_batch_worker_lantern: Optional['GreenLanternVisual'] = None
+
+
+def _init_batch_worker(baseline_dir: str, baseline_cache_size: int, use_npy_cache: bool):
+    global _batch_worker_lantern
+    _batch_worker_lantern = GreenLanternVisual(
+        baseline_dir,
+        baseline_cache_size=baseline_cache_size,
+        use_npy_cache=use_npy_cache
+    )
+    _batch_worker_lantern.narrator = None
+
+
+def _batch_compare_worker(image_path: str, test_name: str, threshold: float,
+                          pixel_precheck: bool) -> Dict[str, Any]:
+    return _batch_worker_lantern.compare_to_baseline(image_path, test_name, threshold, pixel_precheck)
+
+
 # Main entry points - Green Lantern's Mission Interface
 def green_lantern_store_baseline(image_path: str, test_name: str,
                                  metadata: Optional[Dict] = None,
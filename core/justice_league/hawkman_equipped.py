@@ -24,9 +24,12 @@ from datetime import datetime
 from pathlib import Path
 import re
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .hero_base import HeroBase, HeroPriority
 from .green_arrow_visual_validator import GreenArrowVisualValidator
+from .figma_client import get_figma_client
+from .export_manifest import ExportManifest, read_png_header
 
 # Mission Control Narrator for coordinated communication
 try:
@@ -38,6 +41,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Frame export: the manifest is checkpointed this often so an interrupted export resumes
+MANIFEST_SAVE_EVERY = 25
+
 
 class OutputFormat(Enum):
     """Available output formats"""
@@ -115,6 +121,15 @@ class HawkmanEquipped(HeroBase):
         if not self.figma_token:
             logger.warning("⚠️ No Figma token provided. Set FIGMA_ACCESS_TOKEN env var")
 
+        # Shared Figma client: pooled session, version-keyed cache, global rate limit
+        self.figma_client = get_figma_client(self.figma_token) if self.figma_token else None
+
+        # Frame export: node IDs per image-URL request, concurrent CDN downloads
+        self.export_batch_size = int(os.getenv('HAWKMAN_EXPORT_BATCH_SIZE', '20'))
+        self.export_workers = int(os.getenv('HAWKMAN_EXPORT_WORKERS', '8'))
+        self.export_retries = 3
+        self.cdn_timeout = 60
+
         # Chrome DevTools MCP client
         self.chrome_mcp = chrome_mcp_client
 
@@ -260,32 +275,10 @@ class HawkmanEquipped(HeroBase):
         if not self.figma_token:
             raise ValueError("Figma token not set. Cannot fetch real data.")
 
-        headers = {"X-Figma-Token": self.figma_token}
-
-        # Build API URL
-        if node_id:
-            url = f"https://api.figma.com/v1/files/{file_key}/nodes?ids={node_id}"
-        else:
-            url = f"https://api.figma.com/v1/files/{file_key}"
-
-        logger.info(f"🔍 Fetching Figma structure: {url}")
+        logger.info(f"🔍 Fetching Figma structure: {file_key}" + (f" node {node_id}" if node_id else ""))
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Extract the relevant node
-            if node_id:
-                nodes = data.get('nodes', {})
-                if node_id in nodes:
-                    return nodes[node_id]['document']
-                else:
-                    raise ValueError(f"Node {node_id} not found in file")
-            else:
-                return data.get('document', {})
-
+            return self.figma_client.get_document(file_key, node_id)
         except requests.RequestException as e:
             logger.error(f"❌ Failed to fetch Figma data: {e}")
             raise
@@ -304,26 +297,16 @@ class HawkmanEquipped(HeroBase):
         if not self.figma_token:
             raise ValueError("Figma token not set. Cannot export image.")
 
-        headers = {"X-Figma-Token": self.figma_token}
-
-        # Request image export
-        url = f"https://api.figma.com/v1/images/{file_key}?ids={node_id}&format=png&scale=2"
-
         logger.info(f"📸 Exporting Figma image for node {node_id}")
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-
-            if 'images' not in data or node_id not in data['images']:
+            # Request image export
+            image_url = self.figma_client.get_images(file_key, [node_id], scale=2).get(node_id)
+            if not image_url:
                 raise ValueError(f"Failed to export image for node {node_id}")
 
-            image_url = data['images'][node_id]
-
             # Download the image
-            img_response = requests.get(image_url, timeout=30)
+            img_response = self.figma_client.session.get(image_url, timeout=30)
             img_response.raise_for_status()
 
             # Save to exports directory
@@ -439,6 +422,12 @@ class HawkmanEquipped(HeroBase):
         """
         Export all top-level frames from a Figma file as PNG images
 
+        Image URLs are requested in batches of export_batch_size node IDs and
+        downloaded concurrently (export_workers) on the shared Figma session.
+        Exported frames are recorded in the file directory's export manifest;
+        re-running an interrupted export of the same file version and scale
+        skips frames already on disk.
+
         Args:
             file_key: Figma file key
             output_dir: Optional custom output directory (defaults to figma_exports_dir)
@@ -461,8 +450,9 @@ class HawkmanEquipped(HeroBase):
         logger.info(f"🎨 Fetching all frames from Figma file: {file_key}")
 
         try:
-            # Fetch file structure (includes file name and pages)
-            file_data = self._fetch_figma_structure(file_key)
+            # Fetch file structure (includes file name and pages); the version keys resumption
+            file_response = self.figma_client.get_file(file_key)
+            file_data = file_response.get('document', {})
 
             # Extract Figma file name
             file_name = file_data.get('name', 'Figma-Export')
@@ -476,8 +466,8 @@ class HawkmanEquipped(HeroBase):
 
             # Find all exportable nodes (frames, components, component sets) organized by page
             exportable_types = {'FRAME', 'COMPONENT', 'COMPONENT_SET'}
-            total_nodes = 0
-            pages_with_nodes = []
+            all_nodes = []
+            page_count = 0
 
             if 'children' in file_data:
                 for child in file_data['children']:
@@ -486,108 +476,119 @@ class HawkmanEquipped(HeroBase):
                         page_nodes = []
 
                         # Each canvas (page) contains exportable nodes (either directly or inside SECTIONs)
-                        if 'children' in child:
-                            for element in child['children']:
-                                if element.get('type') in exportable_types:
-                                    # Direct exportable node under page
-                                    page_nodes.append({
-                                        'name': element.get('name', 'Unnamed'),
-                                        'id': element.get('id'),
-                                        'type': element.get('type')
-                                    })
-                                elif element.get('type') == 'SECTION':
-                                    # Exportable nodes inside a SECTION
-                                    if 'children' in element:
-                                        for node in element['children']:
-                                            if node.get('type') in exportable_types:
-                                                page_nodes.append({
-                                                    'name': node.get('name', 'Unnamed'),
-                                                    'id': node.get('id'),
-                                                    'type': node.get('type')
-                                                })
-
-                        if page_nodes:
-                            pages_with_nodes.append({
+                        for element in child.get('children', []):
+                            if element.get('type') in exportable_types:
+                                # Direct exportable node under page
+                                page_nodes.append(element)
+                            elif element.get('type') == 'SECTION':
+                                # Exportable nodes inside a SECTION
+                                page_nodes.extend(node for node in element.get('children', [])
+                                                  if node.get('type') in exportable_types)
+
+                        if not page_nodes:
+                            continue
+
+                        # Sanitize page name and create directory
+                        sanitized_page_name = self.sanitize_filename(page_name)
+                        page_dir = file_dir / sanitized_page_name
+                        page_dir.mkdir(exist_ok=True)
+                        page_count += 1
+                        logger.info(f"📂 Page: {page_name} -> {sanitized_page_name}/ ({len(page_nodes)} items)")
+
+                        for node in page_nodes:
+                            node_name = node.get('name', 'Unnamed')
+                            # Save into hierarchical structure: {file_name}/{page_name}/node.png
+                            image_filename = f"{self.sanitize_filename(node_name)}_{node.get('id')}.png"
+                            all_nodes.append({
+                                'node_name': node_name,
+                                'node_type': node.get('type'),
                                 'page_name': page_name,
-                                'nodes': page_nodes
+                                'node_id': node.get('id'),
+                                'file_path': str(page_dir / image_filename),
+                                'file_structure': f"{sanitized_file_name}/{sanitized_page_name}/{image_filename}"
                             })
-                            total_nodes += len(page_nodes)
 
+            total_nodes = len(all_nodes)
             if total_nodes == 0:
                 logger.warning("⚠️ No exportable nodes found in Figma file")
                 return []
 
-            logger.info(f"📋 Found {total_nodes} exportable nodes (frames, components, component sets) across {len(pages_with_nodes)} pages")
-
-            # Export each node into hierarchical structure
-            exported_files = []
-            headers = {"X-Figma-Token": self.figma_token}
-            current_node = 0
-
-            for page_data in pages_with_nodes:
-                page_name = page_data['page_name']
-                nodes = page_data['nodes']
-
-                # Sanitize page name and create directory
-                sanitized_page_name = self.sanitize_filename(page_name)
-                page_dir = file_dir / sanitized_page_name
-                page_dir.mkdir(exist_ok=True)
-
-                logger.info(f"📂 Page: {page_name} -> {sanitized_page_name}/ ({len(nodes)} items)")
-
-                for node in nodes:
-                    current_node += 1
-                    node_name = node['name']
-                    node_id = node['id']
-                    node_type = node['type']
-
-                    # Call progress callback if provided
-                    if progress_callback:
-                        progress_callback(current_node, total_nodes, node_name)
-
-                    logger.info(f"📸 Exporting [{current_node}/{total_nodes}]: {node_name} (Type: {node_type}, ID: {node_id})")
-
-                    # Request image export from Figma API
-                    url = f"https://api.figma.com/v1/images/{file_key}?ids={node_id}&format=png&scale={scale}"
-
-                    try:
-                        response = requests.get(url, headers=headers, timeout=30)
-                        response.raise_for_status()
-                        data = response.json()
-
-                        if 'images' not in data or node_id not in data['images']:
-                            logger.error(f"❌ Failed to export {node_name}: No image URL returned")
-                            continue
-
-                        image_url = data['images'][node_id]
-
-                        # Download the image
-                        img_response = requests.get(image_url, timeout=30)
-                        img_response.raise_for_status()
-
-                        # Sanitize node name for filename
-                        sanitized_node_name = self.sanitize_filename(node_name)
-
-                        # Save into hierarchical structure: {file_name}/{page_name}/node.png
-                        image_filename = f"{sanitized_node_name}_{node_id}.png"
-                        image_path = page_dir / image_filename
-
-                        with open(image_path, 'wb') as f:
-                            f.write(img_response.content)
-
-                        logger.info(f"✅ Saved: {sanitized_file_name}/{sanitized_page_name}/{image_filename}")
-
-                        exported_files.append({
-                            'node_name': node_name,
-                            'node_type': node_type,
-                            'page_name': page_name,
-                            'node_id': node_id,
-                            'file_path': str(image_path)
-                        })
+            logger.info(f"📋 Found {total_nodes} exportable nodes (frames, components, component sets) across {page_count} pages")
+
+            # Resume: frames the manifest recorded for this file version and scale are kept
+            manifest = ExportManifest(file_dir)
+            export_key = {'file_key': file_key, 'version': file_response.get('version'), 'scale': scale}
+            resume = manifest.meta.get('hawkman_export') == export_key
+            if not resume:
+                # Entries of another version or scale must not be resumed later
+                manifest.clear()
+            manifest.meta['hawkman_export'] = export_key
+
+            results: List[Optional[Dict[str, str]]] = [None] * total_nodes
+            progress = {'completed': 0}
+
+            def finish(index: int, result: Optional[Dict[str, str]]):
+                results[index] = result
+                progress['completed'] += 1
+                if progress_callback:
+                    progress_callback(progress['completed'], total_nodes, all_nodes[index]['node_name'])
+                if progress['completed'] % MANIFEST_SAVE_EVERY == 0:
+                    manifest.save()
+
+            pending = []
+            for index, node in enumerate(all_nodes):
+                if resume and manifest.get(node['file_path']):
+                    finish(index, self._export_result(node))
+                else:
+                    pending.append(index)
+            if len(pending) < total_nodes:
+                logger.info(f"♻️ Resuming export: {total_nodes - len(pending)} items already on disk")
 
-                    except requests.RequestException as e:
-                        logger.error(f"❌ Failed to export {node_name}: {e}")
-                        continue
+            def collect(future, index: int):
+                node = all_nodes[index]
+                try:
+                    future.result()
+                except (requests.RequestException, OSError) as e:
+                    logger.error(f"❌ Failed to export {node['node_name']}: {e}")
+                    finish(index, None)
+                    return
+                logger.info(f"✅ Saved: {node['file_structure']}")
+                finish(index, self._export_result(node))
+
+            # Batched URL requests on the calling thread, downloads on a pooled worker set
+            batches = [pending[i:i + self.export_batch_size] for i in range(0, len(pending), self.export_batch_size)]
+            downloads: Dict[Any, int] = {}
+            try:
+                with ThreadPoolExecutor(max_workers=self.export_workers) as pool:
+                    for batch_number, batch in enumerate(batches, 1):
+                        logger.info(f"📸 Requesting image URLs, batch {batch_number}/{len(batches)} ({len(batch)} items)")
+                        try:
+                            image_urls = self.figma_client.get_images(
+                                file_key, [all_nodes[i]['node_id'] for i in batch], scale=scale
+                            )
+                        except requests.RequestException as e:
+                            logger.error(f"❌ Failed to request image URLs for batch {batch_number}: {e}")
+                            image_urls = {}
+
+                        for index in batch:
+                            node = all_nodes[index]
+                            image_url = image_urls.get(node['node_id'])
+                            if not image_url:
+                                logger.error(f"❌ Failed to export {node['node_name']}: No image URL returned")
+                                finish(index, None)
+                                continue
+                            downloads[pool.submit(self._download_frame, image_url, node['file_path'], manifest)] = index
+
+                        # Report downloads that finished while this batch's URLs were rendering
+                        for future in [f for f in downloads if f.done()]:
+                            collect(future, downloads.pop(future))
+
+                    for future in as_completed(list(downloads)):
+                        collect(future, downloads.pop(future))
+            finally:
+                manifest.save()
+
+            exported_files = [result for result in results if result]
 
             logger.info(f"🎉 Successfully exported {len(exported_files)}/{total_nodes} items (frames, components, component sets)")
             logger.info(f"📁 Hierarchical structure: {file_dir}")
@@ -597,6 +598,44 @@ class HawkmanEquipped(HeroBase):
             logger.error(f"❌ Failed to fetch Figma file structure: {e}")
             raise
 
+    @staticmethod
+    def _export_result(node: Dict[str, str]) -> Dict[str, str]:
+        """Return value entry of export_all_frames_as_png for an exported node"""
+        return {key: node[key] for key in ('node_name', 'node_type', 'page_name', 'node_id', 'file_path')}
+
+    def _download_frame(self, image_url: str, image_path: str, manifest: ExportManifest):
+        """
+        Download a rendered frame from the CDN on the shared session and record it
+
+        Raises:
+            requests.RequestException: If every attempt fails
+        """
+        for attempt in range(self.export_retries):
+            try:
+                response = self.figma_client.session.get(image_url, timeout=self.cdn_timeout)
+                response.raise_for_status()
+                break
+            except requests.RequestException:
+                if attempt == self.export_retries - 1:
+                    raise
+                time.sleep(0.5 * 2 ** attempt)
+
+        content = response.content
+        # Write then rename: an interrupted export never leaves a truncated frame behind
+        tmp_path = f"{image_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, image_path)
+
+        header = read_png_header(content)
+        manifest.record(image_path, {
+            'width': header[0] if header else 0,
+            'height': header[1] if header else 0,
+            'mode': header[2] if header else 'unknown',
+            'flattened': False,
+            'bytes': len(content)
+        })
+
     # ==================== ENHANCED STRUCTURAL CAPABILITIES ====================
 
     def get_file_metadata(self, file_key: str) -> Dict[str, Any]:
@@ -22,6 +22,7 @@ Integration: Works independently or coordinated by Superman
 
 import logging
 import json
+import os
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -31,6 +32,7 @@ from enum import Enum
 from .hero_base import HeroBase, HeroPriority
 # Assuming we have access to Green Arrow
 from .green_arrow_visual_validator import GreenArrowVisualValidator
+from .figma_client import get_figma_client
 
 logger = logging.getLogger(__name__)
 
@@ -86,12 +88,14 @@ class HawkmanStructuralParser(HeroBase):
     - Oracle: Pattern storage and reuse
     """
 
-    def __init__(self, parsing_data_dir: Optional[str] = None):
+    def __init__(self, parsing_data_dir: Optional[str] = None, figma_token: Optional[str] = None):
         """
         Initialize Hawkman's structural parsing capabilities
 
         Args:
             parsing_data_dir: Directory for parsing data and reports
+            figma_token: Figma personal access token (or FIGMA_ACCESS_TOKEN env var);
+                without one, a mock structure is parsed
         """
         super().__init__(
             hero_name="Hawkman",
@@ -102,8 +106,12 @@ class HawkmanStructuralParser(HeroBase):
         self.parsing_data_dir = Path(parsing_data_dir) if parsing_data_dir else Path('/Users/admin/Documents/claudecode/Projects/aldo-vision/data/hawkman')
         self.parsing_data_dir.mkdir(parents=True, exist_ok=True)
 
+        # Shared Figma client (None: parse the development mock structure)
+        self.figma_token = figma_token or os.getenv('FIGMA_ACCESS_TOKEN')
+        self.figma_client = get_figma_client(self.figma_token) if self.figma_token else None
+
         # Initialize Green Arrow for visual validation
-        self.green_arrow = GreenArrowVisualValidator()
+        self.green_arrow = GreenArrowVisualValidator(figma_token=self.figma_token)
 
         # Parsing history database
         self.parsing_history_db = self.parsing_data_dir / 'parsing_history.json'
@@ -307,8 +315,10 @@ class HawkmanStructuralParser(HeroBase):
         """
         logger.info(f"🦅 Fetching Figma structure for {file_key}")
 
-        # TODO: Implement actual Figma API/MCP call
-        # For now, return mock structure for development
+        if self.figma_client:
+            return self.figma_client.get_document(file_key, node_id)
+
+        # No token: mock structure for development
         mock_structure = {
             'name': 'POC Test Component',
             'type': 'FRAME',
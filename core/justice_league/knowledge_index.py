@@ -0,0 +1,147 @@
+"""
+📚 KNOWLEDGE INDEX - Tokenized Inverted Index with BM25 Ranking
+
+In-memory full-text index for the Justice League knowledge base: documents
+are tokenized once when added, queries touch only the postings of their
+terms instead of serializing every entry.
+
+- Tokens: lowercase alphanumeric runs, so `button_testing` and
+  `button-testing` both index `button` and `testing`
+- Fields: content and tags share one posting list; tag tokens count
+  TAG_BOOST times (a tag is a stronger signal than a word in a sentence)
+- Prefix matching: a query token also matches indexed terms it prefixes
+  (`test` finds `testing`), keeping the old substring search's recall;
+  each query token scores its best-matching term only
+- Ranking: Okapi BM25 (k1=1.2, b=0.75)
+"""
+
+import bisect
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TAG_BOOST = 3
+# Shorter query tokens match exactly only - 'a' would otherwise hit half the vocabulary
+MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of a string"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def flatten_text(value: Any) -> Iterable[str]:
+    """Every string in a JSON-like value: dict keys and values, list items, scalars"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield str(key)
+            yield from flatten_text(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from flatten_text(item)
+    elif value is not None:
+        yield str(value)
+
+
+def document_terms(content: Any, tags: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Term frequencies of a knowledge entry (content tokens plus boosted tag tokens)"""
+    terms: Dict[str, int] = {}
+    for text in flatten_text(content):
+        for token in tokenize(text):
+            terms[token] = terms.get(token, 0) + 1
+    for tag in tags or []:
+        for token in tokenize(tag):
+            terms[token] = terms.get(token, 0) + TAG_BOOST
+    return terms
+
+
+class BM25Index:
+    """
+    📚 Inverted index over integer document ids
+
+    Not thread-safe on its own - the owner serializes add() and search().
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_lengths: Dict[int, int] = {}
+        self.total_length = 0
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: int, terms: Dict[str, int]):
+        """Index a document's term frequencies (see document_terms)"""
+        if doc_id in self.doc_lengths:
+            self.remove(doc_id)
+        for term, count in terms.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                self._vocabulary = None
+            self.postings[term][doc_id] = count
+        length = sum(terms.values())
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def remove(self, doc_id: int):
+        length = self.doc_lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+        for term in [t for t, docs in self.postings.items() if doc_id in docs]:
+            del self.postings[term][doc_id]
+            if not self.postings[term]:
+                del self.postings[term]
+                self._vocabulary = None
+
+    def expand(self, token: str) -> List[str]:
+        """Indexed terms a query token matches: itself and, if long enough, terms it prefixes"""
+        if len(token) < MIN_PREFIX_LENGTH:
+            return [token] if token in self.postings else []
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        vocabulary = self._vocabulary
+        start = bisect.bisect_left(vocabulary, token)
+        end = bisect.bisect_left(vocabulary, token + '\uffff', lo=start)
+        return vocabulary[start:end]
+
+    def search(self, query: str, candidates: Optional[Iterable[int]] = None) -> Dict[int, float]:
+        """
+        BM25 score of every document matching at least one query token
+
+        Args:
+            query: Free text
+            candidates: Restrict scoring to these document ids
+
+        Returns:
+            {doc_id: score}
+        """
+        allowed = set(candidates) if candidates is not None else None
+        document_count = len(self.doc_lengths)
+        if not document_count:
+            return {}
+        average_length = self.total_length / document_count
+
+        scores: Dict[int, float] = {}
+        for token in dict.fromkeys(tokenize(query)):
+            best: Dict[int, float] = {}
+            for term in self.expand(token):
+                docs = self.postings[term]
+                idf = math.log(1 + (document_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                for doc_id, frequency in docs.items():
+                    if allowed is not None and doc_id not in allowed:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / average_length)
+                    score = idf * frequency * (self.k1 + 1) / (frequency + norm)
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        return scores
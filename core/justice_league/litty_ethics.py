@@ -28,6 +28,13 @@ try:
 except ImportError:
     NARRATOR_AVAILABLE = False
 
+# Shared page snapshot (one capture per page for all browser-driven heroes)
+try:
+    from .page_snapshot import get_page_snapshot, js_round
+    PAGE_SNAPSHOT_AVAILABLE = True
+except ImportError:
+    PAGE_SNAPSHOT_AVAILABLE = False
+
 
 class LittyEthics:
     """
@@ -151,6 +158,9 @@ class LittyEthics:
         print(f"\n{self.emoji} Litty here! Let me check if you're thinking about the users...")
         print("(Or if you're just building for yourself and your developer friends)")
 
+        # One capture for all six checks (None -> each check runs its own script)
+        snapshot = get_page_snapshot(mcp_tools, url) if PAGE_SNAPSHOT_AVAILABLE else None
+
         results = {
             'hero': self.name,
             'emoji': self.emoji,
@@ -160,12 +170,12 @@ class LittyEthics:
             'ethics_score': 0,
             'grade': 'F',
             'checks': {
-                'dark_patterns': self._detect_dark_patterns(mcp_tools),
-                'inclusive_design': self._check_inclusive_design(mcp_tools),
-                'cognitive_load': self._analyze_cognitive_load(mcp_tools),
-                'user_respect': self._evaluate_user_respect(mcp_tools),
-                'accessibility_empathy': self._check_accessibility_empathy(mcp_tools),
-                'ethical_language': self._validate_ethical_language(mcp_tools)
+                'dark_patterns': self._detect_dark_patterns(mcp_tools, snapshot),
+                'inclusive_design': self._check_inclusive_design(mcp_tools, snapshot),
+                'cognitive_load': self._analyze_cognitive_load(mcp_tools, snapshot),
+                'user_respect': self._evaluate_user_respect(mcp_tools, snapshot),
+                'accessibility_empathy': self._check_accessibility_empathy(mcp_tools, snapshot),
+                'ethical_language': self._validate_ethical_language(mcp_tools, snapshot)
             },
             'guilt_trips': [],
             'user_stories': [],
@@ -194,7 +204,7 @@ class LittyEthics:
 
         return results
 
-    def _detect_dark_patterns(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _detect_dark_patterns(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         🕵️ Detect manipulative/deceptive design patterns
 
@@ -297,7 +307,10 @@ class LittyEthics:
         """
 
         try:
-            dark_patterns_found = eval_func(function=dark_pattern_check_js)
+            if snapshot is not None:
+                dark_patterns_found = self._dark_patterns_from_snapshot(snapshot)
+            else:
+                dark_patterns_found = eval_func(function=dark_pattern_check_js)
 
             # Count total dark patterns
             total_dark_patterns = sum(
@@ -320,7 +333,7 @@ class LittyEthics:
                 'severity': 'unknown'
             }
 
-    def _check_inclusive_design(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _check_inclusive_design(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         👵 Check if design works for ALL users (not just tech-savvy 25-year-olds)
 
@@ -400,7 +413,10 @@ class LittyEthics:
         """
 
         try:
-            results = eval_func(function=inclusive_check_js)
+            if snapshot is not None:
+                results = self._inclusive_design_from_snapshot(snapshot)
+            else:
+                results = eval_func(function=inclusive_check_js)
 
             total_issues = (
                 results.get('small_targets_count', 0) +
@@ -424,7 +440,7 @@ class LittyEthics:
                 'severity': 'unknown'
             }
 
-    def _analyze_cognitive_load(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _analyze_cognitive_load(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         🧠 Analyze cognitive complexity - is the interface overwhelming?
 
@@ -492,7 +508,10 @@ class LittyEthics:
         """
 
         try:
-            results = eval_func(function=cognitive_load_js)
+            if snapshot is not None:
+                results = self._cognitive_load_from_snapshot(snapshot)
+            else:
+                results = eval_func(function=cognitive_load_js)
 
             # Calculate cognitive load score
             issues = []
@@ -525,7 +544,7 @@ class LittyEthics:
                 'severity': 'unknown'
             }
 
-    def _evaluate_user_respect(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _evaluate_user_respect(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         🙏 Evaluate if the design respects users' time, attention, and autonomy
 
@@ -608,7 +627,10 @@ class LittyEthics:
         """
 
         try:
-            results = eval_func(function=user_respect_js)
+            if snapshot is not None:
+                results = self._user_respect_from_snapshot(snapshot)
+            else:
+                results = eval_func(function=user_respect_js)
 
             disrespects_count = results.get('disrespects_found', 0)
 
@@ -628,7 +650,7 @@ class LittyEthics:
                 'severity': 'unknown'
             }
 
-    def _check_accessibility_empathy(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _check_accessibility_empathy(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         ♿ Check if accessibility is implemented with empathy (not just checkboxes)
 
@@ -722,7 +744,10 @@ class LittyEthics:
         """
 
         try:
-            results = eval_func(function=a11y_empathy_js)
+            if snapshot is not None:
+                results = self._accessibility_empathy_from_snapshot(snapshot)
+            else:
+                results = eval_func(function=a11y_empathy_js)
 
             issues_count = results.get('issues_count', 0)
 
@@ -742,7 +767,7 @@ class LittyEthics:
                 'severity': 'unknown'
             }
 
-    def _validate_ethical_language(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _validate_ethical_language(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         💬 Validate language for ethical issues
 
@@ -806,7 +831,10 @@ class LittyEthics:
         """
 
         try:
-            results = eval_func(function=language_check_js)
+            if snapshot is not None:
+                results = self._ethical_language_from_snapshot(snapshot)
+            else:
+                results = eval_func(function=language_check_js)
 
             issues_count = results.get('issues_count', 0)
 
@@ -826,6 +854,278 @@ class LittyEthics:
                 'severity': 'unknown'
             }
 
+    # ==================== SNAPSHOT QUERIES ====================
+    # Python ports of the check scripts above, run against a PageSnapshot
+
+    def _dark_patterns_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        dark_patterns = {
+            'confirmshaming': [],
+            'hidden_costs': [],
+            'urgency_manipulation': [],
+            'forced_continuity': [],
+            'obstruction': [],
+            'misdirection': []
+        }
+
+        for btn in snapshot.query_selector_all('button, a, [role="button"]'):
+            text = btn.text_content.lower()
+            if any(p in text for p in ('no thanks', "i don't want", 'continue without', 'skip offer')):
+                if any(p in text for p in ('save money', 'premium', 'better', 'benefits')):
+                    dark_patterns['confirmshaming'].append({
+                        'element': btn.tag_name,
+                        'text': btn.text_content.strip()
+                    })
+
+        all_text = snapshot.body_text.lower()
+        for phrase in ['only', 'left', 'hurry', 'limited', 'expires', 'people viewing', 'last chance']:
+            if phrase in all_text:
+                dark_patterns['urgency_manipulation'].append({
+                    'phrase': phrase,
+                    'context': 'detected in page content'
+                })
+
+        price_count = len(snapshot.query_selector_all('[class*="price"], [class*="cost"], [class*="total"]'))
+        if price_count > 5:
+            dark_patterns['hidden_costs'].append({
+                'type': 'multiple_prices',
+                'count': price_count,
+                'warning': 'Many price elements may indicate hidden fees'
+            })
+
+        for link in snapshot.query_selector_all('a'):
+            text = link.text_content.lower()
+            if 'cancel' in text or 'unsubscribe' in text or 'delete account' in text:
+                font_size = link.font_size()
+                opacity = link.computed_float('opacity')
+                if font_size < 12 or opacity < 0.5:
+                    dark_patterns['obstruction'].append({
+                        'type': 'hidden_cancel_link',
+                        'fontSize': font_size,
+                        'opacity': opacity,
+                        'text': link.text_content.strip()
+                    })
+
+        pre_checked = [
+            cb for cb in snapshot.query_selector_all('input[type="checkbox"]')
+            if cb.prop('checked') and any(
+                term in (cb.get_attribute('name') or '') for term in ('newsletter', 'marketing', 'terms', 'privacy'))
+        ]
+        if pre_checked:
+            dark_patterns['misdirection'].append({
+                'type': 'pre_checked_boxes',
+                'count': len(pre_checked),
+                'warning': 'Pre-checked opt-ins without clear user consent'
+            })
+
+        return dark_patterns
+
+    def _inclusive_design_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        issues = {
+            'small_touch_targets': [],
+            'tiny_text': [],
+            'poor_contrast': [],
+            'complex_language': []
+        }
+
+        for el in snapshot.query_selector_all('button, a, input, select, textarea, [role="button"], [onclick]'):
+            if el.width > 0 and el.height > 0 and (el.width < 44 or el.height < 44):
+                issues['small_touch_targets'].append({
+                    'element': el.tag_name,
+                    'width': js_round(el.width),
+                    'height': js_round(el.height),
+                    'text': el.text_content.strip()[:30] or 'No text'
+                })
+
+        for el in snapshot.query_selector_all('p, span, div, li, td'):
+            font_size = el.font_size()
+            text = el.text_content.strip()
+            if text and len(text) > 20 and font_size < 14:
+                issues['tiny_text'].append({
+                    'fontSize': font_size,
+                    'element': el.tag_name,
+                    'preview': text[:50]
+                })
+
+        words = snapshot.body_text.split()
+        long_words = [w for w in words if len(w) > 12]
+        technical_terms = [w for w in words if any(t in w for t in ('API', 'SDK', 'JSON', 'OAuth', 'CRUD'))]
+        if len(long_words) > 50 or len(technical_terms) > 10:
+            issues['complex_language'].append({
+                'long_words_count': len(long_words),
+                'technical_terms_count': len(technical_terms),
+                'warning': 'May be difficult for non-technical users'
+            })
+
+        return {
+            'small_targets_count': len(issues['small_touch_targets']),
+            'tiny_text_count': len(issues['tiny_text']),
+            'complex_language_issues': len(issues['complex_language']),
+            'details': issues
+        }
+
+    def _cognitive_load_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        interactive = snapshot.query_selector_all(
+            'button, a, input[type="button"], input[type="submit"], [role="button"]')
+
+        walls_of_text = []
+        for el in snapshot.query_selector_all('p, div'):
+            text = el.text_content.strip()
+            if text:
+                word_count = len(text.split())
+                if word_count > 200:
+                    walls_of_text.append({
+                        'wordCount': word_count,
+                        'preview': text[:100] + '...'
+                    })
+
+        return {
+            'choices_count': len(interactive),
+            'navigation_complexity': len(snapshot.query_selector_all('nav a, [role="navigation"] a')),
+            'visible_elements': sum(
+                1 for el in snapshot.elements
+                if el.computed('display') != 'none' and el.computed('visibility') != 'hidden'
+            ),
+            'primary_cta_count': sum(
+                1 for el in interactive
+                if el.font_size() > 16 and el.computed('backgroundColor') != 'rgba(0, 0, 0, 0)'
+            ),
+            'walls_of_text': walls_of_text
+        }
+
+    def _user_respect_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        disrespects = []
+
+        for video in snapshot.query_selector_all('video'):
+            if video.prop('autoplay') and not video.prop('muted'):
+                disrespects.append({
+                    'type': 'autoplay_video',
+                    'severity': 'high',
+                    'reason': 'Auto-playing video with sound is disrespectful'
+                })
+
+        for audio in snapshot.query_selector_all('audio'):
+            if audio.prop('autoplay'):
+                disrespects.append({
+                    'type': 'autoplay_audio',
+                    'severity': 'high',
+                    'reason': 'Auto-playing audio is disrespectful'
+                })
+
+        modals = snapshot.query_selector_all(
+            '[role="dialog"], [class*="modal"], [class*="popup"], [class*="overlay"]')
+        if len(modals) > 3:
+            disrespects.append({
+                'type': 'excessive_modals',
+                'count': len(modals),
+                'severity': 'medium',
+                'reason': 'Too many pop-ups interrupt user flow'
+            })
+
+        for banner in snapshot.query_selector_all('[class*="cookie"], [class*="consent"], [id*="cookie"]'):
+            if len(banner.query_selector_all('button')) == 1:
+                disrespects.append({
+                    'type': 'cookie_dark_pattern',
+                    'severity': 'high',
+                    'reason': 'Cookie banner only has Accept button (no Decline)'
+                })
+
+        signup_forms = snapshot.query_selector_all('form[action*="signup"], form[action*="register"]')
+        body_text = snapshot.body_text.lower()
+        if signup_forms and ('must sign up' in body_text or 'please register' in body_text):
+            disrespects.append({
+                'type': 'forced_registration',
+                'severity': 'medium',
+                'reason': 'Content locked behind forced registration'
+            })
+
+        return {
+            'disrespects_found': len(disrespects),
+            'details': disrespects
+        }
+
+    def _accessibility_empathy_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        empathy_issues = []
+
+        for img in snapshot.query_selector_all('img'):
+            alt = img.get_attribute('alt') or ''
+            if not alt:
+                empathy_issues.append({
+                    'type': 'missing_alt',
+                    'severity': 'high',
+                    'element': 'img',
+                    'reason': 'Screen reader users hear "image" - not helpful'
+                })
+            elif alt.lower() in ('image', 'photo', 'picture'):
+                empathy_issues.append({
+                    'type': 'generic_alt',
+                    'severity': 'medium',
+                    'alt': alt,
+                    'reason': 'Alt text too generic - not descriptive'
+                })
+
+        for el in snapshot.query_selector_all('[aria-label]'):
+            label = el.get_attribute('aria-label')
+            if len(label) < 3 or label.lower() in ('button', 'link'):
+                empathy_issues.append({
+                    'type': 'generic_aria',
+                    'severity': 'medium',
+                    'label': label,
+                    'reason': 'ARIA label not descriptive enough'
+                })
+
+        skip_links = [
+            a for a in snapshot.query_selector_all('a')
+            if 'skip' in a.text_content.lower() or
+            '#main' in a.prop('href', '') or '#content' in a.prop('href', '')
+        ]
+        if not skip_links:
+            empathy_issues.append({
+                'type': 'no_skip_link',
+                'severity': 'medium',
+                'reason': 'No skip navigation link for keyboard users'
+            })
+
+        focusable = snapshot.query_selector_all('a, button, input, select, textarea, [tabindex]:not([tabindex="-1"])')
+        no_focus_indicator = sum(
+            1 for el in focusable if el.computed('outline') == 'none' and el.computed('boxShadow') == 'none'
+        )
+        if no_focus_indicator > len(focusable) * 0.5:
+            empathy_issues.append({
+                'type': 'poor_focus_indicators',
+                'severity': 'high',
+                'count': no_focus_indicator,
+                'reason': 'Many elements lack visible focus indicators'
+            })
+
+        return {
+            'issues_count': len(empathy_issues),
+            'details': empathy_issues
+        }
+
+    def _ethical_language_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        body_text = snapshot.body_text.lower()
+        issues = []
+
+        term_groups = [
+            ('gendered_language', ['guys', 'mankind', 'manpower', 'man-hours'], 'low', 'Use inclusive alternatives'),
+            ('ableist_language', ['crazy', 'insane', 'dumb', 'stupid', 'lame'], 'medium', 'Use neutral alternatives'),
+            ('violent_metaphor', ['kill', 'destroy', 'crush', 'annihilate'], 'low', 'Use gentler language')
+        ]
+        for issue_type, terms, severity, suggestion in term_groups:
+            for term in terms:
+                if term in body_text:
+                    issues.append({
+                        'type': issue_type,
+                        'term': term,
+                        'severity': severity,
+                        'suggestion': suggestion
+                    })
+
+        return {
+            'issues_count': len(issues),
+            'details': issues
+        }
+
     def _generate_guilt_trips(self, checks: Dict) -> List[str]:
         """
         😢 Generate guilt-inducing messages based on failures
@@ -25,6 +25,8 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+from .secret_scanner import SecretScanner
+
 # Mission Control Narrator for coordinated communication
 try:
     from .mission_control_narrator import get_narrator
@@ -62,6 +64,12 @@ class MartianManhunterSecurity:
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.vulnerability_db = self.config_dir / 'vulnerabilities.json'
 
+        # Source files worth scanning for secrets; results cached per file hash
+        self.secret_scanner = SecretScanner(
+            include=('*.js', '*.jsx', '*.ts', '*.tsx', '*.py', '*.env', '.env', '.env.*'),
+            cache_dir=self.config_dir / 'secret_scan'
+        )
+
         # Hero identity for narrator integration
         self.hero_name = "Martian Manhunter"
         self.hero_emoji = "🧠"
@@ -433,42 +441,35 @@ class MartianManhunterSecurity:
         Returns:
             List of exposed secrets
         """
-        vulnerabilities = []
         source_path = target_data.get('source_code_path')
         env_files = target_data.get('env_files', [])
+        findings = []
+
+        # One pass per file over all patterns; unchanged files come from the scan cache
+        try:
+            if source_path and Path(source_path).exists():
+                findings.extend(self.secret_scanner.scan(source_path))
+            findings.extend(self.secret_scanner.scan_files(path for path in env_files if Path(path).is_file()))
+            if target_data.get('html_content'):
+                findings.extend(self.secret_scanner.scan_text(target_data['html_content'], 'html_content'))
+        except Exception as e:
+            logger.warning(f"Secrets detection failed: {e}")
 
-        # Check for hardcoded secrets
-        secret_patterns = [
-            (r'api[_-]?key\s*=\s*["\'][^"\']{20,}["\']', 'Hardcoded API key'),
-            (r'password\s*=\s*["\'][^"\']+["\']', 'Hardcoded password'),
-            (r'secret\s*=\s*["\'][^"\']+["\']', 'Hardcoded secret'),
-            (r'token\s*=\s*["\'][^"\']{20,}["\']', 'Hardcoded token'),
-            (r'(sk|pk)_live_[a-zA-Z0-9]{20,}', 'Stripe API key'),
-            (r'AIza[0-9A-Za-z\\-_]{35}', 'Google API key'),
-            (r'AKIA[0-9A-Z]{16}', 'AWS Access Key'),
-        ]
-
-        if source_path and Path(source_path).exists():
-            try:
-                for file_path in Path(source_path).rglob('*.{js,ts,py,env}'):
-                    if '.git' in str(file_path):
-                        continue
-
-                    content = file_path.read_text()
-                    for pattern, description in secret_patterns:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            vulnerabilities.append({
-                                'id': f'SEC-{len(vulnerabilities)+1:03d}',
-                                'severity': 'critical',
-                                'category': 'Exposed Secrets',
-                                'title': f'{description} detected in code',
-                                'description': f'Found in {file_path.name}',
-                                'recommendation': 'Move secrets to environment variables or secret manager',
-                                'martian_manhunter_says': 'I sense your secrets exposed in the code!'
-                            })
-            except Exception as e:
-                logger.warning(f"Secrets detection failed: {e}")
+        vulnerabilities = []
+        for finding in findings:
+            vulnerabilities.append({
+                'id': f'SEC-{len(vulnerabilities)+1:03d}',
+                'type': finding['type'],
+                'severity': 'critical',
+                'category': 'Exposed Secrets',
+                'title': f"{finding['description']} detected in code",
+                'description': f"Found in {finding['file']}:{finding['line']}",
+                'file': finding['file'],
+                'line': finding['line'],
+                'excerpt': finding['excerpt'],
+                'recommendation': 'Move secrets to environment variables or secret manager',
+                'martian_manhunter_says': 'I sense your secrets exposed in the code!'
+            })
 
         logger.info(f"  ✓ Detected {len(vulnerabilities)} exposed secrets")
         return vulnerabilities
@@ -8,6 +8,11 @@ Transforms technical logs into engaging superhero team banter with:
 - Progress bars with personality
 - Tactical commands + friendly banter mix
 
+Output goes through a sink (see narrator_sink): synchronous stdout by
+default, a queued background writer for heroes narrating from hot loops
+(NARRATOR_SINK=queued), or nothing at all in record mode. The conversation
+log keeps the latest log_size entries.
+
 "Watch the Justice League think, coordinate, and accomplish missions!" 🦸‍♂️
 """
 
@@ -16,6 +21,13 @@ import sys
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
+try:
+    from .narrator_sink import LINE, PROGRESS, VERBOSE, NullSink, create_sink
+except ImportError:
+    from narrator_sink import LINE, PROGRESS, VERBOSE, NullSink, create_sink
+
+DEFAULT_LOG_SIZE = 5_000
+
 
 class NarratorMode(Enum):
     """Narrator verbosity modes"""
@@ -23,6 +35,7 @@ class NarratorMode(Enum):
     TECHNICAL = "technical"   # Legacy: logger.info() style (for developers)
     SILENT = "silent"         # Minimal: Essential output only (for CI/CD)
     DEBUG = "debug"           # Everything: Full logs + banter (for troubleshooting)
+    RECORD = "record"         # Batch runs: nothing printed, conversation log still recorded
 
 
 class BanterStyle(Enum):
@@ -47,12 +60,15 @@ class MissionControlNarrator:
     - Mission milestones and phase transitions
     """
 
-    def __init__(self, mode: str = "narrative"):
+    def __init__(self, mode: str = "narrative", sink: Optional[Any] = None,
+                 log_size: int = DEFAULT_LOG_SIZE):
         """
         Initialize Mission Control Narrator
 
         Args:
-            mode: Narrator mode (narrative, technical, silent, debug)
+            mode: Narrator mode (narrative, technical, silent, debug, record)
+            sink: Output sink (default: NARRATOR_SINK env, else stdout; record mode discards)
+            log_size: Conversation log entries kept
         """
         # Parse mode from string or enum
         if isinstance(mode, str):
@@ -63,6 +79,14 @@ class MissionControlNarrator:
         else:
             self.mode = mode
 
+        if self.mode == NarratorMode.RECORD:
+            self.sink = NullSink()
+        else:
+            self.sink = sink or create_sink(os.getenv('NARRATOR_SINK', 'stdout'))
+
+        self.log_size = log_size
+        # Trimmed in batches so appends stay O(1) amortized
+        self._log_trim_slack = max(1, log_size // 10)
         self.conversation_log = []
         self.step_counter = {}  # Track sequential thinking steps per hero
         self.last_progress = None  # Track last progress update
@@ -73,8 +97,31 @@ class MissionControlNarrator:
         return self.mode != NarratorMode.SILENT
 
     def is_verbose(self) -> bool:
-        """Check if verbose output (narrative or debug)"""
-        return self.mode in [NarratorMode.NARRATIVE, NarratorMode.DEBUG]
+        """Check if verbose output (narrative or debug; record mode records it)"""
+        return self.mode in [NarratorMode.NARRATIVE, NarratorMode.DEBUG, NarratorMode.RECORD]
+
+    def _write(self, text: str = "", end: str = "\n", kind: str = LINE, key: Optional[str] = None):
+        """Send a formatted line to the sink"""
+        self.sink.write(text, end=end, kind=kind, key=key)
+
+    def _record(self, entry: Dict[str, Any]):
+        """Append to the conversation log, dropping the oldest entries past log_size"""
+        log = self.conversation_log
+        log.append(entry)
+        if len(log) > self.log_size + self._log_trim_slack:
+            del log[:len(log) - self.log_size]
+
+    def flush(self):
+        """Write any output still queued in the sink"""
+        self.sink.flush()
+
+    def close(self):
+        """Flush and release the sink (stops a queued sink's writer thread)"""
+        self.sink.close()
+
+    def get_output_stats(self) -> Dict[str, Any]:
+        """Sink statistics (queue depth, dropped and coalesced lines for a queued sink)"""
+        return self.sink.stats()
 
     def show_justice_league_banner(self, mission_type: str = "", force: bool = False):
         """
@@ -98,14 +145,14 @@ class MissionControlNarrator:
     ╚╝╚═╝╚═╝ ╩ ╩╚═╝╚═╝  ╩═╝╚═╝╩ ╩╚═╝╚═╝╚═╝
 ══════════════════════════════════════════════════════════════════════════════
         """
-        print(banner)
+        self._write(banner)
 
         if mission_type:
             mission_line = f"     🦸 MISSION: {mission_type}"
-            print(mission_line.center(78))
-            print("═" * 78)
+            self._write(mission_line.center(78))
+            self._write("═" * 78)
 
-        print()  # Blank line after banner
+        self._write()  # Blank line after banner
 
         # Mark banner as shown for this session
         self.banner_shown = True
@@ -228,8 +275,8 @@ class MissionControlNarrator:
         if technical_info and self.mode == NarratorMode.NARRATIVE:
             formatted += f" [{technical_info}]"
 
-        print(formatted)
-        self.conversation_log.append({
+        self._write(formatted)
+        self._record({
             "hero": hero,
             "message": message,
             "style": style,
@@ -273,9 +320,9 @@ class MissionControlNarrator:
             prefix = f"[Step {step}]"
 
         formatted = f"{hero}: {prefix} {thought}"
-        print(formatted)
+        self._write(formatted, kind=VERBOSE)
 
-        self.conversation_log.append({
+        self._record({
             "hero": hero,
             "thought": thought,
             "step": step,
@@ -312,8 +359,8 @@ class MissionControlNarrator:
             context_str = ", ".join(f"{k}={v}" for k, v in context.items())
             formatted += f" [{context_str}]"
 
-        print(formatted)
-        self.conversation_log.append({
+        self._write(formatted, kind=VERBOSE)
+        self._record({
             "from": from_hero,
             "to": to_hero,
             "task": task,
@@ -356,13 +403,13 @@ class MissionControlNarrator:
         else:
             output = f"\r{hero}: {bar} {current}/{total} ({percentage}%)"
 
-        # Print with carriage return (overwrites previous line)
-        print(output, end='', flush=True)
+        # Carriage return overwrites the previous line; the final update is never sampled away
+        self._write(output, end='', kind=PROGRESS if current < total else LINE, key=hero)
         self.last_progress = (current, total)
 
         # Newline when complete
         if current >= total:
-            print()  # Move to next line
+            self._write()  # Move to next line
 
             # Reset step counter for this hero (for next sequential thinking)
             if hero in self.step_counter:
@@ -387,13 +434,13 @@ class MissionControlNarrator:
             return
 
         border = symbol * 70
-        print()
-        print(border)
-        print(f"  {milestone}")
-        print(border)
-        print()
+        self._write()
+        self._write(border)
+        self._write(f"  {milestone}")
+        self._write(border)
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "milestone",
             "milestone": milestone
         })
@@ -409,9 +456,9 @@ class MissionControlNarrator:
             return
 
         if compact:
-            print("-" * 40)
+            self._write("-" * 40, kind=VERBOSE)
         else:
-            print()
+            self._write(kind=VERBOSE)
 
     def technical_detail(self, label: str, value: str):
         """
@@ -428,7 +475,7 @@ class MissionControlNarrator:
         if not self.is_enabled():
             return
 
-        print(f"   {label}: {value}")
+        self._write(f"   {label}: {value}")
 
     def completion_summary(
         self,
@@ -452,17 +499,17 @@ class MissionControlNarrator:
         if not self.is_enabled():
             return
 
-        print()
-        print("=" * 70)
-        print(f"  {status}")
-        print("=" * 70)
+        self._write()
+        self._write("=" * 70)
+        self._write(f"  {status}")
+        self._write("=" * 70)
 
         for key, value in details.items():
             # Format key: convert underscore to space, title case
             formatted_key = key.replace("_", " ").title()
-            print(f"   {formatted_key}: {value}")
+            self._write(f"   {formatted_key}: {value}")
 
-        self.conversation_log.append({
+        self._record({
             "type": "completion",
             "status": status,
             "details": details
@@ -496,14 +543,14 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print()
-        print("=" * 78)
-        print(f"  {leader}: STRATEGY SESSION")
-        print("=" * 78)
-        print(f"  Topic: {topic}")
-        print(f"  Participants: {', '.join(heroes)}")
-        print("=" * 78)
-        print()
+        self._write()
+        self._write("=" * 78)
+        self._write(f"  {leader}: STRATEGY SESSION")
+        self._write("=" * 78)
+        self._write(f"  Topic: {topic}")
+        self._write(f"  Participants: {', '.join(heroes)}")
+        self._write("=" * 78)
+        self._write()
 
     def strategy_contribution(
         self,
@@ -536,19 +583,19 @@ class MissionControlNarrator:
             return
 
         # Show hero's main perspective
-        print(f"{hero}: {perspective}")
+        self._write(f"{hero}: {perspective}")
 
         # Show sequential thinking if provided
         if reasoning:
             for i, thought in enumerate(reasoning, 1):
                 category = "Analyzing" if i < len(reasoning) else "Conclusion"
-                print(f"{hero}: [{category}] {thought}")
+                self._write(f"{hero}: [{category}] {thought}")
 
         # Show recommendation if provided
         if recommendation:
-            print(f"{hero}: 💡 Recommendation: {recommendation}")
+            self._write(f"{hero}: 💡 Recommendation: {recommendation}")
 
-        print()
+        self._write()
 
     def strategy_decision(
         self,
@@ -585,30 +632,30 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print("─" * 78)
-        print(f"{leader}: DECISION")
-        print("─" * 78)
+        self._write("─" * 78)
+        self._write(f"{leader}: DECISION")
+        self._write("─" * 78)
 
         # Show sequential thinking if provided
         if analysis:
             for i, thought in enumerate(analysis, 1):
                 category = "Strategizing" if i < len(analysis) else "Commanding"
-                print(f"{leader}: [{category}] {thought}")
-            print()
+                self._write(f"{leader}: [{category}] {thought}")
+            self._write()
 
         # Show final decision
-        print(f"{leader}: ✅ {decision}")
-        print()
+        self._write(f"{leader}: ✅ {decision}")
+        self._write()
 
         # Show next steps if provided
         if next_steps:
-            print(f"{leader}: 📋 Team Assignments:")
+            self._write(f"{leader}: 📋 Team Assignments:")
             for hero, task in next_steps.items():
-                print(f"  • {hero}: {task}")
-            print()
+                self._write(f"  • {hero}: {task}")
+            self._write()
 
-        print("=" * 78)
-        print()
+        self._write("=" * 78)
+        self._write()
 
     def debate_start(
         self,
@@ -636,22 +683,22 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print()
-        print("🔥" * 39)
-        print(f"  {initiator}: INVESTIGATION COMPLETE")
-        print("🔥" * 39)
-        print()
-        print(f"{initiator}: {issue}")
-        print()
+        self._write()
+        self._write("🔥" * 39)
+        self._write(f"  {initiator}: INVESTIGATION COMPLETE")
+        self._write("🔥" * 39)
+        self._write()
+        self._write(f"{initiator}: {issue}")
+        self._write()
 
         if context:
-            print("📋 Context:")
+            self._write("📋 Context:")
             for key, value in context.items():
                 formatted_key = key.replace("_", " ").title()
-                print(f"  • {formatted_key}: {value}")
-            print()
+                self._write(f"  • {formatted_key}: {value}")
+            self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_start",
             "initiator": initiator,
             "issue": issue,
@@ -701,10 +748,10 @@ class MissionControlNarrator:
         if evidence:
             formatted += f" [{evidence}]"
 
-        print(formatted)
-        print()
+        self._write(formatted)
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_position",
             "hero": hero,
             "position": position,
@@ -743,10 +790,10 @@ class MissionControlNarrator:
         if concern:
             formatted += f" [⚠️ {concern}]"
 
-        print(formatted)
-        print()
+        self._write(formatted)
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_question",
             "from": from_hero,
             "to": to_hero,
@@ -778,10 +825,10 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print(f"{hero}: [{evidence_type}] {finding}")
-        print()
+        self._write(f"{hero}: [{evidence_type}] {finding}")
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_evidence",
             "hero": hero,
             "finding": finding,
@@ -812,12 +859,12 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print(f"{hero}: 💡 Proposal: {proposal}")
+        self._write(f"{hero}: 💡 Proposal: {proposal}")
         if approach:
-            print(f"  Approach: {approach}")
-        print()
+            self._write(f"  Approach: {approach}")
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_proposal",
             "hero": hero,
             "proposal": proposal,
@@ -848,13 +895,13 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print(f"{hero}: ⚡ MISSION-CRITICAL QUESTION:")
-        print(f"  \"{question}\"")
+        self._write(f"{hero}: ⚡ MISSION-CRITICAL QUESTION:")
+        self._write(f"  \"{question}\"")
         if stakes:
-            print(f"  Stakes: {stakes}")
-        print()
+            self._write(f"  Stakes: {stakes}")
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_critical_question",
             "hero": hero,
             "question": question,
@@ -893,30 +940,30 @@ class MissionControlNarrator:
         if not self.is_verbose():
             return
 
-        print("─" * 78)
-        print(f"{leader}: DECISION")
-        print("─" * 78)
+        self._write("─" * 78)
+        self._write(f"{leader}: DECISION")
+        self._write("─" * 78)
 
         # Show sequential thinking if provided
         if rationale:
             for i, thought in enumerate(rationale, 1):
                 category = "Analyzing Team Input" if i < len(rationale) else "Deciding"
                 self.hero_thinks(leader, thought, category=category)
-            print()
+            self._write()
 
         # Show final decision
-        print(f"{leader}: ✅ {decision}")
-        print()
+        self._write(f"{leader}: ✅ {decision}")
+        self._write()
 
         # Show team agreement if provided
         if team_agreement:
-            print(f"  Team Status: {team_agreement}")
-            print()
+            self._write(f"  Team Status: {team_agreement}")
+            self._write()
 
-        print("=" * 78)
-        print()
+        self._write("=" * 78)
+        self._write()
 
-        self.conversation_log.append({
+        self._record({
             "type": "debate_resolution",
             "leader": leader,
             "decision": decision,
@@ -9,14 +9,22 @@ Tracks every mission from start to finish:
 - Learnings extracted for continuous improvement
 
 Enables self-evolution through comprehensive mission documentation.
+
+Completed missions are appended to a SQLite mission store next to the
+legacy missions JSON file (missions.json -> missions.db); the JSON file is
+imported once and no longer rewritten.
 """
 
-import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 
+try:
+    from .mission_store import MissionStore
+except ImportError:
+    from mission_store import MissionStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,31 +45,18 @@ class MissionLogger:
         Initialize mission logger
 
         Args:
-            missions_db_path: Path to missions database JSON file
+            missions_db_path: Path to the legacy missions database JSON file;
+                the mission store lives beside it with a .db suffix
         """
         self.missions_db = Path(missions_db_path)
         self.missions_db.parent.mkdir(parents=True, exist_ok=True)
 
-        # Initialize database if it doesn't exist
-        if not self.missions_db.exists():
-            self._initialize_database()
+        self.store = MissionStore(self.missions_db.with_suffix('.db'))
+        if self.missions_db.exists():
+            self.store.import_json(self.missions_db)
 
         self.current_mission: Optional[Dict[str, Any]] = None
 
-    def _initialize_database(self):
-        """Initialize empty missions database"""
-        initial_data = {
-            "missions": [],
-            "total_missions": 0,
-            "success_count": 0,
-            "failure_count": 0,
-            "learnings_extracted": 0,
-            "skills_evolved": 0
-        }
-
-        with open(self.missions_db, 'w') as f:
-            json.dump(initial_data, f, indent=2)
-
     def start_mission(
         self,
         user_request: str,
@@ -304,44 +299,19 @@ class MissionLogger:
         return learnings
 
     def _save_mission(self):
-        """Save completed mission to database"""
+        """Append completed mission to the mission store"""
         if not self.current_mission:
             return
 
-        try:
-            with open(self.missions_db, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {
-                "missions": [],
-                "total_missions": 0,
-                "success_count": 0,
-                "failure_count": 0,
-                "learnings_extracted": 0,
-                "skills_evolved": 0
-            }
-
-        # Add mission
-        data["missions"].append(self.current_mission)
-        data["total_missions"] += 1
-
-        # Update stats
-        if self.current_mission.get("outcome", {}).get("success"):
-            data["success_count"] += 1
-        else:
-            data["failure_count"] += 1
-
-        data["learnings_extracted"] += len(self.current_mission.get("learnings", []))
-
-        # Save
-        with open(self.missions_db, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.store.append(self.current_mission)
 
     def get_mission_history(
         self,
         limit: int = 10,
         mission_type: Optional[str] = None,
-        success_only: bool = False
+        success_only: bool = False,
+        since: Union[str, datetime, None] = None,
+        until: Union[str, datetime, None] = None
     ) -> List[Dict[str, Any]]:
         """
         Get mission history
@@ -350,28 +320,19 @@ class MissionLogger:
             limit: Maximum missions to return
             mission_type: Filter by mission type
             success_only: Only return successful missions
+            since: Only missions started at or after this time
+            until: Only missions started before this time
 
         Returns:
-            List of historical missions
+            List of historical missions (most recent first)
         """
-        try:
-            with open(self.missions_db, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
-
-        missions = data.get("missions", [])
-
-        # Filter
-        if mission_type:
-            missions = [m for m in missions if m.get("mission_type") == mission_type]
-
-        if success_only:
-            missions = [m for m in missions if m.get("outcome", {}).get("success")]
-
-        # Sort by timestamp (most recent first) and limit
-        missions.sort(key=lambda m: m.get("start_time", ""), reverse=True)
-        return missions[:limit]
+        return self.store.query(
+            limit=limit,
+            mission_type=mission_type,
+            success=True if success_only else None,
+            since=since,
+            until=until
+        )
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -380,20 +341,17 @@ class MissionLogger:
         Returns:
             Statistics about all missions
         """
-        try:
-            with open(self.missions_db, 'r') as f:
-                data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            data = {}
+        counters = self.store.counters()
 
-        total = data.get("total_missions", 0)
-        success = data.get("success_count", 0)
+        total = counters.get("total_missions", 0)
+        success = counters.get("success_count", 0)
 
         return {
             "total_missions": total,
             "success_count": success,
-            "failure_count": data.get("failure_count", 0),
+            "failure_count": counters.get("failure_count", 0),
             "success_rate": (success / total * 100) if total > 0 else 0,
-            "learnings_extracted": data.get("learnings_extracted", 0),
-            "skills_evolved": data.get("skills_evolved", 0)
+            "learnings_extracted": counters.get("learnings_extracted", 0),
+            "skills_evolved": counters.get("skills_evolved", 0),
+            "by_mission_type": self.store.type_counters()
         }
@@ -0,0 +1,225 @@
+"""
+🔮 MISSION STORE - Append-Only Mission Database for Oracle's MissionLogger
+
+One SQLite database replaces the read-modify-write missions JSON file:
+- `missions`: one row per completed mission, indexed by mission type,
+  outcome and start time; the full mission dict is kept as JSON text
+- `counters`: running totals (missions, successes, failures, learnings)
+  updated in the same transaction as the insert, so statistics are a
+  single-row read
+- `type_counters`: the same totals per mission type
+
+Appending is one INSERT and a few counter updates. SQLite's file locks make
+concurrent writers from threads and processes safe without losing missions.
+An existing missions JSON database is imported once (see import_json()).
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    from .sqlite_store import SQLiteStore, to_epoch
+except ImportError:
+    from sqlite_store import SQLiteStore, to_epoch
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = ("total_missions", "success_count", "failure_count", "learnings_extracted", "skills_evolved")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS missions (
+    id INTEGER PRIMARY KEY,
+    mission_id TEXT NOT NULL,
+    mission_type TEXT,
+    success INTEGER NOT NULL,
+    start_time REAL NOT NULL,
+    duration_seconds REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS missions_time ON missions (start_time);
+CREATE INDEX IF NOT EXISTS missions_type_time ON missions (mission_type, start_time);
+CREATE INDEX IF NOT EXISTS missions_success_time ON missions (success, start_time);
+CREATE INDEX IF NOT EXISTS missions_mission_id ON missions (mission_id);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS type_counters (
+    mission_type TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    success INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS imports (
+    source TEXT PRIMARY KEY,
+    imported_at REAL NOT NULL,
+    missions INTEGER NOT NULL
+);
+"""
+
+
+def _succeeded(mission: Dict[str, Any]) -> bool:
+    return bool((mission.get("outcome") or {}).get("success"))
+
+
+class MissionStore(SQLiteStore):
+    """
+    🔮 Append-only store of completed missions
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        super().__init__(db_path)
+        self._conn.executescript(_SCHEMA)
+        with self._connect(write=True) as conn:
+            conn.executemany('INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)',
+                             [(name,) for name in COUNTERS])
+
+    # ==================== WRITING ====================
+
+    def append(self, mission: Dict[str, Any]) -> int:
+        """
+        Append a completed mission and update the counters
+
+        Args:
+            mission: Mission dict as built by MissionLogger
+
+        Returns:
+            Row id of the stored mission
+        """
+        with self._connect(write=True) as conn:
+            return self._insert(conn, mission)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, mission: Dict[str, Any]) -> int:
+        success = _succeeded(mission)
+        learnings = len(mission.get("learnings") or [])
+        mission_type = mission.get("mission_type")
+
+        row_id = conn.execute(
+            'INSERT INTO missions (mission_id, mission_type, success, start_time, duration_seconds, data) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (mission.get("mission_id", ""), mission_type, int(success), to_epoch(mission.get("start_time")),
+             (mission.get("execution") or {}).get("duration_seconds"), json.dumps(mission, default=str))
+        ).lastrowid
+
+        conn.executemany('UPDATE counters SET value = value + ? WHERE name = ?', [
+            (1, "total_missions"),
+            (1, "success_count" if success else "failure_count"),
+            (learnings, "learnings_extracted"),
+        ])
+        conn.execute(
+            'INSERT INTO type_counters (mission_type, total, success) VALUES (?, 1, ?) '
+            'ON CONFLICT (mission_type) DO UPDATE SET total = total + 1, success = success + excluded.success',
+            (mission_type or "", int(success))
+        )
+        return row_id
+
+    def increment(self, counter: str, amount: int = 1):
+        """Add to a counter (e.g. skills_evolved)"""
+        with self._connect(write=True) as conn:
+            conn.execute('INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)', (counter,))
+            conn.execute('UPDATE counters SET value = value + ? WHERE name = ?', (amount, counter))
+
+    def import_json(self, json_path: Union[str, Path]) -> int:
+        """
+        📦 Import a legacy missions JSON database once
+
+        Missions are appended in one transaction. Totals the file carried
+        beyond its missions list (e.g. skills_evolved) are added to the
+        counters. Re-importing the same file is a no-op.
+
+        Returns:
+            Number of missions imported
+        """
+        path = Path(json_path)
+        source = str(path.resolve())
+        with self._connect(write=True) as conn:
+            if conn.execute('SELECT 1 FROM imports WHERE source = ?', (source,)).fetchone():
+                return 0
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                return 0
+            except (OSError, ValueError) as e:
+                logger.warning(f"🔮 Could not import missions from {path}: {e}")
+                return 0
+
+            missions = data.get("missions", []) if isinstance(data, dict) else []
+            for mission in missions:
+                self._insert(conn, mission)
+            # Counters the missions list alone does not reproduce
+            skills = data.get("skills_evolved", 0) if isinstance(data, dict) else 0
+            if skills:
+                conn.execute('UPDATE counters SET value = value + ? WHERE name = ?', (skills, "skills_evolved"))
+            conn.execute('INSERT INTO imports (source, imported_at, missions) VALUES (?, ?, ?)',
+                         (source, datetime.now().timestamp(), len(missions)))
+
+        if missions:
+            logger.info(f"🔮 Imported {len(missions)} missions from {path} into {self.db_path}")
+        return len(missions)
+
+    # ==================== QUERIES ====================
+
+    def query(self, limit: Optional[int] = 10, mission_type: Optional[str] = None,
+              success: Optional[bool] = None,
+              since: Union[str, float, datetime, None] = None,
+              until: Union[str, float, datetime, None] = None) -> List[Dict[str, Any]]:
+        """
+        Missions, most recent first
+
+        Args:
+            limit: Maximum missions (None for all)
+            mission_type: Only this mission type
+            success: Only successful (True) or failed (False) missions
+            since: Start time lower bound (inclusive)
+            until: Start time upper bound (exclusive)
+
+        Returns:
+            Mission dicts as they were appended
+        """
+        clauses, params = [], []
+        if mission_type is not None:
+            clauses.append('mission_type = ?')
+            params.append(mission_type)
+        if success is not None:
+            clauses.append('success = ?')
+            params.append(int(success))
+        if since is not None:
+            clauses.append('start_time >= ?')
+            params.append(to_epoch(since))
+        if until is not None:
+            clauses.append('start_time < ?')
+            params.append(to_epoch(until))
+
+        query = 'SELECT data FROM missions'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY start_time DESC, id DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def counters(self) -> Dict[str, int]:
+        """Running totals"""
+        with self._connect() as conn:
+            return dict(conn.execute('SELECT name, value FROM counters').fetchall())
+
+    def type_counters(self) -> Dict[str, Dict[str, int]]:
+        """Totals per mission type: {type: {'total', 'success'}}"""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT mission_type, total, success FROM type_counters').fetchall()
+        return {mission_type: {"total": total, "success": success} for mission_type, total, success in rows}
+
+    def __len__(self) -> int:
+        return self.counters().get("total_missions", 0)
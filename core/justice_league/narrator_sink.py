@@ -0,0 +1,189 @@
+"""
+🎙️ NARRATOR SINKS - Where Mission Control's lines go
+
+The narrator formats lines; a sink writes them:
+
+- StdoutSink: print() on the caller's thread (default, interactive use)
+- QueuedSink: the caller only appends to a deque; a background writer
+  coalesces pending lines into one write per interval, collapses
+  superseded progress-bar updates and, under load, samples verbose lines
+  (thinking, handoffs, progress) before ever blocking a hero
+- NullSink: discards output (silent-but-recorded batch runs)
+
+Select with MissionControlNarrator(sink=...) or NARRATOR_SINK=stdout|queued|null.
+"""
+
+import atexit
+import sys
+import threading
+from collections import deque
+from typing import Any, Dict, Optional, TextIO
+
+# Record kinds: essential lines are only dropped at the hard limit
+LINE = "line"
+VERBOSE = "verbose"
+PROGRESS = "progress"
+
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_VERBOSE_WATERMARK = 1_000
+DEFAULT_SAMPLE_EVERY = 10
+DEFAULT_FLUSH_INTERVAL = 0.05
+
+
+class StdoutSink:
+    """Synchronous print() - output appears before the narrator call returns"""
+
+    def write(self, text: str, end: str = "\n", kind: str = LINE, key: Optional[str] = None):
+        print(text, end=end, flush=kind == PROGRESS)
+
+    def flush(self):
+        sys.stdout.flush()
+
+    def close(self):
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"sink": "stdout"}
+
+
+class NullSink:
+    """Discards every line"""
+
+    def write(self, text: str, end: str = "\n", kind: str = LINE, key: Optional[str] = None):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"sink": "null"}
+
+
+class QueuedSink:
+    """
+    🎙️ Background writer fed through a deque
+
+    write() never takes a lock or touches the stream: deque.append is atomic,
+    so heroes on worker threads only pay for formatting. Counters are
+    best-effort diagnostics.
+
+    Args:
+        stream: Output stream (default: sys.stdout at write time)
+        max_pending: Hard limit on queued lines; anything beyond is dropped
+        verbose_watermark: Queue depth from which verbose lines are sampled
+        sample_every: Keep one in N verbose lines above the watermark
+        flush_interval: Seconds between background writes
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 verbose_watermark: int = DEFAULT_VERBOSE_WATERMARK,
+                 sample_every: int = DEFAULT_SAMPLE_EVERY,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.stream = stream
+        self.max_pending = max_pending
+        self.verbose_watermark = verbose_watermark
+        self.sample_every = max(1, sample_every)
+        self.flush_interval = flush_interval
+
+        self._pending: deque = deque()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._verbose_seen = 0
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.writes = 0
+
+        self._thread = threading.Thread(target=self._run, name="narrator-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, text: str, end: str = "\n", kind: str = LINE, key: Optional[str] = None):
+        depth = len(self._pending)
+        if depth >= self.max_pending or self._closed:
+            self.dropped += 1
+            return
+        if kind != LINE and depth >= self.verbose_watermark:
+            self._verbose_seen += 1
+            if self._verbose_seen % self.sample_every:
+                self.dropped += 1
+                return
+        self._pending.append((text, end, kind, key))
+        self.queued += 1
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self):
+        """Write everything queued so far as one coalesced chunk"""
+        with self._write_lock:
+            count = len(self._pending)
+            if not count:
+                return
+            records = [self._pending.popleft() for _ in range(count)]
+
+            chunks = []
+            for index, (text, end, kind, key) in enumerate(records):
+                # A progress update immediately superseded by the same bar's next update is skipped
+                if kind == PROGRESS and index + 1 < count and key is not None and records[index + 1][3] == key:
+                    self.coalesced += 1
+                    continue
+                chunks.append(text + end)
+
+            stream = self.stream or sys.stdout
+            try:
+                stream.write("".join(chunks))
+                stream.flush()
+            except (OSError, ValueError):
+                # Closed or broken pipe - narration is best-effort
+                self.dropped += len(chunks)
+                return
+            self.written += len(chunks)
+            self.writes += 1
+
+    def flush(self):
+        """Write all queued lines now (on the calling thread)"""
+        self._drain()
+
+    def close(self):
+        """Stop the writer thread after writing what is queued"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._drain()
+        atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sink": "queued",
+            "queue_depth": len(self._pending),
+            "queued": self.queued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "writes": self.writes
+        }
+
+
+SINKS = {
+    "stdout": StdoutSink,
+    "queued": QueuedSink,
+    "null": NullSink,
+}
+
+
+def create_sink(name: str):
+    """Sink by name (stdout, queued, null); unknown names fall back to stdout"""
+    return SINKS.get((name or "stdout").lower(), StdoutSink)()
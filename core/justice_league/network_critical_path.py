@@ -0,0 +1,352 @@
+"""
+🌊 NETWORK CRITICAL PATH - Request DAG, Longest Blocking Chain & Slack
+
+Summing the timings of every critical resource treats the page load as if
+all requests ran one after another; with HTTP/2 multiplexing most of them
+overlap. RequestGraph rebuilds who-discovered-whom from the request log and
+schedules it the way the browser did:
+
+- Each request hangs off its initiator (initiator.url / stack, else the
+  script that finished last before it started for script-initiated
+  requests, else the main document).
+- A request that started after its parent finished has a finish-to-start
+  edge (lag = gap after the parent ended); one discovered while the parent
+  was still streaming has a start-to-start edge (lag = offset from the
+  parent's start). Replaying the edges reproduces the observed waterfall.
+- Render time is the latest finish of any render-blocking request; the
+  critical chain is the initiator chain leading to it, and slack is how far
+  each request could slip before render moves (critical-path method
+  forward/backward passes).
+
+Savings are estimated by editing the DAG and replaying it:
+- preload: hang a late-discovered request off the document head
+- defer: stop a script from blocking render
+- inline: serve a small stylesheet/script inside the document
+
+Building the graph is a sort plus binary searches and every replay is a
+single pass, so a 10k-request trace is O(n log n).
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .network_request_store import NetworkRequestStore, TIMING_PHASES
+
+logger = logging.getLogger(__name__)
+
+# Phases before the first document bytes arrive (a preload/inline is usable from then on)
+HEAD_PHASES = ('dns', 'connect', 'ssl', 'send', 'wait')
+
+# Initial TCP congestion window - resources up to this size are worth inlining
+INLINE_MAX_BYTES = 14 * 1024
+
+PRELOADABLE_TYPES = ('stylesheet', 'script', 'font', 'image', 'fetch', 'xhr')
+DEFERRABLE_TYPES = ('script',)
+INLINABLE_TYPES = ('stylesheet', 'script')
+
+# Chain resources simulated one by one per optimization
+MAX_SIMULATED = 10
+
+
+def initiator_url(initiator: Any) -> Optional[str]:
+    """URL that triggered a request (initiator.url or the top stack frame)"""
+    if not isinstance(initiator, dict):
+        return None
+    if initiator.get('url'):
+        return initiator['url']
+    stack = initiator.get('stack') or {}
+    for frame in stack.get('callFrames') or []:
+        if frame.get('url'):
+            return frame['url']
+    return None
+
+
+class RequestGraph:
+    """
+    🌊 Initiator DAG of a page's requests
+
+    All times are milliseconds relative to the earliest request. Arrays are
+    indexed like the store's requests; `order` is the topological order
+    (by start time, parents always precede their children).
+    """
+
+    def __init__(self, requests):
+        self.store = NetworkRequestStore.coerce(requests)
+        n = len(self.store)
+
+        start_s = self.store.column('startTime', 0)
+        start_s = np.asarray([s or 0 for s in start_s.tolist()], dtype=np.float64)
+        # Epoch seconds carry float noise below the microsecond
+        self.start_ms = np.round((start_s - (start_s.min() if n else 0.0)) * 1000.0, 3)
+        self.duration_ms = self.store.total_time(TIMING_PHASES).astype(np.float64)
+        self.end_ms = self.start_ms + self.duration_ms
+        self.head_ms = self.store.total_time(HEAD_PHASES).astype(np.float64)
+
+        self.order = np.lexsort((np.arange(n), self.start_ms))
+        self.position = np.empty(n, dtype=np.int64)
+        self.position[self.order] = np.arange(n)
+
+        self.root = self._find_root()
+        self.parent = self._resolve_parents()
+        self.finish_to_start, self.lag_ms = self._edges(self.parent)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    # ==================== CONSTRUCTION ====================
+
+    def _find_root(self) -> int:
+        """Main document (first document request, else the first request)"""
+        if not len(self):
+            return -1
+        documents = np.flatnonzero(self.store.type_is(['document']))
+        if len(documents):
+            return int(documents[np.argmin(self.position[documents])])
+        return int(self.order[0])
+
+    def _resolve_parents(self) -> np.ndarray:
+        n = len(self)
+        parent = np.full(n, -1, dtype=np.int64)
+        if not n:
+            return parent
+
+        urls = self.store.column('url', '').tolist()
+        initiators = self.store.column('initiator', None).tolist()
+        position = self.position.tolist()
+        start = self.start_ms.tolist()
+        root = self.root
+
+        # url -> positions of its requests (ascending)
+        positions_by_url: Dict[str, List[int]] = {}
+        for pos, i in enumerate(self.order.tolist()):
+            positions_by_url.setdefault(urls[i], []).append(pos)
+
+        # Scripts by end time, for script-initiated requests without a URL
+        scripts = np.flatnonzero(self.store.type_is(['script']))
+        scripts = scripts[np.argsort(self.end_ms[scripts], kind='stable')]
+        script_ends = self.end_ms[scripts].tolist()
+        scripts = scripts.tolist()
+        order = self.order.tolist()
+
+        for i in range(n):
+            if i == root:
+                continue
+            pos = position[i]
+            candidate = -1
+
+            source = initiator_url(initiators[i])
+            if source is not None:
+                # Latest request for that URL that precedes this one
+                source_positions = positions_by_url.get(source)
+                if source_positions:
+                    k = bisect_left(source_positions, pos) - 1
+                    if k >= 0:
+                        candidate = order[source_positions[k]]
+
+            elif isinstance(initiators[i], dict) and initiators[i].get('type') == 'script':
+                # The script that finished last before this request started
+                k = bisect_right(script_ends, start[i]) - 1
+                if k >= 0 and position[scripts[k]] < pos:
+                    candidate = scripts[k]
+
+            if candidate < 0 and position[root] < pos:
+                candidate = root
+            parent[i] = candidate
+
+        return parent
+
+    def _edges(self, parent: np.ndarray):
+        """(finish_to_start mask, lag_ms) of every parent -> request edge"""
+        has_parent = parent >= 0
+        safe_parent = np.where(has_parent, parent, 0)
+        parent_end = self.end_ms[safe_parent] if len(self) else self.end_ms
+        parent_start = self.start_ms[safe_parent] if len(self) else self.start_ms
+
+        finish_to_start = has_parent & (self.start_ms >= parent_end)
+        lag = np.where(finish_to_start, self.start_ms - parent_end, self.start_ms - parent_start)
+        lag = np.where(has_parent, lag, self.start_ms)
+        return finish_to_start, lag
+
+    # ==================== SCHEDULING ====================
+
+    def schedule(self, duration: Optional[np.ndarray] = None, parent: Optional[np.ndarray] = None,
+                 finish_to_start: Optional[np.ndarray] = None, lag: Optional[np.ndarray] = None):
+        """
+        Replay the DAG (forward pass)
+
+        Without arguments this reproduces the observed start/end times;
+        pass edited arrays to simulate a change.
+
+        Returns:
+            (earliest start, earliest finish) arrays
+        """
+        duration = (self.duration_ms if duration is None else duration).tolist()
+        parent = (self.parent if parent is None else parent).tolist()
+        finish_to_start = (self.finish_to_start if finish_to_start is None else finish_to_start).tolist()
+        lag = (self.lag_ms if lag is None else lag).tolist()
+
+        n = len(self)
+        es = [0.0] * n
+        ef = [0.0] * n
+        # Edits only re-parent requests to the document, which precedes them
+        for i in self.order.tolist():
+            p = parent[i]
+            if p < 0:
+                es[i] = lag[i]
+            elif finish_to_start[i]:
+                es[i] = ef[p] + lag[i]
+            else:
+                es[i] = es[p] + lag[i]
+            ef[i] = es[i] + duration[i]
+        return np.array(es), np.array(ef)
+
+    def slack(self, blocking: np.ndarray, es: np.ndarray, ef: np.ndarray,
+              duration: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Slack of every request against render time (backward pass)
+
+        Requests that neither block render nor lead to a blocking request
+        have infinite slack.
+        """
+        duration = self.duration_ms if duration is None else duration
+        render_time = float(ef[blocking].max()) if blocking.any() else 0.0
+
+        latest_start = np.where(blocking, render_time - duration, np.inf).tolist()
+        dur = duration.tolist()
+        parent = self.parent.tolist()
+        fts = self.finish_to_start.tolist()
+        lag = self.lag_ms.tolist()
+
+        for i in reversed(self.order.tolist()):
+            p = parent[i]
+            if p >= 0 and latest_start[i] != np.inf:
+                bound = latest_start[i] - lag[i] - (dur[p] if fts[i] else 0.0)
+                if bound < latest_start[p]:
+                    latest_start[p] = bound
+        return np.array(latest_start) - es
+
+    def critical_chain(self, blocking: np.ndarray, ef: np.ndarray) -> List[int]:
+        """Initiator chain ending at the last render-blocking request (head first)"""
+        if not blocking.any():
+            return []
+        candidates = np.flatnonzero(blocking)
+        last = int(candidates[np.argmax(ef[candidates])])
+        chain = []
+        while last >= 0:
+            chain.append(last)
+            last = int(self.parent[last])
+        return chain[::-1]
+
+    # ==================== ANALYSIS ====================
+
+    def analyze(self, blocking: np.ndarray, sizes: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Critical chain, slack and simulated savings
+
+        Args:
+            blocking: Render-blocking mask over the requests
+            sizes: Transfer sizes (default: the store's size column)
+
+        Returns:
+            {'render_time_ms', 'critical_path_length_ms', 'chain', 'slack_ms',
+             'start_ms', 'end_ms', 'savings'}
+        """
+        blocking = np.asarray(blocking, dtype=bool)
+        es, ef = self.schedule()
+        render_time = float(ef[blocking].max()) if blocking.any() else 0.0
+        chain = self.critical_chain(blocking, ef)
+        length = render_time - float(es[chain[0]]) if chain else 0.0
+
+        return {
+            'render_time_ms': render_time,
+            'critical_path_length_ms': length,
+            'chain': chain,
+            'slack_ms': self.slack(blocking, es, ef),
+            'start_ms': es,
+            'end_ms': ef,
+            'savings': self.simulate_savings(blocking, chain, render_time, sizes)
+        }
+
+    def render_time(self, blocking: np.ndarray, **edits) -> float:
+        """Render time after replaying the DAG with edited arrays"""
+        _, ef = self.schedule(**edits)
+        return float(ef[blocking].max()) if blocking.any() else 0.0
+
+    def _edits(self, preload: Sequence[int] = (), inline: Sequence[int] = ()) -> Dict[str, np.ndarray]:
+        """
+        Edited DAG arrays
+
+        Preloaded and inlined requests are discovered from the document head
+        instead of their initiator (only ever earlier than observed);
+        inlined ones also take no time of their own.
+        """
+        parent = self.parent.copy()
+        fts = self.finish_to_start.copy()
+        lag = self.lag_ms.copy()
+        head = float(self.head_ms[self.root])
+        head_start = float(self.start_ms[self.root]) + head
+        for i in list(preload) + list(inline):
+            if i != self.root and self.start_ms[i] > head_start:
+                parent[i], fts[i], lag[i] = self.root, False, head
+
+        duration = self.duration_ms.copy()
+        duration[list(inline)] = 0.0
+        return {'duration': duration, 'parent': parent, 'finish_to_start': fts, 'lag': lag}
+
+    def simulate_savings(self, blocking: np.ndarray, chain: Sequence[int], render_time: float,
+                         sizes: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Render-time savings of preloading, deferring and inlining chain requests
+
+        Each candidate on the critical chain is replayed on its own; the
+        combined scenario applies every candidate at once (savings overlap,
+        so it is less than the sum).
+        """
+        sizes = self.store.column('size', 0) if sizes is None else sizes
+        types = self.store.column('resourceType', '').tolist()
+        sizes = sizes.tolist()
+        root = self.root
+        chain = [i for i in chain if i != root]
+
+        preload = [i for i in chain if types[i] in PRELOADABLE_TYPES and self.parent[i] != root][:MAX_SIMULATED]
+        defer = [i for i in chain if types[i] in DEFERRABLE_TYPES and blocking[i]][:MAX_SIMULATED]
+        inline = [i for i in chain if types[i] in INLINABLE_TYPES
+                  and isinstance(sizes[i], (int, float)) and sizes[i] <= INLINE_MAX_BYTES][:MAX_SIMULATED]
+
+        def unblocked(targets):
+            mask = blocking.copy()
+            mask[list(targets)] = False
+            return mask
+
+        scenarios = {
+            'preload': (preload, lambda t: self.render_time(blocking, **self._edits(preload=t))),
+            'defer': (defer, lambda t: self.render_time(unblocked(t))),
+            'inline': (inline, lambda t: self.render_time(blocking, **self._edits(inline=t)))
+        }
+
+        savings: Dict[str, Any] = {}
+        for name, (targets, replay) in scenarios.items():
+            per_resource = [(i, max(render_time - replay([i]), 0.0)) for i in targets]
+            savings[name] = {
+                'savings_ms': max(render_time - replay(targets), 0.0) if targets else 0.0,
+                'per_resource_ms': {i: saved for i, saved in per_resource if saved > 0}
+            }
+
+        # Everything at once: inline the small ones, preload the rest, defer the scripts
+        if preload or defer or inline:
+            combined = self.render_time(unblocked(defer), **self._edits(preload=preload, inline=inline))
+        else:
+            combined = render_time
+        savings['combined_savings_ms'] = max(render_time - combined, 0.0)
+        return savings
+
+
+def render_blocking_mask(store: NetworkRequestStore) -> np.ndarray:
+    """Document, stylesheets, high-priority scripts and fonts"""
+    priorities = store.column('priority', 'low').tolist()
+    high_priority = np.fromiter((p in ('high', 'very-high') for p in priorities), dtype=bool, count=len(priorities))
+    return (store.type_is(['document', 'stylesheet', 'font'])
+            | (store.type_is(['script']) & high_priority))
@@ -0,0 +1,420 @@
+"""
+🌊 NETWORK REQUEST STORE - One Request Log, Columnar Analyses
+
+Aquaman's analyses and Superman's network timing analysis used to call
+list_network_requests separately and walk the request dicts one by one.
+NetworkRequestStore pages through list_network_requests once, optionally
+fetches per-request details concurrently on a bounded pool, and exposes the
+log as NumPy columns (url, type, size, timing phases, ...) so every analysis
+is a vectorized pass over the same dataset.
+
+Request dict fields (as returned by Chrome DevTools MCP):
+    url, method, status, resourceType, size, priority, fromCache,
+    startTime (seconds), timing {dns, connect, ssl, send, wait, receive} (ms),
+    initiator, responseHeaders
+
+HAR 1.2 import/export (Chrome's _resourceType/_priority/_initiator fields)
+lets the analyses run offline against a recorded page load.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TIMING_PHASES = ('dns', 'connect', 'ssl', 'send', 'wait', 'receive')
+
+DEFAULT_PAGE_SIZE = 100
+# Guards against list functions that ignore pageIdx
+MAX_PAGES = 1000
+DETAIL_WORKERS = 8
+
+_DOMAIN_PATTERN = re.compile(r'https?://([^/]+)')
+
+
+def extract_domain(url: str) -> Optional[str]:
+    """Host part of an http(s) URL (None if there is none)"""
+    match = _DOMAIN_PATTERN.search(url or '')
+    return match.group(1) if match else None
+
+
+def _column(values: List[Any]) -> np.ndarray:
+    """int64/float64/bool column when the values allow it, object otherwise"""
+    if not values:
+        return np.zeros(0, dtype=np.int64)
+    if all(type(v) is bool for v in values):
+        return np.array(values, dtype=bool)
+    if all(type(v) is int for v in values):
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    if all(type(v) in (int, float) for v in values):
+        return np.array(values, dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def descending(values: np.ndarray) -> np.ndarray:
+    """Indices sorting values largest first, ties kept in request order"""
+    if values.dtype.kind in 'iuf':
+        return np.argsort(-values, kind='stable')
+    items = values.tolist()
+    return np.array(sorted(range(len(items)), key=items.__getitem__, reverse=True), dtype=np.int64)
+
+
+def group_codes(keys: Sequence[Any]):
+    """
+    Integer codes for keys, in order of first appearance
+
+    Returns:
+        (unique keys, codes array)
+    """
+    codes_map: Dict[Any, int] = {}
+    keys = keys.tolist() if isinstance(keys, np.ndarray) else list(keys)
+    codes = np.fromiter((codes_map.setdefault(k, len(codes_map)) for k in keys), dtype=np.int64, count=len(keys))
+    return list(codes_map), codes
+
+
+def group_sum(codes: np.ndarray, values: np.ndarray, groups: int) -> np.ndarray:
+    """Per-group sums keeping integer columns integral"""
+    totals = np.zeros(groups, dtype=values.dtype if values.dtype.kind in 'iuf' else object)
+    if totals.dtype == object:
+        totals[:] = 0
+    np.add.at(totals, codes, values)
+    return totals
+
+
+class NetworkRequestStore:
+    """
+    🌊 Columnar view of a page's network requests
+
+    `requests` keeps the original dicts (analyses that report requests return
+    them unchanged); columns are built lazily and cached, so analyses sharing
+    a store share the work.
+    """
+
+    def __init__(self, requests: Optional[Iterable[Dict[str, Any]]] = None):
+        self.requests: List[Dict[str, Any]] = list(requests or [])
+        self._columns: Dict[Any, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    @classmethod
+    def coerce(cls, requests: Union['NetworkRequestStore', Iterable[Dict[str, Any]]]) -> 'NetworkRequestStore':
+        """Store for either a store or a plain request list"""
+        return requests if isinstance(requests, cls) else cls(requests)
+
+    # ==================== COLUMNS ====================
+
+    def column(self, field: str, default: Any = None) -> np.ndarray:
+        """req.get(field, default) for every request"""
+        return self._cached((field, default), lambda: [r.get(field, default) for r in self.requests])
+
+    def phase(self, name: str) -> np.ndarray:
+        """One timing phase (ms, 0 when missing)"""
+        return self._cached(('timing', name), lambda: [(r.get('timing') or {}).get(name, 0) for r in self.requests])
+
+    def total_time(self, phases: Sequence[str] = TIMING_PHASES) -> np.ndarray:
+        """Sum of the given timing phases per request (added in phase order)"""
+        total = np.zeros(len(self.requests), dtype=np.int64)
+        for name in phases:
+            total = total + self.phase(name)
+        return total
+
+    def domains(self) -> np.ndarray:
+        """Host of every request URL (None when it has none)"""
+        return self._cached(('domain',), lambda: [extract_domain(url) for url in self.column('url', '')])
+
+    def header(self, name: str) -> np.ndarray:
+        """Lower-cased response header value ('' when missing)"""
+        return self._cached(
+            ('header', name),
+            lambda: [str((r.get('responseHeaders') or {}).get(name, '')).lower() for r in self.requests]
+        )
+
+    def _cached(self, key, build: Callable[[], List[Any]]) -> np.ndarray:
+        with self._lock:
+            column = self._columns.get(key)
+        if column is None:
+            column = _column(build())
+            with self._lock:
+                self._columns[key] = column
+        return column
+
+    # ==================== SELECTION ====================
+
+    def select(self, mask_or_indices) -> 'NetworkRequestStore':
+        """New store with the selected requests (boolean mask or index array)"""
+        indices = np.flatnonzero(mask_or_indices) if np.asarray(mask_or_indices).dtype == bool \
+            else np.asarray(mask_or_indices, dtype=np.int64)
+        return NetworkRequestStore([self.requests[i] for i in indices.tolist()])
+
+    def filter_types(self, resource_types: Optional[Sequence[str]]) -> 'NetworkRequestStore':
+        """Requests of the given resource types (all requests if none are given)"""
+        if not resource_types:
+            return self
+        return self.select(self.type_is(resource_types, default=None))
+
+    def type_is(self, resource_types: Sequence[str], default: Any = '') -> np.ndarray:
+        """Boolean mask of requests whose resourceType is one of resource_types"""
+        wanted = set(resource_types)
+        types = self.column('resourceType', default)
+        return np.fromiter((t in wanted for t in types.tolist()), dtype=bool, count=len(types))
+
+    @staticmethod
+    def contains(column: np.ndarray, needles: Sequence[str], lower: bool = False) -> np.ndarray:
+        """Boolean mask of string column values containing any of needles"""
+        values = column.tolist()
+        if lower:
+            values = [v.lower() for v in values]
+        return np.fromiter((any(n in v for n in needles) for v in values), dtype=bool, count=len(values))
+
+    # ==================== FETCHING ====================
+
+    @classmethod
+    def from_mcp(cls, list_func: Callable, get_func: Optional[Callable] = None,
+                 page_size: int = DEFAULT_PAGE_SIZE, fetch_details: bool = False,
+                 max_workers: int = DETAIL_WORKERS) -> 'NetworkRequestStore':
+        """
+        Collect every page of list_network_requests once
+
+        Args:
+            list_func: MCP list_network_requests
+            get_func: MCP get_network_request (used with fetch_details)
+            page_size: Requests per page
+            fetch_details: Also fetch every request's details concurrently
+            max_workers: Detail fetch pool size
+        """
+        store = cls(cls.collect_pages(list_func, page_size))
+        if fetch_details and get_func:
+            store.fetch_details(get_func, max_workers=max_workers)
+        return store
+
+    @staticmethod
+    def collect_pages(list_func: Callable, page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """
+        Every request from a paginated list_network_requests
+
+        Stops at an empty, short or repeated page (list functions that ignore
+        pageIdx return the same page again) or once `total` is reached.
+        """
+        all_requests: List[Dict[str, Any]] = []
+        previous_page = None
+
+        for page_idx in range(MAX_PAGES):
+            try:
+                response = list_func(pageIdx=page_idx, pageSize=page_size)
+            except TypeError:
+                # List function without pagination support
+                if page_idx == 0:
+                    return list((list_func() or {}).get('requests', []))
+                break
+            except Exception as e:
+                logger.warning(f"Error paginating requests: {e}")
+                break
+
+            response = response or {}
+            requests = response.get('requests', [])
+            if not requests or requests == previous_page:
+                break
+            all_requests.extend(requests)
+
+            total = response.get('total')
+            if len(requests) < page_size or (isinstance(total, int) and len(all_requests) >= total):
+                break
+            previous_page = requests
+
+        return all_requests
+
+    def fetch_details(self, get_func: Callable, missing: Optional[str] = None,
+                      max_workers: int = DETAIL_WORKERS) -> int:
+        """
+        Merge get_network_request(url=...) details into the requests, concurrently
+
+        Args:
+            get_func: MCP get_network_request
+            missing: Only fetch requests that lack this field
+            max_workers: Pool size (bounds concurrent DevTools calls)
+
+        Returns:
+            Number of requests updated
+        """
+        targets = [i for i, r in enumerate(self.requests) if r.get('url') and (missing is None or missing not in r)]
+        if not targets:
+            return 0
+
+        def fetch(index: int):
+            try:
+                return get_func(url=self.requests[index]['url'])
+            except Exception as e:
+                logger.debug(f"Detail fetch failed for {self.requests[index].get('url')}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets))),
+                                thread_name_prefix='network-details') as executor:
+            details = list(executor.map(fetch, targets))
+
+        updated = 0
+        for index, detail in zip(targets, details):
+            if isinstance(detail, dict):
+                self.requests[index] = {**self.requests[index], **detail}
+                updated += 1
+        if updated:
+            with self._lock:
+                self._columns.clear()
+        return updated
+
+    # ==================== HAR ====================
+
+    def to_har(self) -> Dict[str, Any]:
+        """HAR 1.2 log of the requests"""
+        entries = []
+        for req in self.requests:
+            timing = req.get('timing') or {}
+            phases = {name: timing.get(name, 0) for name in TIMING_PHASES}
+            headers = req.get('responseHeaders') or {}
+            start = req.get('startTime', 0) or 0
+            entry = {
+                'startedDateTime': datetime.fromtimestamp(start, tz=timezone.utc).isoformat(),
+                'time': sum(phases.values()),
+                'request': {
+                    'method': req.get('method', 'GET'), 'url': req.get('url', ''), 'httpVersion': '',
+                    'cookies': [], 'headers': [], 'queryString': [], 'headersSize': -1, 'bodySize': -1
+                },
+                'response': {
+                    'status': req.get('status', 0), 'statusText': '', 'httpVersion': '', 'cookies': [],
+                    'headers': [{'name': k, 'value': str(v)} for k, v in headers.items()],
+                    'content': {'size': req.get('size', 0), 'mimeType': str(headers.get('content-type', ''))},
+                    'redirectURL': '', 'headersSize': -1, 'bodySize': req.get('size', 0),
+                    '_transferSize': req.get('size', 0)
+                },
+                'cache': {},
+                # HAR counts TLS time inside connect
+                'timings': {
+                    'blocked': -1,
+                    'dns': phases['dns'],
+                    'connect': phases['connect'] + phases['ssl'] if phases['ssl'] > 0 else phases['connect'],
+                    'ssl': phases['ssl'] if phases['ssl'] > 0 else -1,
+                    'send': phases['send'],
+                    'wait': phases['wait'],
+                    'receive': phases['receive']
+                },
+                '_resourceType': req.get('resourceType', 'other'),
+                '_priority': req.get('priority', ''),
+                '_fromCache': bool(req.get('fromCache', False)),
+                '_initiator': req.get('initiator', {})
+            }
+            entries.append(entry)
+
+        return {
+            'log': {
+                'version': '1.2',
+                'creator': {'name': 'Aquaman Network Store', 'version': '1.0.0'},
+                'pages': [],
+                'entries': entries
+            }
+        }
+
+    def save_har(self, path: Union[str, Path]):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_har(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_har(cls, har: Dict[str, Any]) -> 'NetworkRequestStore':
+        """Store from a HAR log (ours or a browser export)"""
+        requests = []
+        for entry in har.get('log', {}).get('entries', []):
+            request = entry.get('request', {})
+            response = entry.get('response', {})
+            timings = entry.get('timings', {})
+
+            phases = {name: max(timings.get(name, 0) or 0, 0) for name in TIMING_PHASES}
+            if phases['ssl'] > 0 and phases['connect'] >= phases['ssl']:
+                phases['connect'] -= phases['ssl']
+
+            size = response.get('_transferSize')
+            if size is None or size < 0:
+                size = response.get('bodySize', -1)
+            if size is None or size < 0:
+                size = response.get('content', {}).get('size', 0)
+
+            started = entry.get('startedDateTime')
+            try:
+                start_time = datetime.fromisoformat(started.replace('Z', '+00:00')).timestamp() if started else 0.0
+            except ValueError:
+                start_time = 0.0
+
+            requests.append({
+                'url': request.get('url', ''),
+                'method': request.get('method', 'GET'),
+                'status': response.get('status', 0),
+                'resourceType': entry.get('_resourceType', 'other'),
+                'size': size,
+                'priority': entry.get('_priority', ''),
+                'fromCache': bool(entry.get('_fromCache', False)),
+                'startTime': start_time,
+                'timing': phases,
+                'initiator': entry.get('_initiator') or {},
+                'responseHeaders': {h['name'].lower(): h['value'] for h in response.get('headers', []) if 'name' in h}
+            })
+        return cls(requests)
+
+    @classmethod
+    def load_har(cls, path: Union[str, Path]) -> 'NetworkRequestStore':
+        with open(path, 'r') as f:
+            return cls.from_har(json.load(f))
+
+
+_store_lock = threading.Lock()
+
+
+def get_request_store(mcp_tools: Optional[Dict[str, Any]], refresh: bool = False) -> Optional[NetworkRequestStore]:
+    """
+    Shared NetworkRequestStore for an mcp_tools dict
+
+    Collected on first use and stored under 'network_store', so every
+    analysis handed the same tools reads one request log. Pass refresh=True
+    to re-read a page that is still loading.
+
+    Returns:
+        The store, or None without list_network_requests (or a stored log)
+    """
+    if not mcp_tools:
+        return None
+    store = mcp_tools.get('network_store')
+    if isinstance(store, NetworkRequestStore) and not refresh:
+        return store
+    list_func = mcp_tools.get('list_network_requests')
+    if not list_func:
+        return store if isinstance(store, NetworkRequestStore) else None
+    with _store_lock:
+        store = mcp_tools.get('network_store')
+        if not isinstance(store, NetworkRequestStore) or refresh:
+            store = NetworkRequestStore.from_mcp(list_func)
+            try:
+                mcp_tools['network_store'] = store
+            except TypeError:
+                pass
+    return store
+
+
+def load_har_tools(path: Union[str, Path]) -> Dict[str, Any]:
+    """mcp_tools stand-in backed by a HAR file (no browser needed)"""
+    return {'network_store': NetworkRequestStore.load_har(path)}
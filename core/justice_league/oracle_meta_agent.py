@@ -25,9 +25,13 @@ import json
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
+import copy
 import hashlib
 import subprocess
 
+from .oracle_similarity import ErrorSimilarityIndex, jaccard, normalize_error_text, shingle_hashes
+from .oracle_store import get_oracle_store
+
 # Import Mission Control Narrator (v2.0)
 try:
     from .mission_control_narrator import get_narrator
@@ -105,8 +109,20 @@ class OracleMeta:
         self.project_patterns_db = Path('/Users/admin/Documents/claudecode/Projects/aldo-vision/data/oracle_project_patterns.json')
         self.shared_components_db = Path('/Users/admin/Documents/claudecode/Projects/aldo-vision/data/oracle_shared_components.json')
 
+        # Load-once, journal-backed storage for all databases
+        self.store = get_oracle_store()
+
+        # Near-duplicate indexes (MinHash/LSH) for errors and recovery patterns
+        self.error_similarity_threshold = 0.8  # store_error_solution dedup
+        self.knowledge_query_threshold = 0.5  # fuzzy matches in query_knowledge_base
+        self.error_index = ErrorSimilarityIndex(threshold=self.error_similarity_threshold)
+        self._error_index_source: Optional[int] = None
+        self.recovery_index = ErrorSimilarityIndex()
+        self._recovery_index_keys: frozenset = frozenset()
+
         # Initialize databases
         self._init_databases()
+        self._register_indexes()
 
         # Self-Learning Extension (v1.9.3)
         try:
@@ -165,20 +181,54 @@ class OracleMeta:
         ]
 
         for db_file, default_data in databases:
-            if not db_file.exists():
-                with open(db_file, 'w') as f:
-                    json.dump(default_data, f, indent=2)
+            self.store.create(db_file, default_data)
+
+    def _register_indexes(self):
+        """Register in-memory indexes used by the hot query paths"""
+        self.store.register_index(self.errors_db, 'by_agent', ['errors'], lambda e: e['agent'])
+        self.store.register_index(self.errors_db, 'by_agent_error_type', ['errors'],
+                                  lambda e: (e['agent'], e['error_type']))
+
+    def _sync_error_index(self) -> List[Dict[str, Any]]:
+        """Bring the error similarity index in line with the errors database"""
+        errors = self.store.load(self.errors_db)['errors']
+        if self._error_index_source != id(errors) or len(self.error_index) != len(errors):
+            self.error_index.clear()
+            for position, error in enumerate(errors):
+                self.error_index.add(position, (error['agent'], error['error_type']), error['error_details'])
+            self._error_index_source = id(errors)
+        return errors
+
+    def _sync_recovery_index(self, recovery_patterns: Dict[str, Any]):
+        """Index recovery pattern symptoms for near-duplicate lookups"""
+        keys = frozenset(recovery_patterns)
+        if keys == self._recovery_index_keys:
+            return
+        self.recovery_index.clear()
+        for pattern_key, pattern_data in recovery_patterns.items():
+            problem = pattern_data.get('problem', {})
+            self.recovery_index.add(pattern_key, None,
+                                    [problem.get('symptom', ''), problem.get('error_message', '')])
+        self._recovery_index_keys = keys
+
+    def _missions_of_type(self, mission_type: str) -> List[Dict[str, Any]]:
+        """Mission history records of one mission type (indexed)"""
+        try:
+            return self.store.lookup(self.project_patterns_db, 'missions_by_type', mission_type)
+        except KeyError:
+            self.store.register_index(self.project_patterns_db, 'missions_by_type',
+                                      ['hero_meta_learning', 'mission_history'],
+                                      lambda m: m.get('mission_type', 'unknown'))
+            return self.store.lookup(self.project_patterns_db, 'missions_by_type', mission_type)
 
     def _load_agent_versions(self) -> Dict[str, str]:
         """Load current agent versions"""
-        with open(self.versions_db, 'r') as f:
-            data = json.load(f)
-            return data.get('agents', {})
+        data = self.store.load(self.versions_db)
+        return data.get('agents', {})
 
     def _save_agent_versions(self):
         """Save agent versions to database"""
-        with open(self.versions_db, 'w') as f:
-            json.dump({'agents': self.agent_versions}, f, indent=2)
+        self.store.put(self.versions_db, ['agents'], self.agent_versions)
 
     # ==================== KNOWLEDGE MANAGEMENT ====================
 
@@ -215,34 +265,42 @@ class OracleMeta:
             'success_rate': 1.0  # Initial success rate
         }
 
-        # Load existing errors
-        with open(self.errors_db, 'r') as f:
-            data = json.load(f)
+        # Check if similar error exists (same agent and error type only)
+        errors = self._sync_error_index()
+        matches = self.error_index.query(error_details, bucket_keys=[(agent_name, error_type)])
 
-        # Check if similar error exists
-        similar_error = self._find_similar_error(agent_name, error_type, error_details, data['errors'])
-
-        if similar_error:
+        if matches:
             # Update existing error
+            position = matches[0][0]
+            similar_error = errors[position]
             similar_error['times_encountered'] += 1
             similar_error['last_seen'] = datetime.now().isoformat()
+            self.store.put(self.errors_db, ['errors', position], similar_error)
             logger.info(f"🔮 Updated existing error: {similar_error['id']}")
         else:
             # Add new error
-            data['errors'].append(error_record)
+            self.store.append(self.errors_db, ['errors'], error_record)
+            self.error_index.add(len(errors) - 1, (agent_name, error_type), error_details)
             logger.info(f"🔮 Stored new error: {error_id}")
 
-        # Save back to database
-        with open(self.errors_db, 'w') as f:
-            json.dump(data, f, indent=2)
-
         # Analyze for patterns
         self._analyze_error_patterns(agent_name, error_type)
 
         return error_id
 
-    def _find_similar_error(self, agent_name: str, error_type: str, error_details: Dict, existing_errors: List) -> Optional[Dict]:
-        """Find similar error in database"""
+    def _find_similar_error(self, agent_name: str, error_type: str, error_details: Dict,
+                            existing_errors: Optional[List] = None) -> Optional[Dict]:
+        """
+        Find similar error in database
+
+        Uses the near-duplicate index unless an explicit list of errors to
+        compare against is given.
+        """
+        if existing_errors is None:
+            errors = self._sync_error_index()
+            matches = self.error_index.query(error_details, bucket_keys=[(agent_name, error_type)])
+            return errors[matches[0][0]] if matches else None
+
         for error in existing_errors:
             if (error['agent'] == agent_name and
                 error['error_type'] == error_type and
@@ -252,15 +310,13 @@ class OracleMeta:
 
     def _errors_are_similar(self, error1: Dict, error2: Dict) -> bool:
         """Check if two errors are similar enough to be considered the same"""
-        # Simple similarity check - can be enhanced with ML
-        error1_str = json.dumps(error1, sort_keys=True)
-        error2_str = json.dumps(error2, sort_keys=True)
-
-        # If 80% of content is similar, consider them the same
-        matching_chars = sum(1 for a, b in zip(error1_str, error2_str) if a == b)
-        similarity = matching_chars / max(len(error1_str), len(error2_str))
-
-        return similarity > 0.8
+        # Shingle-set Jaccard similarity over normalized fields - tolerant of
+        # text shifted by a few characters
+        similarity = jaccard(
+            shingle_hashes(normalize_error_text(error1), self.error_index.shingle_size),
+            shingle_hashes(normalize_error_text(error2), self.error_index.shingle_size)
+        )
+        return similarity >= self.error_similarity_threshold
 
     def query_error_solutions(
         self,
@@ -278,12 +334,11 @@ class OracleMeta:
             List of matching error-solution pairs sorted by confidence
         """
         # Check if error recovery patterns exist in Oracle's knowledge base
-        if not self.project_patterns_db.exists():
+        if not self.store.exists(self.project_patterns_db):
             return []
 
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                patterns = json.load(f)
+            patterns = self.store.load(self.project_patterns_db)
 
             # Check error_recovery_patterns section
             recovery_patterns = patterns.get('error_recovery_patterns', {})
@@ -292,6 +347,11 @@ class OracleMeta:
             error_type = error.get('type', '').lower()
             error_msg = str(error.get('message', '')).lower()
 
+            # Near-duplicate symptom matches from the similarity index
+            self._sync_recovery_index(recovery_patterns)
+            near_duplicates = dict(self.recovery_index.query(error_msg, threshold=min_similarity)) \
+                if error_msg else {}
+
             matches = []
 
             for pattern_key, pattern_data in recovery_patterns.items():
@@ -309,6 +369,8 @@ class OracleMeta:
                 if pattern_context in error_msg or any(keyword in error_msg for keyword in pattern_context.split()):
                     similarity += 0.3
 
+                similarity = max(similarity, near_duplicates.get(pattern_key, 0.0))
+
                 # Check error recovery patterns from file
                 if similarity >= min_similarity or error_type == pattern_data.get('pattern_type', ''):
                     matches.append({
@@ -345,11 +407,10 @@ class OracleMeta:
         Updates confidence scores in knowledge base for learning
         """
         try:
-            if not self.project_patterns_db.exists():
+            if not self.store.exists(self.project_patterns_db):
                 return
 
-            with open(self.project_patterns_db, 'r') as f:
-                patterns = json.load(f)
+            patterns = self.store.load(self.project_patterns_db)
 
             recovery_patterns = patterns.get('error_recovery_patterns', {})
 
@@ -392,12 +453,11 @@ class OracleMeta:
                     successful = pattern_data['usage_stats']['successful']
                     pattern_data['usage_stats']['success_rate'] = successful / total if total > 0 else 0.0
 
+                    # Save updated pattern
+                    self.store.put(self.project_patterns_db,
+                                   ['error_recovery_patterns', pattern_key], pattern_data)
                     break
 
-            # Save updated patterns
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(patterns, f, indent=2)
-
         except Exception as e:
             logger.warning(f"🔮 Error reinforcing solution: {e}")
 
@@ -455,8 +515,7 @@ class OracleMeta:
         """
         # Load patterns from knowledge base
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                patterns_data = json.load(f)
+            patterns_data = self.store.load(self.project_patterns_db)
         except (FileNotFoundError, json.JSONDecodeError):
             patterns_data = {"methodologies": {}}
 
@@ -521,21 +580,32 @@ class OracleMeta:
         # Sequential thinking display
         self.think(f"Searching knowledge base for: {query[:50]}...", category="Scanning")
 
-        with open(self.errors_db, 'r') as f:
-            data = json.load(f)
+        errors = self._sync_error_index()
+        if agent_name:
+            positions = self.store.lookup_positions(self.errors_db, 'by_agent', agent_name)
+            bucket_keys = [key for key in self.error_index.bucket_keys() if key[0] == agent_name]
+        else:
+            positions = range(len(errors))
+            bucket_keys = None
 
         results = []
         query_lower = query.lower()
 
-        for error in data['errors']:
-            # Filter by agent if specified
-            if agent_name and error['agent'] != agent_name:
-                continue
-
-            # Search in error details and solution
-            error_str = json.dumps(error).lower()
+        # Exact keyword hits in error details and solution
+        matched_positions = set()
+        for position in positions:
+            error_str = json.dumps(errors[position]).lower()
             if query_lower in error_str:
-                results.append(error)
+                matched_positions.add(position)
+
+        # Near-duplicate hits for longer queries such as full error messages
+        if len(normalize_error_text(query)) > 2 * self.error_index.shingle_size:
+            for position, _ in self.error_index.query(query, bucket_keys=bucket_keys,
+                                                      threshold=self.knowledge_query_threshold):
+                matched_positions.add(position)
+
+        for position in sorted(matched_positions):
+            results.append(copy.deepcopy(errors[position]))
 
         # Sort by relevance (times encountered and success rate)
         results.sort(key=lambda x: (x['times_encountered'], x['success_rate']), reverse=True)
@@ -557,10 +627,9 @@ class OracleMeta:
         Returns:
             List of best practices
         """
-        with open(self.best_practices_db, 'r') as f:
-            data = json.load(f)
+        data = self.store.load(self.best_practices_db)
 
-        practices = [p for p in data['practices'] if p.get('category') == category]
+        practices = [dict(p) for p in data['practices'] if p.get('category') == category]
 
         logger.info(f"🔮 Retrieved {len(practices)} best practices for {category}")
         return practices
@@ -575,13 +644,7 @@ class OracleMeta:
             'added_at': datetime.now().isoformat()
         }
 
-        with open(self.best_practices_db, 'r') as f:
-            data = json.load(f)
-
-        data['practices'].append(practice)
-
-        with open(self.best_practices_db, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.store.append(self.best_practices_db, ['practices'], practice)
 
         logger.info(f"🔮 Added best practice: {title}")
 
@@ -684,10 +747,7 @@ class OracleMeta:
 
     def _store_mission_insights(self, analysis: Dict):
         """Store mission insights in patterns database"""
-        with open(self.patterns_db, 'r') as f:
-            data = json.load(f)
-
-        data['trends'].append({
+        self.store.append(self.patterns_db, ['trends'], {
             'timestamp': analysis['timestamp'],
             'insights_count': len(analysis['insights']),
             'recommendations_count': len(analysis['recommendations']),
@@ -695,22 +755,15 @@ class OracleMeta:
         })
 
         # Keep only last 100 trends
-        data['trends'] = data['trends'][-100:]
-
-        with open(self.patterns_db, 'w') as f:
-            json.dump(data, f, indent=2)
+        if len(self.store.load(self.patterns_db)['trends']) > 100:
+            self.store.trim(self.patterns_db, ['trends'], 100)
 
     def _analyze_error_patterns(self, agent_name: str, error_type: str):
         """Analyze if error is part of a pattern"""
-        with open(self.errors_db, 'r') as f:
-            data = json.load(f)
-
         # Count similar errors in last 24 hours
         recent_errors = [
-            e for e in data['errors']
-            if e['agent'] == agent_name and
-            e['error_type'] == error_type and
-            (datetime.now() - datetime.fromisoformat(e['timestamp'])) < timedelta(hours=24)
+            e for e in self.store.lookup(self.errors_db, 'by_agent_error_type', (agent_name, error_type))
+            if (datetime.now() - datetime.fromisoformat(e['timestamp'])) < timedelta(hours=24)
         ]
 
         if len(recent_errors) >= 3:
@@ -765,13 +818,7 @@ class OracleMeta:
 
     def _store_pattern(self, pattern: Dict):
         """Store detected pattern"""
-        with open(self.patterns_db, 'r') as f:
-            data = json.load(f)
-
-        data['patterns'].append(pattern)
-
-        with open(self.patterns_db, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.store.append(self.patterns_db, ['patterns'], pattern)
 
     def predict_failures(self, agent_name: str) -> Dict[str, Any]:
         """
@@ -841,8 +888,7 @@ class OracleMeta:
             agent_name: Name of agent
             metrics: Performance metrics dictionary
         """
-        with open(self.metrics_db, 'r') as f:
-            data = json.load(f)
+        data = self.store.load(self.metrics_db)
 
         if agent_name not in data['agents']:
             data['agents'][agent_name] = {
@@ -872,17 +918,15 @@ class OracleMeta:
         # Keep only last 100 metrics
         agent_data['metrics_history'] = agent_data['metrics_history'][-100:]
 
-        with open(self.metrics_db, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.store.put(self.metrics_db, ['agents', agent_name], agent_data)
 
         logger.info(f"🔮 Tracked performance for {agent_name}: Success rate {agent_data['success_rate']:.1%}")
 
     def get_agent_metrics(self, agent_name: str) -> Optional[Dict]:
         """Get current metrics for an agent"""
-        with open(self.metrics_db, 'r') as f:
-            data = json.load(f)
+        data = self.store.load(self.metrics_db)
 
-        return data['agents'].get(agent_name)
+        return copy.deepcopy(data['agents'].get(agent_name))
 
     def generate_performance_report(self) -> Dict[str, Any]:
         """
@@ -891,8 +935,7 @@ class OracleMeta:
         Returns:
             Performance report with recommendations
         """
-        with open(self.metrics_db, 'r') as f:
-            data = json.load(f)
+        data = self.store.load(self.metrics_db)
 
         report = {
             'generated_at': datetime.now().isoformat(),
@@ -1032,15 +1075,13 @@ class OracleMeta:
         }
 
         # Knowledge base stats
-        with open(self.errors_db, 'r') as f:
-            errors_data = json.load(f)
-        with open(self.patterns_db, 'r') as f:
-            patterns_data = json.load(f)
+        errors_data = self.store.load(self.errors_db)
+        patterns_data = self.store.load(self.patterns_db)
 
         report['knowledge_base'] = {
             'total_errors_documented': len(errors_data['errors']),
             'total_patterns_detected': len(patterns_data['patterns']),
-            'knowledge_base_size_mb': sum(f.stat().st_size for f in self.knowledge_base_dir.glob('*.json')) / (1024 * 1024)
+            'knowledge_base_size_mb': sum(f.stat().st_size for f in self.knowledge_base_dir.glob('*.json*')) / (1024 * 1024)
         }
 
         # Performance report
@@ -1049,10 +1090,9 @@ class OracleMeta:
 
         # Generate predictions for all agents
         predictions = {}
-        with open(self.metrics_db, 'r') as f:
-            metrics_data = json.load(f)
+        metrics_data = self.store.load(self.metrics_db)
 
-        for agent_name in metrics_data['agents'].keys():
+        for agent_name in list(metrics_data['agents'].keys()):
             predictions[agent_name] = self.predict_failures(agent_name)
 
         report['predictions'] = predictions
@@ -1100,8 +1140,7 @@ class OracleMeta:
         self.think(f"Analyzing project context for: {file_key[:12]}...", category="Analyzing")
 
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             project = data.get('projects', {}).get(file_key)
 
@@ -1183,8 +1222,7 @@ class OracleMeta:
             Success status
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             # Initialize project if it doesn't exist
             if file_key not in data.get('projects', {}):
@@ -1229,9 +1267,8 @@ class OracleMeta:
                         project['common_patterns'].append(pattern)
                         logger.info(f"🔮 New pattern tracked: {pattern}")
 
-            # Save back
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Save back (only this project's record)
+            self.store.put(self.project_patterns_db, ['projects', file_key], project)
 
             logger.info(f"🔮 Project patterns updated for {file_key}")
             logger.info(f"🔮 Total conversions: {project['conversions_count']}")
@@ -1254,8 +1291,7 @@ class OracleMeta:
             Component status including extraction status, file path, etc.
         """
         try:
-            with open(self.shared_components_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.shared_components_db)
 
             component = data.get('shared_components', {}).get(component_name)
 
@@ -1289,27 +1325,22 @@ class OracleMeta:
             Success status
         """
         try:
-            with open(self.shared_components_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.shared_components_db)
 
             if component_name in data.get('shared_components', {}):
-                data['shared_components'][component_name]['status'] = 'extracted'
-                data['shared_components'][component_name]['file_path'] = file_path
-                data['shared_components'][component_name]['extracted_at'] = datetime.now().isoformat()
+                component = data['shared_components'][component_name]
+                component['status'] = 'extracted'
+                component['file_path'] = file_path
+                component['extracted_at'] = datetime.now().isoformat()
+                self.store.put(self.shared_components_db, ['shared_components', component_name], component)
 
                 # Log extraction
-                if 'extraction_log' not in data:
-                    data['extraction_log'] = []
-
-                data['extraction_log'].append({
+                self.store.append(self.shared_components_db, ['extraction_log'], {
                     'component_name': component_name,
                     'file_path': file_path,
                     'extracted_at': datetime.now().isoformat()
                 })
 
-                with open(self.shared_components_db, 'w') as f:
-                    json.dump(data, f, indent=2)
-
                 logger.info(f"🔮 Shared component extracted: {component_name} → {file_path}")
                 return True
 
@@ -1341,8 +1372,7 @@ class OracleMeta:
             question_id: Unique identifier for the stored question
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             # Generate unique question ID
             question_id = f"Q{len(data.get('user_learning', {}).get('questions_asked', [])) + 1:04d}"
@@ -1360,34 +1390,25 @@ class OracleMeta:
             }
 
             # Store question
-            if 'user_learning' not in data:
-                data['user_learning'] = {'questions_asked': []}
-
-            data['user_learning']['questions_asked'].append(question_record)
+            self.store.append(self.project_patterns_db, ['user_learning', 'questions_asked'], question_record)
+            user_learning = data['user_learning']
 
             # Update category stats
-            if 'question_categories' not in data['user_learning']:
-                data['user_learning']['question_categories'] = {}
-
-            if category not in data['user_learning']['question_categories']:
-                data['user_learning']['question_categories'][category] = {
-                    'count': 0,
-                    'avg_satisfaction': 0.0,
-                    'common_issues': [],
-                    'typical_questions': []
-                }
-
-            data['user_learning']['question_categories'][category]['count'] += 1
+            category_stats = user_learning.get('question_categories', {}).get(category, {
+                'count': 0,
+                'avg_satisfaction': 0.0,
+                'common_issues': [],
+                'typical_questions': []
+            })
+            category_stats['count'] += 1
+            self.store.put(self.project_patterns_db,
+                           ['user_learning', 'question_categories', category], category_stats)
 
             # Update analytics
-            if 'analytics' not in data['user_learning']:
-                data['user_learning']['analytics'] = {}
-
-            data['user_learning']['analytics']['total_questions'] = data['user_learning']['analytics'].get('total_questions', 0) + 1
-            data['user_learning']['analytics']['last_updated'] = datetime.now().isoformat()
-
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(data, f, indent=2)
+            analytics = user_learning.get('analytics', {})
+            analytics['total_questions'] = analytics.get('total_questions', 0) + 1
+            analytics['last_updated'] = datetime.now().isoformat()
+            self.store.put(self.project_patterns_db, ['user_learning', 'analytics'], analytics)
 
             logger.info(f"🔮 User question stored: {question_id} [{category}]")
             return question_id
@@ -1408,8 +1429,7 @@ class OracleMeta:
             List of similar questions with their answers
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             questions_asked = data.get('user_learning', {}).get('questions_asked', [])
 
@@ -1454,8 +1474,7 @@ class OracleMeta:
             Analytics including most asked categories, common patterns, etc.
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             user_learning = data.get('user_learning', {})
             categories = user_learning.get('question_categories', {})
@@ -1492,17 +1511,10 @@ class OracleMeta:
             Success status
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
-
-            if 'user_learning' not in data:
-                data['user_learning'] = {}
-
-            if 'user_journey_log' not in data['user_learning']:
-                data['user_learning']['user_journey_log'] = []
+            data = self.store.load(self.project_patterns_db)
 
             # Log milestone
-            data['user_learning']['user_journey_log'].append({
+            self.store.append(self.project_patterns_db, ['user_learning', 'user_journey_log'], {
                 'user_stage': user_stage,
                 'milestone': milestone,
                 'achieved_at': datetime.now().isoformat()
@@ -1515,9 +1527,6 @@ class OracleMeta:
             if milestone in success_indicators:
                 logger.info(f"🔮 User achieved success indicator: {milestone}")
 
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(data, f, indent=2)
-
             logger.info(f"🔮 User journey tracked: {user_stage} → {milestone}")
             return True
 
@@ -1533,8 +1542,7 @@ class OracleMeta:
             List of identified gaps with severity and suggested improvements
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             questions_asked = data.get('user_learning', {}).get('questions_asked', [])
 
@@ -1588,17 +1596,12 @@ class OracleMeta:
             Success status
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
-            if 'hero_meta_learning' not in data:
-                data['hero_meta_learning'] = {
-                    'mission_history': [],
-                    'hero_performance_trends': {}
-                }
+            meta_learning = data.get('hero_meta_learning', {})
 
             # Extract key mission data
-            mission_id = f"M{len(data['hero_meta_learning']['mission_history']) + 1:04d}"
+            mission_id = f"M{len(meta_learning.get('mission_history', [])) + 1:04d}"
 
             mission_record = {
                 'mission_id': mission_id,
@@ -1617,21 +1620,18 @@ class OracleMeta:
             for hero_name, report in hero_reports.items():
                 mission_record['hero_reports'][hero_name] = self._extract_hero_learnings(hero_name, report)
 
-            # Store mission in history
-            data['hero_meta_learning']['mission_history'].append(mission_record)
-
             # Update hero performance trends
+            data.setdefault('hero_meta_learning', {})
             self._update_hero_performance_trends(data, mission_record)
 
+            # Store mission in history
+            history_keys = ['hero_meta_learning', 'mission_history']
+            self.store.append(self.project_patterns_db, history_keys, mission_record)
+
             # Keep only last 100 missions in main file (archive rest)
             if len(data['hero_meta_learning']['mission_history']) > 100:
-                # Archive old missions
-                archived = data['hero_meta_learning']['mission_history'][:-100]
-                data['hero_meta_learning']['mission_history'] = data['hero_meta_learning']['mission_history'][-100:]
                 # TODO: Save archived missions to separate file
-
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(data, f, indent=2)
+                self.store.trim(self.project_patterns_db, history_keys, 100)
 
             logger.info(f"🔮 Mission outcome tracked: {mission_id} [{mission_record['mission_type']}] - Success: {mission_record['success']}")
 
@@ -1867,24 +1867,20 @@ class OracleMeta:
     def _store_learning_session(self, session: "LearningSession"):
         """Store learning session in knowledge base"""
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
-
-            if 'learning_sessions' not in data:
-                data['learning_sessions'] = {}
+            data = self.store.load(self.project_patterns_db)
 
             if 'satisfaction_patterns' not in data:
-                data['satisfaction_patterns'] = {
+                self.store.put(self.project_patterns_db, ['satisfaction_patterns'], {
                     'user_satisfaction_history': [],
                     'satisfaction_thresholds': {}
-                }
+                })
 
             # Store session
-            data['learning_sessions'][session.session_id] = session.to_dict()
+            self.store.put(self.project_patterns_db, ['learning_sessions', session.session_id], session.to_dict())
 
             # Update satisfaction history
             if session.user_satisfaction:
-                data['satisfaction_patterns']['user_satisfaction_history'].append({
+                self.store.append(self.project_patterns_db, ['satisfaction_patterns', 'user_satisfaction_history'], {
                     'session_id': session.session_id,
                     'timestamp': session.start_time.isoformat(),
                     'score': session.user_satisfaction.get('score', 0),
@@ -1892,18 +1888,12 @@ class OracleMeta:
                     'mission_type': session.mission_type
                 })
 
-            # Keep only last 50 sessions
-            if len(data['learning_sessions']) > 50:
-                # Sort by timestamp and keep latest 50
-                sorted_sessions = sorted(
-                    data['learning_sessions'].items(),
-                    key=lambda x: x[1].get('started_at', ''),
-                    reverse=True
-                )
-                data['learning_sessions'] = dict(sorted_sessions[:50])
-
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Keep only last 50 sessions - journal the dropped keys, not the whole dict
+            sessions = data['learning_sessions']
+            if len(sessions) > 50:
+                oldest_first = sorted(sessions, key=lambda session_id: sessions[session_id].get('started_at', ''))
+                for session_id in oldest_first[:len(sessions) - 50]:
+                    self.store.delete(self.project_patterns_db, ['learning_sessions', session_id])
 
             logger.debug(f"🔮 Learning session stored: {session.session_id}")
 
@@ -1983,8 +1973,9 @@ class OracleMeta:
         for hero_name, hero_data in hero_reports.items():
             hero_key = hero_name.lower().replace(' ', '_').replace('🎨', '').replace('🏹', '').replace('🦇', '').replace('🦅', '').strip()
 
-            if hero_key not in data['hero_meta_learning']['hero_performance_trends']:
-                data['hero_meta_learning']['hero_performance_trends'][hero_key] = {
+            trends = data['hero_meta_learning'].setdefault('hero_performance_trends', {})
+            if hero_key not in trends:
+                trends[hero_key] = {
                     'total_missions': 0,
                     'success_rate': 0.0,
                     'average_accuracy': 0.0,
@@ -1993,7 +1984,7 @@ class OracleMeta:
                     'last_updated': None
                 }
 
-            trend = data['hero_meta_learning']['hero_performance_trends'][hero_key]
+            trend = trends[hero_key]
 
             # Update counters
             trend['total_missions'] += 1
@@ -2020,6 +2011,8 @@ class OracleMeta:
                 trend['accuracy_trend_30d'] = trend['accuracy_trend_30d'][-30:]
 
             trend['last_updated'] = datetime.now().isoformat()
+            self.store.put(self.project_patterns_db,
+                           ['hero_meta_learning', 'hero_performance_trends', hero_key], trend)
 
     def _perform_real_time_learning(self, data: Dict[str, Any], mission_record: Dict[str, Any]):
         """
@@ -2038,10 +2031,9 @@ class OracleMeta:
                 'pattern': 'mission_failure'
             }
 
-            if 'predictive_insights' not in data['hero_meta_learning']:
-                data['hero_meta_learning']['predictive_insights'] = {'failure_patterns': []}
-
-            data['hero_meta_learning']['predictive_insights']['failure_patterns'].append(failure_pattern)
+            self.store.append(self.project_patterns_db,
+                              ['hero_meta_learning', 'predictive_insights', 'failure_patterns'],
+                              failure_pattern)
 
             logger.warning(f"🔮 Mission failure detected: {mission_record['mission_id']} - Oracle is learning from this")
 
@@ -2060,8 +2052,7 @@ class OracleMeta:
             Performance analysis with trends, skill gaps, and insights
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             hero_key = hero_name.lower().replace(' ', '_')
             trends = data.get('hero_meta_learning', {}).get('hero_performance_trends', {}).get(hero_key, {})
@@ -2109,8 +2100,7 @@ class OracleMeta:
             List of identified skill gaps with severity and recommendations
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(self.project_patterns_db)
 
             mission_history = data.get('hero_meta_learning', {}).get('mission_history', [])
             hero_key = hero_name.lower()
@@ -2160,19 +2150,13 @@ class OracleMeta:
             Effectiveness comparison across heroes
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
-
-            mission_history = data.get('hero_meta_learning', {}).get('mission_history', [])
-
             hero_performance = {}
 
-            for mission in mission_history:
-                if mission.get('mission_type') == mission_type:
-                    for hero_name, hero_data in mission.get('hero_reports', {}).items():
-                        if hero_name not in hero_performance:
-                            hero_performance[hero_name] = []
-                        hero_performance[hero_name].append(hero_data.get('score', 0))
+            for mission in self._missions_of_type(mission_type):
+                for hero_name, hero_data in mission.get('hero_reports', {}).items():
+                    if hero_name not in hero_performance:
+                        hero_performance[hero_name] = []
+                    hero_performance[hero_name].append(hero_data.get('score', 0))
 
             # Calculate averages and rank
             hero_rankings = []
@@ -2288,12 +2272,11 @@ class OracleMeta:
         try:
             hero_capabilities_file = Path('/Users/admin/Documents/claudecode/Projects/aldo-vision/data/hero_capabilities.json')
 
-            if not hero_capabilities_file.exists():
+            if not self.store.exists(hero_capabilities_file):
                 logger.warning("🔮 Hero capabilities file not found - using defaults")
                 return {'hero': hero_name, 'status': 'using_defaults', 'thresholds': {}, 'recommended_techniques': []}
 
-            with open(hero_capabilities_file, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(hero_capabilities_file)
 
             hero_key = hero_name.lower().replace(' ', '_')
             hero_config = data.get('heroes', {}).get(hero_key, {})
@@ -2334,8 +2317,7 @@ class OracleMeta:
         try:
             hero_capabilities_file = Path('/Users/admin/Documents/claudecode/Projects/aldo-vision/data/hero_capabilities.json')
 
-            with open(hero_capabilities_file, 'r') as f:
-                data = json.load(f)
+            data = self.store.load(hero_capabilities_file)
 
             hero_key = hero_name.lower().replace(' ', '_')
 
@@ -2366,10 +2348,8 @@ class OracleMeta:
                     hero_config['skill_evolution'] = {}
                 hero_config['skill_evolution'].update(updates)
 
-            data['last_updated'] = datetime.now().isoformat()
-
-            with open(hero_capabilities_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.store.put(hero_capabilities_file, ['heroes', hero_key], hero_config)
+            self.store.put(hero_capabilities_file, ['last_updated'], datetime.now().isoformat())
 
             logger.info(f"🔮 Updated {hero_name} {capability_type}: {updates}")
             return True
@@ -2394,17 +2374,10 @@ class OracleMeta:
             Prediction with probability and reasoning
         """
         try:
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
-
             mission_type = mission_context.get('mission_type', 'unknown')
-            mission_history = data.get('hero_meta_learning', {}).get('mission_history', [])
 
             # Find similar past missions
-            similar_missions = [
-                m for m in mission_history
-                if m.get('mission_type') == mission_type
-            ]
+            similar_missions = self._missions_of_type(mission_type)
 
             if not similar_missions:
                 return {
@@ -2512,18 +2485,13 @@ class OracleMeta:
             }
 
             # Store scenario
-            with open(self.project_patterns_db, 'r') as f:
-                data = json.load(f)
-
-            if 'hero_meta_learning' not in data:
-                data['hero_meta_learning'] = {}
-            if 'training_scenarios' not in data['hero_meta_learning']:
-                data['hero_meta_learning']['training_scenarios'] = {'active_scenarios': [], 'completed_scenarios': []}
-
-            data['hero_meta_learning']['training_scenarios']['active_scenarios'].append(scenario)
+            data = self.store.load(self.project_patterns_db)
+            if 'training_scenarios' not in data.get('hero_meta_learning', {}):
+                self.store.put(self.project_patterns_db, ['hero_meta_learning', 'training_scenarios'],
+                               {'active_scenarios': [], 'completed_scenarios': []})
 
-            with open(self.project_patterns_db, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.store.append(self.project_patterns_db,
+                              ['hero_meta_learning', 'training_scenarios', 'active_scenarios'], scenario)
 
             logger.info(f"🔮 Generated training scenario {scenario_id} for {hero_name} [{weak_area}]")
             return scenario
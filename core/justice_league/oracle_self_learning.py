@@ -256,9 +256,9 @@ class OracleSelfLearning:
         accuracy = learning.get("accuracy", 0)
 
         # Update methodology in project patterns
+        store = self.oracle.store
         try:
-            with open(self.oracle.project_patterns_db, 'r') as f:
-                patterns = json.load(f)
+            patterns = store.load(self.oracle.project_patterns_db)
         except (FileNotFoundError, json.JSONDecodeError):
             return 0
 
@@ -286,8 +286,7 @@ class OracleSelfLearning:
                     method_data["last_accuracy"] = accuracy
 
                 # Save
-                with open(self.oracle.project_patterns_db, 'w') as f:
-                    json.dump(patterns, f, indent=2)
+                store.put(self.oracle.project_patterns_db, ["methodologies", method_key], method_data)
 
                 return 1
 
@@ -351,21 +350,21 @@ class OracleSelfLearning:
         success = learning.get("decision_led_to_success", False)
 
         # Update consultation patterns in project patterns
+        store = self.oracle.store
         try:
-            with open(self.oracle.project_patterns_db, 'r') as f:
-                patterns = json.load(f)
+            patterns = store.load(self.oracle.project_patterns_db)
         except (FileNotFoundError, json.JSONDecodeError):
             return 0
 
         # Create or update decision patterns
         if "decision_patterns" not in patterns:
-            patterns["decision_patterns"] = {
+            store.put(self.oracle.project_patterns_db, ["decision_patterns"], {
                 "optimal_hero_count": 2,
                 "consultation_history": []
-            }
+            })
 
         # Add to history
-        patterns["decision_patterns"]["consultation_history"].append({
+        store.append(self.oracle.project_patterns_db, ["decision_patterns", "consultation_history"], {
             "heroes_consulted": heroes_consulted,
             "success": success,
             "timestamp": datetime.now().isoformat()
@@ -378,11 +377,8 @@ class OracleSelfLearning:
             successful = [h for h in history if h.get("success")]
             if successful:
                 avg_heroes = sum(h["heroes_consulted"] for h in successful) / len(successful)
-                patterns["decision_patterns"]["optimal_hero_count"] = round(avg_heroes)
-
-        # Save
-        with open(self.oracle.project_patterns_db, 'w') as f:
-            json.dump(patterns, f, indent=2)
+                store.put(self.oracle.project_patterns_db,
+                          ["decision_patterns", "optimal_hero_count"], round(avg_heroes))
 
         return 1
 
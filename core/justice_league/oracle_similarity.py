@@ -0,0 +1,214 @@
+"""
+🔮 ORACLE SIMILARITY - Near-Duplicate Error Index
+
+MinHash + LSH index used by Oracle to find errors it has already seen.
+
+Each record is normalized to text (dict fields flattened in key order,
+lowercased, numbers and hex ids collapsed), split into character shingles and
+summarized by a MinHash signature. Signatures are split into bands; records
+sharing any band land in the same LSH bucket, so a query only verifies a
+handful of candidates instead of scanning every stored error. Candidates are
+verified with the exact Jaccard similarity of their shingle sets, which (unlike
+a position-by-position character comparison) tolerates text shifted by a few
+characters.
+
+Records are grouped by a caller-supplied bucket key - Oracle uses
+(agent, error_type) - and a query can be limited to some of those groups.
+"""
+
+import hashlib
+import random
+import re
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_HEX_ID = re.compile(r'\b(?:0x)?[0-9a-f]{8,}\b')
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_error_text(value: Any) -> str:
+    """
+    Flatten an error record (dict/list/scalar) into normalized text
+
+    Dict values are emitted in sorted key order so the same error always
+    produces the same text (keys themselves are dropped, so a free-text query
+    can match a structured record); numbers and long hex ids are collapsed to
+    '#' so "timeout after 30s" and "timeout after 60s" normalize identically.
+    """
+    parts: List[str] = []
+
+    def flatten(node: Any):
+        if isinstance(node, dict):
+            for key in sorted(node, key=str):
+                flatten(node[key])
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                flatten(item)
+        elif node is not None:
+            parts.append(str(node))
+
+    flatten(value)
+    text = ' '.join(parts).lower()
+    text = _HEX_ID.sub('#', text)
+    text = _NUMBER.sub('#', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def shingle_hashes(text: str, shingle_size: int = 5) -> Set[int]:
+    """64-bit hashes of the character shingles of `text`"""
+    if len(text) <= shingle_size:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + shingle_size] for i in range(len(text) - shingle_size + 1)}
+    return {
+        int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+        for s in shingles
+    }
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class ErrorSimilarityIndex:
+    """
+    🔮 MinHash/LSH near-duplicate index
+
+    Args:
+        threshold: Default minimum Jaccard similarity for a match
+        num_perm: MinHash signature length (must equal bands * rows)
+        bands: LSH bands - more bands find lower-similarity candidates
+        shingle_size: Characters per shingle
+        normalize: Record -> text normalizer
+
+    With the defaults (16 bands x 4 rows) pairs at 0.8 similarity become
+    candidates with ~99.9% probability and pairs at 0.5 with ~64%, so
+    thresholds much below 0.5 trade recall for speed.
+    """
+
+    def __init__(self,
+                 threshold: float = 0.8,
+                 num_perm: int = 64,
+                 bands: int = 16,
+                 shingle_size: int = 5,
+                 normalize: Callable[[Any], str] = normalize_error_text):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.normalize = normalize
+
+        rng = random.Random(1337)  # Fixed seed: signatures are stable across runs
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._shingles: Dict[Hashable, Set[int]] = {}
+        self._bucket_of: Dict[Hashable, Hashable] = {}
+        # (bucket_key, band_number, band_signature) -> record ids
+        self._lsh: Dict[Tuple[Hashable, int, Tuple[int, ...]], Set[Hashable]] = {}
+        self._buckets: Dict[Hashable, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def __contains__(self, record_id: Hashable) -> bool:
+        return record_id in self._shingles
+
+    def bucket_keys(self) -> List[Hashable]:
+        """All bucket keys that hold at least one record"""
+        return list(self._buckets)
+
+    def add(self, record_id: Hashable, bucket_key: Hashable, record: Any):
+        """Index a record (re-adding an id replaces it)"""
+        if record_id in self._shingles:
+            self.remove(record_id)
+
+        shingles = shingle_hashes(self.normalize(record), self.shingle_size)
+        self._shingles[record_id] = shingles
+        self._bucket_of[record_id] = bucket_key
+        self._buckets.setdefault(bucket_key, set()).add(record_id)
+        for band_key in self._band_keys(bucket_key, shingles):
+            self._lsh.setdefault(band_key, set()).add(record_id)
+
+    def remove(self, record_id: Hashable):
+        """Drop a record from the index"""
+        shingles = self._shingles.pop(record_id, None)
+        if shingles is None:
+            return
+        bucket_key = self._bucket_of.pop(record_id)
+        self._buckets[bucket_key].discard(record_id)
+        if not self._buckets[bucket_key]:
+            del self._buckets[bucket_key]
+        for band_key in self._band_keys(bucket_key, shingles):
+            members = self._lsh.get(band_key)
+            if members is not None:
+                members.discard(record_id)
+                if not members:
+                    del self._lsh[band_key]
+
+    def clear(self):
+        """Drop every record"""
+        self._shingles.clear()
+        self._bucket_of.clear()
+        self._lsh.clear()
+        self._buckets.clear()
+
+    def query(self,
+              record: Any,
+              bucket_keys: Optional[Iterable[Hashable]] = None,
+              threshold: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Find indexed records similar to `record`
+
+        Args:
+            record: Record (or text) to look up
+            bucket_keys: Buckets to search (default: all)
+            threshold: Minimum Jaccard similarity (default: self.threshold)
+
+        Returns:
+            (record_id, similarity) pairs, most similar first
+        """
+        threshold = self.threshold if threshold is None else threshold
+        shingles = shingle_hashes(self.normalize(record), self.shingle_size)
+        signature = self._signature(shingles)
+
+        keys = list(self._buckets) if bucket_keys is None else list(bucket_keys)
+        candidates: Set[Hashable] = set()
+        for bucket_key in keys:
+            for band_key in self._band_keys(bucket_key, shingles, signature):
+                candidates.update(self._lsh.get(band_key, ()))
+
+        matches = []
+        for record_id in candidates:
+            similarity = jaccard(shingles, self._shingles[record_id])
+            if similarity >= threshold:
+                matches.append((record_id, similarity))
+
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def _signature(self, shingles: Set[int]) -> List[int]:
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in shingles)
+            for a, b in self._permutations
+        ]
+
+    def _band_keys(self,
+                   bucket_key: Hashable,
+                   shingles: Set[int],
+                   signature: Optional[List[int]] = None) -> List[Tuple[Hashable, int, Tuple[int, ...]]]:
+        signature = signature if signature is not None else self._signature(shingles)
+        return [
+            (bucket_key, band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
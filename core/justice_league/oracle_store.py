@@ -0,0 +1,346 @@
+"""
+🔮 ORACLE STORE - Load-Once Knowledge Base Engine
+
+Oracle's databases (errors, patterns, metrics, project patterns, ...) used to be
+re-parsed with json.load on nearly every call and rewritten in full with
+json.dump after every change. OracleStore keeps each database in memory after
+the first load and persists changes incrementally.
+
+Storage layout (per database):
+- <name>.json          Compacted snapshot - same format as the legacy databases,
+                       so existing files are imported as-is on first load
+- <name>.json.journal  Append-only JSON-lines log of changes since the snapshot
+
+Journal operations:
+- {"op": "put",    "keys": [...], "value": ...}   Set value at key path
+- {"op": "append", "keys": [...], "value": ...}   Append value to list at key path
+- {"op": "trim",   "keys": [...], "value": N}     Keep only the last N list items
+- {"op": "delete", "keys": [...], "value": null}  Remove the dict key at key path
+
+On load the snapshot is read and the journal replayed. Once the journal grows
+past `compact_threshold` operations (and on shutdown) the snapshot is rewritten
+atomically and the journal truncated, so other tools reading the .json files
+still see the full database.
+
+Indexes:
+    Callers register typed indexes over list sections (e.g. errors by agent,
+    missions by mission_type). Indexes are maintained on append and rebuilt
+    whenever the indexed list is replaced or trimmed.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+KeyPath = Sequence[Union[str, int]]
+
+
+class _Document:
+    """In-memory state for one database file"""
+
+    def __init__(self, path: Path, data: Dict[str, Any], snapshot_stat: Optional[tuple], journal_ops: int):
+        self.path = path
+        self.journal_path = path.with_name(path.name + '.journal')
+        self.data = data
+        self.snapshot_stat = snapshot_stat
+        self.journal_ops = journal_ops
+        self.indexes: Dict[str, '_Index'] = {}
+
+
+class _Index:
+    """Maps key_fn(record) -> list positions for one list section"""
+
+    def __init__(self, list_keys: KeyPath, key_fn: Callable[[Dict[str, Any]], Hashable]):
+        self.list_keys = list(list_keys)
+        self.key_fn = key_fn
+        self.positions: Dict[Hashable, List[int]] = {}
+
+    def rebuild(self, records: List[Any]):
+        self.positions = {}
+        for position, record in enumerate(records):
+            self.add(position, record)
+
+    def add(self, position: int, record: Any):
+        try:
+            key = self.key_fn(record)
+        except (KeyError, TypeError, AttributeError):
+            return
+        self.positions.setdefault(key, []).append(position)
+
+
+class OracleStore:
+    """
+    🔮 Load-once, journal-backed store for Oracle's JSON databases
+
+    All methods are thread-safe. Documents returned by load() are live: mutate
+    them only through put/append/trim/delete (or mutate a sub-object in place and then
+    put() it) so the change is journaled.
+    """
+
+    def __init__(self, compact_threshold: int = 500):
+        """
+        Args:
+            compact_threshold: Journal operations per database before the
+                snapshot is rewritten and the journal truncated
+        """
+        self.compact_threshold = compact_threshold
+        self._documents: Dict[Path, _Document] = {}
+        self._lock = threading.RLock()
+        atexit.register(self.close)
+
+    # ==================== LOADING ====================
+
+    def load(self, path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Get the live document for a database, loading it on first use
+
+        The snapshot is re-read only if it was changed on disk by someone else.
+
+        Raises:
+            FileNotFoundError: Neither snapshot nor journal exists
+            json.JSONDecodeError: Snapshot is not valid JSON
+        """
+        path = Path(path)
+        with self._lock:
+            doc = self._documents.get(path)
+            if doc is not None and doc.snapshot_stat == self._stat(path):
+                return doc.data
+            return self._read(path).data
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """True if the database is loaded or present on disk"""
+        path = Path(path)
+        with self._lock:
+            return path in self._documents or path.exists()
+
+    def create(self, path: Union[str, Path], default_data: Dict[str, Any]):
+        """Create a database snapshot with default contents if it doesn't exist"""
+        path = Path(path)
+        with self._lock:
+            if path.exists():
+                return
+            self._write_snapshot(path, default_data)
+
+    def _read(self, path: Path) -> _Document:
+        journal_path = path.with_name(path.name + '.journal')
+        if path.exists():
+            with open(path, 'r') as f:
+                data = json.load(f)
+        elif journal_path.exists():
+            data = {}
+        else:
+            raise FileNotFoundError(str(path))
+
+        journal_ops = 0
+        if journal_path.exists():
+            with open(journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final write - everything before it is intact
+                        logger.warning(f"🔮 Ignoring incomplete journal entry in {journal_path.name}")
+                        break
+                    self._apply(data, entry['op'], entry['keys'], entry['value'])
+                    journal_ops += 1
+
+        previous = self._documents.get(path)
+        doc = _Document(path, data, self._stat(path), journal_ops)
+        if previous is not None:
+            # Keep registered indexes across external reloads
+            doc.indexes = previous.indexes
+            for index in doc.indexes.values():
+                index.rebuild(self._resolve_list(data, index.list_keys))
+        self._documents[path] = doc
+        return doc
+
+    # ==================== MUTATIONS ====================
+
+    def put(self, path: Union[str, Path], keys: KeyPath, value: Any):
+        """
+        Set value at a key path (intermediate dicts are created) and journal it
+
+        Passing a live sub-object that was already mutated in place is fine -
+        the journal records its current contents.
+        """
+        self._mutate(Path(path), 'put', keys, value)
+
+    def append(self, path: Union[str, Path], keys: KeyPath, value: Any):
+        """Append value to the list at a key path (created if missing) and journal it"""
+        self._mutate(Path(path), 'append', keys, value)
+
+    def trim(self, path: Union[str, Path], keys: KeyPath, keep_last: int):
+        """Keep only the last `keep_last` items of the list at a key path"""
+        self._mutate(Path(path), 'trim', keys, keep_last)
+
+    def delete(self, path: Union[str, Path], keys: KeyPath):
+        """Remove the dict key at a key path (no-op if it is missing) and journal it"""
+        self._mutate(Path(path), 'delete', keys, None)
+
+    def _mutate(self, path: Path, op: str, keys: KeyPath, value: Any):
+        keys = list(keys)
+        with self._lock:
+            self.load(path)
+            doc = self._documents[path]
+            self._apply(doc.data, op, keys, value)
+            self._update_indexes(doc, op, keys)
+
+            with open(doc.journal_path, 'a') as f:
+                f.write(json.dumps({'op': op, 'keys': keys, 'value': value}) + '\n')
+            doc.journal_ops += 1
+
+            if doc.journal_ops >= self.compact_threshold:
+                self._compact(doc)
+
+    @staticmethod
+    def _apply(data: Dict[str, Any], op: str, keys: List[Union[str, int]], value: Any):
+        parent = data
+        for key in keys[:-1]:
+            if isinstance(parent, dict):
+                parent = parent.setdefault(key, {})
+            else:
+                parent = parent[key]
+        last = keys[-1]
+
+        if op == 'put':
+            parent[last] = value
+        elif op == 'append':
+            if isinstance(parent, dict):
+                parent.setdefault(last, [])
+            parent[last].append(value)
+        elif op == 'trim':
+            if len(parent[last]) > value:
+                parent[last] = parent[last][-value:] if value > 0 else []
+        elif op == 'delete':
+            parent.pop(last, None)
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
+
+    # ==================== INDEXES ====================
+
+    def register_index(self,
+                       path: Union[str, Path],
+                       name: str,
+                       list_keys: KeyPath,
+                       key_fn: Callable[[Dict[str, Any]], Hashable]):
+        """
+        Register an index over the list at `list_keys`
+
+        Args:
+            path: Database file
+            name: Index name used with lookup()
+            list_keys: Key path of the indexed list
+            key_fn: Extracts the index key from a record
+        """
+        path = Path(path)
+        with self._lock:
+            self.load(path)
+            doc = self._documents[path]
+            index = _Index(list_keys, key_fn)
+            index.rebuild(self._resolve_list(doc.data, index.list_keys))
+            doc.indexes[name] = index
+
+    def lookup_positions(self, path: Union[str, Path], name: str, key: Hashable) -> List[int]:
+        """Positions in the indexed list whose index key equals `key`"""
+        path = Path(path)
+        with self._lock:
+            self.load(path)
+            return list(self._documents[path].indexes[name].positions.get(key, []))
+
+    def lookup(self, path: Union[str, Path], name: str, key: Hashable) -> List[Dict[str, Any]]:
+        """Live records in the indexed list whose index key equals `key`"""
+        path = Path(path)
+        with self._lock:
+            self.load(path)
+            doc = self._documents[path]
+            index = doc.indexes[name]
+            records = self._resolve_list(doc.data, index.list_keys)
+            return [records[position] for position in index.positions.get(key, [])]
+
+    def _update_indexes(self, doc: _Document, op: str, keys: List[Union[str, int]]):
+        for index in doc.indexes.values():
+            list_keys = index.list_keys
+            if op == 'append' and keys == list_keys:
+                records = self._resolve_list(doc.data, list_keys)
+                index.add(len(records) - 1, records[-1])
+            elif keys[:len(list_keys)] == list_keys or list_keys[:len(keys)] == keys:
+                # The indexed list (or a record in it) was replaced or trimmed
+                index.rebuild(self._resolve_list(doc.data, list_keys))
+
+    @staticmethod
+    def _resolve_list(data: Dict[str, Any], keys: List[Union[str, int]]) -> List[Any]:
+        node: Any = data
+        for key in keys:
+            if isinstance(node, dict):
+                node = node.get(key)
+            elif isinstance(node, list) and isinstance(key, int) and -len(node) <= key < len(node):
+                node = node[key]
+            else:
+                return []
+            if node is None:
+                return []
+        return node if isinstance(node, list) else []
+
+    # ==================== PERSISTENCE ====================
+
+    def compact(self, path: Optional[Union[str, Path]] = None):
+        """Rewrite snapshot(s) and truncate journal(s)"""
+        with self._lock:
+            if path is not None:
+                doc = self._documents.get(Path(path))
+                if doc is not None:
+                    self._compact(doc)
+                return
+            for doc in list(self._documents.values()):
+                if doc.journal_ops:
+                    self._compact(doc)
+
+    def close(self):
+        """Compact every database with pending journal entries"""
+        try:
+            self.compact()
+        except Exception as e:
+            logger.warning(f"🔮 Oracle store compaction failed: {e}")
+
+    def _compact(self, doc: _Document):
+        self._write_snapshot(doc.path, doc.data)
+        doc.snapshot_stat = self._stat(doc.path)
+        if doc.journal_path.exists():
+            doc.journal_path.unlink()
+        doc.journal_ops = 0
+        logger.debug(f"🔮 Compacted {doc.path.name}")
+
+    @staticmethod
+    def _write_snapshot(path: Path, data: Dict[str, Any]):
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+
+# Shared store so every OracleMeta in the process sees the same documents
+_oracle_store: Optional[OracleStore] = None
+_oracle_store_lock = threading.Lock()
+
+
+def get_oracle_store() -> OracleStore:
+    """Get the process-wide Oracle store"""
+    global _oracle_store
+    with _oracle_store_lock:
+        if _oracle_store is None:
+            _oracle_store = OracleStore()
+        return _oracle_store
@@ -0,0 +1,607 @@
+"""
+📸 PAGE SNAPSHOT - Single-Capture DOM/Style/Text Layer
+
+Litty, Zatanna and Plastic Man used to run their own evaluate_script round
+trips, each re-walking links, headings, buttons and computed styles of the
+same DOM. PageCapture collects one normalized snapshot per URL and viewport
+with a single batched script, and the heroes query it locally.
+
+Snapshot format (version 1):
+
+    {
+      "version": 1,
+      "url": "https://example.com/", "hostname": "example.com",
+      "title": "...", "lang": "en",
+      "viewport": {"width": 1280, "height": 800},
+      "scroll_width": 1280,
+      "media": {"touch": false, "hover": true, "pointer_fine": true},
+      "body_text": "<document.body.innerText>",
+      "elements": [                      # document.querySelectorAll('*') order
+        {"tag": "a", "parent": 12,
+         "attrs": {"href": "/pricing", "class": "nav-link"},
+         "nodes": ["Pricing", 41],       # text nodes and child element indexes
+         "style": {"display": "inline", "fontSize": "16px", ...},
+         "rect": [x, y, width, height],
+         "props": {"href": "https://example.com/pricing"}}
+      ]
+    }
+
+Inline <script>/<style> source is not copied (only its length), except
+JSON-LD, so textContent computed from a snapshot leaves it out.
+
+Offline mode: a saved capture file (one snapshot, or {"snapshots": [...]}
+for several viewports) loaded with load_offline_tools() replaces mcp_tools,
+so the heroes can be re-run and benchmarked without a browser.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Computed style properties copied for every element
+STYLE_PROPERTIES = ('display', 'visibility', 'fontSize', 'opacity', 'backgroundColor', 'outline', 'boxShadow')
+
+CAPTURE_SCRIPT = """
+() => {
+    const all = Array.from(document.querySelectorAll('*'));
+    const index = new Map(all.map((el, i) => [el, i]));
+    const styleProps = %s;
+
+    const elements = all.map(el => {
+        const tag = el.tagName.toLowerCase();
+        const attrs = {};
+        for (const attr of el.attributes) {
+            attrs[attr.name] = attr.value;
+        }
+
+        // Inline script/style source stays in the browser (JSON-LD excepted)
+        const opaque = tag === 'style' ||
+            (tag === 'script' && (el.getAttribute('type') || '').toLowerCase() !== 'application/ld+json');
+
+        const nodes = [];
+        el.childNodes.forEach(child => {
+            if (child.nodeType === Node.ELEMENT_NODE) {
+                if (index.has(child)) nodes.push(index.get(child));
+            } else if (!opaque && (child.nodeType === Node.TEXT_NODE || child.nodeType === Node.CDATA_SECTION_NODE)) {
+                nodes.push(child.data);
+            }
+        });
+
+        const computed = window.getComputedStyle(el);
+        const style = {};
+        styleProps.forEach(prop => { style[prop] = computed[prop]; });
+
+        const r = el.getBoundingClientRect();
+        const entry = {
+            tag: tag,
+            parent: index.has(el.parentElement) ? index.get(el.parentElement) : -1,
+            attrs: attrs,
+            nodes: nodes,
+            style: style,
+            rect: [r.x, r.y, r.width, r.height]
+        };
+        if (opaque) entry.text_length = el.textContent.length;
+
+        const props = {};
+        if (typeof el.href === 'string') props.href = el.href;
+        if (typeof el.src === 'string') props.src = el.src;
+        if (tag === 'input') props.checked = el.checked;
+        if (tag === 'video' || tag === 'audio') {
+            props.autoplay = el.autoplay;
+            props.muted = el.muted;
+        }
+        if (tag === 'img') {
+            props.naturalWidth = el.naturalWidth;
+            props.naturalHeight = el.naturalHeight;
+        }
+        if (Object.keys(props).length) entry.props = props;
+        return entry;
+    });
+
+    return {
+        version: %d,
+        url: location.href,
+        hostname: location.hostname,
+        title: document.title || '',
+        lang: document.documentElement.lang || '',
+        viewport: {width: window.innerWidth, height: window.innerHeight},
+        scroll_width: document.body ? document.body.scrollWidth : 0,
+        media: {
+            touch: 'ontouchstart' in window || navigator.maxTouchPoints > 0,
+            hover: window.matchMedia('(hover: hover)').matches,
+            pointer_fine: window.matchMedia('(pointer: fine)').matches
+        },
+        body_text: document.body ? document.body.innerText : '',
+        elements: elements
+    };
+}
+""" % (json.dumps(list(STYLE_PROPERTIES)), SNAPSHOT_VERSION)
+
+
+# ==================== SELECTORS ====================
+
+_SIMPLE_TOKEN = re.compile(r"""
+    (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+  | :not\((?P<not>[^()]*)\)
+""", re.VERBOSE)
+
+
+class _Compound:
+    """tag + attribute conditions + :not() compounds"""
+
+    __slots__ = ('tag', 'conditions', 'negations')
+
+    def __init__(self, tag: Optional[str], conditions: List[Tuple[str, Optional[str], Optional[str]]],
+                 negations: List['_Compound']):
+        self.tag = tag
+        self.conditions = conditions
+        self.negations = negations
+
+    def matches(self, element: 'SnapshotElement') -> bool:
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        attrs = element.attrs
+        for name, op, value in self.conditions:
+            actual = attrs.get(name)
+            if actual is None:
+                return False
+            if op is None:
+                continue
+            if op == '=':
+                ok = actual == value
+            elif op == '*=':
+                ok = bool(value) and value in actual
+            elif op == '^=':
+                ok = bool(value) and actual.startswith(value)
+            elif op == '$=':
+                ok = bool(value) and actual.endswith(value)
+            elif op == '~=':
+                ok = value in actual.split()
+            else:  # |=
+                ok = actual == value or actual.startswith(value + '-')
+            if not ok:
+                return False
+        return not any(negation.matches(element) for negation in self.negations)
+
+
+def _parse_compound(text: str) -> _Compound:
+    tag = None
+    conditions = []
+    negations = []
+    position = 0
+    while position < len(text):
+        match = _SIMPLE_TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Unsupported selector: {text!r}")
+        position = match.end()
+        if match.group('tag'):
+            tag = None if match.group('tag') == '*' else match.group('tag').lower()
+        elif match.group('id'):
+            conditions.append(('id', '=', match.group('id')))
+        elif match.group('cls'):
+            conditions.append(('class', '~=', match.group('cls')))
+        elif match.group('attr'):
+            value = next((v for v in (match.group('dq'), match.group('sq'), match.group('bare')) if v is not None), None)
+            conditions.append((match.group('attr').lower(), match.group('op'), value))
+        else:
+            negations.append(_parse_compound(match.group('not').strip()))
+    return _Compound(tag, conditions, negations)
+
+
+def _split_outside_brackets(text: str, separators: str) -> List[Tuple[str, str]]:
+    """Split on separator characters outside [] / () / quotes -> [(separator_before, part)]"""
+    parts = []
+    depth = 0
+    quote = None
+    current = ''
+    separator = ''
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '"\'':
+            quote = char
+        elif char in '[(':
+            depth += 1
+        elif char in '])':
+            depth -= 1
+        elif depth == 0 and char in separators:
+            if current.strip():
+                parts.append((separator, current.strip()))
+                current = ''
+                separator = char
+            elif char != ' ':
+                separator = char
+            continue
+        current += char
+    if current.strip():
+        parts.append((separator, current.strip()))
+    return parts
+
+
+@lru_cache(maxsize=256)
+def parse_selector(selector: str) -> List[List[Tuple[str, _Compound]]]:
+    """
+    Parse a CSS selector list (the subset the heroes use)
+
+    Supports type/universal, #id, .class, [attr], [attr=|~=|^=|$=|*=||=value],
+    :not(compound), and descendant / child (>) combinators.
+    """
+    groups = []
+    for _, group in _split_outside_brackets(selector, ','):
+        normalized = re.sub(r'\s*>\s*', ' > ', group.strip())
+        steps = []
+        combinator = ' '
+        for _, token in _split_outside_brackets(normalized, ' '):
+            if token == '>':
+                combinator = '>'
+                continue
+            steps.append((combinator, _parse_compound(token)))
+            combinator = ' '
+        groups.append(steps)
+    return groups
+
+
+def _matches_steps(element: 'SnapshotElement', steps: List[Tuple[str, _Compound]], position: int,
+                   scope: Optional['SnapshotElement']) -> bool:
+    if not steps[position][1].matches(element):
+        return False
+    if position == 0:
+        return True
+    combinator = steps[position][0]
+    parent = element.parent
+    while parent is not None and parent is not scope:
+        if _matches_steps(parent, steps, position - 1, scope):
+            return True
+        if combinator == '>':
+            return False
+        parent = parent.parent
+    return False
+
+
+# ==================== SNAPSHOT ====================
+
+class SnapshotElement:
+    """One element of a PageSnapshot (read-only DOM stand-in)"""
+
+    __slots__ = ('snapshot', 'index', 'tag', 'attrs', 'parent_index', 'nodes', 'style', 'rect', 'props',
+                 'text_length', '_text')
+
+    def __init__(self, snapshot: 'PageSnapshot', index: int, data: Dict[str, Any]):
+        self.snapshot = snapshot
+        self.index = index
+        self.tag = data.get('tag', '').lower()
+        self.attrs = data.get('attrs') or {}
+        self.parent_index = data.get('parent', -1)
+        self.nodes = data.get('nodes') or []
+        self.style = data.get('style') or {}
+        self.rect = data.get('rect') or [0, 0, 0, 0]
+        self.props = data.get('props') or {}
+        self.text_length = data.get('text_length')
+        self._text = None
+
+    @property
+    def tag_name(self) -> str:
+        """element.tagName"""
+        return self.tag.upper()
+
+    @property
+    def parent(self) -> Optional['SnapshotElement']:
+        if self.parent_index is None or self.parent_index < 0:
+            return None
+        return self.snapshot.elements[self.parent_index]
+
+    @property
+    def width(self) -> float:
+        return self.rect[2]
+
+    @property
+    def height(self) -> float:
+        return self.rect[3]
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.attrs.get(name.lower())
+
+    def has_attribute(self, name: str) -> bool:
+        return name.lower() in self.attrs
+
+    def prop(self, name: str, default: Any = None) -> Any:
+        """DOM property captured with the snapshot (href, src, checked, ...)"""
+        return self.props.get(name, default)
+
+    def computed(self, prop: str) -> str:
+        """getComputedStyle(element)[prop]"""
+        return self.style.get(prop, '')
+
+    def computed_float(self, prop: str) -> float:
+        """parseFloat(getComputedStyle(element)[prop]) (NaN if unset)"""
+        return _parse_float(self.computed(prop))
+
+    def font_size(self) -> float:
+        return self.computed_float('fontSize')
+
+    @property
+    def text_content(self) -> str:
+        """element.textContent (without inline script/style source)"""
+        if self._text is None:
+            self._build_text()
+        return self._text
+
+    def descendants(self) -> Iterator['SnapshotElement']:
+        """Descendant elements in document order"""
+        stack = [child for child in reversed(self.nodes) if isinstance(child, int)]
+        elements = self.snapshot.elements
+        while stack:
+            element = elements[stack.pop()]
+            yield element
+            stack.extend(child for child in reversed(element.nodes) if isinstance(child, int))
+
+    def query_selector_all(self, selector: str) -> List['SnapshotElement']:
+        groups = parse_selector(selector)
+        return [el for el in self.descendants()
+                if any(_matches_steps(el, steps, len(steps) - 1, self) for steps in groups)]
+
+    def _build_text(self):
+        # Post-order walk so every child's text is ready before its parent's
+        elements = self.snapshot.elements
+        stack = [(self, False)]
+        while stack:
+            element, expanded = stack.pop()
+            if element._text is not None:
+                continue
+            if expanded:
+                element._text = ''.join(
+                    elements[node]._text if isinstance(node, int) else node for node in element.nodes
+                )
+                continue
+            stack.append((element, True))
+            stack.extend((elements[node], False) for node in element.nodes if isinstance(node, int))
+
+
+class PageSnapshot:
+    """
+    📸 Normalized DOM/style/text snapshot of one page at one viewport
+
+    query_selector_all() mirrors document.querySelectorAll for the selector
+    subset parse_selector() supports, returning elements in document order.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.url = data.get('url', '')
+        self.hostname = data.get('hostname', '')
+        self.title = data.get('title', '')
+        self.lang = data.get('lang', '')
+        viewport = data.get('viewport') or {}
+        self.viewport = (viewport.get('width', 0), viewport.get('height', 0))
+        self.scroll_width = data.get('scroll_width', 0)
+        self.media = data.get('media') or {}
+        self.body_text = data.get('body_text', '')
+        self.elements = [SnapshotElement(self, i, element) for i, element in enumerate(data.get('elements', []))]
+
+    @staticmethod
+    def is_snapshot(data: Any) -> bool:
+        """True if data looks like a capture result"""
+        return isinstance(data, dict) and data.get('version') == SNAPSHOT_VERSION and isinstance(data.get('elements'), list)
+
+    def query_selector_all(self, selector: str) -> List[SnapshotElement]:
+        groups = parse_selector(selector)
+        return [el for el in self.elements
+                if any(_matches_steps(el, steps, len(steps) - 1, None) for steps in groups)]
+
+    def query_selector(self, selector: str) -> Optional[SnapshotElement]:
+        groups = parse_selector(selector)
+        for el in self.elements:
+            if any(_matches_steps(el, steps, len(steps) - 1, None) for steps in groups):
+                return el
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.data
+
+
+def _parse_float(value: Any) -> float:
+    """JavaScript parseFloat for CSS values like '16px'"""
+    match = re.match(r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?', str(value))
+    return float(match.group()) if match else float('nan')
+
+
+def js_to_fixed(value: float, digits: int) -> str:
+    """Number.prototype.toFixed (ties round away from zero on the exact binary value)"""
+    return str(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+
+def js_round(value: float) -> int:
+    """Math.round (halves round up)"""
+    return int(value + 0.5) if value >= 0 else -int(-value + 0.5)
+
+
+# ==================== CAPTURE ====================
+
+ViewportKey = Optional[Tuple[int, int]]
+
+
+class PageCapture:
+    """
+    📸 One snapshot per (URL, viewport) for a set of MCP tools
+
+    Thread-safe; concurrent heroes asking for the same page wait for a single
+    capture. If evaluate_script returns something that is not a snapshot
+    (e.g. a test double) the capture is marked unsupported and heroes fall
+    back to their own scripts.
+
+    Offline captures are built from saved snapshots and never touch a browser.
+    """
+
+    def __init__(self, evaluate_script: Optional[Any] = None, snapshots: Optional[List[PageSnapshot]] = None):
+        self.evaluate_script = evaluate_script
+        self.offline = evaluate_script is None
+        self.supported = True
+        self.current_url: Optional[str] = None
+        self.current_viewport: ViewportKey = None
+        self.captures = 0
+        self.hits = 0
+        self._snapshots: Dict[Tuple[Optional[str], ViewportKey], PageSnapshot] = {}
+        self._saved: List[PageSnapshot] = list(snapshots or [])
+        self._lock = threading.Lock()
+
+    def set_viewport(self, width: int, height: int):
+        """Record a resize (later snapshots are taken at this viewport)"""
+        with self._lock:
+            self.current_viewport = (int(width), int(height))
+
+    def invalidate(self):
+        """Forget live snapshots (after navigation or DOM changes)"""
+        with self._lock:
+            self._snapshots.clear()
+            self.current_url = None
+
+    def snapshot(self, url: Optional[str] = None, capture: bool = True) -> Optional[PageSnapshot]:
+        """
+        Snapshot of the current page at the current viewport
+
+        Args:
+            url: URL the caller is analyzing (defaults to the last one seen)
+            capture: False to only return a snapshot that already exists
+                (for checks cheaper than a full capture)
+
+        Returns:
+            PageSnapshot, or None if unavailable (no capture support, or no
+            saved snapshot for this viewport in offline mode)
+        """
+        with self._lock:
+            if not self.supported:
+                return None
+            if url:
+                self.current_url = url
+            key = (self.current_url, self.current_viewport)
+
+            cached = self._snapshots.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            if self.offline:
+                snapshot = self._find_saved(*key)
+            elif capture:
+                snapshot = self._capture()
+            else:
+                snapshot = None
+            if snapshot is None:
+                return None
+
+            self._snapshots[key] = snapshot
+            # Also reachable under the URL the browser reported
+            self._snapshots.setdefault((snapshot.url or None, self.current_viewport), snapshot)
+            if self.current_url is None:
+                self.current_url = snapshot.url or None
+            return snapshot
+
+    def _capture(self) -> Optional[PageSnapshot]:
+        try:
+            data = self.evaluate_script(function=CAPTURE_SCRIPT)
+        except Exception as e:
+            logger.warning(f"📸 Page capture failed: {e}")
+            return None
+        if not PageSnapshot.is_snapshot(data):
+            logger.debug("📸 evaluate_script did not return a page snapshot - heroes use their own scripts")
+            self.supported = False
+            return None
+        self.captures += 1
+        snapshot = PageSnapshot(data)
+        self._saved.append(snapshot)
+        logger.info(f"📸 Captured {len(snapshot.elements)} elements at {snapshot.viewport[0]}x{snapshot.viewport[1]}")
+        return snapshot
+
+    def _find_saved(self, url: Optional[str], viewport: ViewportKey) -> Optional[PageSnapshot]:
+        candidates = [s for s in self._saved if url and s.url == url] or self._saved
+        if viewport is None:
+            return candidates[0] if candidates else None
+        return next((s for s in candidates if tuple(s.viewport) == viewport), None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'mode': 'offline' if self.offline else 'live',
+            'captures': self.captures,
+            'cache_hits': self.hits,
+            'snapshots': len(self._saved)
+        }
+
+    def save(self, path: Union[str, Path]):
+        """Write every snapshot taken (or loaded) so far for offline re-runs"""
+        path = Path(path)
+        with self._lock:
+            data = {'version': SNAPSHOT_VERSION, 'snapshots': [s.to_dict() for s in self._saved]}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'PageCapture':
+        """Offline capture from a saved snapshot file"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        raw = data.get('snapshots', [data]) if isinstance(data, dict) else data
+        snapshots = [PageSnapshot(s) for s in raw if PageSnapshot.is_snapshot(s)]
+        if not snapshots:
+            raise ValueError(f"No page snapshots in {path}")
+        return cls(snapshots=snapshots)
+
+
+_capture_lock = threading.Lock()
+
+
+def get_page_capture(mcp_tools: Optional[Dict[str, Any]]) -> Optional[PageCapture]:
+    """
+    Shared PageCapture for an mcp_tools dict
+
+    Created on first use (and stored under 'page_capture') so every hero
+    handed the same tools shares one capture.
+    """
+    if not mcp_tools:
+        return None
+    capture = mcp_tools.get('page_capture')
+    if isinstance(capture, PageCapture):
+        return capture
+    evaluate_script = mcp_tools.get('evaluate_script')
+    if not evaluate_script:
+        return None
+    with _capture_lock:
+        capture = mcp_tools.get('page_capture')
+        if not isinstance(capture, PageCapture):
+            capture = PageCapture(evaluate_script)
+            try:
+                mcp_tools['page_capture'] = capture
+            except TypeError:
+                pass
+    return capture
+
+
+def get_page_snapshot(mcp_tools: Optional[Dict[str, Any]], url: Optional[str] = None) -> Optional[PageSnapshot]:
+    """Snapshot for the current page/viewport, or None if the heroes should use their own scripts"""
+    capture = get_page_capture(mcp_tools)
+    return capture.snapshot(url) if capture else None
+
+
+def load_offline_tools(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    mcp_tools stand-in backed by a saved snapshot file (no browser needed)
+
+    resize_page selects the saved snapshot for that viewport.
+    """
+    capture = PageCapture.load(path)
+    return {'page_capture': capture, 'resize_page': capture.set_viewport}
@@ -26,6 +26,8 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.utils import ImageReader
 
+from .export_manifest import ManifestIndex
+
 
 class PDFCompiler:
     """
@@ -163,10 +165,14 @@ class PDFCompiler:
         """
         Scan export directory and organize frames by page
 
+        Frame dimensions come from the export manifest written by Quicksilver;
+        only frames missing from it (or changed since) are opened.
+
         Returns:
             Dict mapping page names to list of (frame_path, frame_info) tuples
         """
         frames_by_page = {}
+        manifests = ManifestIndex(export_dir)
 
         # Expected structure: export_dir/Document/PageName/frame.png
         doc_dir = export_dir / "Document"
@@ -189,11 +195,15 @@ class PDFCompiler:
                 frame_name = png_file.stem
 
                 # Get image dimensions
-                try:
-                    with Image.open(png_file) as img:
-                        width, height = img.size
-                except Exception:
-                    width, height = 0, 0
+                entry = manifests.entry_for(png_file)
+                if entry is not None:
+                    width, height = entry['width'], entry['height']
+                else:
+                    try:
+                        with Image.open(png_file) as img:
+                            width, height = img.size
+                    except Exception:
+                        width, height = 0, 0
 
                 frame_info = {
                     'name': frame_name,
@@ -0,0 +1,418 @@
+"""
+📈 PERFORMANCE HISTORY - Append-Only Metrics Store for Flash & Superman
+
+One SQLite database per baseline directory replaces the per-run JSON files:
+- `runs`: one row per profiling run (hero, test, timestamp, score, grade)
+- `metrics`: one row per (run, metric) - the narrow, columnar table every
+  trend query reads, indexed by (test_name, metric, timestamp)
+- `run_blobs`: the full result dict, zlib-compressed, read only on request
+
+History listings, percentiles, trends and regression checks never parse a
+full result. Regressions are judged against the rolling median ± k·MAD of
+recent runs rather than a single baseline run, so one noisy run neither
+hides nor fakes a regression.
+
+Existing `{test}_{YYYYmmdd_HHMMSS}.json` history files and `{test}_baseline.json`
+baselines are imported once by migrate_json_files().
+"""
+
+import json
+import logging
+import sqlite3
+import statistics
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .sqlite_store import SQLiteStore, to_epoch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_NAME = 'performance_history.db'
+
+# Metric name -> True when a higher value is better
+METRIC_DIRECTIONS = {
+    'score': True,
+    'lcp': False,
+    'fid': False,
+    'cls': False,
+    'fcp': False,
+    'tti': False,
+    'tbt': False,
+    'inp': False
+}
+
+# Hero -> result key holding its score dict
+SCORE_KEYS = {
+    'superman': 'superman_performance_score',
+    'flash': 'flash_speed_score'
+}
+
+DEFAULT_WINDOW = 20
+DEFAULT_MIN_RUNS = 5
+DEFAULT_MAD_THRESHOLD = 3.0
+# MAD -> standard deviation for normally distributed values
+MAD_SCALE = 1.4826
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    hero TEXT NOT NULL,
+    test_name TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    url TEXT,
+    score REAL,
+    grade TEXT,
+    source TEXT UNIQUE
+);
+CREATE INDEX IF NOT EXISTS runs_test_time ON runs (test_name, timestamp);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    hero TEXT NOT NULL,
+    test_name TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metrics_series ON metrics (test_name, metric, timestamp, value);
+
+CREATE TABLE IF NOT EXISTS run_blobs (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id),
+    data BLOB NOT NULL
+);
+"""
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile (0-100) of already sorted values"""
+    if not sorted_values:
+        raise ValueError("percentile of an empty series")
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def median_mad(values: Sequence[float]) -> Tuple[float, float]:
+    """Median and scaled median absolute deviation"""
+    median = statistics.median(values)
+    mad = statistics.median(abs(value - median) for value in values) * MAD_SCALE
+    return median, mad
+
+
+def extract_metrics(results: Dict[str, Any], hero: str) -> Dict[str, float]:
+    """
+    Numeric metrics of a Flash/Superman result: score plus every Core Web
+    Vital that was measured (vitals marked source='missing' are skipped so
+    unreported metrics do not enter the history as zeros)
+    """
+    metrics = {}
+    score = (results.get(SCORE_KEYS.get(hero, ''), None) or {}).get('score')
+    if isinstance(score, (int, float)):
+        metrics['score'] = float(score)
+
+    for key, data in (results.get('core_web_vitals') or {}).items():
+        if not isinstance(data, dict) or data.get('source') == 'missing':
+            continue
+        value = data.get('value')
+        if isinstance(value, (int, float)):
+            metrics[key.lower()] = float(value)
+
+    for key, value in (results.get('trace_metrics') or {}).items():
+        if key in METRIC_DIRECTIONS and key not in metrics and isinstance(value, (int, float)):
+            metrics[key] = float(value)
+    return metrics
+
+
+class PerformanceHistory(SQLiteStore):
+    """
+    📈 Append-only performance history shared by Flash and Superman
+
+    A Flash and a Superman run may append to the same database concurrently.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        super().__init__(db_path)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    # ==================== WRITING ====================
+
+    def record(self, test_name: str, results: Dict[str, Any], hero: str = 'superman',
+               timestamp: Union[str, float, datetime, None] = None, store_blob: bool = True,
+               source: Optional[str] = None) -> int:
+        """
+        Append one profiling run
+
+        Args:
+            test_name: Test name
+            results: Flash/Superman result dict
+            hero: 'superman' or 'flash' (selects the score key)
+            timestamp: Run time (default: results['timestamp'], else now)
+            store_blob: Keep the full result dict for get_run()
+            source: Unique origin (migrated file path); duplicates are skipped
+
+        Returns:
+            Run id (the existing id when source was already imported)
+        """
+        with self._connect() as conn:
+            if source is not None:
+                row = conn.execute('SELECT id FROM runs WHERE source = ?', (source,)).fetchone()
+                if row:
+                    return row[0]
+            return self._insert(conn, test_name, results, hero, timestamp, store_blob, source)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, test_name: str, results: Dict[str, Any], hero: str,
+                timestamp, store_blob: bool, source: Optional[str]) -> int:
+        epoch = to_epoch(timestamp if timestamp is not None else results.get('timestamp'))
+        score = results.get(SCORE_KEYS.get(hero, ''), None) or {}
+        metrics = extract_metrics(results, hero)
+
+        run_id = conn.execute(
+            'INSERT INTO runs (hero, test_name, timestamp, url, score, grade, source) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (hero, test_name, epoch, results.get('url'), metrics.get('score'), score.get('grade'), source)
+        ).lastrowid
+        conn.executemany(
+            'INSERT INTO metrics (run_id, hero, test_name, metric, timestamp, value) VALUES (?, ?, ?, ?, ?, ?)',
+            [(run_id, hero, test_name, metric, epoch, value) for metric, value in metrics.items()]
+        )
+        if store_blob:
+            blob = zlib.compress(json.dumps(results, default=str).encode('utf-8'))
+            conn.execute('INSERT INTO run_blobs (run_id, data) VALUES (?, ?)', (run_id, blob))
+        return run_id
+
+    def migrate_json_files(self, paths: Iterable[Union[str, Path]], store_blob: bool = True,
+                           hero: Optional[str] = None, only_new_tests: bool = False) -> Dict[str, int]:
+        """
+        📦 Import legacy per-run history and baseline JSON files
+
+        Test name comes from the file's 'test_name' or its name
+        ({test}_{YYYYmmdd}_{HHMMSS}.json / {test}_baseline.json); the hero
+        from the score key it carries. Files already imported are skipped,
+        so the migration can run on every start.
+
+        Args:
+            paths: JSON files to import
+            store_blob: Keep each file's content for get_run()
+            hero: Only import files of this hero (others are skipped)
+            only_new_tests: Skip files for tests that already have runs of
+                their hero (for files the hero keeps rewriting, e.g. baselines)
+
+        Returns:
+            Counts of imported, skipped and failed files
+        """
+        counts = {'imported': 0, 'skipped': 0, 'failed': 0}
+        # One transaction for the whole import
+        with self._connect() as conn:
+            known = {row[0] for row in conn.execute('SELECT source FROM runs WHERE source IS NOT NULL')}
+
+            for path in sorted(Path(p) for p in paths):
+                source = str(path.resolve())
+                if source in known:
+                    counts['skipped'] += 1
+                    continue
+                try:
+                    with open(path, 'r') as f:
+                        data = json.load(f)
+                    file_hero = 'flash' if 'flash_speed_score' in data else 'superman'
+                    if hero and file_hero != hero:
+                        counts['skipped'] += 1
+                        continue
+                    test_name = data.get('test_name') or self._test_name_from_file(path)
+                    if only_new_tests and conn.execute('SELECT 1 FROM runs WHERE test_name = ? AND hero = ? LIMIT 1',
+                                                       (test_name, file_hero)).fetchone():
+                        counts['skipped'] += 1
+                        continue
+                    timestamp = data.get('timestamp') or path.stat().st_mtime
+                    self._insert(conn, test_name, data, file_hero, timestamp, store_blob, source)
+                    counts['imported'] += 1
+                except (OSError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning(f"📈 Could not migrate {path}: {e}")
+                    counts['failed'] += 1
+
+        if counts['imported']:
+            logger.info(f"📈 Migrated {counts['imported']} JSON history files into {self.db_path}")
+        return counts
+
+    @staticmethod
+    def _test_name_from_file(path: Path) -> str:
+        stem = path.stem
+        if stem.endswith('_baseline'):
+            return stem[:-len('_baseline')]
+        parts = stem.rsplit('_', 2)
+        if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+            return parts[0]
+        return stem
+
+    # ==================== QUERIES ====================
+
+    def history(self, test_name: str, limit: int = 10, hero: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent runs first: run_id, hero, timestamp, url, score, grade"""
+        query = 'SELECT id, hero, timestamp, url, score, grade FROM runs WHERE test_name = ?'
+        params: List[Any] = [test_name]
+        if hero:
+            query += ' AND hero = ?'
+            params.append(hero)
+        query += ' ORDER BY timestamp DESC, id DESC LIMIT ?'
+        params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            {'run_id': run_id, 'hero': run_hero, 'timestamp': _iso(epoch), 'url': url, 'score': score, 'grade': grade}
+            for run_id, run_hero, epoch, url, score, grade in rows
+        ]
+
+    def series(self, test_name: str, metric: str = 'score', limit: Optional[int] = None,
+               since: Union[str, float, datetime, None] = None,
+               before: Union[str, float, datetime, None] = None,
+               hero: Optional[str] = None) -> List[Tuple[float, float]]:
+        """(epoch seconds, value) of one metric, oldest first (the latest `limit` runs)"""
+        query = 'SELECT timestamp, value FROM metrics WHERE test_name = ? AND metric = ?'
+        params: List[Any] = [test_name, metric]
+        if hero:
+            query += ' AND hero = ?'
+            params.append(hero)
+        if since is not None:
+            query += ' AND timestamp >= ?'
+            params.append(to_epoch(since))
+        if before is not None:
+            query += ' AND timestamp < ?'
+            params.append(to_epoch(before))
+        query += ' ORDER BY timestamp DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        rows.reverse()
+        return rows
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Full result dict of one run (None if it was stored without one)"""
+        with self._connect() as conn:
+            row = conn.execute('SELECT data FROM run_blobs WHERE run_id = ?', (run_id,)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def percentiles(self, test_name: str, metric: str = 'score',
+                    percentiles: Sequence[float] = (50, 75, 95), limit: Optional[int] = None,
+                    since: Union[str, float, datetime, None] = None, hero: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Percentiles of a metric over the latest runs
+
+        Returns:
+            {'count', 'min', 'max', 'p50': ..., 'p75': ..., ...}
+            (count 0 and no percentiles when there is no history)
+        """
+        values = sorted(value for _, value in self.series(test_name, metric, limit=limit, since=since, hero=hero))
+        summary: Dict[str, Any] = {'metric': metric, 'count': len(values)}
+        if values:
+            summary.update(min=values[0], max=values[-1])
+            for pct in percentiles:
+                summary[f'p{pct:g}'] = round(percentile(values, pct), 4)
+        return summary
+
+    def trend(self, test_name: str, metric: str = 'score', window: int = DEFAULT_WINDOW * 2,
+              hero: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Least-squares trend of a metric over its latest `window` runs
+
+        direction is 'improving' / 'degrading' when the fitted change across
+        the window exceeds one MAD, 'flat' otherwise.
+        """
+        points = self.series(test_name, metric, limit=window, hero=hero)
+        result: Dict[str, Any] = {'metric': metric, 'runs': len(points), 'direction': 'insufficient_history'}
+        if len(points) < 3:
+            return result
+
+        days = [(epoch - points[0][0]) / 86400.0 for epoch, _ in points]
+        values = [value for _, value in points]
+        mean_day, mean_value = statistics.fmean(days), statistics.fmean(values)
+        spread = sum((day - mean_day) ** 2 for day in days)
+        slope = (sum((day - mean_day) * (value - mean_value) for day, value in zip(days, values)) / spread
+                 if spread else 0.0)
+
+        change = slope * (days[-1] - days[0])
+        median, mad = median_mad(values)
+        higher_is_better = METRIC_DIRECTIONS.get(metric, True)
+        if abs(change) <= mad or change == 0:
+            direction = 'flat'
+        else:
+            direction = 'improving' if (change > 0) == higher_is_better else 'degrading'
+
+        result.update(direction=direction, slope_per_day=round(slope, 6), change_over_window=round(change, 4),
+                      median=median, mad=round(mad, 4), first=_iso(points[0][0]), last=_iso(points[-1][0]))
+        return result
+
+    def check_regression(self, test_name: str, metric: str, value: float,
+                         window: int = DEFAULT_WINDOW, min_runs: int = DEFAULT_MIN_RUNS,
+                         threshold: float = DEFAULT_MAD_THRESHOLD,
+                         before: Union[str, float, datetime, None] = None,
+                         hero: Optional[str] = None) -> Dict[str, Any]:
+        """
+        🔍 Is `value` outside the rolling median ± threshold·MAD of recent runs?
+
+        Args:
+            test_name: Test name
+            metric: Metric name (direction from METRIC_DIRECTIONS)
+            value: Current value, not yet recorded
+            window: Number of previous runs in the reference window
+            min_runs: Fewer runs give status 'insufficient_history'
+            threshold: Allowed deviation in scaled MADs
+            before: Only runs before this time (default: all recorded runs)
+            hero: Only runs of this hero (their scores are not comparable)
+
+        Returns:
+            status ('regression' / 'improvement' / 'stable' /
+            'insufficient_history'), is_regression, median, mad, bounds and
+            the deviation in MADs
+        """
+        values = [v for _, v in self.series(test_name, metric, limit=window, before=before, hero=hero)]
+        result: Dict[str, Any] = {
+            'metric': metric, 'value': value, 'runs': len(values),
+            'status': 'insufficient_history', 'is_regression': False
+        }
+        if len(values) < min_runs:
+            return result
+
+        median, mad = median_mad(values)
+        # Identical runs have no spread: allow 1% of the median instead
+        scale = mad or abs(median) * 0.01 or 1e-9
+        deviation = (value - median) / scale
+        higher_is_better = METRIC_DIRECTIONS.get(metric, True)
+        worse = -deviation if higher_is_better else deviation
+
+        if worse > threshold:
+            status = 'regression'
+        elif worse < -threshold:
+            status = 'improvement'
+        else:
+            status = 'stable'
+
+        result.update(
+            status=status, is_regression=status == 'regression',
+            median=median, mad=round(mad, 4),
+            lower_bound=round(median - threshold * scale, 4), upper_bound=round(median + threshold * scale, 4),
+            deviation_mads=round(deviation, 3)
+        )
+        return result
+
+    def check_run(self, test_name: str, results: Dict[str, Any], hero: str = 'superman',
+                  **kwargs) -> Dict[str, Dict[str, Any]]:
+        """check_regression() for every metric of a (not yet recorded) run"""
+        return {metric: self.check_regression(test_name, metric, value, hero=hero, **kwargs)
+                for metric, value in extract_metrics(results, hero).items()}
+
+    def list_tests(self) -> List[str]:
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute('SELECT DISTINCT test_name FROM runs ORDER BY test_name')]
+
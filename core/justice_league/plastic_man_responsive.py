@@ -30,6 +30,13 @@ except ImportError:
     NARRATOR_AVAILABLE = False
     logging.warning("Mission Control Narrator not available - Plastic Man will operate without narrator")
 
+# Shared page snapshot (one capture per page/viewport for all browser-driven heroes)
+try:
+    from .page_snapshot import get_page_capture
+    PAGE_SNAPSHOT_AVAILABLE = True
+except ImportError:
+    PAGE_SNAPSHOT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -134,33 +141,36 @@ class PlasticManResponsive:
         # Determine which breakpoints to test
         breakpoints_to_test = test_scenarios or list(self.BREAKPOINTS.keys())
 
+        # Shared page capture (None -> each test runs its own script)
+        capture = get_page_capture(mcp_tools) if PAGE_SNAPSHOT_AVAILABLE else None
+
         # Power 1: Elasticity - Test each breakpoint
         logger.info("🎨 Using Elasticity to stretch across breakpoints...")
         for breakpoint_name in breakpoints_to_test:
             if breakpoint_name in self.BREAKPOINTS:
-                bp_result = self._elastic_stretch_test(breakpoint_name, mcp_tools)
+                bp_result = self._elastic_stretch_test(breakpoint_name, mcp_tools, capture)
                 results['breakpoint_results'][breakpoint_name] = bp_result
                 results['breakpoints_tested'].append(breakpoint_name)
 
         # Power 2: Shape-shifting - Test device-specific features
         logger.info("🎨 Shape-shifting to test device features...")
-        device_tests = self._shapeshift_device_test(mcp_tools)
+        device_tests = self._shapeshift_device_test(mcp_tools, capture)
         results['device_specific'] = device_tests
 
         # Power 3: Malleability - Test viewport meta tags
         logger.info("🎨 Using Malleability to validate viewport...")
-        viewport_result = self._malleable_viewport_test(mcp_tools)
+        viewport_result = self._malleable_viewport_test(mcp_tools, capture)
         results['viewport_analysis'] = viewport_result
         results['viewport_issues'].extend(viewport_result.get('issues', []))
 
         # Power 4: Flexibility - Test orientation changes
         logger.info("🎨 Testing Flexibility with orientation changes...")
-        orientation_result = self._flexible_orientation_test(mcp_tools)
+        orientation_result = self._flexible_orientation_test(mcp_tools, capture)
         results['orientation_testing'] = orientation_result
 
         # Power 5: Extensibility - Validate touch targets
         logger.info("🎨 Extending to validate touch targets...")
-        touch_result = self._extensible_touch_target_test(mcp_tools)
+        touch_result = self._extensible_touch_target_test(mcp_tools, capture)
         results['touch_target_analysis'] = touch_result
         results['touch_target_issues'].extend(touch_result.get('issues', []))
 
@@ -181,13 +191,14 @@ class PlasticManResponsive:
 
         return results
 
-    def _elastic_stretch_test(self, breakpoint_name: str, mcp_tools: Dict) -> Dict[str, Any]:
+    def _elastic_stretch_test(self, breakpoint_name: str, mcp_tools: Dict, capture: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎨 Elasticity - Stretch to test a specific breakpoint
 
         Args:
             breakpoint_name: Name of breakpoint to test
             mcp_tools: MCP tools
+            capture: Shared PageCapture (optional)
 
         Returns:
             Breakpoint test results
@@ -210,27 +221,36 @@ class PlasticManResponsive:
             resize_func = mcp_tools.get('resize_page')
             if resize_func:
                 resize_func(width=width, height=height)
+                if capture:
+                    capture.set_viewport(width, height)
                 logger.info(f"  ✓ Stretched to {label}")
 
+            # Reuse a snapshot already taken at this size (a full capture costs more than one check)
+            page = capture.snapshot(capture=False) if capture else None
+
             # Take snapshot at this size
             snapshot_func = mcp_tools.get('take_snapshot')
             if snapshot_func:
                 snapshot = snapshot_func()
                 result['snapshot_taken'] = True
 
-                # Check for horizontal scroll (bad on mobile)
+            # Check for horizontal scroll (bad on mobile)
+            has_horizontal_scroll = False
+            if page is not None:
+                has_horizontal_scroll = page.scroll_width > page.viewport[0]
+            elif snapshot_func:
                 eval_func = mcp_tools.get('evaluate_script')
                 if eval_func:
                     has_horizontal_scroll = eval_func(
                         function="() => document.body.scrollWidth > window.innerWidth"
                     )
-                    if has_horizontal_scroll:
-                        result['issues'].append({
-                            'issue': 'Horizontal scroll detected',
-                            'severity': 'medium',
-                            'recommendation': 'Fix overflow, use max-width: 100%'
-                        })
-                        result['passed'] = False
+            if has_horizontal_scroll:
+                result['issues'].append({
+                    'issue': 'Horizontal scroll detected',
+                    'severity': 'medium',
+                    'recommendation': 'Fix overflow, use max-width: 100%'
+                })
+                result['passed'] = False
 
             # Check if text is readable (not too small)
             # Minimum font size should be 16px on mobile
@@ -244,12 +264,13 @@ class PlasticManResponsive:
 
         return result
 
-    def _shapeshift_device_test(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _shapeshift_device_test(self, mcp_tools: Dict, capture: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎨 Shape-shifting - Test device-specific features
 
         Args:
             mcp_tools: MCP tools
+            capture: Shared PageCapture (optional)
 
         Returns:
             Device-specific test results
@@ -263,24 +284,30 @@ class PlasticManResponsive:
         }
 
         eval_func = mcp_tools.get('evaluate_script')
-        if eval_func:
+        page = capture.snapshot() if capture else None
+        if page is not None or eval_func:
             try:
-                # Check if touch is supported
-                touch_enabled = eval_func(
-                    function="() => 'ontouchstart' in window || navigator.maxTouchPoints > 0"
-                )
-                result['touch_enabled'] = touch_enabled
+                if page is not None:
+                    touch_enabled = page.media.get('touch', False)
+                    hover_supported = page.media.get('hover', False)
+                    pointer_fine = page.media.get('pointer_fine', False)
+                else:
+                    # Check if touch is supported
+                    touch_enabled = eval_func(
+                        function="() => 'ontouchstart' in window || navigator.maxTouchPoints > 0"
+                    )
 
-                # Check hover support
-                hover_supported = eval_func(
-                    function="() => window.matchMedia('(hover: hover)').matches"
-                )
-                result['hover_supported'] = hover_supported
+                    # Check hover support
+                    hover_supported = eval_func(
+                        function="() => window.matchMedia('(hover: hover)').matches"
+                    )
 
-                # Check pointer precision
-                pointer_fine = eval_func(
-                    function="() => window.matchMedia('(pointer: fine)').matches"
-                )
+                    # Check pointer precision
+                    pointer_fine = eval_func(
+                        function="() => window.matchMedia('(pointer: fine)').matches"
+                    )
+                result['touch_enabled'] = touch_enabled
+                result['hover_supported'] = hover_supported
                 result['pointer_fine'] = pointer_fine
 
                 # If touch but hover-dependent UI, that's an issue
@@ -296,12 +323,13 @@ class PlasticManResponsive:
 
         return result
 
-    def _malleable_viewport_test(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _malleable_viewport_test(self, mcp_tools: Dict, capture: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎨 Malleability - Validate viewport meta tags
 
         Args:
             mcp_tools: MCP tools
+            capture: Shared PageCapture (optional)
 
         Returns:
             Viewport validation results
@@ -314,12 +342,17 @@ class PlasticManResponsive:
         }
 
         eval_func = mcp_tools.get('evaluate_script')
-        if eval_func:
+        page = capture.snapshot() if capture else None
+        if page is not None or eval_func:
             try:
                 # Check for viewport meta tag
-                viewport_content = eval_func(
-                    function="() => document.querySelector('meta[name=\"viewport\"]')?.content || ''"
-                )
+                if page is not None:
+                    viewport_meta = page.query_selector('meta[name="viewport"]')
+                    viewport_content = (viewport_meta.get_attribute('content') or '') if viewport_meta else ''
+                else:
+                    viewport_content = eval_func(
+                        function="() => document.querySelector('meta[name=\"viewport\"]')?.content || ''"
+                    )
 
                 if viewport_content:
                     result['viewport_meta_present'] = True
@@ -359,12 +392,13 @@ class PlasticManResponsive:
 
         return result
 
-    def _flexible_orientation_test(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _flexible_orientation_test(self, mcp_tools: Dict, capture: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎨 Flexibility - Test orientation changes (portrait/landscape)
 
         Args:
             mcp_tools: MCP tools
+            capture: Shared PageCapture (optional)
 
         Returns:
             Orientation test results
@@ -386,6 +420,8 @@ class PlasticManResponsive:
             for orientation, width, height in orientations:
                 try:
                     resize_func(width=width, height=height)
+                    if capture:
+                        capture.set_viewport(width, height)
                     result['orientations_tested'].append(orientation)
                     logger.info(f"  ✓ Tested {orientation} orientation ({width}x{height})")
                 except Exception as e:
@@ -394,12 +430,13 @@ class PlasticManResponsive:
 
         return result
 
-    def _extensible_touch_target_test(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _extensible_touch_target_test(self, mcp_tools: Dict, capture: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎨 Extensibility - Validate touch target sizes
 
         Args:
             mcp_tools: MCP tools
+            capture: Shared PageCapture (optional)
 
         Returns:
             Touch target validation results
@@ -412,34 +449,38 @@ class PlasticManResponsive:
         }
 
         eval_func = mcp_tools.get('evaluate_script')
-        if eval_func:
+        page = capture.snapshot() if capture else None
+        if page is not None or eval_func:
             try:
                 # Check size of all interactive elements
-                small_targets = eval_func(
-                    function=f"""() => {{
-                        const minSize = {self.MIN_TOUCH_TARGET_SIZE};
-                        const interactive = document.querySelectorAll('button, a, input, select, textarea, [role="button"], [onclick]');
-                        const smallTargets = [];
-
-                        interactive.forEach(el => {{
-                            const rect = el.getBoundingClientRect();
-                            if (rect.width < minSize || rect.height < minSize) {{
-                                smallTargets.push({{
-                                    tag: el.tagName,
-                                    width: rect.width,
-                                    height: rect.height,
-                                    text: el.textContent?.substring(0, 30)
-                                }});
-                            }}
-                        }});
-
-                        return {{
-                            total: interactive.length,
-                            smallCount: smallTargets.length,
-                            examples: smallTargets.slice(0, 5)
-                        }};
-                    }}"""
-                )
+                if page is not None:
+                    small_targets = self._touch_targets_from_snapshot(page)
+                else:
+                    small_targets = eval_func(
+                        function=f"""() => {{
+                            const minSize = {self.MIN_TOUCH_TARGET_SIZE};
+                            const interactive = document.querySelectorAll('button, a, input, select, textarea, [role="button"], [onclick]');
+                            const smallTargets = [];
+
+                            interactive.forEach(el => {{
+                                const rect = el.getBoundingClientRect();
+                                if (rect.width < minSize || rect.height < minSize) {{
+                                    smallTargets.push({{
+                                        tag: el.tagName,
+                                        width: rect.width,
+                                        height: rect.height,
+                                        text: el.textContent?.substring(0, 30)
+                                    }});
+                                }}
+                            }});
+
+                            return {{
+                                total: interactive.length,
+                                smallCount: smallTargets.length,
+                                examples: smallTargets.slice(0, 5)
+                            }};
+                        }}"""
+                    )
 
                 result['interactive_elements_checked'] = small_targets.get('total', 0)
                 result['too_small_targets'] = small_targets.get('smallCount', 0)
@@ -458,6 +499,26 @@ class PlasticManResponsive:
 
         return result
 
+    def _touch_targets_from_snapshot(self, page) -> Dict[str, Any]:
+        """Touch target sizes from a PageSnapshot (same result as the touch target script)"""
+        min_size = self.MIN_TOUCH_TARGET_SIZE
+        interactive = page.query_selector_all('button, a, input, select, textarea, [role="button"], [onclick]')
+        small_targets = [
+            {
+                'tag': el.tag_name,
+                'width': el.width,
+                'height': el.height,
+                'text': el.text_content[:30]
+            }
+            for el in interactive
+            if el.width < min_size or el.height < min_size
+        ]
+        return {
+            'total': len(interactive),
+            'smallCount': len(small_targets),
+            'examples': small_targets[:5]
+        }
+
     def _calculate_plastic_man_score(self, results: Dict) -> Dict[str, Any]:
         """
         🎨 Calculate Plastic Man's responsive design score
@@ -25,11 +25,14 @@ from datetime import datetime
 from pathlib import Path
 import re
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 import threading
 
 from .hero_base import HeroBase, HeroPriority
 from .green_arrow_visual_validator import GreenArrowVisualValidator
+from .export_manifest import ALPHA_MODES, ExportManifest, ManifestIndex, flatten_png, flatten_png_file
+from .figma_client import FigmaRateLimiter, get_figma_client, parse_retry_after
 
 # Mission Control Narrator for coordinated communication
 try:
@@ -96,6 +99,7 @@ class QuicksilverSpeedExport(HeroBase):
     Configuration (Environment Variables):
     - QUICKSILVER_MAX_WORKERS: Concurrent workers (default: 8)
     - QUICKSILVER_BATCH_SIZE: Frames per API batch (default: 15)
+    - QUICKSILVER_URL_WORKERS: Concurrent URL batch requests (default: 3)
     - QUICKSILVER_API_TIMEOUT: API timeout seconds (default: 60)
     - QUICKSILVER_CDN_TIMEOUT: CDN timeout seconds (default: 120)
     """
@@ -177,20 +181,20 @@ class QuicksilverSpeedExport(HeroBase):
         self.api_timeout = int(os.getenv('QUICKSILVER_API_TIMEOUT', '60'))
         self.cdn_timeout = int(os.getenv('QUICKSILVER_CDN_TIMEOUT', '120'))
         self.max_retries = int(os.getenv('QUICKSILVER_MAX_RETRIES', '5'))
+        self.url_workers = int(os.getenv('QUICKSILVER_URL_WORKERS', '3'))
 
-        # Connection pooling: Create persistent session with adapter
-        self.session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=self.max_workers,
-            pool_maxsize=self.max_workers * 2,
-            max_retries=3
-        )
-        self.session.mount('https://', adapter)
+        # Connection pooling and rate limiting: the shared Figma client's
+        # keep-alive session and token bucket serve API and CDN requests
+        self.figma_client = get_figma_client(
+            self.figma_token, timeout=self.api_timeout, max_retries=self.max_retries
+        ) if self.figma_token else None
+        self._session = None if self.figma_client else requests.Session()
 
         # Thread safety
         self.progress_lock = threading.Lock()
         self.rate_limit_lock = threading.Lock()
         self.rate_limited = False
+        self.rate_limiter = self.figma_client.rate_limiter if self.figma_client else FigmaRateLimiter()
 
         # Complexity thresholds for format selection (copied from Hawkman)
         self.complexity_thresholds = {
@@ -241,6 +245,18 @@ class QuicksilverSpeedExport(HeroBase):
     # NARRATOR INTEGRATION - Unique Speed-Focused Personality
     # ================================================================
 
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for Figma API and CDN requests (the shared client's when a token is set)"""
+        return self.figma_client.session if self.figma_client else self._session
+
+    @session.setter
+    def session(self, session: requests.Session):
+        if self.figma_client:
+            self.figma_client.session = session
+        else:
+            self._session = session
+
     def say(self, message: str, style: str = "energetic", technical_info: Optional[str] = None):
         """
         Quicksilver dialogue - Speed-focused, energetic personality
@@ -326,32 +342,11 @@ class QuicksilverSpeedExport(HeroBase):
         if not self.figma_token:
             raise ValueError("Figma token not set. Cannot fetch real data.")
 
-        headers = {"X-Figma-Token": self.figma_token}
-
-        # Build API URL
-        if node_id:
-            url = f"https://api.figma.com/v1/files/{file_key}/nodes?ids={node_id}"
-        else:
-            url = f"https://api.figma.com/v1/files/{file_key}"
-
-        logger.info(f"🔍 Fetching Figma structure: {url}")
+        logger.info(f"🔍 Fetching Figma structure: {file_key}" + (f" node {node_id}" if node_id else ""))
 
         try:
-            response = self.session.get(url, headers=headers, timeout=self.api_timeout)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Extract the relevant node
-            if node_id:
-                nodes = data.get('nodes', {})
-                if node_id in nodes:
-                    return nodes[node_id]['document']
-                else:
-                    raise ValueError(f"Node {node_id} not found in file")
-            else:
-                return data.get('document', {})
-
+            # Shared client: cached by file version, concurrent fetches coalesced
+            return self.figma_client.get_document(file_key, node_id)
         except requests.RequestException as e:
             logger.error(f"❌ Failed to fetch Figma data: {e}")
             raise
@@ -474,18 +469,20 @@ class QuicksilverSpeedExport(HeroBase):
         url = f"https://api.figma.com/v1/images/{file_key}?ids={ids_param}&format=png&scale={scale}"
 
         try:
-            response = self.session.get(url, headers=headers, timeout=self.api_timeout)
-
-            # Check for rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 60))
-                logger.warning(f"⚠️ Rate limit hit, waiting {retry_after}s")
-                with self.rate_limit_lock:
-                    self.rate_limited = True
-                time.sleep(retry_after)
-                # Retry once
+            for attempt in range(self.max_retries):
+                self.rate_limiter.acquire()
                 response = self.session.get(url, headers=headers, timeout=self.api_timeout)
 
+                # Rate limited: close the shared gate so every worker backs off
+                if response.status_code == 429 and attempt < self.max_retries - 1:
+                    retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                    logger.warning(f"⚠️ Rate limit hit, pausing Figma API requests for {retry_after}s")
+                    with self.rate_limit_lock:
+                        self.rate_limited = True
+                    self.rate_limiter.pause(retry_after)
+                    continue
+                break
+
             response.raise_for_status()
             data = response.json()
 
@@ -495,6 +492,11 @@ class QuicksilverSpeedExport(HeroBase):
             logger.error(f"❌ Batch API request failed: {e}")
             return {}
 
+    @staticmethod
+    def _parse_retry_after(value: Optional[str], default: float = 60.0) -> float:
+        """Retry-After header in seconds (delta-seconds form; anything else -> default)"""
+        return parse_retry_after(value, default)
+
     def _download_image_with_retry(
         self,
         image_url: str,
@@ -555,36 +557,54 @@ class QuicksilverSpeedExport(HeroBase):
         Returns:
             Result dict with success status and metadata
         """
+        success, content, error = self._download_image_with_retry(image_url)
+
+        if not success:
+            return {
+                'success': False,
+                'node_name': node_data['name'],
+                'node_id': node_data['id'],
+                'error': error
+            }
+
+        content, image_info = flatten_png(content)
+        return self._write_frame(node_data, content, page_dir, sanitized_file_name, sanitized_page_name, image_info)
+
+    def _write_frame(
+        self,
+        node_data: Dict[str, Any],
+        content: bytes,
+        page_dir: Path,
+        sanitized_file_name: str,
+        sanitized_page_name: str,
+        image_info: Optional[Dict[str, Any]] = None,
+        manifest: Optional[ExportManifest] = None
+    ) -> Dict[str, Any]:
+        """
+        Writer stage: save a downloaded frame into {file_name}/{page_name}/node.png
+
+        image_info (from flatten_png) is recorded in `manifest` when given.
+        """
         node_name = node_data['name']
         node_id = node_data['id']
-        node_type = node_data['type']
 
         try:
-            # Download with retry
-            success, content, error = self._download_image_with_retry(image_url)
-
-            if not success:
-                return {
-                    'success': False,
-                    'node_name': node_name,
-                    'node_id': node_id,
-                    'error': error
-                }
-
             # Sanitize node name for filename
             sanitized_node_name = self.sanitize_filename(node_name)
 
-            # Save into hierarchical structure: {file_name}/{page_name}/node.png
             image_filename = f"{sanitized_node_name}_{node_id}.png"
             image_path = page_dir / image_filename
 
             with open(image_path, 'wb') as f:
                 f.write(content)
 
+            if manifest is not None and image_info is not None:
+                manifest.record(image_path, {**image_info, 'bytes': len(content)})
+
             return {
                 'success': True,
                 'node_name': node_name,
-                'node_type': node_type,
+                'node_type': node_data['type'],
                 'page_name': node_data.get('page_name'),
                 'node_id': node_id,
                 'file_path': str(image_path),
@@ -600,6 +620,124 @@ class QuicksilverSpeedExport(HeroBase):
                 'error': str(e)
             }
 
+    def _run_export_pipeline(
+        self,
+        file_key: str,
+        nodes: List[Dict[str, Any]],
+        scale: float,
+        write_frame: callable,
+        on_result: Optional[callable] = None,
+        process_content: Optional[callable] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        💨 Staged export pipeline: URL batches -> CDN downloads -> disk writes
+
+        URL batches resolve concurrently (url_workers) under the shared rate
+        limiter. As soon as a batch's URLs arrive its downloads are queued on
+        the download pool (max_workers), and every downloaded image is handed
+        to a single writer thread, so no stage waits for the previous one to
+        finish the whole file. CPU work on the downloaded bytes (e.g. alpha
+        flattening) runs in the download workers via process_content.
+
+        Args:
+            file_key: Figma file key
+            nodes: Node dicts with at least 'id' and 'name'
+            scale: Export scale
+            write_frame: write_frame(node, payload) -> result dict, run on the writer stage
+            on_result: Called as on_result(node, result) on the calling thread as
+                each node finishes (including nodes that got no URL)
+            process_content: Optional process_content(content) -> payload, run in
+                the download worker; the payload defaults to the raw bytes
+
+        Returns:
+            One result dict per node, in the order of `nodes`
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(nodes)
+        batches = [
+            list(range(i, min(i + self.batch_size, len(nodes))))
+            for i in range(0, len(nodes), self.batch_size)
+        ]
+
+        def finish(index: int, result: Dict[str, Any]):
+            results[index] = result
+            if on_result:
+                on_result(nodes[index], result)
+
+        def fetch(image_url: str) -> Tuple[bool, Any, Optional[str]]:
+            success, content, error = self._download_image_with_retry(image_url)
+            if success and process_content:
+                content = process_content(content)
+            return success, content, error
+
+        url_pool = ThreadPoolExecutor(max_workers=max(1, min(self.url_workers, len(batches) or 1)))
+        download_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        writer = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            # future -> (stage, payload)
+            pending: Dict[Any, Tuple[str, Any]] = {}
+            for batch_number, batch in enumerate(batches, 1):
+                logger.info(f"📦 Requesting batch {batch_number}/{len(batches)} ({len(batch)} frames)")
+                future = url_pool.submit(
+                    self._batch_request_export_urls, file_key, [nodes[i]['id'] for i in batch], scale
+                )
+                pending[future] = ('urls', batch)
+
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, payload = pending.pop(future)
+
+                    if stage == 'urls':
+                        image_urls = future.result()
+                        for index in payload:
+                            node = nodes[index]
+                            image_url = image_urls.get(node['id'])
+                            if not image_url:
+                                logger.warning(f"⚠️ No image URL for node {node['name']} (ID: {node['id']})")
+                                finish(index, {
+                                    'success': False,
+                                    'node_name': node['name'],
+                                    'node_id': node['id'],
+                                    'error': 'No image URL returned from API'
+                                })
+                                continue
+                            pending[download_pool.submit(fetch, image_url)] = ('download', index)
+
+                    elif stage == 'download':
+                        node = nodes[payload]
+                        try:
+                            success, content, error = future.result()
+                        except Exception as e:
+                            success, content, error = False, None, str(e)
+                        if not success:
+                            finish(payload, {
+                                'success': False,
+                                'node_name': node['name'],
+                                'node_id': node['id'],
+                                'error': error
+                            })
+                            continue
+                        pending[writer.submit(write_frame, node, content)] = ('write', payload)
+
+                    else:
+                        node = nodes[payload]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {
+                                'success': False,
+                                'node_name': node['name'],
+                                'node_id': node['id'],
+                                'error': str(e)
+                            }
+                        finish(payload, result)
+        finally:
+            for pool in (url_pool, download_pool, writer):
+                pool.shutdown(wait=True)
+
+        return results
+
     def export_all_frames_as_png(
         self,
         file_key: str,
@@ -611,8 +749,10 @@ class QuicksilverSpeedExport(HeroBase):
         💨 SPEED-OPTIMIZED: Export all top-level frames from a Figma file as PNG images
 
         Performance Optimizations:
-        - Batch API requests (10-15 frames per call)
-        - Concurrent downloads (8 workers default)
+        - Batch API requests (10-15 frames per call), resolved concurrently
+        - Downloads start as soon as each batch's URLs arrive (8 workers default)
+        - Separate writer stage for disk I/O
+        - Shared rate limiter honouring Retry-After across all workers
         - Connection pooling (HTTP session reuse)
         - Smart timeout tuning (15s API, 30s CDN)
 
@@ -711,29 +851,10 @@ class QuicksilverSpeedExport(HeroBase):
             logger.info(f"📋 Found {total_nodes} exportable nodes across {len(pages_metadata)} pages")
             logger.info(f"💨 Starting concurrent export with {self.max_workers} workers")
 
-            # ==================== BATCH API REQUESTS ====================
-
-            logger.info(f"📦 Batching API requests (batch size: {self.batch_size})")
-            image_url_map = {}
-
-            # Batch nodes into groups
-            for i in range(0, len(all_nodes), self.batch_size):
-                batch = all_nodes[i:i + self.batch_size]
-                batch_node_ids = [n['id'] for n in batch]
-
-                logger.info(f"📦 Requesting batch {i // self.batch_size + 1}/{(len(all_nodes) + self.batch_size - 1) // self.batch_size} ({len(batch)} frames)")
+            # ==================== PIPELINED EXPORT ====================
 
-                # Single API call for batch
-                batch_urls = self._batch_request_export_urls(file_key, batch_node_ids, scale)
-                image_url_map.update(batch_urls)
-
-            logger.info(f"✅ Received {len(image_url_map)} image URLs from Figma API")
-
-            # ==================== CONCURRENT DOWNLOADS ====================
-
-            exported_files = []
-            failed_exports = []
-            current_node = 0
+            logger.info(f"📦 Pipelining {(total_nodes + self.batch_size - 1) // self.batch_size} URL batches "
+                        f"(batch size: {self.batch_size}, {self.url_workers} concurrent)")
 
             # Thread-safe progress counter
             progress_data = {'completed': 0, 'lock': threading.Lock()}
@@ -745,52 +866,36 @@ class QuicksilverSpeedExport(HeroBase):
                     if progress_callback:
                         progress_callback(progress_data['completed'], total_nodes, node_name)
 
-            # Concurrent download with ThreadPoolExecutor
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = []
-
-                for node in all_nodes:
-                    node_id = node['id']
-                    image_url = image_url_map.get(node_id)
-
-                    if not image_url:
-                        logger.warning(f"⚠️ No image URL for node {node['name']} (ID: {node_id})")
-                        failed_exports.append({
-                            'node_name': node['name'],
-                            'node_id': node_id,
-                            'error': 'No image URL returned from API'
-                        })
-                        continue
-
-                    # Get page metadata
-                    page_name = node['page_name']
-                    page_meta = pages_metadata[page_name]
-
-                    # Submit worker task
-                    future = executor.submit(
-                        self._export_single_frame_worker,
-                        node,
-                        image_url,
-                        export_dir,
-                        page_meta['page_dir'],
-                        sanitized_file_name,
-                        page_meta['sanitized_name']
-                    )
-                    futures.append((future, node))
-
-                # Collect results as they complete
-                for future, node in futures:
-                    result = future.result()
+            # Frames are flattened onto white in the download workers and
+            # their dimensions recorded for PDFCompiler
+            manifest = ExportManifest(file_dir)
+
+            def write_frame(node: Dict[str, Any], flattened: Tuple[bytes, Dict[str, Any]]) -> Dict[str, Any]:
+                content, image_info = flattened
+                page_meta = pages_metadata[node['page_name']]
+                return self._write_frame(
+                    node,
+                    content,
+                    page_meta['page_dir'],
+                    sanitized_file_name,
+                    page_meta['sanitized_name'],
+                    image_info,
+                    manifest
+                )
 
-                    if result['success']:
-                        exported_files.append(result)
-                        logger.info(f"✅ [{progress_data['completed'] + 1}/{total_nodes}] {result['file_structure']}")
-                    else:
-                        failed_exports.append(result)
-                        logger.error(f"❌ [{progress_data['completed'] + 1}/{total_nodes}] Failed: {result['node_name']} - {result.get('error', 'Unknown error')}")
+            def on_result(node: Dict[str, Any], result: Dict[str, Any]):
+                if result['success']:
+                    logger.info(f"✅ [{progress_data['completed'] + 1}/{total_nodes}] {result['file_structure']}")
+                else:
+                    logger.error(f"❌ [{progress_data['completed'] + 1}/{total_nodes}] Failed: {result['node_name']} - {result.get('error', 'Unknown error')}")
+                update_progress(node['name'])
 
-                    # Update progress
-                    update_progress(node['name'])
+            results = self._run_export_pipeline(
+                file_key, all_nodes, scale, write_frame, on_result, process_content=flatten_png
+            )
+            manifest.save()
+            exported_files = [result for result in results if result['success']]
+            failed_exports = [result for result in results if not result['success']]
 
             # ==================== RESULTS ====================
 
@@ -821,6 +926,9 @@ class QuicksilverSpeedExport(HeroBase):
         Convert transparent PNGs (RGBA) to white-background PNGs (RGB)
 
         This fixes black borders in PDF viewers caused by PNG alpha channels.
+        Frames already flattened during export are known from the export
+        manifest and skipped; anything else is flattened in a process pool and
+        recorded in the manifest so PDFCompiler doesn't decode it again.
 
         Args:
             export_dir: Directory containing PNG files
@@ -828,26 +936,54 @@ class QuicksilverSpeedExport(HeroBase):
         Returns:
             Number of PNGs converted
         """
-        from PIL import Image
+        index = ManifestIndex(export_dir)
+        pending = []
+
+        for png_path in export_dir.rglob("*.png"):
+            entry = index.entry_for(png_path)
+            if entry is not None and entry['mode'] not in ALPHA_MODES:
+                continue
+            pending.append(png_path)
 
-        png_files = list(export_dir.rglob("*.png"))
+        if not pending:
+            return 0
+
+        fallback_manifest = None
         converted = 0
 
-        for png_path in png_files:
+        def record(png_path: Path, info: Dict[str, Any]):
+            nonlocal converted, fallback_manifest
+            manifest = index.manifest_for(png_path)
+            if manifest is None:
+                if fallback_manifest is None:
+                    fallback_manifest = ExportManifest(export_dir)
+                manifest = fallback_manifest
+            manifest.record(png_path, info)
+            if info['flattened']:
+                converted += 1
+
+        done = set()
+        if len(pending) >= 4:
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.max_workers, os.cpu_count() or 1)) as executor:
+                    for png_path, info in zip(pending, executor.map(flatten_png_file, pending, chunksize=8)):
+                        record(png_path, info)
+                        done.add(png_path)
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"⚠️ Process pool unavailable, flattening in-process: {e}")
+
+        for png_path in pending:
+            if png_path in done:
+                continue
             try:
-                with Image.open(png_path) as img:
-                    if img.mode in ('RGBA', 'LA', 'PA'):
-                        # Create white background
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        # Paste image on white using alpha as mask
-                        background.paste(img, mask=img.split()[3])
-                        # Save as RGB (no alpha) - overwrite original
-                        background.save(png_path, 'PNG')
-                        converted += 1
+                record(png_path, flatten_png_file(png_path))
             except Exception:
                 # Skip files that can't be processed
                 continue
 
+        for manifest in list(index.manifests()) + ([fallback_manifest] if fallback_manifest else []):
+            manifest.save()
+
         return converted
 
     def compile_pdf_from_export(
@@ -860,7 +996,8 @@ class QuicksilverSpeedExport(HeroBase):
         Compile PNG export directory into a PDF document
 
         Automatically converts transparent PNGs to white-background PNGs
-        to prevent black borders in PDF viewers.
+        to prevent black borders in PDF viewers (frames flattened during
+        export are skipped via the export manifest).
 
         Args:
             export_dir: Directory containing exported PNG files
@@ -1163,11 +1300,14 @@ class QuicksilverSpeedExport(HeroBase):
                 'batch_size': self.batch_size,
                 'api_timeout': self.api_timeout,
                 'cdn_timeout': self.cdn_timeout,
-                'max_retries': self.max_retries
+                'max_retries': self.max_retries,
+                'url_workers': self.url_workers
             },
             'optimizations': [
                 'Concurrent downloads with ThreadPoolExecutor',
                 'Batch API requests (multiple frames per call)',
+                'Pipelined URL, download and writer stages',
+                'Shared Retry-After aware rate limiter',
                 'Connection pooling with session reuse',
                 'Exponential backoff retry logic',
                 'Rate limit detection and auto-adjustment'
@@ -1269,35 +1409,39 @@ class QuicksilverSpeedExport(HeroBase):
 
         logger.info(f"♻️ Retrying {len(failed_nodes)} failed exports...")
 
-        node_ids = [n['node_id'] for n in failed_nodes]
+        export_dir = Path(output_dir)
+        nodes = [{'id': n['node_id'], 'name': n['node_name']} for n in failed_nodes]
+        progress = {'completed': 0}
 
-        # Batch API request
-        image_urls = self._batch_request_export_urls(file_key, node_ids, scale)
+        manifest = ExportManifest(export_dir)
 
-        # Concurrent retry
-        export_dir = Path(output_dir)
-        retried_files = []
+        def write_frame(node: Dict[str, Any], flattened: Tuple[bytes, Dict[str, Any]]) -> Dict[str, Any]:
+            content, image_info = flattened
+            sanitized_name = self.sanitize_filename(node['name'])
+            image_path = export_dir / f"{sanitized_name}_{node['id']}.png"
+            with open(image_path, 'wb') as f:
+                f.write(content)
+            manifest.record(image_path, {**image_info, 'bytes': len(content)})
+            return {
+                'success': True,
+                'node_name': node['name'],
+                'node_id': node['id'],
+                'file_path': str(image_path)
+            }
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            for node in failed_nodes:
-                node_id = node['node_id']
-                if node_id in image_urls:
-                    future = executor.submit(
-                        self._download_and_save_frame,
-                        node,
-                        image_urls[node_id],
-                        export_dir
-                    )
-                    futures.append(future)
+        def on_result(node: Dict[str, Any], result: Dict[str, Any]):
+            if result['success']:
+                logger.info(f"✅ Retry successful: {result['node_name']}")
+            progress['completed'] += 1
+            if progress_callback:
+                progress_callback(progress['completed'], len(nodes), result.get('node_name', ''))
 
-            for i, future in enumerate(as_completed(futures)):
-                result = future.result()
-                if result['success']:
-                    retried_files.append(result)
-                    logger.info(f"✅ Retry successful: {result['node_name']}")
-                if progress_callback:
-                    progress_callback(i + 1, len(futures), result.get('node_name', ''))
+        # Same batched, rate-limited pipeline as the main export
+        results = self._run_export_pipeline(
+            file_key, nodes, scale, write_frame, on_result, process_content=flatten_png
+        )
+        manifest.save()
+        retried_files = [result for result in results if result['success']]
 
         success_rate = (len(retried_files) / len(failed_nodes) * 100) if failed_nodes else 0
         logger.info(f"♻️ Retry complete: {len(retried_files)}/{len(failed_nodes)} succeeded ({success_rate:.1f}%)")
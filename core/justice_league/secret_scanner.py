@@ -0,0 +1,370 @@
+"""
+🔐 SECRET SCANNER - Single-Pass Multi-Pattern Secret Detection
+
+Shared by Martian Manhunter and the security audit:
+
+- One regex: every pattern is a named branch of a single alternation, so
+  each file is scanned once instead of once per pattern
+- mmap reads: files are matched in place without building a str copy
+- Skips binaries (NUL byte in the first 8 KB), oversized files and
+  .gitignore'd paths (git ls-files in a work tree, .gitignore files otherwise)
+- Process pool: large scans are spread across CPU cores
+- Incremental cache: results are kept per file with its size, mtime and
+  SHA-256, so re-scans only run the regex over files whose content changed
+
+Findings carry the file, line and column, the pattern that matched and a
+redacted excerpt - the secret itself is never stored or logged.
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# (name, regex, description) - matched case-insensitively
+SECRET_PATTERNS: List[Tuple[str, str, str]] = [
+    ('private_key_block', r'-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP )?PRIVATE KEY-----', 'Private key block'),
+    ('stripe_key', r'(?:sk|pk)_live_[a-zA-Z0-9]{20,}', 'Stripe API key'),
+    ('google_api_key', r'AIza[0-9A-Za-z\-_]{35}', 'Google API key'),
+    ('aws_access_key', r'AKIA[0-9A-Z]{16}', 'AWS Access Key'),
+    ('api_key', r'api[_-]?key\s*=\s*["\'][^"\']{20,}["\']', 'Hardcoded API key'),
+    ('access_key', r'access[_-]?key\s*=\s*["\'][^"\']{16,}["\']', 'Hardcoded access key'),
+    ('private_key', r'private[_-]?key\s*=\s*["\'][^"\']{16,}["\']', 'Hardcoded private key'),
+    ('password', r'password\s*=\s*["\'][^"\']+["\']', 'Hardcoded password'),
+    ('secret', r'secret\s*=\s*["\'][^"\']+["\']', 'Hardcoded secret'),
+    ('token', r'token\s*=\s*["\'][^"\']{20,}["\']', 'Hardcoded token'),
+]
+
+# Never worth scanning, whatever .gitignore says
+SKIP_DIRS = {'.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv', '.tox', '.mypy_cache'}
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "justice_league" / "secret_scan"
+DEFAULT_MAX_FILE_SIZE = 5 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+# Below this many files to scan, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 64
+CACHE_FORMAT = 1
+
+
+def compile_patterns(patterns: Sequence[Tuple[str, str, str]]) -> "re.Pattern":
+    """One bytes regex with a named branch (p0, p1, ...) per pattern"""
+    branches = [f'(?P<p{index}>{regex})' for index, (_, regex, _) in enumerate(patterns)]
+    return re.compile('|'.join(branches).encode(), re.IGNORECASE)
+
+
+def redact(secret: str) -> str:
+    """First few characters of a match, enough to locate it but not to use it"""
+    return secret[:6] + '…' if len(secret) > 6 else secret[:2] + '…'
+
+
+def scan_buffer(buffer, regex: "re.Pattern", patterns: Sequence[Tuple[str, str, str]],
+                path: str = '<text>') -> List[Dict[str, Any]]:
+    """
+    Findings in a bytes-like buffer (bytes or mmap)
+
+    Returns:
+        [{'file', 'line', 'column', 'type', 'description', 'excerpt'}], in file order
+    """
+    findings = []
+    line = 1
+    position = 0
+    for match in regex.finditer(buffer):
+        start = match.start()
+        line += buffer[position:start].count(b'\n')
+        position = start
+        line_start = buffer.rfind(b'\n', 0, start) + 1
+        name, _, description = patterns[int(match.lastgroup[1:])]
+        findings.append({
+            'file': path,
+            'line': line,
+            'column': start - line_start + 1,
+            'type': name,
+            'description': description,
+            'excerpt': redact(match.group().decode('utf-8', 'replace'))
+        })
+    return findings
+
+
+def _scan_file(path: str, known_sha256: Optional[str], regex: "re.Pattern",
+               patterns: Sequence[Tuple[str, str, str]]) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+    """
+    (sha256, findings) of a file; findings is None when the content still has
+    known_sha256 (cached findings apply) or the file is binary/unreadable
+    """
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return hashlib.sha256(b'').hexdigest(), []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if b'\0' in buffer[:BINARY_SNIFF_BYTES]:
+                    return None, None
+                sha256 = hashlib.sha256(buffer).hexdigest()
+                if sha256 == known_sha256:
+                    return sha256, None
+                return sha256, scan_buffer(buffer, regex, patterns, path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not scan {path}: {e}")
+        return None, None
+
+
+# Process-pool workers compile the patterns once, in the initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(patterns: Sequence[Tuple[str, str, str]]):
+    _worker_state['patterns'] = patterns
+    _worker_state['regex'] = compile_patterns(patterns)
+
+
+def _scan_file_worker(job: Tuple[str, Optional[str]]):
+    path, known_sha256 = job
+    return _scan_file(path, known_sha256, _worker_state['regex'], _worker_state['patterns'])
+
+
+class _IgnoreRules:
+    """Minimal .gitignore matching for trees outside a git work tree (no negation)"""
+
+    def __init__(self):
+        # (directory relative to root, pattern, directory_only, anchored)
+        self.rules: List[Tuple[str, str, bool, bool]] = []
+
+    def load(self, root: Path, directory: str):
+        try:
+            lines = (root / directory / '.gitignore').read_text(errors='replace').splitlines()
+        except OSError:
+            return
+        for raw in lines:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith(('#', '!')):
+                continue
+            directory_only = pattern.endswith('/')
+            pattern = pattern.rstrip('/')
+            anchored = '/' in pattern
+            self.rules.append((directory, pattern.lstrip('/'), directory_only, anchored))
+
+    def ignored(self, relative: str, is_dir: bool) -> bool:
+        name = relative.rsplit('/', 1)[-1]
+        for directory, pattern, directory_only, anchored in self.rules:
+            if directory_only and not is_dir:
+                continue
+            if directory:
+                if not relative.startswith(directory + '/'):
+                    continue
+                local = relative[len(directory) + 1:]
+            else:
+                local = relative
+            if fnmatch.fnmatchcase(local if anchored else name, pattern):
+                return True
+        return False
+
+
+class SecretScanner:
+    """
+    🔐 Scans a directory tree for hardcoded secrets
+
+    Args:
+        patterns: (name, regex, description) tuples (default: SECRET_PATTERNS)
+        include: Filename globs to scan, e.g. ('*.py', '.env*') (default: every text file)
+        cache_dir: Where per-tree result caches live (None: ~/.cache/justice_league/secret_scan;
+            False: no cache)
+        max_workers: Process pool size (default: CPU count; 1 scans in-process)
+        parallel_threshold: Minimum files to scan before using the process pool
+        max_file_size: Larger files are skipped
+    """
+
+    def __init__(self, patterns: Optional[Sequence[Tuple[str, str, str]]] = None,
+                 include: Optional[Iterable[str]] = None,
+                 cache_dir: Union[str, Path, None, bool] = None,
+                 max_workers: Optional[int] = None,
+                 parallel_threshold: int = PARALLEL_THRESHOLD,
+                 max_file_size: int = DEFAULT_MAX_FILE_SIZE):
+        self.patterns = list(patterns or SECRET_PATTERNS)
+        self.regex = compile_patterns(self.patterns)
+        self.include = tuple(include) if include else None
+        self.cache_dir = None if cache_dir is False else Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_threshold = parallel_threshold
+        self.max_file_size = max_file_size
+        # Cached results are only valid for the same patterns
+        self.fingerprint = hashlib.sha256(json.dumps(self.patterns).encode()).hexdigest()[:16]
+        self.stats: Dict[str, int] = {}
+
+    # ==================== SCANNING ====================
+
+    def scan_text(self, text: str, name: str = '<text>') -> List[Dict[str, Any]]:
+        """Findings in an in-memory string (HTML, config dumps, ...)"""
+        return scan_buffer(text.encode('utf-8', 'replace'), self.regex, self.patterns, name)
+
+    def scan_files(self, paths: Iterable[Union[str, Path]]) -> List[Dict[str, Any]]:
+        """Findings in explicit files (no ignore rules, no cache)"""
+        findings = []
+        for path in paths:
+            _, file_findings = _scan_file(str(path), None, self.regex, self.patterns)
+            findings.extend(file_findings or [])
+        return findings
+
+    def scan(self, root: Union[str, Path]) -> List[Dict[str, Any]]:
+        """
+        Findings in every non-ignored, non-binary file under root
+
+        Returns:
+            Findings sorted by file and line; 'file' is relative to root
+        """
+        root = Path(root).resolve()
+        cache = self._load_cache(root)
+        cached_files = cache['files']
+        files: Dict[str, Dict[str, Any]] = {}
+        jobs: List[Tuple[str, Optional[str]]] = []
+        stats = {'files': 0, 'cache_hits': 0, 'rehashed': 0, 'scanned': 0, 'skipped': 0}
+
+        for relative in self._candidate_files(root):
+            try:
+                stat = os.stat(root / relative)
+            except OSError:
+                continue
+            if stat.st_size > self.max_file_size:
+                stats['skipped'] += 1
+                continue
+            entry = cached_files.get(relative)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                files[relative] = entry
+                stats['skipped' if entry['sha256'] is None else 'cache_hits'] += 1
+                stats['files'] += entry['sha256'] is not None
+                continue
+            stats['files'] += 1
+            files[relative] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': None, 'findings': []}
+            jobs.append((relative, entry['sha256'] if entry else None))
+
+        for (relative, known_sha256), (sha256, findings) in zip(jobs, self._run(root, jobs)):
+            entry = files[relative]
+            if sha256 is None:
+                # Binary or unreadable: remembered so it is not re-read until it changes
+                stats['skipped'] += 1
+                stats['files'] -= 1
+            elif findings is None:
+                # Touched but unchanged content: the cached findings still apply
+                entry['findings'] = cached_files[relative]['findings']
+                stats['rehashed'] += 1
+            else:
+                for finding in findings:
+                    finding['file'] = relative
+                entry['findings'] = findings
+                stats['scanned'] += 1
+            entry['sha256'] = sha256
+
+        cache['files'] = files
+        self._save_cache(root, cache)
+        self.stats = stats
+
+        results = [finding for relative in sorted(files) for finding in files[relative]['findings']]
+        logger.info(f"🔐 Secret scan of {root}: {len(results)} findings in {stats['files']} files "
+                    f"({stats['scanned']} scanned, {stats['cache_hits'] + stats['rehashed']} cached)")
+        return results
+
+    def _run(self, root: Path, jobs: List[Tuple[str, Optional[str]]]):
+        """Scan results for jobs, in order - in a process pool when there are enough"""
+        absolute = [(str(root / relative), sha256) for relative, sha256 in jobs]
+        if self.max_workers > 1 and len(jobs) >= self.parallel_threshold:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                         initargs=(self.patterns,)) as pool:
+                    return list(pool.map(_scan_file_worker, absolute, chunksize=16))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"⚠️ Secret scan process pool unavailable ({e}), scanning in-process")
+        return [_scan_file(path, sha256, self.regex, self.patterns) for path, sha256 in absolute]
+
+    # ==================== FILE SELECTION ====================
+
+    def _wanted(self, relative: str) -> bool:
+        if self.include is None:
+            return True
+        name = relative.rsplit('/', 1)[-1]
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.include)
+
+    def _candidate_files(self, root: Path) -> List[str]:
+        """Relative POSIX paths of files to consider, ignore rules applied"""
+        listed = self._git_files(root)
+        if listed is None:
+            listed = self._walk(root)
+        return [relative for relative in listed
+                if self._wanted(relative) and not SKIP_DIRS.intersection(relative.split('/')[:-1])]
+
+    @staticmethod
+    def _git_files(root: Path) -> Optional[List[str]]:
+        """Tracked and untracked-but-not-ignored files, or None outside a git work tree"""
+        try:
+            result = subprocess.run(
+                ['git', 'ls-files', '--cached', '--others', '--exclude-standard', '-z'],
+                cwd=root, capture_output=True, timeout=60
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        return sorted(set(path for path in result.stdout.decode('utf-8', 'replace').split('\0') if path))
+
+    @staticmethod
+    def _walk(root: Path) -> List[str]:
+        rules = _IgnoreRules()
+        listed = []
+        for directory, dirnames, filenames in os.walk(root):
+            relative_dir = Path(directory).relative_to(root).as_posix()
+            relative_dir = '' if relative_dir == '.' else relative_dir
+            rules.load(root, relative_dir)
+            prefix = relative_dir + '/' if relative_dir else ''
+            dirnames[:] = sorted(name for name in dirnames
+                                 if name not in SKIP_DIRS and not rules.ignored(prefix + name, True))
+            listed.extend(prefix + name for name in sorted(filenames) if not rules.ignored(prefix + name, False))
+        return listed
+
+    # ==================== CACHE ====================
+
+    def _cache_path(self, root: Path) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{hashlib.sha256(str(root).encode()).hexdigest()[:16]}.json"
+
+    def _load_cache(self, root: Path) -> Dict[str, Any]:
+        empty = {'format': CACHE_FORMAT, 'root': str(root), 'patterns': self.fingerprint, 'files': {}}
+        path = self._cache_path(root)
+        if path is None:
+            return empty
+        try:
+            with open(path, 'r') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable secret scan cache {path}: {e}")
+            return empty
+        if cache.get('format') != CACHE_FORMAT or cache.get('patterns') != self.fingerprint:
+            return empty
+        return cache
+
+    def _save_cache(self, root: Path, cache: Dict[str, Any]):
+        path = self._cache_path(root)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write secret scan cache {path}: {e}")
+
+
+def scan_secrets(root: Union[str, Path], **kwargs) -> List[Dict[str, Any]]:
+    """Findings under root with a SecretScanner built from kwargs"""
+    return SecretScanner(**kwargs).scan(root)
@@ -0,0 +1,60 @@
+"""
+🗄️ SQLITE STORE - Shared Setup for the Append-Only SQLite Stores
+
+PerformanceHistory (Flash/Superman runs) and MissionStore (Oracle's
+missions) each keep one SQLite database. This module holds the connection
+setup and the timestamp conversion they share.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Union
+
+
+def to_epoch(timestamp: Union[str, float, int, datetime, None]) -> float:
+    """Seconds since the epoch for an ISO string, datetime or number (now if None)"""
+    if timestamp is None:
+        return datetime.now().timestamp()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    return datetime.fromisoformat(timestamp).timestamp()
+
+
+class SQLiteStore:
+    """
+    🗄️ Base class for a store backed by one SQLite database file
+
+    One connection per instance, serialized by a lock, so an instance can be
+    shared across threads; WAL mode lets other processes append to the same
+    database concurrently.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # Kept open: closing the last WAL connection checkpoints and fsyncs
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # WAL + NORMAL: no fsync per appended row, still corruption-safe
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+
+    @contextmanager
+    def _connect(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """The connection inside one transaction"""
+        with self._lock:
+            with self._conn:
+                if write:
+                    # Take the file's write lock up front: concurrent appenders wait for it
+                    # instead of failing to upgrade a read lock mid-transaction
+                    self._conn.execute('BEGIN IMMEDIATE')
+                yield self._conn
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -39,14 +39,16 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 # Import Mission Control Narrator (v2.0)
 from .mission_control_narrator import get_narrator
 
 # Import Git Worktree Manager and Parallel Optimizer for parallel operations
 try:
-    from ..utils.git_worktree_manager import GitWorktreeManager, HeroWorktreeContext
+    from ..utils.git_worktree_manager import HeroWorktreeContext, WorktreePool
     from ..utils.parallel_optimizer import ParallelOptimizer, ParallelRecommendation
     GIT_WORKTREE_AVAILABLE = True
     PARALLEL_OPTIMIZER_AVAILABLE = True
@@ -168,6 +170,20 @@ except ImportError:
     QUICKSILVER_AVAILABLE = False
     logging.warning("Quicksilver not available")
 
+# Shared page snapshot for the browser-driven heroes
+try:
+    from .page_snapshot import PageCapture, load_offline_tools
+    PAGE_SNAPSHOT_AVAILABLE = True
+except ImportError:
+    PAGE_SNAPSHOT_AVAILABLE = False
+
+# Shared network request log for Aquaman + Superman network timing
+try:
+    from .network_request_store import get_request_store, load_har_tools
+    NETWORK_STORE_AVAILABLE = True
+except ImportError:
+    NETWORK_STORE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -188,6 +204,26 @@ class SupermanCoordinator:
     8. Deliver final verdict
     """
 
+    # Assembly roster in deployment order:
+    # (mission option, hero_reports key, display label, deploy method)
+    ASSEMBLY_ROSTER = (
+        ('test_interactive', 'batman', '🦇 Batman', '_deploy_batman'),
+        ('test_visual', 'green_lantern', '💚 Green Lantern', '_deploy_green_lantern'),
+        ('test_accessibility', 'wonder_woman', '⚡ Wonder Woman', '_deploy_wonder_woman'),
+        ('test_performance', 'flash', '⚡ Flash', '_deploy_flash'),
+        ('test_network', 'aquaman', '🌊 Aquaman', '_deploy_aquaman'),
+        ('test_integrations', 'cyborg', '🤖 Cyborg', '_deploy_cyborg'),
+        ('test_components', 'atom', '🔬 The Atom', '_deploy_atom'),
+        ('test_security', 'martian_manhunter', '🧠 Martian Manhunter', '_deploy_martian_manhunter'),
+        ('test_responsive', 'plastic_man', '🤸 Plastic Man', '_deploy_plastic_man'),
+        ('test_seo', 'zatanna', '🎩 Zatanna', '_deploy_zatanna'),
+        ('validate_ethics', 'litty', '🪔 Litty', '_deploy_litty'),
+    )
+
+    # Concurrent assembly defaults
+    ASSEMBLY_MAX_WORKERS = 4
+    ASSEMBLY_HERO_TIMEOUT = 300.0  # seconds per hero, measured from hero start
+
     def __init__(self, baseline_dir: Optional[str] = None):
         """
         Initialize Superman's command center
@@ -223,6 +259,9 @@ class SupermanCoordinator:
         self.hawkman = HawkmanEquipped(narrator=self.narrator) if HAWKMAN_AVAILABLE else None
         self.quicksilver = QuicksilverSpeedExport(narrator=self.narrator) if QUICKSILVER_AVAILABLE else None
 
+        # Pre-warmed git worktrees, created on the first worktree deployment and reused after it
+        self.worktree_pool: Optional['WorktreePool'] = None
+
         # Hero identity for narrator integration
         self.hero_name = "Superman"
         self.hero_emoji = "🦸"
@@ -375,8 +414,13 @@ class SupermanCoordinator:
             self.say(f"Deploying {len(missions)} heroes in parallel", style="tactical",
                     technical_info=f"{max_workers} workers, worktrees={'enabled' if use_worktrees else 'disabled'}")
 
-        # Initialize worktree manager if needed
-        worktree_manager = GitWorktreeManager() if use_worktrees else None
+        # Warm the worktree pool: one worktree per worker, kept for later deployments
+        worktree_pool = None
+        if use_worktrees:
+            if self.worktree_pool is None:
+                self.worktree_pool = WorktreePool(max_size=ParallelOptimizer.MAX_WORKERS)
+            worktree_pool = self.worktree_pool
+            worktree_pool.warm(min(max_workers, len(missions)))
 
         results = {
             'total_missions': len(missions),
@@ -398,7 +442,7 @@ class SupermanCoordinator:
                     future = executor.submit(
                         self._execute_mission_with_worktree,
                         mission,
-                        worktree_manager
+                        worktree_pool
                     )
                 else:
                     # Submit without worktree
@@ -437,10 +481,13 @@ class SupermanCoordinator:
                         'mission': mission
                     })
 
-        # Cleanup worktrees if used
-        if use_worktrees and worktree_manager:
-            cleanup_summary = worktree_manager.cleanup_all(force=True)
-            results['worktree_cleanup'] = cleanup_summary
+        # Worktrees stay in the pool (reset) for the next deployment
+        if worktree_pool:
+            results['worktree_pool'] = worktree_pool.stats()
+            logger.info(
+                f"🌳 Worktree pool: {results['worktree_pool']['hit_rate'] * 100:.0f}% hit rate, "
+                f"{results['worktree_pool']['avg_acquire_ms']:.1f}ms average acquisition"
+            )
 
         if self.narrator:
             self.say(f"Parallel deployment complete: {results['successful']} succeeded, {results['failed']} failed",
@@ -513,6 +560,7 @@ class SupermanCoordinator:
         # Step 4: Determine execution path based on strategy
         import time
         start_time = time.time()
+        cpu_start = time.process_time()
 
         if recommendation.strategy.value == "sequential":
             # Sequential execution (no parallelization)
@@ -567,9 +615,11 @@ class SupermanCoordinator:
                         style="tactical",
                         technical_info=f"{final_workers} workers, Oracle confidence: {recommendation.confidence*100:.0f}%")
 
-            # Use existing parallel deployment with Oracle's settings
+            # Use existing parallel deployment with Oracle's settings; the pool
+            # takes missions in submission order, so longest-expected-first is LPT
+            scheduled = [missions[i] for i in recommendation.mission_order] or missions
             results = self.deploy_heroes_parallel(
-                missions=missions,
+                missions=scheduled,
                 max_workers=final_workers,
                 use_worktrees=final_worktrees
             )
@@ -595,18 +645,27 @@ class SupermanCoordinator:
             'duration': actual_duration,
             'successful': results['successful'],
             'total_missions': results['total_missions'],
-            'used_worktrees': results.get('used_worktrees', False)
+            'used_worktrees': results.get('used_worktrees', False),
+            'hero_results': results['hero_results'],
+            'workers': final_workers if results.get('parallel_execution') else 1,
+            'cpu_seconds': time.process_time() - cpu_start
         }
 
         optimizer.record_decision(recommendation, actual_result)
-
-        # Step 6: Report results
+        report = optimizer.decision_history[-1]['makespan_report']
+        results['makespan_report'] = report
+
+        # Step 6: Report predicted vs actual makespan
+        error_pct = f"{report['error_pct']:+.0f}%" if report['error_pct'] is not None else "n/a"
+        logger.info(
+            f"🔮 Makespan: predicted {report['predicted_makespan']:.2f}s, "
+            f"actual {report['actual_makespan']:.2f}s ({error_pct}), {report['workers']} worker(s)"
+        )
         if self.narrator:
-            actual_speedup = recommendation.estimated_duration / actual_duration if actual_duration > 0 else 1.0
             self.say(
                 f"Smart deployment complete: {results['successful']}/{results['total_missions']} succeeded",
                 style="tactical",
-                technical_info=f"Actual: {actual_duration:.1f}s (predicted: {recommendation.estimated_duration:.1f}s)"
+                technical_info=f"Actual: {actual_duration:.1f}s (predicted: {recommendation.estimated_duration:.1f}s, {error_pct})"
             )
 
         return results
@@ -614,14 +673,14 @@ class SupermanCoordinator:
     def _execute_mission_with_worktree(
         self,
         mission: Dict[str, Any],
-        worktree_manager: 'GitWorktreeManager'
+        worktree_pool: 'WorktreePool'
     ) -> Dict[str, Any]:
         """
-        Execute a single mission in an isolated worktree
+        Execute a single mission in an isolated worktree from the pool
 
         Args:
             mission: Mission parameters
-            worktree_manager: Worktree manager instance
+            worktree_pool: Pool the worktree is taken from and returned to
 
         Returns:
             Mission result
@@ -630,23 +689,22 @@ class SupermanCoordinator:
         start_time = time.time()
 
         try:
-            # Create worktree for this mission
-            worktree_info = worktree_manager.create_worktree(
-                task_name=mission['task_name'],
-                branch=mission.get('branch')
-            )
-
-            # Execute mission in worktree
-            result = self._execute_hero_mission(
-                mission,
-                workspace_path=worktree_info['path']
-            )
-
-            duration = time.time() - start_time
+            # Take a worktree for this mission (its cost feeds Oracle's worktree decisions)
+            with worktree_pool.worktree(mission['task_name'], branch=mission.get('branch')) as worktree_info:
+                worktree_setup = time.time() - start_time
+
+                # Execute mission in worktree
+                result = self._execute_hero_mission(
+                    mission,
+                    workspace_path=worktree_info['path']
+                )
+                duration = time.time() - start_time
 
             return {
                 **result,
+                'mission': mission,
                 'worktree_path': str(worktree_info['path']),
+                'worktree_setup': worktree_setup,
                 'duration': duration
             }
 
@@ -678,6 +736,7 @@ class SupermanCoordinator:
 
             return {
                 **result,
+                'mission': mission,
                 'duration': duration
             }
 
@@ -1030,7 +1089,13 @@ class SupermanCoordinator:
             return result
         return {"error": "Oracle learning system not available"}
 
-    def assemble_justice_league(self, mission: Dict[str, Any]) -> Dict[str, Any]:
+    def assemble_justice_league(
+        self,
+        mission: Dict[str, Any],
+        concurrent: bool = False,
+        max_workers: Optional[int] = None,
+        hero_timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         🦸 ASSEMBLE THE JUSTICE LEAGUE!
 
@@ -1044,6 +1109,9 @@ class SupermanCoordinator:
                     'design_data': Dict,  # Extracted design data
                     'components': Dict,  # Component library
                     'page_snapshot': str,  # DOM snapshot
+                    'page_capture_file': str,  # Saved PageCapture file - run Litty, Zatanna
+                                               # and Plastic Man offline against it
+                    'network_har_file': str,  # Recorded HAR - run Aquaman offline against it
                     'screenshot_path': str,  # Screenshot for visual testing
                     'options': {
                         'test_interactive': bool,  # Deploy Batman?
@@ -1059,6 +1127,12 @@ class SupermanCoordinator:
                         'validate_ethics': bool,  # Deploy Litty?
                     }
                 }
+            concurrent: Deploy independent heroes on a bounded thread pool
+                instead of one after another
+            max_workers: Pool size for concurrent mode
+                (default: ASSEMBLY_MAX_WORKERS)
+            hero_timeout: Per-hero timeout in seconds for concurrent mode,
+                measured from when the hero starts (default: ASSEMBLY_HERO_TIMEOUT)
 
         Returns:
             Complete Justice League analysis results
@@ -1084,6 +1158,9 @@ class SupermanCoordinator:
             'hero_reports': {}
         }
 
+        # Litty, Zatanna and Plastic Man share one page capture
+        mission, page_capture = self._attach_page_capture(mission)
+
         options = mission.get('options', {})
         mcp_tools = mission.get('mcp_tools', {})
         design_data = mission.get('design_data', {})
@@ -1091,82 +1168,20 @@ class SupermanCoordinator:
         page_snapshot = mission.get('page_snapshot', '')
         screenshot_path = mission.get('screenshot_path', '')
 
-        # Deploy Batman (Interactive Testing)
-        if options.get('test_interactive', True):
-            batman_result = self._deploy_batman(mission)
-            if batman_result:
-                results['hero_reports']['batman'] = batman_result
-                results['heroes_deployed'].append('🦇 Batman')
-
-        # Deploy Green Lantern (Visual Regression)
-        if options.get('test_visual', True):
-            gl_result = self._deploy_green_lantern(mission)
-            if gl_result:
-                results['hero_reports']['green_lantern'] = gl_result
-                results['heroes_deployed'].append('💚 Green Lantern')
-
-        # Deploy Wonder Woman (Accessibility)
-        if options.get('test_accessibility', True):
-            ww_result = self._deploy_wonder_woman(mission)
-            if ww_result:
-                results['hero_reports']['wonder_woman'] = ww_result
-                results['heroes_deployed'].append('⚡ Wonder Woman')
-
-        # Deploy Flash (Performance)
-        if options.get('test_performance', True):
-            flash_result = self._deploy_flash(mission)
-            if flash_result:
-                results['hero_reports']['flash'] = flash_result
-                results['heroes_deployed'].append('⚡ Flash')
-
-        # Deploy Aquaman (Network)
-        if options.get('test_network', True):
-            aquaman_result = self._deploy_aquaman(mission)
-            if aquaman_result:
-                results['hero_reports']['aquaman'] = aquaman_result
-                results['heroes_deployed'].append('🌊 Aquaman')
-
-        # Deploy Cyborg (Integrations)
-        if options.get('test_integrations', True):
-            cyborg_result = self._deploy_cyborg(mission)
-            if cyborg_result:
-                results['hero_reports']['cyborg'] = cyborg_result
-                results['heroes_deployed'].append('🤖 Cyborg')
-
-        # Deploy The Atom (Component Analysis)
-        if options.get('test_components', True):
-            atom_result = self._deploy_atom(mission)
-            if atom_result:
-                results['hero_reports']['atom'] = atom_result
-                results['heroes_deployed'].append('🔬 The Atom')
-
-        # Deploy Martian Manhunter (Security)
-        if options.get('test_security', True):
-            mm_result = self._deploy_martian_manhunter(mission)
-            if mm_result:
-                results['hero_reports']['martian_manhunter'] = mm_result
-                results['heroes_deployed'].append('🧠 Martian Manhunter')
-
-        # Deploy Plastic Man (Responsive Design)
-        if options.get('test_responsive', True):
-            pm_result = self._deploy_plastic_man(mission)
-            if pm_result:
-                results['hero_reports']['plastic_man'] = pm_result
-                results['heroes_deployed'].append('🤸 Plastic Man')
-
-        # Deploy Zatanna (SEO & Metadata)
-        if options.get('test_seo', True):
-            zatanna_result = self._deploy_zatanna(mission)
-            if zatanna_result:
-                results['hero_reports']['zatanna'] = zatanna_result
-                results['heroes_deployed'].append('🎩 Zatanna')
-
-        # Deploy Litty (Ethics & User Empathy)
-        if options.get('validate_ethics', True):
-            litty_result = self._deploy_litty(mission)
-            if litty_result:
-                results['hero_reports']['litty'] = litty_result
-                results['heroes_deployed'].append('🪔 Litty')
+        # Deploy heroes (sequentially by default, or on a bounded pool)
+        if concurrent:
+            self._assemble_concurrently(mission, results, max_workers, hero_timeout)
+        else:
+            for option_key, report_key, hero_label, deploy_method in self.ASSEMBLY_ROSTER:
+                if not options.get(option_key, True):
+                    continue
+                hero_result = getattr(self, deploy_method)(mission)
+                if hero_result:
+                    results['hero_reports'][report_key] = hero_result
+                    results['heroes_deployed'].append(hero_label)
+
+        if page_capture:
+            results['page_capture'] = page_capture.stats()
 
         # Superman combines all results
         logger.info("🦸 Superman analyzing combined results...")
@@ -1201,6 +1216,161 @@ class SupermanCoordinator:
 
         return results
 
+    def _attach_page_capture(self, mission: Dict[str, Any]):
+        """
+        📸 Give the browser-driven heroes one shared page capture
+
+        With mission['page_capture_file'] the capture is loaded from disk and
+        the heroes run offline; otherwise a live capture wraps evaluate_script.
+        The caller's mcp_tools dict is not modified.
+
+        Returns:
+            (mission, PageCapture or None)
+        """
+        if not PAGE_SNAPSHOT_AVAILABLE:
+            return mission, None
+
+        mcp_tools = dict(mission.get('mcp_tools') or {})
+        capture_file = mission.get('page_capture_file')
+        if capture_file:
+            try:
+                mcp_tools.update(load_offline_tools(capture_file))
+            except (OSError, ValueError) as e:
+                logger.warning(f"📸 Could not load page capture {capture_file}: {e}")
+                return mission, None
+        elif isinstance(mcp_tools.get('page_capture'), PageCapture):
+            return mission, mcp_tools['page_capture']
+        elif mcp_tools.get('evaluate_script'):
+            mcp_tools['page_capture'] = PageCapture(mcp_tools['evaluate_script'])
+        else:
+            return mission, None
+
+        return {**mission, 'mcp_tools': mcp_tools}, mcp_tools['page_capture']
+
+    def _assemble_concurrently(
+        self,
+        mission: Dict[str, Any],
+        results: Dict[str, Any],
+        max_workers: Optional[int] = None,
+        hero_timeout: Optional[float] = None
+    ) -> None:
+        """
+        🦸 Deploy independent heroes on a bounded thread pool
+
+        Heroes only read the shared mission dict, so they can run side by side.
+        Results are merged in ASSEMBLY_ROSTER order, which keeps hero_reports
+        (and therefore the combined analysis and score) identical to the
+        sequential path. A hero that exceeds its timeout or raises is left out
+        of hero_reports and recorded under results['concurrent_assembly'].
+
+        Args:
+            mission: Mission parameters (see assemble_justice_league)
+            results: Results dict to merge hero reports into
+            max_workers: Pool size (default: ASSEMBLY_MAX_WORKERS)
+            hero_timeout: Seconds each hero may run once started
+                (default: ASSEMBLY_HERO_TIMEOUT)
+        """
+        options = mission.get('options', {})
+        roster = [entry for entry in self.ASSEMBLY_ROSTER if options.get(entry[0], True)]
+        if not roster:
+            return
+
+        max_workers = max(1, min(max_workers or self.ASSEMBLY_MAX_WORKERS, len(roster)))
+        if hero_timeout is None:
+            hero_timeout = self.ASSEMBLY_HERO_TIMEOUT
+
+        start_times: Dict[str, float] = {}
+        durations: Dict[str, float] = {}
+        timed_out: List[str] = []
+        errors: Dict[str, str] = {}
+
+        def run_hero(report_key: str, deploy_method: str) -> Optional[Dict[str, Any]]:
+            start_times[report_key] = time.monotonic()
+            try:
+                return getattr(self, deploy_method)(mission)
+            finally:
+                durations[report_key] = time.monotonic() - start_times[report_key]
+
+        logger.info(f"🦸 Deploying {len(roster)} heroes concurrently ({max_workers} workers, "
+                    f"{hero_timeout:.0f}s per hero)")
+        assembly_start = time.monotonic()
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='justice-league')
+        try:
+            hero_futures = {
+                report_key: executor.submit(run_hero, report_key, deploy_method)
+                for _, report_key, _, deploy_method in roster
+            }
+
+            def workers_stalled() -> bool:
+                hung = sum(1 for key in timed_out if not hero_futures[key].done())
+                return hung >= max_workers
+
+            # Merge in roster order so output matches the sequential path
+            for _, report_key, hero_label, _ in roster:
+                try:
+                    hero_result = self._await_hero_result(
+                        hero_futures[report_key], report_key, start_times,
+                        hero_timeout, stalled=workers_stalled
+                    )
+                except FuturesTimeoutError:
+                    timed_out.append(report_key)
+                    logger.warning(f"  ⏱️ {hero_label} timed out after {hero_timeout:.0f}s")
+                    continue
+                except Exception as e:
+                    errors[report_key] = str(e)
+                    logger.error(f"  ❌ {hero_label} mission failed: {e}")
+                    continue
+
+                if hero_result:
+                    results['hero_reports'][report_key] = hero_result
+                    results['heroes_deployed'].append(hero_label)
+        finally:
+            # Don't block on heroes that overran their timeout
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results['concurrent_assembly'] = {
+            'max_workers': max_workers,
+            'hero_timeout': hero_timeout,
+            'wall_time': time.monotonic() - assembly_start,
+            'hero_durations': {
+                entry[1]: durations[entry[1]] for entry in roster if entry[1] in durations
+            },
+            'timed_out': timed_out,
+            'errors': errors
+        }
+
+    @staticmethod
+    def _await_hero_result(
+        future,
+        report_key: str,
+        start_times: Dict[str, float],
+        hero_timeout: float,
+        stalled,
+        poll_interval: float = 0.05
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for one hero, applying its timeout from when it actually started
+
+        Heroes still queued behind others are waited on without a deadline,
+        unless every worker is held by a hero that already timed out
+        (``stalled()``), in which case the queued hero can never start.
+
+        Raises:
+            concurrent.futures.TimeoutError: Hero ran past hero_timeout
+        """
+        while report_key not in start_times and not future.done():
+            if stalled():
+                future.cancel()
+                raise FuturesTimeoutError()
+            wait([future], timeout=poll_interval)
+
+        if future.done():
+            return future.result()
+
+        remaining = hero_timeout - (time.monotonic() - start_times[report_key])
+        return future.result(timeout=max(remaining, 0))
+
     def _deploy_batman(self, mission: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """🦇 Deploy Batman for interactive testing"""
         if not self.batman:
@@ -1354,12 +1524,24 @@ class SupermanCoordinator:
             return None
 
         mcp_tools = mission.get('mcp_tools', {})
+        har_file = mission.get('network_har_file')
+        if har_file and NETWORK_STORE_AVAILABLE:
+            try:
+                mcp_tools = {**(mcp_tools or {}), **load_har_tools(har_file)}
+            except (OSError, ValueError) as e:
+                logger.warning(f"🌊 Could not load HAR file {har_file}: {e}")
+
         if not mcp_tools:
             logger.warning("No MCP tools available for Aquaman")
             return None
 
         logger.info("🦸 Deploying 🌊 AQUAMAN for network analysis...")
 
+        # Collect the request log once for Aquaman and Superman's timing analysis
+        if NETWORK_STORE_AVAILABLE:
+            mcp_tools = dict(mcp_tools)
+            get_request_store(mcp_tools)
+
         # Run standard Aquaman analysis first
         aquaman_result = self.aquaman.analyze_network_traffic(mcp_tools)
 
@@ -1375,7 +1557,8 @@ class SupermanCoordinator:
                 # Prepare MCP tools in expected format
                 mcp_tools_dict = {
                     'list_network_requests': mcp_tools.get('list_network_requests'),
-                    'get_network_request': mcp_tools.get('get_network_request')
+                    'get_network_request': mcp_tools.get('get_network_request'),
+                    'network_store': mcp_tools.get('network_store')
                 }
 
                 # Get performance budget if specified
@@ -2143,7 +2326,10 @@ class SupermanCoordinator:
 
 # Main entry point - Superman's Mission Interface
 def assemble_justice_league(mission: Dict[str, Any],
-                            baseline_dir: Optional[str] = None) -> Dict[str, Any]:
+                            baseline_dir: Optional[str] = None,
+                            concurrent: bool = False,
+                            max_workers: Optional[int] = None,
+                            hero_timeout: Optional[float] = None) -> Dict[str, Any]:
     """
     🦸 ASSEMBLE THE JUSTICE LEAGUE!
 
@@ -2152,9 +2338,17 @@ def assemble_justice_league(mission: Dict[str, Any],
     Args:
         mission: Mission parameters with all necessary data
         baseline_dir: Optional baseline directory
+        concurrent: Deploy independent heroes on a bounded thread pool
+        max_workers: Pool size for concurrent mode
+        hero_timeout: Per-hero timeout (seconds) for concurrent mode
 
     Returns:
         Complete Justice League analysis
     """
     superman = SupermanCoordinator(baseline_dir)
-    return superman.assemble_justice_league(mission)
+    return superman.assemble_justice_league(
+        mission,
+        concurrent=concurrent,
+        max_workers=max_workers,
+        hero_timeout=hero_timeout
+    )
@@ -0,0 +1,513 @@
+"""
+⚡ TRACE VITALS - Streaming Core Web Vitals from Raw Chrome Traces
+
+Computes LCP, FCP, CLS, TBT (with long tasks and TTI), INP and FID directly
+from a DevTools trace's `traceEvents` instead of relying on pre-computed
+`lcp` / `cls` / ... keys.
+
+Traces of large SPAs run to hundreds of MB, so events are read one at a
+time by an incremental JSON reader (json.JSONDecoder.raw_decode over a
+sliding text buffer, gzip detected from the magic bytes) and only the few
+events a metric needs are kept. Memory is bounded by the read chunk plus the
+metric events, not by the trace size.
+
+Metric definitions follow web-vitals / Lighthouse:
+- Times are milliseconds from the main-frame navigationStart
+- LCP: last largestContentfulPaint::Candidate (minus invalidated ones)
+- CLS: largest session window (shifts < 1s apart, window < 5s), shifts
+  after recent input excluded
+- TBT: sum of (task - 50ms) for main-thread tasks between FCP and TTI
+- TTI: end of the last long task before a 5s quiet window after FCP (CPU
+  quiet only - network quiet is not visible in every trace)
+- INP: worst interaction latency, ignoring one outlier per 50 interactions
+"""
+
+import gzip
+import io
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+TraceSource = Union[str, Path, bytes, Dict[str, Any], List[Dict[str, Any]], io.IOBase]
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # characters per read
+# Larger "events" mean a malformed trace rather than a slow one
+MAX_EVENT_CHARS = 64 << 20
+
+LONG_TASK_MS = 50.0
+TTI_QUIET_WINDOW_MS = 5000.0
+CLS_SESSION_GAP_MS = 1000.0
+CLS_SESSION_MAX_MS = 5000.0
+INP_OUTLIERS_PER = 50
+
+# Top-level main-thread task events across Chrome versions
+TASK_EVENT_NAMES = frozenset((
+    'RunTask', 'ThreadControllerImpl::RunTask', 'ThreadControllerImpl::DoWork',
+    'TaskQueueManager::ProcessTaskFromWorkQueue'
+))
+FIRST_INPUT_TYPES = frozenset(('pointerdown', 'mousedown', 'keydown', 'click', 'pointerup', 'keypress'))
+
+_GZIP_MAGIC = b'\x1f\x8b'
+_WHITESPACE = ' \t\r\n'
+
+
+# ==================== INCREMENTAL READER ====================
+
+def _open_text(source) -> Tuple[io.TextIOBase, Callable[[], None]]:
+    """Text stream over a path, bytes or file object (gzip detected), plus its cleanup"""
+    if isinstance(source, (str, Path)):
+        raw = open(source, 'rb')
+    elif isinstance(source, (bytes, bytearray)):
+        raw = io.BytesIO(source)
+    elif isinstance(source.read(0), str):
+        return source, lambda: None
+    else:
+        raw = None
+
+    binary = raw if raw is not None else source
+    if hasattr(binary, 'peek'):
+        magic = binary.peek(2)[:2]
+    elif binary.seekable():
+        position = binary.tell()
+        magic = binary.read(2)
+        binary.seek(position)
+    else:
+        magic = b''
+    if magic == _GZIP_MAGIC:
+        # GzipFile leaves a passed-in fileobj open
+        binary = gzip.GzipFile(fileobj=binary)
+
+    text = io.TextIOWrapper(binary, encoding='utf-8')
+    if raw is not None:
+        return text, text.close
+    # Caller's file object: release the wrapper without closing it
+    return text, text.detach if binary is source else text.close
+
+
+class _TraceReader:
+    """Sliding-buffer JSON reader yielding one trace event at a time"""
+
+    def __init__(self, stream: io.TextIOBase, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self) -> Optional[str]:
+        """Next non-whitespace character (None at end of input)"""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._fill():
+                return None
+
+    def _decode(self) -> Any:
+        """Next complete JSON value, reading more input until it parses"""
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if len(self.buffer) - self.pos > MAX_EVENT_CHARS:
+                    raise ValueError(f"Malformed trace: no complete JSON value at offset {self.pos}")
+                if self._fill():
+                    continue
+                raise
+            # A number can parse while its digits are still arriving
+            if end == len(self.buffer) and not isinstance(value, (dict, list, str)) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Malformed trace: expected '{char}' at offset {self.pos}")
+        self.pos += 1
+
+    def events(self) -> Iterator[Dict[str, Any]]:
+        first = self._peek()
+        if first == '[':
+            self.pos += 1
+            yield from self._array()
+        elif first == '{':
+            self.pos += 1
+            yield from self._object()
+        elif first is not None:
+            raise ValueError("Malformed trace: expected a JSON object or array")
+
+    def _object(self) -> Iterator[Dict[str, Any]]:
+        """{"traceEvents": [...], "metadata": {...}} - other keys are skipped"""
+        while True:
+            char = self._peek()
+            if char is None or char == '}':
+                return
+            if char == ',':
+                self.pos += 1
+                continue
+            key = self._decode()
+            self._expect(':')
+            if key == 'traceEvents':
+                self._expect('[')
+                yield from self._array()
+            else:
+                self._peek()
+                self._decode()
+
+    def _array(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            char = self._peek()
+            if char is None:
+                # Chrome's array format allows a missing closing bracket
+                return
+            if char == ']':
+                self.pos += 1
+                return
+            if char == ',':
+                self.pos += 1
+                continue
+            try:
+                event = self._decode()
+            except json.JSONDecodeError:
+                logger.warning("⚡ Trace ends mid-event - ignoring the truncated tail")
+                self.buffer, self.pos = '', 0
+                return
+            if isinstance(event, dict):
+                yield event
+
+
+def iter_trace_events(source: TraceSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Trace events one at a time
+
+    Args:
+        source: Trace file path (.json or .json.gz), bytes, binary/text file
+            object, a loaded trace dict or a list of events
+        chunk_size: Characters read per step
+    """
+    if isinstance(source, dict):
+        yield from source.get('traceEvents', [])
+        return
+    if isinstance(source, list):
+        yield from source
+        return
+
+    stream, cleanup = _open_text(source)
+    try:
+        yield from _TraceReader(stream, chunk_size).events()
+    finally:
+        cleanup()
+
+
+# ==================== METRICS ====================
+
+def _data(event: Dict[str, Any]) -> Dict[str, Any]:
+    args = event.get('args') or {}
+    return args.get('data') or {}
+
+
+class TraceVitals:
+    """
+    ⚡ Core Web Vitals accumulator
+
+    Feed events in any order with add(); metrics() resolves the main-frame
+    navigation and computes every metric from the retained events.
+    """
+
+    def __init__(self):
+        self.events_parsed = 0
+        self.navigations: List[Tuple[float, Optional[str], str, Tuple[Any, Any]]] = []
+        self.first_paints: List[Tuple[float, Optional[str]]] = []
+        self.lcp_candidates: List[Tuple[float, Optional[str], int]] = []
+        self.lcp_invalidations: List[Tuple[float, Optional[str]]] = []
+        self.layout_shifts: List[Tuple[float, float]] = []
+        self.long_tasks: List[Tuple[float, float, Tuple[Any, Any]]] = []
+        self.interactions: Dict[Any, Dict[str, float]] = {}
+        self.main_threads = set()
+        self.first_ts: Optional[float] = None
+
+    def add(self, event: Dict[str, Any]):
+        self.events_parsed += 1
+        name = event.get('name')
+        ts = event.get('ts')
+        if ts is None:
+            return
+        if self.first_ts is None or ts < self.first_ts:
+            self.first_ts = ts
+        args = event.get('args') or {}
+
+        if name in TASK_EVENT_NAMES:
+            dur = event.get('dur')
+            if dur is not None and dur > LONG_TASK_MS * 1000:
+                self.long_tasks.append((ts, dur, (event.get('pid'), event.get('tid'))))
+
+        elif name == 'navigationStart':
+            data = _data(event)
+            url = data.get('documentLoaderURL', '')
+            if data.get('isLoadingMainFrame', True) and url.startswith('http'):
+                self.navigations.append((ts, args.get('frame'), url, (event.get('pid'), event.get('tid'))))
+
+        elif name == 'firstContentfulPaint':
+            self.first_paints.append((ts, args.get('frame')))
+
+        elif name == 'largestContentfulPaint::Candidate':
+            self.lcp_candidates.append((ts, args.get('frame'), _data(event).get('candidateIndex', 0)))
+
+        elif name == 'largestContentfulPaint::Invalidate':
+            self.lcp_invalidations.append((ts, args.get('frame')))
+
+        elif name == 'LayoutShift':
+            data = _data(event)
+            if not data.get('had_recent_input', False):
+                score = data.get('weighted_score_delta', data.get('score', 0)) or 0
+                self.layout_shifts.append((ts, float(score)))
+
+        elif name == 'EventTiming' and event.get('ph') in ('b', 'X', None):
+            data = _data(event)
+            interaction_id = data.get('interactionId', 0)
+            if interaction_id:
+                entry = self.interactions.setdefault(interaction_id, {
+                    'ts': ts, 'duration': 0.0, 'type': data.get('type', ''), 'delay': None
+                })
+                entry['duration'] = max(entry['duration'], float(data.get('duration', 0) or 0))
+                if entry['delay'] is None and 'processingStart' in data and 'timeStamp' in data:
+                    entry['delay'] = float(data['processingStart']) - float(data['timeStamp'])
+                if ts < entry['ts']:
+                    entry['ts'] = ts
+
+        elif name == 'thread_name' and event.get('ph') == 'M':
+            if args.get('name') == 'CrRendererMain':
+                self.main_threads.add((event.get('pid'), event.get('tid')))
+
+    # ---------- resolution ----------
+
+    def _navigation(self):
+        """Main-frame navigation the metrics are measured from (the last one with a paint)"""
+        navigations = sorted(self.navigations, key=lambda nav: nav[0])
+        paint_times = sorted(ts for ts, _ in self.first_paints)
+        chosen = navigations[0] if navigations else None
+        for nav in navigations:
+            if any(ts >= nav[0] for ts in paint_times):
+                chosen = nav
+        return chosen
+
+    def metrics(self) -> Dict[str, Any]:
+        """LCP/FCP/CLS/TBT/TTI/INP/FID (None when the trace has no events for it)"""
+        navigation = self._navigation()
+        if navigation:
+            nav_ts, frame, url, main_thread = navigation
+        else:
+            nav_ts, frame, url, main_thread = self.first_ts or 0, None, None, None
+
+        def after_navigation(ts):
+            return ts >= nav_ts
+
+        def in_frame(event_frame):
+            return frame is None or event_frame is None or event_frame == frame
+
+        def ms(ts):
+            return round((ts - nav_ts) / 1000.0, 3)
+
+        # Navigation bound for the next main-frame navigation, if any
+        later = [nav[0] for nav in self.navigations if nav[0] > nav_ts]
+        end_ts = min(later) if later else float('inf')
+
+        paints = sorted(ts for ts, f in self.first_paints if after_navigation(ts) and ts < end_ts and in_frame(f))
+        fcp_ts = paints[0] if paints else None
+
+        lcp_ts = None
+        invalidations = [ts for ts, f in self.lcp_invalidations if after_navigation(ts) and ts < end_ts and in_frame(f)]
+        candidates = sorted((ts, index) for ts, f, index in self.lcp_candidates
+                            if after_navigation(ts) and ts < end_ts and in_frame(f))
+        if candidates:
+            lcp_ts = candidates[-1][0]
+            if invalidations and max(invalidations) > lcp_ts:
+                lcp_ts = None
+
+        cls, shift_count = self._cls([(ts, s) for ts, s in self.layout_shifts if after_navigation(ts) and ts < end_ts])
+
+        threads = {main_thread} if main_thread else self.main_threads
+        tasks = sorted((ts, dur) for ts, dur, thread in self.long_tasks
+                       if (not threads or thread in threads) and after_navigation(ts) and ts < end_ts)
+        tti_ts = self._tti(tasks, fcp_ts)
+        tbt = self._tbt(tasks, fcp_ts, tti_ts)
+
+        inp, fid, interaction_count = self._interactions(nav_ts, end_ts)
+
+        return {
+            'url': url,
+            'navigation_start_us': nav_ts,
+            'fcp': ms(fcp_ts) if fcp_ts is not None else None,
+            'lcp': ms(lcp_ts) if lcp_ts is not None else None,
+            'cls': round(cls, 4) if shift_count else (0.0 if fcp_ts is not None else None),
+            'tti': ms(tti_ts) if tti_ts is not None else None,
+            'tbt': round(tbt, 3) if fcp_ts is not None else None,
+            'inp': inp,
+            'fid': fid,
+            'long_tasks': [{'start_ms': ms(ts), 'duration_ms': round(dur / 1000.0, 3)} for ts, dur in tasks],
+            'long_task_count': len(tasks),
+            'layout_shift_count': shift_count,
+            'interaction_count': interaction_count,
+            'events_parsed': self.events_parsed
+        }
+
+    @staticmethod
+    def _cls(shifts: List[Tuple[float, float]]) -> Tuple[float, int]:
+        """Largest session window of layout shifts"""
+        best = window = 0.0
+        window_start = previous = None
+        for ts, score in sorted(shifts):
+            if (previous is None or (ts - previous) / 1000.0 >= CLS_SESSION_GAP_MS
+                    or (ts - window_start) / 1000.0 >= CLS_SESSION_MAX_MS):
+                window, window_start = 0.0, ts
+            window += score
+            previous = ts
+            best = max(best, window)
+        return best, len(shifts)
+
+    @staticmethod
+    def _tti(tasks: List[Tuple[float, float]], fcp_ts: Optional[float]) -> Optional[float]:
+        """End of the last long task before a quiet window after FCP"""
+        if fcp_ts is None:
+            return None
+        tti = fcp_ts
+        for ts, dur in tasks:
+            end = ts + dur
+            if end <= fcp_ts:
+                continue
+            if (ts - tti) / 1000.0 >= TTI_QUIET_WINDOW_MS:
+                break
+            tti = max(tti, end)
+        return tti
+
+    @staticmethod
+    def _tbt(tasks: List[Tuple[float, float]], fcp_ts: Optional[float], tti_ts: Optional[float]) -> float:
+        if fcp_ts is None:
+            return 0.0
+        total = 0.0
+        for ts, dur in tasks:
+            start, end = max(ts, fcp_ts), min(ts + dur, tti_ts)
+            if end > start:
+                total += max((end - start) / 1000.0 - LONG_TASK_MS, 0.0)
+        return total
+
+    def _interactions(self, nav_ts: float, end_ts: float):
+        entries = sorted((e for e in self.interactions.values() if nav_ts <= e['ts'] < end_ts),
+                         key=lambda e: e['ts'])
+        if not entries:
+            return None, None, 0
+        durations = sorted((e['duration'] for e in entries), reverse=True)
+        inp = durations[min(len(durations) - 1, len(durations) // INP_OUTLIERS_PER)]
+        first_input = next((e for e in entries if e['type'] in FIRST_INPUT_TYPES and e['delay'] is not None), None)
+        fid = round(first_input['delay'], 3) if first_input else None
+        return round(inp, 3), fid, len(entries)
+
+
+def compute_trace_vitals(source: TraceSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    ⚡ Core Web Vitals of a raw Chrome trace, streamed
+
+    Args:
+        source: Trace file path (.json or .json.gz), bytes, file object,
+            loaded trace dict or list of events
+        chunk_size: Characters read per step (bounds reader memory)
+
+    Returns:
+        Metrics dict (see TraceVitals.metrics)
+    """
+    vitals = TraceVitals()
+    for event in iter_trace_events(source, chunk_size):
+        vitals.add(event)
+    return vitals.metrics()
+
+
+# Keys the MCP stop_trace result may use to point at the raw trace
+TRACE_SOURCE_KEYS = ('traceEvents', 'trace_file', 'traceFile', 'filePath', 'trace_path')
+
+
+def trace_source(trace_data: Dict[str, Any]) -> Optional[TraceSource]:
+    """Raw trace referenced by a stop_trace result (events or a file), if any"""
+    if not isinstance(trace_data, dict):
+        return None
+    for key in TRACE_SOURCE_KEYS:
+        value = trace_data.get(key)
+        if value:
+            return {'traceEvents': value} if key == 'traceEvents' else value
+    return None
+
+
+def vitals_from_trace_data(trace_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Metrics computed from the raw trace in a stop_trace result
+
+    Returns None when the result carries no raw trace or it cannot be parsed.
+    """
+    source = trace_source(trace_data)
+    if source is None:
+        return None
+    try:
+        return compute_trace_vitals(source)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚡ Could not parse raw trace: {e}")
+        return None
+
+
+# Pre-computed keys a stop_trace result may report, per metric
+VITAL_ALIASES = {
+    'lcp': ('lcp', 'largestContentfulPaint'),
+    'fid': ('fid', 'firstInputDelay'),
+    'cls': ('cls', 'cumulativeLayoutShift'),
+    'fcp': ('fcp', 'firstContentfulPaint'),
+    'tti': ('tti', 'timeToInteractive'),
+    'tbt': ('tbt', 'totalBlockingTime'),
+    'inp': ('inp', 'interactionToNextPaint')
+}
+
+
+def resolve_vitals(trace_data: Dict[str, Any]) -> Dict[str, Tuple[Any, str]]:
+    """
+    (value, source) per metric: reported key, else computed from the raw trace
+
+    source is 'reported', 'trace' or 'missing' (value None). The raw trace
+    is parsed at most once per result: the metrics are kept under
+    trace_data['trace_vitals'].
+    """
+    trace_data = trace_data if isinstance(trace_data, dict) else {}
+    resolved: Dict[str, Tuple[Any, str]] = {}
+    missing = []
+    for metric, aliases in VITAL_ALIASES.items():
+        key = next((alias for alias in aliases if alias in trace_data), None)
+        if key is None:
+            missing.append(metric)
+        else:
+            resolved[metric] = (trace_data[key], 'reported')
+
+    if missing:
+        metrics = trace_data.get('trace_vitals')
+        if metrics is None and trace_source(trace_data) is not None:
+            metrics = vitals_from_trace_data(trace_data)
+            if metrics is not None:
+                trace_data['trace_vitals'] = metrics
+        for metric in missing:
+            value = (metrics or {}).get(metric)
+            resolved[metric] = (value, 'trace') if value is not None else (None, 'missing')
+
+    return resolved
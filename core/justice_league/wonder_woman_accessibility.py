@@ -55,6 +55,13 @@ except ImportError:
     COLORMATH_AVAILABLE = False
     logging.warning("colormath not available - Advanced color analysis disabled")
 
+# Batched contrast / Delta E over unique color pairs (needs NumPy, not colormath)
+try:
+    from .color_science import get_color_analyzer
+    COLOR_ENGINE_AVAILABLE = True
+except ImportError:
+    COLOR_ENGINE_AVAILABLE = False
+
 # Playwright for automated testing
 try:
     from playwright.sync_api import sync_playwright, Page
@@ -107,6 +114,9 @@ class WonderWomanAccessibility:
         self.world_class_analyzer = WorldClassAccessibilityAnalyzer()
         self.axe_enabled = AXE_AVAILABLE
         self.colormath_enabled = COLORMATH_AVAILABLE
+        self.color_engine_enabled = COLOR_ENGINE_AVAILABLE
+        # Either backend computes contrast and Delta E
+        self.bracers_enabled = self.colormath_enabled or self.color_engine_enabled
         self.playwright_enabled = PLAYWRIGHT_AVAILABLE
         self.browser_eyes_enabled = BROWSER_EYES_AVAILABLE
 
@@ -125,7 +135,7 @@ class WonderWomanAccessibility:
 
         logger.info(f"⚡ Wonder Woman - Accessibility Champion Initialized")
         logger.info(f"  Lasso of Truth (axe-core): {'✅ ENABLED' if self.axe_enabled else '❌ Disabled'}")
-        logger.info(f"  Bracers of Submission (colormath): {'✅ ENABLED' if self.colormath_enabled else '❌ Disabled'}")
+        logger.info(f"  Bracers of Submission ({self._bracers_tool_name()}): {'✅ ENABLED' if self.bracers_enabled else '❌ Disabled'}")
         logger.info(f"  Invisible Jet (Playwright): {'✅ ENABLED' if self.playwright_enabled else '❌ Disabled'}")
         logger.info(f"  👁️ Amazon Vision (Browser Eyes): {'✅ ENABLED' if self.browser_eyes_enabled else '❌ Disabled'}")
         if self.browser_eyes_enabled:
@@ -217,11 +227,11 @@ class WonderWomanAccessibility:
             results['tools_used'].append('axe-core (Deque Systems)')
 
         # Power 3: Bracers of Submission (Advanced Color Science)
-        if self.colormath_enabled:
+        if self.bracers_enabled:
             logger.info("⚡ Power 3: Bracers Deflect Color Issues (Advanced Color Science)")
             color_analysis = self._analyze_colors_with_bracers(design_data)
             results['analyses']['color_science'] = color_analysis
-            results['tools_used'].append('colormath (Advanced Color Science)')
+            results['tools_used'].append(f'{self._bracers_tool_name()} (Advanced Color Science)')
 
         # Power 4: Invisible Jet (Automated Browser Testing)
         if self.playwright_enabled and html_output_path:
@@ -320,12 +330,12 @@ class WonderWomanAccessibility:
         Returns:
             Advanced color analysis results
         """
-        if not self.colormath_enabled:
-            return {'status': 'disabled', 'message': 'colormath not installed - Bracers unavailable!'}
+        if not self.bracers_enabled:
+            return {'status': 'disabled', 'message': 'Neither NumPy nor colormath installed - Bracers unavailable!'}
 
         color_results = {
             'status': 'active',
-            'tool': 'colormath (Bracers of Submission)',
+            'tool': f'{self._bracers_tool_name()} (Bracers of Submission)',
             'analyses_performed': [],
             'color_pairs_analyzed': 0,
             'recommendations': []
@@ -333,36 +343,41 @@ class WonderWomanAccessibility:
 
         try:
             components = design_data.get('components', {})
-            color_pairs_analyzed = 0
 
+            # Parse each distinct hex once, keeping component order
+            parsed_colors = {}
+            component_pairs = []
             for comp_id, component in components.items():
                 fg = component.get('foreground_color')
                 bg = component.get('background_color')
 
                 if fg and bg:
-                    # Convert hex to RGB
-                    fg_rgb = self._hex_to_rgb(fg)
-                    bg_rgb = self._hex_to_rgb(bg)
+                    fg_rgb = self._parse_color_cached(fg, parsed_colors)
+                    bg_rgb = self._parse_color_cached(bg, parsed_colors)
 
                     if fg_rgb and bg_rgb:
-                        # Calculate WCAG contrast ratio
-                        contrast = self._calculate_wcag_contrast(fg_rgb, bg_rgb)
+                        component_pairs.append((comp_id, fg_rgb, bg_rgb))
 
-                        # Calculate perceptual difference (Delta E)
-                        delta_e = self._calculate_delta_e(fg_rgb, bg_rgb)
+            # Contrast and Delta E once per unique pair
+            pair_metrics = self._measure_color_pairs([(fg_rgb, bg_rgb) for _, fg_rgb, bg_rgb in component_pairs])
+            color_pairs_analyzed = len(component_pairs)
 
-                        color_pairs_analyzed += 1
+            for comp_id, fg_rgb, bg_rgb in component_pairs:
+                contrast, delta_e = pair_metrics[(fg_rgb, bg_rgb)]
 
-                        # Check if colors are too similar (low Delta E)
-                        if delta_e < 30:  # Threshold for perceptual difference
-                            color_results['recommendations'].append({
-                                'component_id': comp_id,
-                                'issue': 'Colors too similar perceptually - Bracers deflect!',
-                                'delta_e': round(delta_e, 2),
-                                'contrast_ratio': round(contrast, 2),
-                                'severity': 'moderate' if contrast >= 4.5 else 'serious',
-                                'wonder_woman_action': 'Increase color difference for clarity'
-                            })
+                # Check if colors are too similar (low Delta E)
+                if delta_e < 30:  # Threshold for perceptual difference
+                    color_results['recommendations'].append({
+                        'component_id': comp_id,
+                        'issue': 'Colors too similar perceptually - Bracers deflect!',
+                        'delta_e': round(delta_e, 2),
+                        'contrast_ratio': round(contrast, 2),
+                        'severity': 'moderate' if contrast >= 4.5 else 'serious',
+                        'wonder_woman_action': 'Increase color difference for clarity'
+                    })
+
+            color_results['unique_color_pairs'] = len(pair_metrics)
+            color_results['engine'] = 'vectorized' if self.color_engine_enabled else 'scalar'
 
             color_results['color_pairs_analyzed'] = color_pairs_analyzed
             color_results['analyses_performed'] = [
@@ -571,6 +586,37 @@ class WonderWomanAccessibility:
             return {'hours': '80+', 'days': '10+', 'level': 'Epic War', 'wonder_woman_says': 'Call the Justice League!'}
 
     # Helper methods for color calculations
+    def _parse_color_cached(self, color: str, parsed_colors: Dict) -> Optional[tuple]:
+        """_hex_to_rgb, memoized per analysis"""
+        try:
+            return parsed_colors[color]
+        except KeyError:
+            rgb = parsed_colors[color] = self._hex_to_rgb(color)
+            return rgb
+        except TypeError:
+            # Unhashable color value
+            return self._hex_to_rgb(color)
+
+    def _bracers_tool_name(self) -> str:
+        """Color backend the Bracers use"""
+        return 'NumPy color engine' if self.color_engine_enabled else 'colormath'
+
+    def _measure_color_pairs(self, pairs: List[tuple]) -> Dict[tuple, tuple]:
+        """
+        (contrast_ratio, delta_e) per unique (fg_rgb, bg_rgb) pair
+
+        Uses the batched, memoized color engine when available and the
+        scalar helpers otherwise - both give the same values.
+        """
+        if self.color_engine_enabled:
+            # The shared analyzer writes its cache file once, at exit
+            return get_color_analyzer().analyze(pairs)
+
+        return {
+            pair: (self._calculate_wcag_contrast(*pair), self._calculate_delta_e(*pair))
+            for pair in dict.fromkeys(pairs)
+        }
+
     def _hex_to_rgb(self, hex_color: str) -> Optional[tuple]:
         """Convert hex color to RGB tuple"""
         try:
@@ -14,6 +14,7 @@ from pathlib import Path
 import json
 import re
 from datetime import datetime
+from urllib.parse import urlparse
 
 # Mission Control Narrator for coordinated communication
 try:
@@ -22,6 +23,13 @@ try:
 except ImportError:
     NARRATOR_AVAILABLE = False
 
+# Shared page snapshot (one capture per page for all browser-driven heroes)
+try:
+    from .page_snapshot import get_page_snapshot, js_to_fixed
+    PAGE_SNAPSHOT_AVAILABLE = True
+except ImportError:
+    PAGE_SNAPSHOT_AVAILABLE = False
+
 
 class ZatannaSEO:
     """
@@ -131,39 +139,42 @@ class ZatannaSEO:
         }
 
         try:
+            # One capture serves every spell (None -> each spell runs its own script)
+            snapshot = get_page_snapshot(mcp_tools, target_url) if PAGE_SNAPSHOT_AVAILABLE else None
+
             # Spell 1: Reveal meta tags
             results['magic_spells_cast'].append(self.MAGIC_SPELLS['meta_reveal'])
-            meta_analysis = self._backwards_spell_meta_reveal(mcp_tools)
+            meta_analysis = self._backwards_spell_meta_reveal(mcp_tools, snapshot)
             results['meta_tags'] = meta_analysis
 
             # Spell 2: Find structured data
             results['magic_spells_cast'].append(self.MAGIC_SPELLS['structured_data'])
-            structured_data = self._backwards_spell_structured_data(mcp_tools)
+            structured_data = self._backwards_spell_structured_data(mcp_tools, snapshot)
             results['structured_data'] = structured_data
 
             # Spell 3: Check crawlability
             results['magic_spells_cast'].append(self.MAGIC_SPELLS['crawlability'])
-            crawl_analysis = self._backwards_spell_crawlability(mcp_tools)
+            crawl_analysis = self._backwards_spell_crawlability(mcp_tools, snapshot)
             results['crawlability'] = crawl_analysis
 
             # Additional analysis: Headings
-            headings_analysis = self._analyze_heading_hierarchy(mcp_tools)
+            headings_analysis = self._analyze_heading_hierarchy(mcp_tools, snapshot)
             results['headings'] = headings_analysis
 
             # Additional analysis: Images
-            images_analysis = self._analyze_images_seo(mcp_tools)
+            images_analysis = self._analyze_images_seo(mcp_tools, snapshot)
             results['images'] = images_analysis
 
             # Additional analysis: Links
-            links_analysis = self._analyze_internal_links(mcp_tools)
+            links_analysis = self._analyze_internal_links(mcp_tools, snapshot)
             results['links'] = links_analysis
 
             # Additional analysis: Mobile
-            mobile_analysis = self._analyze_mobile_seo(mcp_tools)
+            mobile_analysis = self._analyze_mobile_seo(mcp_tools, snapshot)
             results['mobile'] = mobile_analysis
 
             # Additional analysis: Core Web Vitals impact
-            cwv_impact = self._analyze_cwv_impact(mcp_tools)
+            cwv_impact = self._analyze_cwv_impact(mcp_tools, snapshot)
             results['core_web_vitals_impact'] = cwv_impact
 
             # Compile all issues
@@ -196,7 +207,7 @@ class ZatannaSEO:
             }
             return results
 
-    def _backwards_spell_meta_reveal(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _backwards_spell_meta_reveal(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎩 Spell: !sgat atem laeveR (Reveal meta tags!)
 
@@ -213,7 +224,7 @@ class ZatannaSEO:
         print("   🔮 Casting: !sgat atem laeveR")
 
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         # Extract all meta tags via JavaScript
@@ -276,7 +287,10 @@ class ZatannaSEO:
         }
         """
 
-        meta_data = evaluate_script(function=meta_extraction_js)
+        if snapshot is not None:
+            meta_data = self._meta_tags_from_snapshot(snapshot)
+        else:
+            meta_data = evaluate_script(function=meta_extraction_js)
 
         # Validate meta tags
         validation = {
@@ -293,7 +307,7 @@ class ZatannaSEO:
 
         return validation
 
-    def _backwards_spell_structured_data(self, mcp_tools: Dict) -> List[Dict[str, Any]]:
+    def _backwards_spell_structured_data(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> List[Dict[str, Any]]:
         """
         🎩 Spell: !atad derutcurts dniF (Find structured data!)
 
@@ -305,7 +319,7 @@ class ZatannaSEO:
         print("   🔮 Casting: !atad derutcurts dniF")
 
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return []
 
         # Extract JSON-LD structured data
@@ -349,7 +363,10 @@ class ZatannaSEO:
         }
         """
 
-        structured_data = evaluate_script(function=structured_data_js)
+        if snapshot is not None:
+            structured_data = self._structured_data_from_snapshot(snapshot)
+        else:
+            structured_data = evaluate_script(function=structured_data_js)
 
         # Validate structured data
         validated_data = []
@@ -362,7 +379,7 @@ class ZatannaSEO:
 
         return validated_data
 
-    def _backwards_spell_crawlability(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _backwards_spell_crawlability(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         🎩 Spell: !ytilibwalwarc kcehC (Check crawlability!)
 
@@ -376,7 +393,7 @@ class ZatannaSEO:
         print("   🔮 Casting: !ytilibwalwarc kcehC")
 
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         crawl_js = """
@@ -423,7 +440,10 @@ class ZatannaSEO:
         }
         """
 
-        crawl_data = evaluate_script(function=crawl_js)
+        if snapshot is not None:
+            crawl_data = self._crawlability_from_snapshot(snapshot)
+        else:
+            crawl_data = evaluate_script(function=crawl_js)
 
         # Analyze crawlability
         analysis = {
@@ -444,10 +464,10 @@ class ZatannaSEO:
 
         return analysis
 
-    def _analyze_heading_hierarchy(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _analyze_heading_hierarchy(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """Analyze heading structure (H1-H6) for SEO"""
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         headings_js = """
@@ -473,7 +493,10 @@ class ZatannaSEO:
         }
         """
 
-        headings_data = evaluate_script(function=headings_js)
+        if snapshot is not None:
+            headings_data = self._headings_from_snapshot(snapshot)
+        else:
+            headings_data = evaluate_script(function=headings_js)
 
         # Validate heading hierarchy
         issues = []
@@ -488,10 +511,10 @@ class ZatannaSEO:
             'valid': len(issues) == 0
         }
 
-    def _analyze_images_seo(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _analyze_images_seo(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """Analyze images for SEO (alt text, file names, dimensions)"""
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         images_js = """
@@ -525,7 +548,10 @@ class ZatannaSEO:
         }
         """
 
-        images_data = evaluate_script(function=images_js)
+        if snapshot is not None:
+            images_data = self._images_from_snapshot(snapshot)
+        else:
+            images_data = evaluate_script(function=images_js)
 
         issues = []
         if images_data.get('images_without_alt', 0) > 0:
@@ -534,13 +560,13 @@ class ZatannaSEO:
         return {
             'stats': images_data,
             'issues': issues,
-            'seo_friendly': images_data.get('alt_coverage_percent', 0) >= 90
+            'seo_friendly': float(images_data.get('alt_coverage_percent', 0)) >= 90
         }
 
-    def _analyze_internal_links(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _analyze_internal_links(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """Analyze internal linking structure"""
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         links_js = """
@@ -591,7 +617,10 @@ class ZatannaSEO:
         }
         """
 
-        links_data = evaluate_script(function=links_js)
+        if snapshot is not None:
+            links_data = self._links_from_snapshot(snapshot)
+        else:
+            links_data = evaluate_script(function=links_js)
 
         issues = []
         if links_data.get('broken_links', 0) > 0:
@@ -603,10 +632,10 @@ class ZatannaSEO:
             'healthy_link_structure': links_data.get('broken_links', 0) == 0
         }
 
-    def _analyze_mobile_seo(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _analyze_mobile_seo(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """Analyze mobile SEO factors"""
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         mobile_js = """
@@ -623,7 +652,10 @@ class ZatannaSEO:
         }
         """
 
-        mobile_data = evaluate_script(function=mobile_js)
+        if snapshot is not None:
+            mobile_data = self._mobile_from_snapshot(snapshot)
+        else:
+            mobile_data = evaluate_script(function=mobile_js)
 
         issues = []
         if not mobile_data.get('has_viewport'):
@@ -640,7 +672,7 @@ class ZatannaSEO:
             'mobile_optimized': len(issues) == 0
         }
 
-    def _analyze_cwv_impact(self, mcp_tools: Dict) -> Dict[str, Any]:
+    def _analyze_cwv_impact(self, mcp_tools: Dict, snapshot: Optional[Any] = None) -> Dict[str, Any]:
         """
         Analyze how page structure impacts Core Web Vitals (SEO ranking factor)
 
@@ -650,7 +682,7 @@ class ZatannaSEO:
         - CLS (Cumulative Layout Shift)
         """
         evaluate_script = mcp_tools.get('evaluate_script')
-        if not evaluate_script:
+        if snapshot is None and not evaluate_script:
             return {'error': 'MCP evaluate_script not available'}
 
         cwv_js = """
@@ -689,7 +721,10 @@ class ZatannaSEO:
         }
         """
 
-        cwv_data = evaluate_script(function=cwv_js)
+        if snapshot is not None:
+            cwv_data = self._cwv_from_snapshot(snapshot)
+        else:
+            cwv_data = evaluate_script(function=cwv_js)
 
         issues = []
         recommendations = []
@@ -712,6 +747,186 @@ class ZatannaSEO:
             'cwv_optimized': len(issues) == 0
         }
 
+    # Snapshot queries - Python ports of the spell scripts above, run against a PageSnapshot
+    def _meta_tags_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        def content(selector: str) -> str:
+            tag = snapshot.query_selector(selector)
+            return (tag.get_attribute('content') or '') if tag else ''
+
+        canonical = snapshot.query_selector('link[rel="canonical"]')
+        meta = {
+            'title': snapshot.title,
+            'description': content('meta[name="description"]'),
+            'canonical': canonical.prop('href', '') if canonical else '',
+            'robots': content('meta[name="robots"]'),
+            'language': snapshot.lang,
+            'viewport': content('meta[name="viewport"]'),
+            'open_graph': {},
+            'twitter': {},
+            'other': []
+        }
+
+        for tag in snapshot.query_selector_all('meta[property^="og:"]'):
+            meta['open_graph'][tag.get_attribute('property').replace('og:', '', 1)] = tag.get_attribute('content') or ''
+
+        for tag in snapshot.query_selector_all('meta[name^="twitter:"]'):
+            meta['twitter'][tag.get_attribute('name').replace('twitter:', '', 1)] = tag.get_attribute('content') or ''
+
+        for tag in snapshot.query_selector_all('meta'):
+            name = tag.get_attribute('name') or tag.get_attribute('property')
+            if name and not name.startswith('og:') and not name.startswith('twitter:') and \
+                    name not in ('description', 'robots', 'viewport'):
+                meta['other'].append({'name': name, 'content': tag.get_attribute('content') or ''})
+
+        return meta
+
+    def _structured_data_from_snapshot(self, snapshot) -> List[Dict[str, Any]]:
+        structured_data = []
+
+        for script in snapshot.query_selector_all('script[type="application/ld+json"]'):
+            try:
+                data = json.loads(script.text_content)
+                structured_data.append({
+                    'type': 'json-ld',
+                    'schema': (data.get('@type') if isinstance(data, dict) else None) or 'Unknown',
+                    'data': data,
+                    'valid': True
+                })
+            except ValueError as e:
+                structured_data.append({
+                    'type': 'json-ld',
+                    'schema': 'Parse Error',
+                    'error': str(e),
+                    'valid': False
+                })
+
+        for item in snapshot.query_selector_all('[itemscope]'):
+            item_type = item.get_attribute('itemtype') or 'Unknown'
+            structured_data.append({
+                'type': 'microdata',
+                'schema': item_type.split('/')[-1],
+                'element': item.tag_name,
+                'valid': True
+            })
+
+        return structured_data
+
+    def _crawlability_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        def href(selector: str) -> str:
+            link = snapshot.query_selector(selector)
+            return link.prop('href', '') if link else ''
+
+        crawl = {
+            'robots_meta': '',
+            'canonical': href('link[rel="canonical"]'),
+            'hreflang': [
+                {'hreflang': link.get_attribute('hreflang'), 'href': link.prop('href', '')}
+                for link in snapshot.query_selector_all('link[rel="alternate"][hreflang]')
+            ],
+            'pagination': {
+                'prev': href('link[rel="prev"]'),
+                'next': href('link[rel="next"]')
+            },
+            'noindex': False,
+            'nofollow': False
+        }
+
+        robots_meta = snapshot.query_selector('meta[name="robots"]')
+        if robots_meta:
+            robots = robots_meta.get_attribute('content') or ''
+            crawl['robots_meta'] = robots
+            crawl['noindex'] = 'noindex' in robots.lower()
+            crawl['nofollow'] = 'nofollow' in robots.lower()
+
+        return crawl
+
+    def _headings_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        headings = {tag: [h.text_content.strip() for h in snapshot.query_selector_all(tag)]
+                    for tag in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')}
+        data = {f'{tag}_count': len(texts) for tag, texts in headings.items()}
+        data['h1_texts'] = headings['h1']
+        data['hierarchy_valid'] = len(headings['h1']) > 0
+        return data
+
+    def _images_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        images = snapshot.query_selector_all('img')
+        with_alt = 0
+        missing_alt = []
+
+        for index, img in enumerate(images):
+            alt = img.get_attribute('alt')
+            if alt and alt.strip():
+                with_alt += 1
+            else:
+                missing_alt.append({
+                    'index': index,
+                    'src': img.prop('src', ''),
+                    'width': img.prop('naturalWidth', 0),
+                    'height': img.prop('naturalHeight', 0)
+                })
+
+        total = len(images)
+        return {
+            'total_images': total,
+            'images_with_alt': with_alt,
+            'images_without_alt': len(missing_alt),
+            'alt_coverage_percent': js_to_fixed(with_alt / total * 100, 1) if total > 0 else 0,
+            'missing_alt_details': missing_alt[:10]
+        }
+
+    def _links_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        links = snapshot.query_selector_all('a[href]')
+        internal = external = broken = nofollow_count = 0
+
+        for link in links:
+            href = link.prop('href', '')
+            try:
+                hostname = urlparse(href).hostname or ''
+                if hostname == snapshot.hostname:
+                    internal += 1
+                else:
+                    external += 1
+            except ValueError:
+                # Unparseable URL = internal
+                internal += 1
+
+            if 'nofollow' in (link.get_attribute('rel') or ''):
+                nofollow_count += 1
+
+            if href in ('#', ''):
+                broken += 1
+
+        return {
+            'total_links': len(links),
+            'internal_links': internal,
+            'external_links': external,
+            'broken_links': broken,
+            'nofollow_links': nofollow_count
+        }
+
+    def _mobile_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        viewport = snapshot.query_selector('meta[name="viewport"]')
+        viewport_content = (viewport.get_attribute('content') or '') if viewport else ''
+        return {
+            'has_viewport': viewport is not None,
+            'viewport_content': viewport_content,
+            'mobile_friendly': 'width=device-width' in viewport_content,
+            'user_scalable_disabled': 'user-scalable=no' in viewport_content
+        }
+
+    def _cwv_from_snapshot(self, snapshot) -> Dict[str, Any]:
+        images = snapshot.query_selector_all('img')
+        return {
+            'images_without_dimensions': sum(
+                1 for img in images if not img.has_attribute('width') or not img.has_attribute('height')),
+            'lazy_loading': any((img.get_attribute('loading') or '').lower() == 'lazy' for img in images),
+            'font_display': False,
+            'inline_css_size': sum(style.text_length or 0 for style in snapshot.query_selector_all('style')),
+            'blocking_scripts': sum(
+                1 for script in snapshot.query_selector_all('script:not([async]):not([defer])')
+                if script.prop('src'))
+        }
+
     # Validation methods
     def _validate_title(self, title: str) -> Dict[str, Any]:
         """Validate title tag"""
@@ -3,13 +3,30 @@
 
 Provides heroes access to global best practices during analysis.
 Each hero can query their specific domain knowledge.
+
+GLOBAL_BEST_PRACTICES.md is compiled once into every hero section (plus the
+dark patterns table) and kept in memory and in a JSON artifact under
+knowledge_base/.cache/. Each query only stats the markdown: a changed
+mtime/size re-validates the artifact by content hash and recompiles when
+the markdown really changed, so a fresh process answers its first query
+without parsing anything.
 """
 
+import copy
+import hashlib
+import logging
 import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 
+logger = logging.getLogger(__name__)
+
+# Bump when the compiled structure changes so stale artifacts are rebuilt
+CACHE_VERSION = 1
+
+
 class KnowledgeBaseLoader:
     """
     Load and query the Justice League global knowledge base.
@@ -18,12 +35,13 @@ class KnowledgeBaseLoader:
     during their analysis.
     """
 
-    def __init__(self, kb_path: Optional[str] = None):
+    def __init__(self, kb_path: Optional[str] = None, cache_path: Optional[str] = None):
         """
         Initialize knowledge base loader.
 
         Args:
             kb_path: Path to knowledge base directory
+            cache_path: Compiled knowledge artifact (default: <kb_path>/.cache/GLOBAL_BEST_PRACTICES.json)
         """
         if kb_path is None:
             # Default to knowledge_base directory in project root
@@ -32,6 +50,12 @@ class KnowledgeBaseLoader:
 
         self.kb_path = Path(kb_path)
         self.best_practices_file = self.kb_path / 'GLOBAL_BEST_PRACTICES.md'
+        self.cache_path = Path(cache_path) if cache_path else self.kb_path / '.cache' / 'GLOBAL_BEST_PRACTICES.json'
+
+        # Compiled knowledge and the (mtime_ns, size) of the markdown it came from
+        self._compiled: Optional[Dict[str, Any]] = None
+        self._compiled_stamp: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
 
         # Hero-specific knowledge sections
         self.hero_sections = {
@@ -76,27 +100,117 @@ class KnowledgeBaseLoader:
         return knowledge
 
     def _parse_hero_section(self, hero_key: str) -> Dict[str, Any]:
-        """Parse hero's section from GLOBAL_BEST_PRACTICES.md"""
-
-        if not self.best_practices_file.exists():
+        """Hero's section of GLOBAL_BEST_PRACTICES.md (from the compiled cache)"""
+        compiled = self._get_compiled()
+        if compiled is None:
             return {
                 'error': 'Knowledge base not found',
                 'path': str(self.best_practices_file)
             }
 
-        # Read the markdown file
-        with open(self.best_practices_file, 'r') as f:
-            content = f.read()
+        knowledge = compiled['sections'].get(hero_key)
+        if knowledge is None:
+            return {
+                'error': f'Section not found: {self.hero_sections[hero_key]}'
+            }
+
+        # Callers get their own copy to modify
+        return copy.deepcopy(knowledge)
+
+    # ===========================================
+    # COMPILED CACHE
+    # ===========================================
+
+    def _get_compiled(self) -> Optional[Dict[str, Any]]:
+        """Compiled knowledge for the current markdown, or None if it does not exist"""
+        try:
+            stat = self.best_practices_file.stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if self._compiled is not None and self._compiled_stamp == stamp:
+                return self._compiled
+
+            compiled = self._load_artifact(stamp)
+            if compiled is None:
+                try:
+                    raw = self.best_practices_file.read_bytes()
+                except OSError:
+                    return None
+                compiled = self._compile(raw.decode('utf-8'), hashlib.sha256(raw).hexdigest())
+                self._write_artifact(compiled, stamp)
+
+            self._compiled, self._compiled_stamp = compiled, stamp
+            return compiled
+
+    def _compile(self, content: str, digest: str) -> Dict[str, Any]:
+        """Parse every hero section and the dark patterns table once"""
+        sections = {}
+        for hero_key in self.hero_sections:
+            section = self._parse_section(content, hero_key)
+            if section is not None:
+                sections[hero_key] = section
+
+        litty = sections.get('litty')
+        return {
+            'version': CACHE_VERSION,
+            'source_sha256': digest,
+            'hero_sections': self.hero_sections,
+            'sections': sections,
+            'dark_patterns': self._parse_dark_patterns(litty['raw_content']) if litty else []
+        }
 
+    def _load_artifact(self, stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """The on-disk compiled knowledge if it still matches the markdown"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                artifact = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (not isinstance(artifact, dict) or artifact.get('version') != CACHE_VERSION
+                or artifact.get('hero_sections') != self.hero_sections):
+            return None
+        if artifact.get('source_stamp') == list(stamp):
+            return artifact
+
+        # mtime/size changed (checkout, touch, edit): trust the artifact only if the content did not
+        try:
+            digest = hashlib.sha256(self.best_practices_file.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        if digest != artifact.get('source_sha256'):
+            return None
+        self._write_artifact(artifact, stamp)
+        return artifact
+
+    def _write_artifact(self, compiled: Dict[str, Any], stamp: Tuple[int, int]):
+        """Atomically store compiled knowledge (best effort - a read-only KB just recompiles)"""
+        compiled['source_stamp'] = list(stamp)
+        tmp_path = self.cache_path.with_name(f'{self.cache_path.name}.{os.getpid()}.tmp')
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(compiled, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.debug(f"🧠 Could not write knowledge cache {self.cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _parse_section(self, content: str, hero_key: str) -> Optional[Dict[str, Any]]:
+        """Parse one hero's section from the markdown content (None if missing)"""
         section_name = self.hero_sections[hero_key]
 
         # Extract hero's section
         section_start = f'## {section_name}'
 
         if section_start not in content:
-            return {
-                'error': f'Section not found: {section_name}'
-            }
+            return None
 
         # Find section boundaries
         start_idx = content.index(section_start)
@@ -195,41 +309,42 @@ class KnowledgeBaseLoader:
 
     def get_dark_patterns_list(self) -> List[Dict[str, str]]:
         """Get Litty's dark patterns list"""
-        litty_knowledge = self.get_hero_knowledge('litty')
+        compiled = self._get_compiled()
+        if compiled is None:
+            return []
+        return copy.deepcopy(compiled['dark_patterns'])
 
-        # Parse dark patterns table from content
+    def _parse_dark_patterns(self, content: str) -> List[Dict[str, str]]:
+        """Parse the dark patterns table from Litty's section"""
         dark_patterns = []
 
-        if 'raw_content' in litty_knowledge:
-            content = litty_knowledge['raw_content']
+        # Find dark patterns table
+        if '| Pattern |' in content:
+            lines = content.split('\n')
+            in_table = False
 
-            # Find dark patterns table
-            if '| Pattern |' in content:
-                lines = content.split('\n')
-                in_table = False
+            for line in lines:
+                if '| Pattern |' in line:
+                    in_table = True
+                    continue
 
-                for line in lines:
-                    if '| Pattern |' in line:
-                        in_table = True
+                if in_table and line.startswith('|'):
+                    # Skip separator line
+                    if '---' in line:
                         continue
 
-                    if in_table and line.startswith('|'):
-                        # Skip separator line
-                        if '---' in line:
-                            continue
-
-                        # Parse table row
-                        parts = [p.strip() for p in line.split('|') if p.strip()]
-                        if len(parts) >= 3:
-                            # Remove bold markdown formatting from pattern name
-                            pattern_name = parts[0].replace('**', '').strip()
-                            dark_patterns.append({
-                                'pattern': pattern_name,
-                                'description': parts[1],
-                                'example': parts[2]
-                            })
-                    elif in_table and not line.startswith('|'):
-                        break
+                    # Parse table row
+                    parts = [p.strip() for p in line.split('|') if p.strip()]
+                    if len(parts) >= 3:
+                        # Remove bold markdown formatting from pattern name
+                        pattern_name = parts[0].replace('**', '').strip()
+                        dark_patterns.append({
+                            'pattern': pattern_name,
+                            'description': parts[1],
+                            'example': parts[2]
+                        })
+                elif in_table and not line.startswith('|'):
+                    break
 
         return dark_patterns
 
@@ -254,8 +369,6 @@ class KnowledgeBaseLoader:
 
     def get_core_web_vitals(self) -> Dict[str, Dict[str, str]]:
         """Get Flash's Core Web Vitals targets"""
-        flash_knowledge = self.get_hero_knowledge('flash')
-
         cwv = {
             'LCP': {
                 'good': '≤2.5s',
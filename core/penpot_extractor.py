@@ -5,17 +5,34 @@ Handles extraction and parsing of Penpot design files
 
 import json
 import zipfile
-import uuid
-from pathlib import Path
-from typing import Dict, List, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 import logging
 
 
 class PenpotExtractor:
-    """Extract and parse Penpot design files (.penpot are ZIP archives)"""
-
-    def __init__(self):
+    """
+    Extract and parse Penpot design files (.penpot are ZIP archives)
+
+    Archive members are read straight from the ZipFile - nothing is extracted
+    to disk. Layout:
+        manifest.json
+        files/<file_id>/<file_id>.json                       File metadata
+        files/<file_id>/pages/<page_id>/<page_id>.json       Page metadata
+        files/<file_id>/pages/<page_id>/<object_id>.json     Page objects
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: Threads used to parse pages in parallel. At most
+                twice this many parsed pages are held in memory at once by
+                iter_pages().
+        """
         self.logger = logging.getLogger(__name__)
+        self.max_workers = max(1, max_workers)
 
     def extract_penpot_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -34,152 +51,170 @@ class PenpotExtractor:
 
         try:
             with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                # Create temporary extraction directory
-                extract_dir = Path(file_path).parent / f"temp_extract_{uuid.uuid4().hex[:8]}"
-                extract_dir.mkdir(exist_ok=True)
-
-                # Extract all files
-                zip_ref.extractall(extract_dir)
-
-                # Parse extracted data
-                extracted_data = self._parse_extracted_files(extract_dir)
-
-                # Clean up temporary directory
-                self._cleanup_temp_dir(extract_dir)
-
-                return extracted_data
+                layout = self._index_archive(zip_ref)
+
+                data = {
+                    'manifest': None,
+                    'files': {},
+                    'pages': {},
+                    'components': {},
+                    'total_objects': 0,
+                    'extraction_metadata': {
+                        'source_path': str(Path(file_path).parent),
+                        'extracted_files_count': layout['json_count']
+                    }
+                }
+
+                if layout['manifest']:
+                    data['manifest'] = self._read_json(zip_ref, layout['manifest'])
+                    self.logger.info(f"Loaded manifest for {data['manifest'].get('files', [{}])[0].get('name', 'Unknown')}")
+
+                for file_id, file_layout in layout['files'].items():
+                    data['files'][file_id] = {
+                        'id': file_id,
+                        'metadata': self._read_json(zip_ref, file_layout['metadata']) if file_layout['metadata'] else None,
+                        'pages': {},
+                        'objects_count': 0
+                    }
+
+                for file_id, page_id, page_data in self._parse_pages(zip_ref, layout):
+                    file_data = data['files'][file_id]
+                    file_data['pages'][page_id] = page_data
+                    file_data['objects_count'] += len(page_data['objects'])
+
+                data['total_objects'] = self._count_total_objects(data)
+
+                return data
 
         except Exception as e:
             self.logger.error(f"Failed to extract Penpot file: {str(e)}")
             raise
 
-    def _parse_extracted_files(self, extract_dir: Path) -> Dict[str, Any]:
-        """Parse extracted Penpot files"""
-        data = {
-            'manifest': None,
-            'files': {},
-            'pages': {},
-            'components': {},
-            'total_objects': 0,
-            'extraction_metadata': {
-                'source_path': str(extract_dir.parent),
-                'extracted_files_count': 0
-            }
-        }
-
-        # Parse manifest.json
-        manifest_path = extract_dir / "manifest.json"
-        if manifest_path.exists():
-            with open(manifest_path, 'r') as f:
-                data['manifest'] = json.load(f)
-                self.logger.info(f"Loaded manifest for {data['manifest'].get('files', [{}])[0].get('name', 'Unknown')}")
-
-        # Parse files directory
-        files_dir = extract_dir / "files"
-        if files_dir.exists():
-            data['files'] = self._parse_files_directory(files_dir)
-
-        # Count total objects
-        data['total_objects'] = self._count_total_objects(data)
-
-        # Get file count
-        data['extraction_metadata']['extracted_files_count'] = len(list(extract_dir.rglob("*.json")))
-
-        return data
-
-    def _parse_files_directory(self, files_dir: Path) -> Dict[str, Any]:
-        """Parse the files directory structure"""
-        files_data = {}
-
-        for file_dir in files_dir.iterdir():
-            if file_dir.is_dir():
-                file_id = file_dir.name
-                file_data = self._parse_single_file(file_dir)
-                files_data[file_id] = file_data
-
-        return files_data
-
-    def _parse_single_file(self, file_dir: Path) -> Dict[str, Any]:
-        """Parse a single file directory"""
-        file_data = {
-            'id': file_dir.name,
-            'metadata': None,
-            'pages': {},
-            'objects_count': 0
-        }
+    def iter_pages(self, file_path: str) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Stream parsed pages without building the whole file in memory
 
-        # Parse main file metadata
-        main_file = file_dir / f"{file_dir.name}.json"
-        if main_file.exists():
-            with open(main_file, 'r') as f:
-                file_data['metadata'] = json.load(f)
+        Pages are parsed in parallel worker threads and yielded in archive
+        order as (file_id, page_id, page_data), where page_data has the same
+        shape as the entries of extract_penpot_file()['files'][id]['pages'].
+        """
+        with zipfile.ZipFile(file_path, 'r') as zip_ref:
+            yield from self._parse_pages(zip_ref, self._index_archive(zip_ref))
 
-        # Parse pages directory
-        pages_dir = file_dir / "pages"
-        if pages_dir.exists():
-            file_data['pages'] = self._parse_pages_directory(pages_dir)
+    def iter_objects(self, file_path: str) -> Iterator[Tuple[str, str, str, Dict[str, Any]]]:
+        """
+        Stream every page object as (file_id, page_id, object_id, object_data)
 
-        # Count objects in this file
-        file_data['objects_count'] = sum(
-            len(page.get('objects', {})) for page in file_data['pages'].values()
+        Objects are decoded one at a time, so memory stays flat regardless of
+        file size. The stream can be passed directly to
+        ComponentDetector.detect_components().
+        """
+        with zipfile.ZipFile(file_path, 'r') as zip_ref:
+            layout = self._index_archive(zip_ref)
+            for file_id, file_layout in layout['files'].items():
+                for page_id, page_layout in file_layout['pages'].items():
+                    for object_id, member in page_layout['objects']:
+                        try:
+                            yield file_id, page_id, object_id, self._read_json(zip_ref, member)
+                        except Exception as e:
+                            self.logger.warning(f"Failed to parse object file {member}: {str(e)}")
+
+    def _index_archive(self, zip_ref: zipfile.ZipFile) -> Dict[str, Any]:
+        """Group archive member names into manifest / files / pages / objects"""
+        layout = {'manifest': None, 'files': {}, 'json_count': 0}
+
+        for member in zip_ref.namelist():
+            if member.endswith('/'):
+                continue
+            parts = PurePosixPath(member).parts
+            if not parts or not parts[-1].endswith('.json'):
+                continue
+            layout['json_count'] += 1
+
+            if parts == ('manifest.json',):
+                layout['manifest'] = member
+                continue
+            if len(parts) < 3 or parts[0] != 'files':
+                continue
+
+            file_id = parts[1]
+            file_layout = layout['files'].setdefault(file_id, {'metadata': None, 'pages': {}})
+
+            if len(parts) == 3 and parts[2] == f"{file_id}.json":
+                file_layout['metadata'] = member
+            elif len(parts) == 5 and parts[2] == 'pages':
+                page_id = parts[3]
+                page_layout = file_layout['pages'].setdefault(page_id, {'metadata': None, 'objects': []})
+                object_id = parts[4][:-len('.json')]
+                if object_id == page_id:
+                    page_layout['metadata'] = member
+                else:
+                    page_layout['objects'].append((object_id, member))
+
+        return layout
+
+    def _parse_pages(self, zip_ref: zipfile.ZipFile, layout: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """Parse pages on worker threads, keeping a bounded number in flight"""
+        page_jobs = (
+            (file_id, page_id, page_layout)
+            for file_id, file_layout in layout['files'].items()
+            for page_id, page_layout in file_layout['pages'].items()
         )
-
-        return file_data
-
-    def _parse_pages_directory(self, pages_dir: Path) -> Dict[str, Any]:
-        """Parse pages directory"""
-        pages_data = {}
-
-        for page_dir in pages_dir.iterdir():
-            if page_dir.is_dir():
-                page_id = page_dir.name
-                page_data = self._parse_single_page(page_dir)
-                pages_data[page_id] = page_data
-
-        return pages_data
-
-    def _parse_single_page(self, page_dir: Path) -> Dict[str, Any]:
-        """Parse a single page directory"""
+        max_in_flight = self.max_workers * 2
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for file_id, page_id, page_layout in page_jobs:
+                pending.append((file_id, page_id,
+                                executor.submit(self._parse_single_page, zip_ref, page_id, page_layout)))
+                if len(pending) >= max_in_flight:
+                    file_id, page_id, future = pending.popleft()
+                    yield file_id, page_id, future.result()
+            while pending:
+                file_id, page_id, future = pending.popleft()
+                yield file_id, page_id, future.result()
+
+    def _parse_single_page(self, zip_ref: zipfile.ZipFile, page_id: str, page_layout: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse one page's metadata and objects from the archive"""
         page_data = {
-            'id': page_dir.name,
+            'id': page_id,
             'metadata': None,
             'objects': {},
             'object_types': {},
-            'components_used': set()
+            'components_used': []
         }
+        components_used = {}
 
-        # Parse page metadata if exists
-        page_metadata_file = page_dir / f"{page_dir.name}.json"
-        if page_metadata_file.exists():
-            with open(page_metadata_file, 'r') as f:
-                page_data['metadata'] = json.load(f)
+        if page_layout['metadata']:
+            page_data['metadata'] = self._read_json(zip_ref, page_layout['metadata'])
 
-        # Parse all object files in the page
-        for object_file in page_dir.glob("*.json"):
-            if object_file.name != f"{page_dir.name}.json":  # Skip page metadata
-                object_id = object_file.stem
-                try:
-                    with open(object_file, 'r') as f:
-                        object_data = json.load(f)
-                        page_data['objects'][object_id] = object_data
+        for object_id, member in page_layout['objects']:
+            try:
+                object_data = self._read_json(zip_ref, member)
+                page_data['objects'][object_id] = object_data
 
-                        # Track object types
-                        obj_type = object_data.get('type', 'unknown')
-                        page_data['object_types'][obj_type] = page_data['object_types'].get(obj_type, 0) + 1
+                # Track object types
+                obj_type = object_data.get('type', 'unknown')
+                page_data['object_types'][obj_type] = page_data['object_types'].get(obj_type, 0) + 1
 
-                        # Track component usage
-                        component_name = object_data.get('name', '')
-                        if component_name and ('V1-' in component_name or 'component' in component_name.lower()):
-                            page_data['components_used'].add(component_name)
+                # Track component usage
+                component_name = object_data.get('name', '')
+                if component_name and ('V1-' in component_name or 'component' in component_name.lower()):
+                    components_used[component_name] = None
 
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse object file {object_file}: {str(e)}")
+            except Exception as e:
+                self.logger.warning(f"Failed to parse object file {member}: {str(e)}")
 
-        # Convert set to list for JSON serialization
-        page_data['components_used'] = list(page_data['components_used'])
+        page_data['components_used'] = list(components_used)
 
         return page_data
 
+    @staticmethod
+    def _read_json(zip_ref: zipfile.ZipFile, member: str) -> Any:
+        """Decode one archive member without extracting it"""
+        with zip_ref.open(member) as f:
+            return json.load(f)
+
     def _count_total_objects(self, data: Dict[str, Any]) -> int:
         """Count total objects across all files and pages"""
         total = 0
@@ -187,14 +222,6 @@ class PenpotExtractor:
             total += file_data.get('objects_count', 0)
         return total
 
-    def _cleanup_temp_dir(self, temp_dir: Path):
-        """Clean up temporary extraction directory"""
-        import shutil
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception as e:
-            self.logger.warning(f"Failed to cleanup temp directory {temp_dir}: {str(e)}")
-
     def get_file_summary(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate a summary of the extracted file"""
         manifest = extracted_data.get('manifest', {})
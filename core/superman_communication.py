@@ -9,14 +9,30 @@ Inter-hero communication system allowing heroes to:
 - Verify each other's work
 - Collaborate on complex problems
 
+Memory stays bounded in long-running sessions:
+- History, conversations and per-hero inboxes are ring buffers
+- Each hero has an indexed inbox (and pending help requests), so lookups
+  never scan the whole history; broadcasts are stored once
+- Delivery runs on worker threads: the sender returns once a message is
+  queued, each hero still receives its messages in order, and a full
+  delivery queue blocks senders (backpressure) instead of growing
+- Evicted history can be spilled to a JSON-lines file on disk
+
 Author: Superman (with Claude Code)
 Created: October 21, 2025
 Status: Production Ready
 """
 
+import heapq
+import itertools
+import json
 import logging
-from typing import Dict, Any, List, Optional
-from collections import defaultdict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Union
+from collections import Counter, defaultdict, deque
 from datetime import datetime
 
 # Import from hero_base with fallback
@@ -25,6 +41,14 @@ try:
 except ImportError:
     from justice_league.hero_base import HeroMessage, HeroPriority
 
+DEFAULT_HISTORY_SIZE = 10_000
+DEFAULT_INBOX_SIZE = 1_000
+DEFAULT_MAX_PENDING = 1_000
+SPILL_FILE_NAME = "hero_messages.jsonl"
+# Messages one worker delivers to a hero before yielding to other heroes' mailboxes
+DELIVERY_BATCH = 64
+LATENCY_SAMPLES = 1_000
+
 
 class HeroCommunicationHub:
     """
@@ -34,13 +58,64 @@ class HeroCommunicationHub:
     and enables real-time collaboration.
     """
 
-    def __init__(self):
-        """Initialize communication hub."""
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE,
+                 inbox_size: int = DEFAULT_INBOX_SIZE,
+                 delivery_workers: int = 4,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 backpressure_timeout: Optional[float] = 30.0,
+                 spill_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize communication hub.
+
+        Args:
+            history_size: Messages kept in message_history (and the queue)
+            inbox_size: Messages kept per hero inbox and per conversation
+            delivery_workers: Delivery threads; 0 delivers synchronously in route_message
+            max_pending: Queued deliveries before senders block
+            backpressure_timeout: Seconds a blocked sender waits before the delivery
+                is dropped (None waits indefinitely)
+            spill_dir: Directory to append evicted history to (hero_messages.jsonl)
+        """
         self.heroes: Dict[str, Any] = {}  # hero_name -> hero_instance
-        self.message_queue: List[HeroMessage] = []
-        self.message_history: List[HeroMessage] = []
-        self.conversations: Dict[str, List[HeroMessage]] = defaultdict(list)  # conversation_id -> messages
+        self.history_size = history_size
+        self.inbox_size = inbox_size
+        self.message_queue: deque = deque(maxlen=history_size)
+        self.message_history: deque = deque(maxlen=history_size)
+        self.conversations: Dict[str, deque] = defaultdict(lambda: deque(maxlen=inbox_size))  # conversation_id -> messages
         self.logger = logging.getLogger("SupermanCommunicationHub")
+
+        # Indexes: (sequence, message) so a hero's inbox and broadcasts merge in routing order
+        self._sequence = itertools.count()
+        self._inboxes: Dict[str, deque] = defaultdict(lambda: deque(maxlen=inbox_size))
+        self._broadcasts: deque = deque(maxlen=inbox_size)
+        self._pending_requests: Dict[str, deque] = defaultdict(lambda: deque(maxlen=inbox_size))
+
+        # Running counters - stats never scan the history
+        self._total_messages = 0
+        self._type_counts: Counter = Counter()
+        self._sender_counts: Counter = Counter()
+
+        self._lock = threading.RLock()
+        self._delivery_done = threading.Condition(self._lock)
+
+        # Delivery: one mailbox per hero, drained by at most one worker at a time
+        self.max_pending = max_pending
+        self.backpressure_timeout = backpressure_timeout
+        self._mailboxes: Dict[str, deque] = defaultdict(deque)
+        self._draining: set = set()
+        self._pending_deliveries = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._delivery_errors = 0
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._worker = threading.local()
+        self._executor = (ThreadPoolExecutor(max_workers=delivery_workers, thread_name_prefix="hero-delivery")
+                          if delivery_workers > 0 else None)
+
+        self.spill_path = Path(spill_dir) / SPILL_FILE_NAME if spill_dir else None
+        self._spill_file = None
+        self._spilled = 0
+
         self.logger.info("🦸 Communication Hub initialized")
 
     def register_hero(self, hero_name: str, hero_instance: Any):
@@ -59,31 +134,167 @@ class HeroCommunicationHub:
         """
         Route a message to the appropriate hero(es).
 
+        With delivery workers the message is queued and this returns before the
+        recipients' receive_message runs (see flush()).
+
         Args:
             message: Message to route
         """
-        self.message_queue.append(message)
-        self.message_history.append(message)
-
-        # Track conversation
-        conversation_id = f"{message.from_hero}_{message.to_hero}"
-        self.conversations[conversation_id].append(message)
+        with self._lock:
+            self._record(message)
 
         self.logger.info(f"📨 Routing {message.message_type} from {message.from_hero} to {message.to_hero}")
 
         # Broadcast to all heroes
         if message.to_hero == "ALL_HEROES":
-            for hero_name, hero_instance in self.heroes.items():
-                if hero_name != message.from_hero:
-                    hero_instance.receive_message(message)
-                    self.logger.info(f"  → Delivered to {hero_name}")
+            recipients = [name for name in self.heroes if name != message.from_hero]
         # Send to specific hero
         elif message.to_hero in self.heroes:
-            hero_instance = self.heroes[message.to_hero]
-            hero_instance.receive_message(message)
-            self.logger.info(f"  → Delivered to {message.to_hero}")
+            recipients = [message.to_hero]
         else:
             self.logger.warning(f"⚠️  Hero '{message.to_hero}' not registered")
+            return
+
+        for hero_name in recipients:
+            self._enqueue(hero_name, message)
+
+    def _record(self, message: HeroMessage):
+        """Add a message to the bounded history and indexes (caller holds the lock)"""
+        entry = (next(self._sequence), message)
+
+        if self.spill_path and len(self.message_history) == self.history_size:
+            self._spill(self.message_history[0])
+        self.message_queue.append(message)
+        self.message_history.append(message)
+
+        # Track conversation
+        conversation_id = f"{message.from_hero}_{message.to_hero}"
+        self.conversations[conversation_id].append(message)
+
+        if message.to_hero == "ALL_HEROES":
+            self._broadcasts.append(entry)
+        else:
+            self._inboxes[message.from_hero].append(entry)
+            if message.to_hero != message.from_hero:
+                self._inboxes[message.to_hero].append(entry)
+            if message.message_type == "request_help":
+                self._pending_requests[message.to_hero].append(message)
+
+        self._total_messages += 1
+        self._type_counts[message.message_type] += 1
+        self._sender_counts[message.from_hero] += 1
+
+    def _spill(self, message: HeroMessage):
+        """Append a message about to leave the history to the spill file"""
+        try:
+            if self._spill_file is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_file = open(self.spill_path, 'a', encoding='utf-8')
+            self._spill_file.write(json.dumps(message.to_dict(), default=str) + '\n')
+            self._spilled += 1
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"⚠️  Could not spill message {message.message_id}: {e}")
+
+    def _enqueue(self, hero_name: str, message: HeroMessage):
+        """Hand a message to a hero's mailbox, blocking while the hub is at capacity"""
+        queued_at = time.perf_counter()
+        if self._executor is None:
+            self._deliver(hero_name, message, queued_at)
+            return
+
+        with self._lock:
+            # Heroes routing from inside receive_message never wait on their own workers
+            if not getattr(self._worker, 'active', False):
+                deadline = (None if self.backpressure_timeout is None
+                            else queued_at + self.backpressure_timeout)
+                while self._pending_deliveries >= self.max_pending:
+                    remaining = None if deadline is None else deadline - time.perf_counter()
+                    if remaining is not None and remaining <= 0:
+                        self._dropped += 1
+                        self.logger.warning(f"⚠️  Delivery queue full - dropped {message.message_type} "
+                                            f"for {hero_name}")
+                        return
+                    self._delivery_done.wait(remaining)
+
+            self._pending_deliveries += 1
+            self._mailboxes[hero_name].append((message, queued_at))
+            if hero_name not in self._draining:
+                self._draining.add(hero_name)
+                self._executor.submit(self._drain, hero_name)
+
+    def _drain(self, hero_name: str):
+        """Deliver a hero's queued messages in order (runs on a delivery worker)"""
+        self._worker.active = True
+        try:
+            for _ in range(DELIVERY_BATCH):
+                with self._lock:
+                    mailbox = self._mailboxes[hero_name]
+                    if not mailbox:
+                        self._draining.discard(hero_name)
+                        return
+                    message, queued_at = mailbox.popleft()
+                self._deliver(hero_name, message, queued_at)
+                with self._lock:
+                    self._pending_deliveries -= 1
+                    self._delivery_done.notify_all()
+            # Yield the worker; the hero stays marked as draining so order is kept
+            self._executor.submit(self._drain, hero_name)
+        finally:
+            self._worker.active = False
+
+    def _deliver(self, hero_name: str, message: HeroMessage, queued_at: float):
+        hero_instance = self.heroes.get(hero_name)
+        try:
+            hero_instance.receive_message(message)
+            self.logger.info(f"  → Delivered to {hero_name}")
+        except Exception as e:
+            with self._lock:
+                self._delivery_errors += 1
+            self.logger.error(f"❌ Delivery of {message.message_type} to {hero_name} failed: {e}")
+        with self._lock:
+            self._delivered += 1
+            self._latencies.append(time.perf_counter() - queued_at)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message has been delivered.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the delivery queue drained
+        """
+        with self._lock:
+            drained = self._delivery_done.wait_for(lambda: self._pending_deliveries == 0, timeout)
+            if self._spill_file is not None:
+                self._spill_file.flush()
+        return drained
+
+    def close(self):
+        """Deliver queued messages, stop the delivery workers and close the spill file."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def iter_spilled(self) -> Iterator[Dict[str, Any]]:
+        """Messages spilled from the history, oldest first (as to_dict() dicts)."""
+        if not self.spill_path or not self.spill_path.exists():
+            return
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.flush()
+        with open(self.spill_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
 
     def broadcast(self, from_hero: str, message_type: str, content: Dict[str, Any]):
         """
@@ -136,10 +347,9 @@ class HeroCommunicationHub:
         Returns:
             List of messages
         """
-        relevant_messages = [
-            msg for msg in self.message_history
-            if msg.from_hero == hero_name or msg.to_hero == hero_name or msg.to_hero == "ALL_HEROES"
-        ]
+        with self._lock:
+            relevant_messages = [message for _, message in heapq.merge(
+                list(self._inboxes.get(hero_name, ())), list(self._broadcasts), key=lambda entry: entry[0])]
 
         return [m.to_dict() for m in relevant_messages]
 
@@ -153,16 +363,16 @@ class HeroCommunicationHub:
         Returns:
             List of pending help requests
         """
-        pending = [
-            msg for msg in self.message_queue
-            if msg.to_hero == hero_name and msg.message_type == "request_help"
-        ]
+        with self._lock:
+            pending = list(self._pending_requests.get(hero_name, ()))
 
         return [m.to_dict() for m in pending]
 
     def clear_queue(self):
         """Clear processed messages from queue."""
-        self.message_queue.clear()
+        with self._lock:
+            self.message_queue.clear()
+            self._pending_requests.clear()
         self.logger.info("🧹 Message queue cleared")
 
     # ===========================================
@@ -477,15 +687,28 @@ class HeroCommunicationHub:
         Returns:
             Stats dict
         """
-        stats = {
-            "registered_heroes": len(self.heroes),
-            "total_messages": len(self.message_history),
-            "pending_messages": len(self.message_queue),
-            "active_conversations": len(self.conversations),
-            "heroes": list(self.heroes.keys()),
-            "message_types": self._count_message_types(),
-            "most_active_heroes": self._get_most_active_heroes()
-        }
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "registered_heroes": len(self.heroes),
+                "total_messages": self._total_messages,
+                "retained_messages": len(self.message_history),
+                "pending_messages": len(self.message_queue),
+                "active_conversations": len(self.conversations),
+                "heroes": list(self.heroes.keys()),
+                "message_types": self._count_message_types(),
+                "most_active_heroes": self._get_most_active_heroes(),
+                "delivery": {
+                    "queue_depth": self._pending_deliveries,
+                    "delivered": self._delivered,
+                    "dropped": self._dropped,
+                    "errors": self._delivery_errors,
+                    "avg_latency_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+                    "p95_latency_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 3) if latencies else 0.0,
+                    "max_latency_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0
+                },
+                "spilled_messages": self._spilled
+            }
 
         # Add debate stats if debates exist
         if hasattr(self, 'active_debates'):
@@ -497,19 +720,11 @@ class HeroCommunicationHub:
 
     def _count_message_types(self) -> Dict[str, int]:
         """Count messages by type."""
-        counts = defaultdict(int)
-        for msg in self.message_history:
-            counts[msg.message_type] += 1
-        return dict(counts)
+        return dict(self._type_counts)
 
     def _get_most_active_heroes(self) -> List[Dict[str, Any]]:
         """Get most active heroes by message count."""
-        activity = defaultdict(int)
-        for msg in self.message_history:
-            activity[msg.from_hero] += 1
-
-        sorted_activity = sorted(activity.items(), key=lambda x: x[1], reverse=True)
-        return [{"hero": hero, "message_count": count} for hero, count in sorted_activity[:5]]
+        return [{"hero": hero, "message_count": count} for hero, count in self._sender_counts.most_common(5)]
 
     def generate_communication_report(self) -> str:
         """
@@ -526,6 +741,8 @@ class HeroCommunicationHub:
         report.append(f"Registered Heroes: {stats['registered_heroes']}")
         report.append(f"Total Messages: {stats['total_messages']}")
         report.append(f"Pending Messages: {stats['pending_messages']}")
+        report.append(f"Delivery Queue Depth: {stats['delivery']['queue_depth']} "
+                      f"(p95 latency {stats['delivery']['p95_latency_ms']}ms)")
         report.append(f"Active Conversations: {stats['active_conversations']}")
 
         report.append("\n📊 Message Types:")
@@ -573,6 +790,7 @@ if __name__ == "__main__":
     flash.verify_with_peer({"test": "performance", "score": 95}, "Batman")
 
     # Get stats
+    hub.flush()
     print(hub.generate_communication_report())
 
     # Get conversation between Batman and Wonder Woman
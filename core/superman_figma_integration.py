@@ -23,6 +23,11 @@ import json
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    from .justice_league.figma_client import FigmaClient, get_figma_client
+except ImportError:
+    from justice_league.figma_client import FigmaClient, get_figma_client
+
 
 class SupermanFigmaIntegration:
     """
@@ -42,6 +47,20 @@ class SupermanFigmaIntegration:
             "X-Figma-Token": figma_token,
             "Content-Type": "application/json"
         }
+        self._client: Optional[FigmaClient] = None
+
+    @property
+    def client(self) -> FigmaClient:
+        """
+        Client shared with the other heroes (pooled session, version-keyed
+        cache, global rate limit), created on the first API call
+
+        Raises:
+            ValueError: If no token is given or set in the environment
+        """
+        if self._client is None:
+            self._client = get_figma_client(self.figma_token)
+        return self._client
 
     def extract_file_key(self, figma_url: str) -> str:
         """
@@ -81,14 +100,9 @@ class SupermanFigmaIntegration:
         Returns:
             Complete file data including nodes, components, styles
         """
-        url = f"{self.base_url}/files/{file_key}"
-        params = {"depth": depth}
-
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self.client.get_file(file_key, depth=depth)
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {
                 "error": str(e),
                 "file_key": file_key,
@@ -106,14 +120,9 @@ class SupermanFigmaIntegration:
         Returns:
             Node data for specified nodes
         """
-        url = f"{self.base_url}/files/{file_key}/nodes"
-        params = {"ids": ",".join(node_ids)}
-
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self.client.get_nodes(file_key, node_ids)
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {
                 "error": str(e),
                 "file_key": file_key,
@@ -135,18 +144,10 @@ class SupermanFigmaIntegration:
         Returns:
             URLs to rendered images
         """
-        url = f"{self.base_url}/images/{file_key}"
-        params = {
-            "ids": ",".join(node_ids),
-            "scale": scale,
-            "format": format
-        }
-
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            params = {"ids": ",".join(node_ids), "scale": scale, "format": format}
+            return self.client.request_json(f"/images/{file_key}", params)
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {
                 "error": str(e),
                 "file_key": file_key,
@@ -16,13 +16,21 @@ Created: October 21, 2025
 Status: Production Ready
 """
 
+import atexit
 import json
 import logging
+import os
+import threading
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 
+try:
+    from .justice_league.knowledge_index import BM25Index, document_terms, tokenize
+except ImportError:
+    from justice_league.knowledge_index import BM25Index, document_terms, tokenize
+
 
 class KnowledgeEntry:
     """Represents a single piece of knowledge."""
@@ -71,30 +79,62 @@ class JusticeLeagueKnowledgeBase:
 
     Stores and retrieves knowledge from all hero missions,
     enabling collective learning and continuous improvement.
+
+    Storage:
+    - justice_league_knowledge.json: compacted snapshot (legacy format)
+    - justice_league_knowledge.json.journal: append-only JSON-lines log of
+      changes since the snapshot ({"op": "add" | "access" | "useful", ...})
+
+    Search goes through a BM25 inverted index over content and tags.
+    Access counts from searches are batched in memory and journaled by a
+    background flusher; the journal is folded into the snapshot once it
+    passes compact_threshold operations and at exit.
     """
 
-    def __init__(self, storage_dir: Optional[str] = None):
+    def __init__(self, storage_dir: Optional[str] = None,
+                 compact_threshold: int = 500, flush_interval: float = 5.0):
         """
         Initialize knowledge base.
 
         Args:
             storage_dir: Directory to store knowledge
+            compact_threshold: Journal operations before the snapshot is rewritten
+            flush_interval: Seconds between background flushes of access
+                counts (0 flushes after every search)
         """
         self.storage_dir = Path(storage_dir or '/tmp/aldo-vision-knowledge-base')
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.knowledge_file = self.storage_dir / "justice_league_knowledge.json"
+        self.journal_file = self.storage_dir / "justice_league_knowledge.json.journal"
         self.knowledge: List[KnowledgeEntry] = []
 
         # Indices for fast lookup
         self.by_hero: Dict[str, List[KnowledgeEntry]] = defaultdict(list)
         self.by_type: Dict[str, List[KnowledgeEntry]] = defaultdict(list)
         self.by_tag: Dict[str, List[KnowledgeEntry]] = defaultdict(list)
+        self.by_id: Dict[str, KnowledgeEntry] = {}
+        # Full-text index; document ids are positions in self.knowledge
+        self.index = BM25Index()
+        # id(entry) -> document id; entry_ids are not guaranteed unique
+        self._doc_ids: Dict[int, int] = {}
+
+        self.compact_threshold = compact_threshold
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending_access: Dict[str, KnowledgeEntry] = {}
+        self._journal_ops = 0
+        # Journal bytes already applied - lines past it were written by another instance
+        self._journal_offset = 0
+        self._snapshot_stat: Optional[tuple] = None
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
 
         self.logger = logging.getLogger("SupermanKnowledgeBase")
 
         # Load existing knowledge
         self._load()
+        atexit.register(self.close)
         self.logger.info(f"🦸 Knowledge Base initialized with {len(self.knowledge)} entries")
 
     def add_knowledge(self, hero: str, knowledge_type: str, content: Dict[str, Any],
@@ -121,16 +161,11 @@ class JusticeLeagueKnowledgeBase:
             )
         """
         entry = KnowledgeEntry(hero, knowledge_type, content, tags)
-        self.knowledge.append(entry)
-
-        # Update indices
-        self.by_hero[hero].append(entry)
-        self.by_type[knowledge_type].append(entry)
-        for tag in entry.tags:
-            self.by_tag[tag].append(entry)
-
-        # Save to disk
-        self._save()
+        with self._lock:
+            self._sync()
+            self._index_entry(entry)
+            # Append to the journal instead of rewriting the knowledge file
+            self._journal([{"op": "add", "entry": entry.to_dict()}])
 
         self.logger.info(f"📚 Added {knowledge_type} from {hero} (ID: {entry.entry_id})")
 
@@ -141,6 +176,10 @@ class JusticeLeagueKnowledgeBase:
         """
         Search knowledge base.
 
+        Matches are ranked by usefulness score first, then BM25 relevance
+        (reported as 'relevance'), then access count. An empty query
+        matches every entry that passes the filters.
+
         Args:
             query: Search query
             requesting_hero: Hero making the request
@@ -151,39 +190,39 @@ class JusticeLeagueKnowledgeBase:
         Returns:
             List of relevant knowledge entries
         """
-        results = []
-
-        # Filter by type if specified
-        if knowledge_type:
-            candidates = self.by_type.get(knowledge_type, [])
-        else:
-            candidates = self.knowledge
-
-        # Filter by tags if specified
-        if tags:
-            tagged_entries = set()
-            for tag in tags:
-                tagged_entries.update(self.by_tag.get(tag, []))
-            candidates = [e for e in candidates if e in tagged_entries]
-
-        # Search in content
-        query_lower = query.lower()
-        for entry in candidates:
-            content_str = json.dumps(entry.content).lower()
-            if query_lower in content_str or query_lower in " ".join(entry.tags):
-                # Increment access counter
+        with self._lock:
+            self._sync()
+            # Type and tag filters narrow the documents BM25 scores
+            candidates = None
+            if knowledge_type:
+                candidates = {self._doc_ids[id(e)] for e in self.by_type.get(knowledge_type, [])}
+            if tags:
+                tagged = {self._doc_ids[id(e)] for tag in tags for e in self.by_tag.get(tag, [])}
+                candidates = tagged if candidates is None else candidates & tagged
+
+            if tokenize(query):
+                scores = self.index.search(query, candidates)
+            else:
+                doc_ids = sorted(candidates) if candidates is not None else range(len(self.knowledge))
+                scores = dict.fromkeys(doc_ids, 0.0)
+            matches = [(self.knowledge[doc_id], score) for doc_id, score in scores.items()]
+
+            # Sort by usefulness score, relevance and recent access
+            matches.sort(key=lambda m: (m[0].usefulness_score, m[1], m[0].times_accessed), reverse=True)
+            matches = matches[:limit]
+
+            # Increment access counters of the returned entries - persisted in batches
+            for entry, _ in matches:
                 entry.times_accessed += 1
-                results.append(entry.to_dict())
+                self._pending_access[entry.entry_id] = entry
+            results = [dict(entry.to_dict(), relevance=round(score, 4)) for entry, score in matches]
 
-        # Sort by usefulness score and recent access
-        results.sort(key=lambda x: (x['usefulness_score'], x['times_accessed']), reverse=True)
+        self.logger.info(f"🔍 Search '{query}' returned {len(results)} results (requested by {requesting_hero})")
 
-        self.logger.info(f"🔍 Search '{query}' returned {len(results[:limit])} results (requested by {requesting_hero})")
+        if matches:
+            self._schedule_flush()
 
-        # Save updated access counts
-        self._save()
-
-        return results[:limit]
+        return results
 
     def mark_useful(self, entry_id: str, usefulness_increase: int = 1):
         """
@@ -193,12 +232,14 @@ class JusticeLeagueKnowledgeBase:
             entry_id: Knowledge entry ID
             usefulness_increase: How much to increase score
         """
-        for entry in self.knowledge:
-            if entry.entry_id == entry_id:
-                entry.usefulness_score += usefulness_increase
-                self._save()
-                self.logger.info(f"⭐ Knowledge {entry_id} marked as useful (+{usefulness_increase})")
+        with self._lock:
+            self._sync()
+            entry = self.by_id.get(entry_id)
+            if entry is None:
                 return
+            entry.usefulness_score += usefulness_increase
+            self._journal([{"op": "useful", "entry_id": entry_id, "usefulness_score": entry.usefulness_score}])
+        self.logger.info(f"⭐ Knowledge {entry_id} marked as useful (+{usefulness_increase})")
 
     def get_by_hero(self, hero: str) -> List[Dict[str, Any]]:
         """Get all knowledge contributed by a hero."""
@@ -263,27 +304,165 @@ class JusticeLeagueKnowledgeBase:
 
         return "\n".join(report)
 
+    def flush(self):
+        """Journal access counts batched since the last flush."""
+        with self._lock:
+            if not self._pending_access:
+                return
+            self._sync()
+            counts = {entry_id: entry.times_accessed for entry_id, entry in self._pending_access.items()}
+            self._pending_access.clear()
+            self._journal([{"op": "access", "counts": counts}])
+
+    def close(self):
+        """Stop the background flusher and fold the journal into the snapshot."""
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=self.flush_interval + 1)
+        if not self.storage_dir.exists():
+            # Storage removed (temporary directory) - nothing to persist to
+            return
+        try:
+            with self._lock:
+                self._sync()
+                if self._journal_ops or self._pending_access:
+                    self._save()
+        except Exception as e:
+            self.logger.warning(f"Knowledge base compaction failed: {e}")
+
+    def _schedule_flush(self):
+        if self.flush_interval <= 0:
+            self.flush()
+            return
+        with self._lock:
+            if self._flusher is None and not self._stop.is_set():
+                self._flusher = threading.Thread(target=self._flush_loop, name="KnowledgeBaseFlusher",
+                                                 daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.warning(f"Knowledge base flush failed: {e}")
+
+    def _index_entry(self, entry: KnowledgeEntry):
+        doc_id = len(self.knowledge)
+        self.index.add(doc_id, document_terms(entry.content, entry.tags))
+        self._doc_ids[id(entry)] = doc_id
+        self.knowledge.append(entry)
+
+        # Update indices
+        self.by_hero[entry.hero].append(entry)
+        self.by_type[entry.knowledge_type].append(entry)
+        for tag in entry.tags:
+            self.by_tag[tag].append(entry)
+        self.by_id[entry.entry_id] = entry
+
+    def _journal(self, ops: List[Dict[str, Any]]):
+        """Append operations to the journal; compact once it is long enough."""
+        with open(self.journal_file, 'ab') as f:
+            f.write("".join(json.dumps(op) + "\n" for op in ops).encode('utf-8'))
+            self._journal_offset = f.tell()
+        self._journal_ops += len(ops)
+        if self._journal_ops >= self.compact_threshold:
+            self._save()
+
+    def _apply(self, op: Dict[str, Any]):
+        if op["op"] == "add":
+            self._index_entry(KnowledgeEntry.from_dict(op["entry"]))
+        elif op["op"] == "access":
+            for entry_id, count in op["counts"].items():
+                if entry_id in self.by_id:
+                    self.by_id[entry_id].times_accessed = count
+        elif op["op"] == "useful":
+            if op["entry_id"] in self.by_id:
+                self.by_id[op["entry_id"]].usefulness_score = op["usefulness_score"]
+
+    def _sync(self):
+        """Pick up changes another instance made to the same storage directory."""
+        if self._stat(self.knowledge_file) != self._snapshot_stat:
+            # Snapshot was compacted elsewhere: reload, keeping unflushed access counts
+            pending = {entry_id: entry.times_accessed for entry_id, entry in self._pending_access.items()}
+            self._load()
+            for entry_id, count in pending.items():
+                if entry_id in self.by_id:
+                    self.by_id[entry_id].times_accessed = max(count, self.by_id[entry_id].times_accessed)
+                    self._pending_access[entry_id] = self.by_id[entry_id]
+            return
+        try:
+            size = self.journal_file.stat().st_size
+        except FileNotFoundError:
+            return
+        if size > self._journal_offset:
+            self._replay_journal(self._journal_offset)
+
     def _save(self):
-        """Save knowledge to disk."""
+        """Save knowledge to disk (rewrite the snapshot and truncate the journal)."""
         data = [e.to_dict() for e in self.knowledge]
-        with open(self.knowledge_file, 'w') as f:
+        tmp_file = self.knowledge_file.with_name(self.knowledge_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_file, self.knowledge_file)
+        if self.journal_file.exists():
+            self.journal_file.unlink()
+        self._pending_access.clear()
+        self._journal_ops = 0
+        self._journal_offset = 0
+        self._snapshot_stat = self._stat(self.knowledge_file)
 
     def _load(self):
-        """Load knowledge from disk."""
+        """Load knowledge from disk (snapshot, then journal replay)."""
+        self.knowledge = []
+        self.by_hero.clear()
+        self.by_type.clear()
+        self.by_tag.clear()
+        self.by_id = {}
+        self.index = BM25Index()
+        self._doc_ids = {}
+        self._pending_access = {}
+        self._journal_ops = 0
+        self._journal_offset = 0
+
+        self._snapshot_stat = self._stat(self.knowledge_file)
         if self.knowledge_file.exists():
             with open(self.knowledge_file, 'r') as f:
                 data = json.load(f)
 
             for entry_data in data:
-                entry = KnowledgeEntry.from_dict(entry_data)
-                self.knowledge.append(entry)
-
                 # Rebuild indices
-                self.by_hero[entry.hero].append(entry)
-                self.by_type[entry.knowledge_type].append(entry)
-                for tag in entry.tags:
-                    self.by_tag[tag].append(entry)
+                self._index_entry(KnowledgeEntry.from_dict(entry_data))
+
+        if self.journal_file.exists():
+            self._replay_journal(0)
+
+    def _replay_journal(self, offset: int):
+        with open(self.journal_file, 'rb') as f:
+            f.seek(offset)
+            while True:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    # End of file, or a torn final write still in progress
+                    break
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(f"Ignoring corrupt journal entry in {self.journal_file.name}")
+                    offset = f.tell()
+                    continue
+                self._apply(op)
+                self._journal_ops += 1
+                offset = f.tell()
+        self._journal_offset = offset
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[tuple]:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
 
 # Example usage
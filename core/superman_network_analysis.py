@@ -19,14 +19,29 @@ MCP Tools Used:
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
-from collections import defaultdict
 import json
 from pathlib import Path
 
+import numpy as np
+
+# Shared request log (one collection for Aquaman and Superman)
+try:
+    from .justice_league.network_request_store import (
+        NetworkRequestStore, get_request_store, group_codes
+    )
+    from .justice_league.network_critical_path import RequestGraph, render_blocking_mask
+except ImportError:
+    from justice_league.network_request_store import (
+        NetworkRequestStore, get_request_store, group_codes
+    )
+    from justice_league.network_critical_path import RequestGraph, render_blocking_mask
+
 logger = logging.getLogger(__name__)
 
+RequestLog = Union[NetworkRequestStore, List[Dict]]
+
 
 class SupermanNetworkAnalysis:
     """
@@ -107,14 +122,13 @@ class SupermanNetworkAnalysis:
         try:
             # Step 1: List all network requests
             logger.info(f"🦸 Step 1: Collecting all network requests...")
-            list_func = mcp_tools.get('list_network_requests')
-            get_func = mcp_tools.get('get_network_request')
+            # Collected once per mcp_tools and shared with Aquaman
+            store = get_request_store(mcp_tools)
 
-            if not list_func:
+            if store is None:
                 raise ValueError("list_network_requests MCP tool required")
 
-            # Get all requests
-            all_requests = self._collect_all_requests(list_func)
+            all_requests = store.requests
             logger.info(f"  ✓ Collected {len(all_requests)} network requests")
 
             results['total_requests'] = len(all_requests)
@@ -128,7 +142,7 @@ class SupermanNetworkAnalysis:
 
             # Step 3: Detect critical rendering path
             logger.info(f"🦸 Step 3: Detecting critical rendering path...")
-            critical_path = self._detect_critical_path_advanced(all_requests)
+            critical_path = self._detect_critical_path_advanced(store)
             results['critical_path'] = critical_path
             logger.info(f"  ✓ Found {critical_path['critical_resource_count']} critical resources")
 
@@ -140,20 +154,20 @@ class SupermanNetworkAnalysis:
 
             # Step 5: Analyze request/response timing phases
             logger.info(f"🦸 Step 5: Analyzing timing phases...")
-            timing_phases = self._analyze_timing_phases(all_requests)
+            timing_phases = self._analyze_timing_phases(store)
             results['timing_phases'] = timing_phases
             logger.info(f"  ✓ Analyzed {timing_phases['requests_analyzed']} request timings")
 
             # Step 6: Detect network bottlenecks
             logger.info(f"🦸 Step 6: Detecting network bottlenecks...")
-            bottlenecks = self._detect_network_bottlenecks(all_requests, timing_phases)
+            bottlenecks = self._detect_network_bottlenecks(store, timing_phases)
             results['bottlenecks'] = bottlenecks
             logger.info(f"  ✓ Found {len(bottlenecks['bottlenecks'])} bottlenecks")
 
             # Step 7: Check performance budget
             logger.info(f"🦸 Step 7: Checking performance budget...")
             budget_check = self._check_performance_budget(
-                all_requests,
+                store,
                 performance_budget or self._get_default_budget()
             )
             results['performance_budget'] = budget_check
@@ -161,7 +175,7 @@ class SupermanNetworkAnalysis:
 
             # Step 8: Analyze CDN effectiveness
             logger.info(f"🦸 Step 8: Analyzing CDN effectiveness...")
-            cdn_analysis = self._analyze_cdn_effectiveness(all_requests)
+            cdn_analysis = self._analyze_cdn_effectiveness(store)
             results['cdn_analysis'] = cdn_analysis
             logger.info(f"  ✓ CDN usage: {cdn_analysis['cdn_usage_percent']:.1f}%")
 
@@ -203,31 +217,7 @@ class SupermanNetworkAnalysis:
         Returns:
             List of all network requests
         """
-        all_requests = []
-        page_idx = 0
-        page_size = 100
-
-        while True:
-            try:
-                response = list_func(pageIdx=page_idx, pageSize=page_size)
-                requests = response.get('requests', [])
-
-                if not requests:
-                    break
-
-                all_requests.extend(requests)
-
-                # Check if more pages
-                if len(requests) < page_size:
-                    break
-
-                page_idx += 1
-
-            except Exception as e:
-                logger.warning(f"Error paginating requests: {e}")
-                break
-
-        return all_requests
+        return NetworkRequestStore.collect_pages(list_func, page_size=100)
 
     def _generate_waterfall_data(self, requests: List[Dict]) -> Dict[str, Any]:
         """
@@ -328,78 +318,95 @@ class SupermanNetworkAnalysis:
             }
         }
 
-    def _detect_critical_path_advanced(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _detect_critical_path_advanced(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🦸 Detect critical rendering path with advanced timing analysis
 
-        Critical path = resources that block initial render
+        Critical path = resources that block initial render. Its length is
+        the longest initiator chain ending at the last render-blocking
+        request (overlapping requests are not double counted); savings are
+        simulated by preloading, deferring and inlining chain resources.
 
         Args:
-            requests: List of network requests
+            requests: List of network requests (or a NetworkRequestStore)
 
         Returns:
             Advanced critical path analysis
         """
-        critical_resources = []
-        critical_path_length = 0
-
-        for req in requests:
-            res_type = req.get('resourceType', '')
-            url = req.get('url', '')
-            timing = req.get('timing', {})
-            priority = req.get('priority', 'low')
-
-            is_critical = False
-            reason = []
-
-            # Document is always critical
-            if res_type == 'document':
-                is_critical = True
-                reason.append('Main HTML document')
-
-            # Blocking CSS is critical
-            elif res_type == 'stylesheet':
-                is_critical = True
-                reason.append('Render-blocking CSS')
-
-            # High priority scripts are critical
-            elif res_type == 'script' and priority in ['high', 'very-high']:
-                is_critical = True
-                reason.append('High priority JavaScript')
-
-            # Fonts can be critical
-            elif res_type == 'font':
-                is_critical = True
-                reason.append('Web font (may block text render)')
-
-            if is_critical:
-                # Calculate resource time
-                resource_time = (
-                    timing.get('dns', 0) + timing.get('connect', 0) +
-                    timing.get('ssl', 0) + timing.get('send', 0) +
-                    timing.get('wait', 0) + timing.get('receive', 0)
-                )
-
-                critical_resources.append({
-                    'url': url,
-                    'type': res_type,
-                    'priority': priority,
-                    'size': req.get('size', 0),
-                    'time_ms': resource_time,
-                    'reasons': reason,
-                    'superman_analysis': ', '.join(reason)
-                })
+        store = NetworkRequestStore.coerce(requests)
+        graph = RequestGraph(store)
+        blocking = render_blocking_mask(store)
+        analysis = graph.analyze(blocking)
+
+        urls = store.column('url', '').tolist()
+        types = store.column('resourceType', '').tolist()
+        priorities = store.column('priority', 'low').tolist()
+        sizes = store.column('size', 0).tolist()
+        durations = store.total_time().tolist()
+        start, end, slack = (analysis[key].tolist() for key in ('start_ms', 'end_ms', 'slack_ms'))
+        on_chain = set(analysis['chain'])
+
+        reasons_by_type = {
+            'document': 'Main HTML document',
+            'stylesheet': 'Render-blocking CSS',
+            'script': 'High priority JavaScript',
+            'font': 'Web font (may block text render)'
+        }
 
-                critical_path_length += resource_time
+        critical_resources = []
+        for i in np.flatnonzero(blocking).tolist():
+            reason = [reasons_by_type[types[i]]]
+            critical_resources.append({
+                'url': urls[i],
+                'type': types[i],
+                'priority': priorities[i],
+                'size': sizes[i],
+                'time_ms': durations[i],
+                'start_ms': round(start[i], 1),
+                'end_ms': round(end[i], 1),
+                'slack_ms': round(slack[i], 1),
+                'on_critical_path': i in on_chain,
+                'reasons': reason,
+                'superman_analysis': ', '.join(reason)
+            })
 
         # Sort by time (slowest first)
         critical_resources.sort(key=lambda x: x['time_ms'], reverse=True)
 
+        critical_path_length = round(analysis['critical_path_length_ms'], 1)
+        savings = analysis['savings']
+
         return {
             'critical_resource_count': len(critical_resources),
             'critical_resources': critical_resources,
             'critical_path_length_ms': critical_path_length,
-            'optimization_potential_ms': critical_path_length * 0.3,  # Estimate 30% reduction
+            'render_time_ms': round(analysis['render_time_ms'], 1),
+            # What the old serial sum reported, for comparison
+            'serial_time_ms': sum(r['time_ms'] for r in critical_resources),
+            'critical_chain': [
+                {
+                    'url': urls[i],
+                    'type': types[i],
+                    'start_ms': round(start[i], 1),
+                    'end_ms': round(end[i], 1),
+                    'duration_ms': durations[i]
+                }
+                for i in analysis['chain']
+            ],
+            'optimization_potential_ms': round(savings['combined_savings_ms'], 1),
+            'savings_simulation': {
+                **{
+                    action: {
+                        'savings_ms': round(savings[action]['savings_ms'], 1),
+                        'resources': [
+                            {'url': urls[i], 'type': types[i], 'savings_ms': round(saved, 1)}
+                            for i, saved in savings[action]['per_resource_ms'].items()
+                        ]
+                    }
+                    for action in ('preload', 'defer', 'inline')
+                },
+                'combined_savings_ms': round(savings['combined_savings_ms'], 1)
+            },
             'superman_verdict': (
                 '🦸 Critical path is lean!' if critical_path_length < 2000
                 else '🦸 Critical path needs optimization' if critical_path_length < 4000
@@ -499,7 +506,7 @@ class SupermanNetworkAnalysis:
             )
         }
 
-    def _analyze_timing_phases(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _analyze_timing_phases(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🦸 Analyze request/response timing phases in detail
 
@@ -517,52 +524,29 @@ class SupermanNetworkAnalysis:
         Returns:
             Detailed timing phase analysis
         """
-        phase_totals = {
-            'dns': 0,
-            'connect': 0,
-            'ssl': 0,
-            'send': 0,
-            'wait': 0,
-            'receive': 0
-        }
-
-        phase_counts = {
-            'dns': 0,
-            'connect': 0,
-            'ssl': 0,
-            'send': 0,
-            'wait': 0,
-            'receive': 0
-        }
-
-        slowest_by_phase = {
-            'dns': None,
-            'connect': None,
-            'ssl': None,
-            'send': None,
-            'wait': None,
-            'receive': None
-        }
-
-        for req in requests:
-            timing = req.get('timing', {})
-            url = req.get('url', '')
-
-            for phase in phase_totals.keys():
-                phase_time = timing.get(phase, 0)
-
-                if phase_time > 0:
-                    phase_totals[phase] += phase_time
-                    phase_counts[phase] += 1
-
-                    # Track slowest
-                    if (slowest_by_phase[phase] is None or
-                        phase_time > slowest_by_phase[phase]['time']):
-                        slowest_by_phase[phase] = {
-                            'url': url,
-                            'time': phase_time,
-                            'resourceType': req.get('resourceType', 'unknown')
-                        }
+        store = NetworkRequestStore.coerce(requests)
+        urls = store.column('url', '')
+        types = store.column('resourceType', 'unknown')
+
+        phase_totals = {}
+        phase_counts = {}
+        slowest_by_phase = {}
+
+        for phase in ('dns', 'connect', 'ssl', 'send', 'wait', 'receive'):
+            phase_times = store.phase(phase)
+            timed = np.flatnonzero(phase_times > 0)
+            phase_totals[phase] = phase_times[timed].sum().item() if len(timed) else 0
+            phase_counts[phase] = len(timed)
+
+            # Slowest (first one on ties)
+            slowest_by_phase[phase] = None
+            if len(timed):
+                slowest = timed[np.argmax(phase_times[timed])]
+                slowest_by_phase[phase] = {
+                    'url': urls[slowest],
+                    'time': phase_times[slowest].item(),
+                    'resourceType': types[slowest]
+                }
 
         # Calculate averages
         phase_averages = {
@@ -572,7 +556,7 @@ class SupermanNetworkAnalysis:
         }
 
         return {
-            'requests_analyzed': len(requests),
+            'requests_analyzed': len(store),
             'phase_totals_ms': phase_totals,
             'phase_averages_ms': phase_averages,
             'phase_counts': phase_counts,
@@ -601,7 +585,7 @@ class SupermanNetworkAnalysis:
 
     def _detect_network_bottlenecks(
         self,
-        requests: List[Dict],
+        requests: RequestLog,
         timing_phases: Dict
     ) -> Dict[str, Any]:
         """
@@ -660,35 +644,33 @@ class SupermanNetworkAnalysis:
                 'fix': 'Optimize database queries, add server caching, use CDN'
             })
 
+        store = NetworkRequestStore.coerce(requests)
+
         # Check for large downloads
-        large_resources = [
-            r for r in requests
-            if r.get('size', 0) > 1024 * 1024  # > 1MB
-        ]
+        sizes = store.column('size', 0)
+        large_sizes = sizes[sizes > 1024 * 1024]  # > 1MB
+        large_count = len(large_sizes)
 
-        if large_resources:
-            total_large_size = sum(r.get('size', 0) for r in large_resources)
+        if large_count:
+            total_large_size = sum(large_sizes.tolist())
             bottlenecks.append({
                 'type': 'large_resources',
-                'severity': 'high' if len(large_resources) > 5 else 'medium',
-                'value': len(large_resources),
-                'issue': f'{len(large_resources)} resources over 1MB ({total_large_size / 1024 / 1024:.1f}MB total)',
+                'severity': 'high' if large_count > 5 else 'medium',
+                'value': large_count,
+                'issue': f'{large_count} resources over 1MB ({total_large_size / 1024 / 1024:.1f}MB total)',
                 'superman_says': '🦸 Large files detected - compress or lazy load!',
                 'fix': 'Compress images, use lazy loading, split bundles'
             })
 
         # Check request count per domain
-        domain_counts = defaultdict(int)
-        for req in requests:
-            url = req.get('url', '')
-            # Extract domain
-            import re
-            match = re.search(r'https?://([^/]+)', url)
-            if match:
-                domain_counts[match.group(1)] += 1
+        domains = store.domains()
+        domain_names, codes = group_codes(domains[np.fromiter(
+            (domain is not None for domain in domains.tolist()), dtype=bool, count=len(domains)
+        )])
+        domain_counts = np.bincount(codes, minlength=len(domain_names))
 
         high_traffic_domains = {
-            domain: count for domain, count in domain_counts.items()
+            domain: count for domain, count in zip(domain_names, domain_counts.tolist())
             if count > 20
         }
 
@@ -716,7 +698,7 @@ class SupermanNetworkAnalysis:
 
     def _check_performance_budget(
         self,
-        requests: List[Dict],
+        requests: RequestLog,
         budget: Dict[str, int]
     ) -> Dict[str, Any]:
         """
@@ -729,22 +711,20 @@ class SupermanNetworkAnalysis:
         Returns:
             Budget compliance check
         """
+        store = NetworkRequestStore.coerce(requests)
+        sizes = store.column('size', 0)
+
+        def size_kb(mask=None):
+            selected = sizes if mask is None else sizes[mask]
+            return sum(selected.tolist()) / 1024
+
         # Calculate actual metrics
         actual = {
-            'total_requests': len(requests),
-            'total_size_kb': sum(r.get('size', 0) for r in requests) / 1024,
-            'scripts_kb': sum(
-                r.get('size', 0) for r in requests
-                if r.get('resourceType') == 'script'
-            ) / 1024,
-            'images_kb': sum(
-                r.get('size', 0) for r in requests
-                if r.get('resourceType') == 'image'
-            ) / 1024,
-            'css_kb': sum(
-                r.get('size', 0) for r in requests
-                if r.get('resourceType') == 'stylesheet'
-            ) / 1024
+            'total_requests': len(store),
+            'total_size_kb': size_kb(),
+            'scripts_kb': size_kb(store.type_is(['script'], None)),
+            'images_kb': size_kb(store.type_is(['image'], None)),
+            'css_kb': size_kb(store.type_is(['stylesheet'], None))
         }
 
         # Compare to budget
@@ -777,7 +757,7 @@ class SupermanNetworkAnalysis:
             )
         }
 
-    def _analyze_cdn_effectiveness(self, requests: List[Dict]) -> Dict[str, Any]:
+    def _analyze_cdn_effectiveness(self, requests: RequestLog) -> Dict[str, Any]:
         """
         🦸 Analyze CDN usage and effectiveness
 
@@ -792,28 +772,26 @@ class SupermanNetworkAnalysis:
             'cloudflare.com', 'jsdelivr.net', 'unpkg.com'
         ]
 
-        cdn_requests = []
-        cdn_size = 0
+        store = NetworkRequestStore.coerce(requests)
+        urls = store.column('url', '')
+        sizes = store.column('size', 0)
+        types = store.column('resourceType', 'unknown')
 
-        for req in requests:
-            url = req.get('url', '')
-
-            if any(pattern in url.lower() for pattern in cdn_patterns):
-                cdn_requests.append({
-                    'url': url,
-                    'size': req.get('size', 0),
-                    'type': req.get('resourceType', 'unknown')
-                })
-                cdn_size += req.get('size', 0)
-
-        total_size = sum(r.get('size', 0) for r in requests)
+        cdn_indices = np.flatnonzero(store.contains(urls, cdn_patterns, lower=True))
+        size_list = sizes.tolist()
+        cdn_requests = [
+            {'url': urls[i], 'size': size_list[i], 'type': types[i]}
+            for i in cdn_indices[:10].tolist()  # Top 10
+        ]
+        cdn_size = sum(sizes[cdn_indices].tolist())
+        total_size = sum(size_list)
         cdn_usage_percent = (cdn_size / total_size * 100) if total_size > 0 else 0
 
         return {
-            'cdn_request_count': len(cdn_requests),
+            'cdn_request_count': len(cdn_indices),
             'cdn_size_kb': cdn_size / 1024,
             'cdn_usage_percent': round(cdn_usage_percent, 1),
-            'cdn_requests': cdn_requests[:10],  # Top 10
+            'cdn_requests': cdn_requests,
             'superman_assessment': (
                 '🦸 Excellent CDN usage!' if cdn_usage_percent > 70
                 else '🦸 Good CDN usage' if cdn_usage_percent > 40
@@ -963,7 +941,8 @@ class SupermanNetworkAnalysis:
                     'Preload critical resources',
                     'Reduce critical resource count',
                     'Use resource hints (preconnect, dns-prefetch)'
-                ]
+                ],
+                'estimated_savings_ms': results.get('critical_path', {}).get('optimization_potential_ms', 0)
             })
 
         # Blocking resource recommendations
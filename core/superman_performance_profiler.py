@@ -23,6 +23,7 @@ MCP Tools Used:
 Libraries:
 - Built on top of Flash Performance hero
 - JSON for baseline storage
+- SQLite performance history (trend and regression queries)
 - Pathlib for file management
 """
 
@@ -32,6 +33,13 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    from .justice_league.trace_vitals import resolve_vitals
+    from .justice_league.performance_history import PerformanceHistory, DEFAULT_DB_NAME
+except ImportError:
+    from justice_league.trace_vitals import resolve_vitals
+    from justice_league.performance_history import PerformanceHistory, DEFAULT_DB_NAME
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,6 +69,13 @@ class SupermanPerformanceProfiler:
         self.history_dir = self.baseline_dir / 'history'
         self.history_dir.mkdir(exist_ok=True)
 
+        # Run history lives in one SQLite store; per-run JSON files from
+        # earlier versions are imported once
+        self.history = PerformanceHistory(self.baseline_dir / DEFAULT_DB_NAME)
+        legacy_history = list(self.history_dir.glob('*.json'))
+        if legacy_history:
+            self.history.migrate_json_files(legacy_history)
+
         self.reports_dir = self.baseline_dir / 'reports'
         self.reports_dir.mkdir(exist_ok=True)
 
@@ -152,6 +167,8 @@ class SupermanPerformanceProfiler:
             logger.info("🦸⚡ STEP 3: Extracting Core Web Vitals...")
             core_vitals = self._extract_core_web_vitals(trace_results)
             results['core_web_vitals'] = core_vitals
+            if trace_results.get('trace_vitals'):
+                results['trace_metrics'] = trace_results['trace_vitals']
 
             vitals_summary = self._summarize_core_vitals(core_vitals)
             results['vitals_summary'] = vitals_summary
@@ -264,12 +281,19 @@ class SupermanPerformanceProfiler:
             Extracted and analyzed Core Web Vitals
         """
         # Extract metrics from trace data structure
-        # Chrome DevTools provides these in various formats
+        # Chrome DevTools provides these in various formats; metrics it does
+        # not report are computed from the raw traceEvents, if present.
+        # Still missing: value None, status 'unknown', left out of the score
+        resolved = resolve_vitals(trace_data)
+
+        def metric_value(metric):
+            return resolved[metric][0]
 
         vitals = {
             'LCP': {
                 'name': 'Largest Contentful Paint',
-                'value': trace_data.get('lcp', trace_data.get('largestContentfulPaint', 0)),
+                'value': metric_value('lcp'),
+                'source': resolved['lcp'][1],
                 'unit': 'ms',
                 'threshold_good': 2500,
                 'threshold_needs_improvement': 4000,
@@ -277,7 +301,8 @@ class SupermanPerformanceProfiler:
             },
             'FID': {
                 'name': 'First Input Delay',
-                'value': trace_data.get('fid', trace_data.get('firstInputDelay', 0)),
+                'value': metric_value('fid'),
+                'source': resolved['fid'][1],
                 'unit': 'ms',
                 'threshold_good': 100,
                 'threshold_needs_improvement': 300,
@@ -285,7 +310,8 @@ class SupermanPerformanceProfiler:
             },
             'CLS': {
                 'name': 'Cumulative Layout Shift',
-                'value': trace_data.get('cls', trace_data.get('cumulativeLayoutShift', 0)),
+                'value': metric_value('cls'),
+                'source': resolved['cls'][1],
                 'unit': 'score',
                 'threshold_good': 0.1,
                 'threshold_needs_improvement': 0.25,
@@ -293,7 +319,8 @@ class SupermanPerformanceProfiler:
             },
             'FCP': {
                 'name': 'First Contentful Paint',
-                'value': trace_data.get('fcp', trace_data.get('firstContentfulPaint', 0)),
+                'value': metric_value('fcp'),
+                'source': resolved['fcp'][1],
                 'unit': 'ms',
                 'threshold_good': 1800,
                 'threshold_needs_improvement': 3000,
@@ -301,7 +328,8 @@ class SupermanPerformanceProfiler:
             },
             'TTI': {
                 'name': 'Time to Interactive',
-                'value': trace_data.get('tti', trace_data.get('timeToInteractive', 0)),
+                'value': metric_value('tti'),
+                'source': resolved['tti'][1],
                 'unit': 'ms',
                 'threshold_good': 3800,
                 'threshold_needs_improvement': 7300,
@@ -309,7 +337,8 @@ class SupermanPerformanceProfiler:
             },
             'TBT': {
                 'name': 'Total Blocking Time',
-                'value': trace_data.get('tbt', trace_data.get('totalBlockingTime', 0)),
+                'value': metric_value('tbt'),
+                'source': resolved['tbt'][1],
                 'unit': 'ms',
                 'threshold_good': 200,
                 'threshold_needs_improvement': 600,
@@ -324,6 +353,11 @@ class SupermanPerformanceProfiler:
             needs_improvement = metric_data['threshold_needs_improvement']
 
             # Determine status
+            if value is None:
+                metric_data['status'] = 'unknown'
+                metric_data['score'] = None
+                metric_data['passed'] = False
+                continue
             if metric_key == 'CLS':
                 # CLS is special - lower is better
                 if value <= good:
@@ -367,7 +401,7 @@ class SupermanPerformanceProfiler:
             Summary statistics
         """
         passed = sum(1 for v in core_vitals.values() if v.get('passed', False))
-        total = len(core_vitals)
+        total = sum(1 for v in core_vitals.values() if v.get('status') != 'unknown')
 
         good_count = sum(1 for v in core_vitals.values() if v.get('status') == 'good')
         needs_improvement = sum(1 for v in core_vitals.values() if v.get('status') == 'needs_improvement')
@@ -380,7 +414,7 @@ class SupermanPerformanceProfiler:
             'good': good_count,
             'needs_improvement': needs_improvement,
             'poor': poor_count,
-            'overall_status': 'good' if passed >= total * 0.75 else 'needs_improvement' if passed >= total * 0.5 else 'poor'
+            'overall_status': 'unknown' if total == 0 else 'good' if passed >= total * 0.75 else 'needs_improvement' if passed >= total * 0.5 else 'poor'
         }
 
     def _calculate_performance_score(self, results: Dict) -> Dict[str, Any]:
@@ -409,6 +443,8 @@ class SupermanPerformanceProfiler:
         total_weight = 0
 
         for metric_key, metric_data in core_vitals.items():
+            if metric_data.get('status') == 'unknown':
+                continue
             metric_score = metric_data.get('score', 0)
             weight = metric_data.get('weight', 0)
             vitals_score += metric_score * weight
@@ -477,13 +513,18 @@ class SupermanPerformanceProfiler:
         Returns:
             Regression analysis
         """
+        # Rolling median ± MAD of earlier runs, per metric
+        history_check = self.history.check_run(test_name, results, hero='superman')
+        history_regression = history_check.get('score', {}).get('is_regression', False)
+
         baseline_path = self.baseline_dir / f"{test_name}_baseline.json"
 
         if not baseline_path.exists():
             return {
-                'status': 'no_baseline',
+                'status': 'regression_detected' if history_regression else 'no_baseline',
                 'message': 'No baseline exists - this run will become the baseline',
-                'is_regression': False
+                'is_regression': history_regression,
+                'history_check': history_check
             }
 
         # Load baseline
@@ -504,8 +545,8 @@ class SupermanPerformanceProfiler:
 
         score_diff = current_score - baseline_score
 
-        # Regression threshold: 5 point drop
-        is_regression = score_diff < -5
+        # Regression threshold: 5 point drop, or a score outside the run history's spread
+        is_regression = score_diff < -5 or history_regression
 
         # Compare Core Web Vitals
         current_vitals = results.get('core_web_vitals', {})
@@ -513,8 +554,10 @@ class SupermanPerformanceProfiler:
 
         vitals_comparison = {}
         for metric_key in current_vitals.keys():
-            current_value = current_vitals.get(metric_key, {}).get('value', 0)
-            baseline_value = baseline_vitals.get(metric_key, {}).get('value', 0)
+            current_value = current_vitals.get(metric_key, {}).get('value')
+            baseline_value = baseline_vitals.get(metric_key, {}).get('value')
+            if current_value is None or baseline_value is None:
+                continue
 
             vitals_comparison[metric_key] = {
                 'current': current_value,
@@ -531,6 +574,7 @@ class SupermanPerformanceProfiler:
             'score_difference': round(score_diff, 1),
             'vitals_comparison': vitals_comparison,
             'baseline_timestamp': baseline.get('timestamp'),
+            'history_check': history_check,
             'superman_verdict': '⚠️  PERFORMANCE REGRESSION DETECTED!' if is_regression else '✅ Performance maintained or improved'
         }
 
@@ -578,15 +622,14 @@ class SupermanPerformanceProfiler:
             Storage confirmation
         """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        history_path = self.history_dir / f"{test_name}_{timestamp}.json"
 
-        # Store full results in history
-        with open(history_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Metrics go to the indexed columns, full results to a compressed blob
+        run_id = self.history.record(test_name, results, hero='superman')
 
         return {
             'stored': True,
-            'path': str(history_path),
+            'path': str(self.history.db_path),
+            'run_id': run_id,
             'timestamp': timestamp
         }
 
@@ -719,28 +762,49 @@ class SupermanPerformanceProfiler:
             limit: Maximum number of history entries to return
 
         Returns:
-            List of historical performance runs
+            List of historical performance runs (most recent first); the
+            full results of a run are available from get_history_run()
+        """
+        return [
+            {
+                'timestamp': entry['timestamp'],
+                'score': entry['score'],
+                'grade': entry['grade'],
+                'run_id': entry['run_id']
+            }
+            for entry in self.history.history(test_name, limit=limit, hero='superman')
+        ]
+
+    def get_history_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """
+        🦸 Full results of one archived run
+
+        Args:
+            run_id: Run id from get_performance_history()
+
+        Returns:
+            Stored results, or None if the run is unknown
+        """
+        return self.history.get_run(run_id)
+
+    def get_performance_trend(self, test_name: str, metric: str = 'score',
+                              window: int = 40) -> Dict[str, Any]:
+        """
+        🦸 Percentiles and trend of one metric over recent runs
+
+        Args:
+            test_name: Test name
+            metric: 'score' or a Core Web Vital ('lcp', 'cls', 'tbt', ...)
+            window: Number of most recent runs
+
+        Returns:
+            Percentile summary and least-squares trend
         """
-        history_files = sorted(
-            self.history_dir.glob(f"{test_name}_*.json"),
-            reverse=True  # Most recent first
-        )[:limit]
-
-        history = []
-        for file_path in history_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    history.append({
-                        'timestamp': data.get('timestamp'),
-                        'score': data.get('superman_performance_score', {}).get('score'),
-                        'grade': data.get('superman_performance_score', {}).get('grade'),
-                        'file': str(file_path)
-                    })
-            except Exception as e:
-                logger.warning(f"Failed to load history file {file_path}: {e}")
-
-        return history
+        return {
+            'test_name': test_name,
+            'percentiles': self.history.percentiles(test_name, metric, limit=window, hero='superman'),
+            'trend': self.history.trend(test_name, metric, window=window, hero='superman')
+        }
 
 
 # Main entry point - Superman's Performance Interface
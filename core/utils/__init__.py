@@ -2,13 +2,14 @@
 Core utilities for Justice League operations
 
 Modules:
-- git_worktree_manager: Git worktree management for parallel operations
+- git_worktree_manager: Git worktree management (and pooling) for parallel operations
 - git_tree_storage: Git tree object storage for Oracle patterns
 """
 
 from .git_worktree_manager import (
     GitWorktreeManager,
     HeroWorktreeContext,
+    WorktreePool,
     create_hero_worktree,
     cleanup_hero_worktrees
 )
@@ -16,6 +17,7 @@ from .git_worktree_manager import (
 __all__ = [
     'GitWorktreeManager',
     'HeroWorktreeContext',
+    'WorktreePool',
     'create_hero_worktree',
     'cleanup_hero_worktrees'
 ]
@@ -0,0 +1,306 @@
+"""
+📊 EXECUTION PROFILE - Measured Mission Costs for Oracle's Planner
+
+Everything the parallel planner knows about how missions actually run,
+learned from completed deployments instead of hard-coded constants:
+
+- Durations: decayed log-bucket histograms per (hero, task type) and per hero
+- CPU profile: share of mission wall time spent on this process's CPU
+  (missions run on threads, so CPU-bound heroes contend for the GIL)
+- Contention: observed slowdown of missions at each worker count
+- Worktree cost: seconds to create a git worktree in this repository
+- Dispatch overhead: parallel makespan beyond the ideal schedule
+
+The profile is a small JSON file rewritten atomically after every run.
+
+Configuration (environment):
+    PARALLEL_PLANNER_PROFILE: Profile path
+        (default ~/.cache/justice_league/parallel_profile.json)
+
+Version: 1.0.0
+Created: 2026-10-16
+"""
+
+import bisect
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_PATH = Path.home() / ".cache" / "justice_league" / "parallel_profile.json"
+PROFILE_FORMAT = 1
+
+# Bucket upper edges: 10ms doubling every two buckets, past two hours
+BUCKET_EDGES = [0.01 * 2 ** (i / 2) for i in range(40)]
+
+
+def task_type(mission: Dict[str, Any]) -> str:
+    """Task type of a mission: explicit 'task_type', else task_name without its trailing number"""
+    explicit = mission.get('task_type')
+    if explicit:
+        return str(explicit).lower()
+    name = str(mission.get('task_name', '')).lower()
+    return re.sub(r'[-_ ]*\d+$', '', name) or name
+
+
+class DurationHistogram:
+    """
+    Exponentially decayed histogram of durations
+
+    Each new sample first scales the old counts by `decay`, so the estimate
+    follows a hero getting faster or slower instead of averaging forever.
+    """
+
+    def __init__(self, decay: float = 0.95):
+        self.decay = decay
+        self.counts = [0.0] * (len(BUCKET_EDGES) + 1)
+        self.total = 0.0
+        self.weight = 0.0
+        self.samples = 0
+
+    def add(self, seconds: float):
+        seconds = max(0.0, seconds)
+        self.counts = [count * self.decay for count in self.counts]
+        self.total *= self.decay
+        self.weight *= self.decay
+        self.counts[bisect.bisect_left(BUCKET_EDGES, seconds)] += 1.0
+        self.total += seconds
+        self.weight += 1.0
+        self.samples += 1
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.weight if self.weight else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile (geometric middle of the bucket it falls in)"""
+        if not self.weight:
+            return None
+        target = q * self.weight
+        running = 0.0
+        for index, count in enumerate(self.counts):
+            running += count
+            if running >= target and count:
+                break
+        upper = BUCKET_EDGES[min(index, len(BUCKET_EDGES) - 1)]
+        lower = BUCKET_EDGES[index - 1] if index else upper / math.sqrt(2)
+        return math.sqrt(lower * upper)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'counts': {str(i): round(c, 6) for i, c in enumerate(self.counts) if c > 1e-6},
+            'total': self.total,
+            'weight': self.weight,
+            'samples': self.samples
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DurationHistogram':
+        histogram = cls()
+        for index, count in data.get('counts', {}).items():
+            histogram.counts[int(index)] = float(count)
+        histogram.total = float(data.get('total', 0.0))
+        histogram.weight = float(data.get('weight', 0.0))
+        histogram.samples = int(data.get('samples', 0))
+        return histogram
+
+
+def _ewma(entry: Optional[Dict[str, float]], value: float, min_alpha: float = 0.2) -> Dict[str, float]:
+    """Running average that is a plain mean for the first samples, then an EWMA"""
+    if not entry:
+        return {'value': value, 'samples': 1}
+    samples = entry['samples'] + 1
+    alpha = max(1.0 / samples, min_alpha)
+    return {'value': entry['value'] + alpha * (value - entry['value']), 'samples': samples}
+
+
+class ExecutionProfile:
+    """
+    📊 Persistent, thread-safe store of measured mission costs
+
+    Args:
+        path: Profile JSON path (None: PARALLEL_PLANNER_PROFILE or the default;
+              False: in memory only)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path, bool]] = None):
+        if path is False:
+            self.path = None
+        else:
+            self.path = Path(path or os.getenv('PARALLEL_PLANNER_PROFILE') or DEFAULT_PROFILE_PATH)
+        self._lock = threading.Lock()
+        self.durations: Dict[str, DurationHistogram] = {}
+        self.cpu_fraction: Dict[str, Dict[str, float]] = {}
+        self.contention: Dict[str, Dict[str, float]] = {}
+        self.worktree_cost = DurationHistogram()
+        self.dispatch_overhead: Optional[Dict[str, float]] = None
+        self.runs = 0
+        self._load()
+
+    # ==================== QUERIES ====================
+
+    def expected_duration(self, mission: Dict[str, Any]) -> Tuple[Optional[float], int]:
+        """(mean seconds, samples) for a mission: (hero, task type) first, then the hero"""
+        hero = str(mission.get('hero_name', '')).lower()
+        with self._lock:
+            for key in (f"{hero}|{task_type(mission)}", f"{hero}|*"):
+                histogram = self.durations.get(key)
+                if histogram is not None and histogram.weight:
+                    return histogram.mean, histogram.samples
+        return None, 0
+
+    def cpu_share(self, heroes: Iterable[str]) -> Optional[float]:
+        """Measured CPU share of these heroes' missions (per hero, else across all runs)"""
+        with self._lock:
+            values = [self.cpu_fraction[h]['value'] for h in heroes if h in self.cpu_fraction]
+            if not values and '*' in self.cpu_fraction:
+                values = [self.cpu_fraction['*']['value']]
+        return sum(values) / len(values) if values else None
+
+    def slowdown(self, workers: int) -> Optional[float]:
+        """Measured mission slowdown at a worker count (None if never run that way)"""
+        with self._lock:
+            entry = self.contention.get(str(workers))
+        return entry['value'] if entry else None
+
+    def worktree_seconds(self) -> Tuple[Optional[float], int]:
+        with self._lock:
+            return self.worktree_cost.mean, self.worktree_cost.samples
+
+    def dispatch_seconds(self) -> Optional[float]:
+        with self._lock:
+            return self.dispatch_overhead['value'] if self.dispatch_overhead else None
+
+    # ==================== OBSERVATIONS ====================
+
+    def observe_run(self, samples: List[Dict[str, Any]], workers: int,
+                    makespan: float, cpu_seconds: Optional[float] = None,
+                    ideal_makespan: Optional[float] = None,
+                    slowdown_model: float = 1.0):
+        """
+        Learn from one finished deployment
+
+        Args:
+            samples: Per mission: {'mission', 'duration', 'worktree_setup' (optional)}
+            workers: Workers the missions ran on
+            makespan: Wall seconds of the whole deployment
+            cpu_seconds: Process CPU seconds used during the deployment
+            ideal_makespan: Makespan of the LPT schedule of the measured durations
+            slowdown_model: Slowdown the planner assumed for this worker count
+        """
+        if not samples:
+            return
+        with self._lock:
+            expected = []
+            for sample in samples:
+                mission = sample['mission']
+                hero = str(mission.get('hero_name', '')).lower()
+                key = f"{hero}|{task_type(mission)}"
+                histogram = self.durations.get(key)
+                expected.append(histogram.mean if histogram is not None and histogram.weight else None)
+
+            # Contention: how much slower missions ran than their solo history
+            ratios = [sample['duration'] / previous for sample, previous in zip(samples, expected)
+                      if previous and sample['duration'] > 0]
+            if workers > 1 and ratios:
+                observed = max(1.0, sum(ratios) / len(ratios))
+                self.contention[str(workers)] = _ewma(self.contention.get(str(workers)), observed)
+                slowdown_model = observed
+            # Histograms hold solo-equivalent durations so one worker count's contention doesn't leak into another
+            solo_factor = 1.0 if workers <= 1 else max(1.0, slowdown_model)
+
+            for sample in samples:
+                mission = sample['mission']
+                hero = str(mission.get('hero_name', '')).lower()
+                solo = sample['duration'] / solo_factor
+                for key in (f"{hero}|{task_type(mission)}", f"{hero}|*"):
+                    self.durations.setdefault(key, DurationHistogram()).add(solo)
+                if sample.get('worktree_setup') is not None:
+                    self.worktree_cost.add(sample['worktree_setup'])
+
+            busy = sum(sample['duration'] for sample in samples)
+            if cpu_seconds is not None and busy > 0:
+                share = min(1.0, max(0.0, cpu_seconds / busy))
+                self.cpu_fraction['*'] = _ewma(self.cpu_fraction.get('*'), share)
+                heroes = {str(s['mission'].get('hero_name', '')).lower() for s in samples}
+                if len(heroes) == 1:
+                    hero = heroes.pop()
+                    self.cpu_fraction[hero] = _ewma(self.cpu_fraction.get(hero), share)
+
+            if workers > 1 and ideal_makespan is not None:
+                self.dispatch_overhead = _ewma(self.dispatch_overhead, max(0.0, makespan - ideal_makespan))
+
+            self.runs += 1
+        self.save()
+
+    # ==================== PERSISTENCE ====================
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'format': PROFILE_FORMAT,
+                'runs': self.runs,
+                'durations': {key: h.to_dict() for key, h in self.durations.items()},
+                'cpu_fraction': dict(self.cpu_fraction),
+                'contention': dict(self.contention),
+                'worktree_cost': self.worktree_cost.to_dict(),
+                'dispatch_overhead': self.dispatch_overhead
+            }
+
+    def save(self):
+        if self.path is None:
+            return
+        data = self.to_dict()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            # Planning still works from priors and in-memory measurements
+            logger.warning(f"⚠️ Could not save execution profile {self.path}: {e}")
+
+    def _load(self):
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable execution profile {self.path}: {e}")
+            return
+        if data.get('format') != PROFILE_FORMAT:
+            return
+        self.runs = data.get('runs', 0)
+        self.durations = {key: DurationHistogram.from_dict(h) for key, h in data.get('durations', {}).items()}
+        self.cpu_fraction = data.get('cpu_fraction', {})
+        self.contention = data.get('contention', {})
+        self.worktree_cost = DurationHistogram.from_dict(data.get('worktree_cost', {}))
+        self.dispatch_overhead = data.get('dispatch_overhead')
+
+
+_profiles: Dict[Optional[Path], ExecutionProfile] = {}
+_profiles_lock = threading.Lock()
+
+
+def get_execution_profile(path: Optional[Union[str, Path]] = None) -> ExecutionProfile:
+    """The shared profile for a path (default: PARALLEL_PLANNER_PROFILE or the default path)"""
+    resolved = Path(path or os.getenv('PARALLEL_PLANNER_PROFILE') or DEFAULT_PROFILE_PATH)
+    with _profiles_lock:
+        profile = _profiles.get(resolved)
+        if profile is None:
+            profile = _profiles[resolved] = ExecutionProfile(resolved)
+        return profile
@@ -7,19 +7,31 @@ Enables:
 - Clean context switching between tasks
 - Atomic commits per operation
 - Efficient cleanup and resource management
+- Pre-warmed worktree pool reused across parallel deployments
 
-Version: 1.0.0
+Version: 1.1.0
 Created: 2025-10-31
 """
 
+import hashlib
 import logging
 import subprocess
 import shutil
+import threading
+import time
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
 import tempfile
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows: pooled worktrees are only guarded within this process
+    FCNTL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +76,17 @@ class GitWorktreeManager:
             # Fallback to current directory
             return Path.cwd()
 
+    def current_commit(self) -> str:
+        """SHA of the repository's HEAD"""
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()
+
     def create_worktree(
         self,
         task_name: str,
@@ -321,6 +344,358 @@ class GitWorktreeManager:
             return 0
 
 
+class WorktreePool:
+    """
+    🌳 Pool of pre-created detached worktrees, reused across missions
+
+    Creating a worktree checks out the whole tree, which takes seconds on a
+    large repository. The pool creates its worktrees once and between
+    missions only resets them (`git checkout --detach --force <sha>` and
+    `git clean -ffdx`), which touches just the files a mission changed.
+
+    Pool slots live under the temp directory, one pool per repository, and
+    are kept after the process exits so the next process adopts them. A lock
+    file per slot keeps two processes out of the same worktree.
+
+    Usage:
+        pool = WorktreePool(manager)
+        pool.warm(4)
+        with pool.worktree("artemis-conversion") as worktree:
+            artemis.generate_component(worktree['path'])
+        print(pool.stats())
+    """
+
+    def __init__(
+        self,
+        manager: Optional[GitWorktreeManager] = None,
+        max_size: int = 8,
+        base_dir: Optional[Path] = None
+    ):
+        """
+        Initialize worktree pool
+
+        Args:
+            manager: GitWorktreeManager of the repository (created if None)
+            max_size: Most worktrees kept between missions
+            base_dir: Directory of the pool's worktrees (default: per-repo temp directory)
+        """
+        self.manager = manager or GitWorktreeManager()
+        repo_id = hashlib.sha1(str(Path(self.manager.repo_root).resolve()).encode()).hexdigest()[:10]
+        self.base_dir = Path(base_dir) if base_dir else (
+            Path(tempfile.gettempdir()) / "justice-league-worktrees" / f"pool-{repo_id}"
+        )
+        self.max_size = max_size
+        self.size = 0
+        self.commit: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._slots: Dict[str, Dict[str, Any]] = {}
+        self._adopted = False
+        self._stats = {
+            'acquisitions': 0,
+            'hits': 0,
+            'misses': 0,
+            'created': 0,
+            'resets': 0,
+            'discarded': 0,
+            'acquire_seconds': 0.0,
+            'max_acquire_seconds': 0.0
+        }
+
+    # ==================== PUBLIC API ====================
+
+    def warm(self, size: int) -> int:
+        """
+        Make sure `size` worktrees exist at the current HEAD (never shrinks the pool)
+
+        Resolves HEAD once for the missions that follow, instead of once per
+        mission. Worktrees left by an earlier process are adopted.
+
+        Returns:
+            Number of worktrees created
+        """
+        try:
+            self.commit = self.manager.current_commit()
+        except subprocess.CalledProcessError as e:
+            logger.error(f"❌ Cannot warm worktree pool, no commit to check out: {e.stderr or e}")
+            return 0
+        with self._lock:
+            self.size = min(self.max_size, max(self.size, size))
+            adopt = not self._adopted
+            self._adopted = True
+        if adopt:
+            self._adopt_existing()
+
+        created = 0
+        while True:
+            with self._lock:
+                if len(self._slots) >= self.size:
+                    break
+                slot = self._new_slot()
+            try:
+                self._create(slot)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"❌ Failed to pre-create pooled worktree: {e.stderr or e}")
+                with self._lock:
+                    self._slots.pop(slot['name'], None)
+                break
+            with self._lock:
+                slot['busy'] = False
+            created += 1
+
+        if created:
+            logger.info(f"🌳 Worktree pool warmed: {created} created, {self.size} ready at {self.commit[:8]}")
+        return created
+
+    def acquire(self, task_name: str, branch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Take a worktree for a task, reset to the pool's commit (or `branch`)
+
+        Returns:
+            Worktree information dict (same keys as create_worktree, plus
+            'pooled', 'commit' and 'acquire_seconds')
+
+        Raises:
+            subprocess.CalledProcessError: If no worktree could be prepared
+        """
+        start = time.perf_counter()
+        if self.commit is None:
+            self.commit = self.manager.current_commit()
+        target = branch or self.commit
+
+        slot = self._take_idle(target)
+        hit = slot is not None
+        if hit:
+            try:
+                if slot['commit'] != target:
+                    self._checkout(slot, target)
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"⚠️ Discarding pooled worktree {slot['path']}: {e.stderr or e}")
+                self._discard(slot)
+                hit, slot = False, None
+
+        if slot is None:
+            with self._lock:
+                slot = self._new_slot()
+            try:
+                self._create(slot, target)
+            except subprocess.CalledProcessError:
+                with self._lock:
+                    self._slots.pop(slot['name'], None)
+                raise
+            self._lock_slot(slot)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats['acquisitions'] += 1
+            self._stats['hits' if hit else 'misses'] += 1
+            self._stats['acquire_seconds'] += elapsed
+            self._stats['max_acquire_seconds'] = max(self._stats['max_acquire_seconds'], elapsed)
+
+        return {
+            'path': slot['path'],
+            'branch': branch or 'detached',
+            'task_name': task_name,
+            'created_at': datetime.now().isoformat(),
+            'status': 'active',
+            'pooled': True,
+            'commit': slot['commit'],
+            'acquire_seconds': elapsed
+        }
+
+    def release(self, worktree_info: Dict[str, Any]):
+        """Reset a worktree and return it to the pool (extra worktrees beyond the pool size are removed)"""
+        with self._lock:
+            slot = next((s for s in self._slots.values() if s['path'] == worktree_info['path']), None)
+        if slot is None:
+            return
+
+        with self._lock:
+            surplus = len(self._slots) > self.size
+        if surplus:
+            self._discard(slot)
+            return
+
+        try:
+            self._reset(slot)
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"⚠️ Could not reset pooled worktree {slot['path']}: {e.stderr or e}")
+            self._discard(slot)
+            return
+
+        self._unlock_slot(slot)
+        with self._lock:
+            slot['busy'] = False
+
+    @contextmanager
+    def worktree(self, task_name: str, branch: Optional[str] = None):
+        """Context manager: acquire a worktree, release it on exit"""
+        info = self.acquire(task_name, branch)
+        try:
+            yield info
+        finally:
+            self.release(info)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, hit rate and acquisition latency"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = self.size
+            stats['worktrees'] = len(self._slots)
+            stats['busy'] = sum(1 for s in self._slots.values() if s['busy'])
+        acquisitions = stats['acquisitions']
+        acquire_seconds = stats.pop('acquire_seconds')
+        stats['hit_rate'] = stats['hits'] / acquisitions if acquisitions else 0.0
+        stats['avg_acquire_ms'] = acquire_seconds / acquisitions * 1000 if acquisitions else 0.0
+        stats['max_acquire_ms'] = stats.pop('max_acquire_seconds') * 1000
+        return stats
+
+    def close(self) -> int:
+        """
+        Remove every idle pooled worktree, including ones left by earlier processes
+
+        Worktrees locked by another process are in use there and are kept.
+
+        Returns:
+            Number of worktrees removed
+        """
+        with self._lock:
+            adopt = not self._adopted
+            self._adopted = True
+        if adopt:
+            self._adopt_existing()
+        with self._lock:
+            idle = [s for s in self._slots.values() if not s['busy']]
+            for slot in idle:
+                slot['busy'] = True
+            self.size = 0
+        removed = 0
+        for slot in idle:
+            if not self._lock_slot(slot):
+                logger.info(f"🌳 Keeping pooled worktree in use by another process: {slot['path']}")
+                with self._lock:
+                    slot['busy'] = False
+                continue
+            self._discard(slot)
+            removed += 1
+        self._git(['worktree', 'prune'], check=False)
+        return removed
+
+    # ==================== SLOTS ====================
+
+    def _take_idle(self, target: str) -> Optional[Dict[str, Any]]:
+        """Claim an idle slot, preferring one already at the target commit"""
+        tried = set()
+        while True:
+            with self._lock:
+                idle = [s for s in self._slots.values() if not s['busy'] and s['name'] not in tried]
+                if not idle:
+                    return None
+                slot = min(idle, key=lambda s: s['commit'] != target)
+                slot['busy'] = True
+            if self._lock_slot(slot):
+                return slot
+            # Another process is using this worktree
+            tried.add(slot['name'])
+            with self._lock:
+                slot['busy'] = False
+
+    def _new_slot(self) -> Dict[str, Any]:
+        """Reserve a free slot name (caller holds the lock)"""
+        index = 0
+        while f"slot-{index}" in self._slots or (self.base_dir / f"slot-{index}").exists():
+            index += 1
+        name = f"slot-{index}"
+        slot = {'name': name, 'path': self.base_dir / name, 'commit': None, 'busy': True, 'lock_file': None}
+        self._slots[name] = slot
+        return slot
+
+    def _create(self, slot: Dict[str, Any], commit: Optional[str] = None):
+        commit = commit or self.commit
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"🌳 Creating pooled worktree: {slot['path']}")
+        self._git(['worktree', 'add', '--detach', str(slot['path']), commit])
+        slot['commit'] = commit
+        with self._lock:
+            self._stats['created'] += 1
+
+    def _checkout(self, slot: Dict[str, Any], commit: str):
+        self._git(['checkout', '--detach', '--force', '--quiet', commit], cwd=slot['path'])
+        slot['commit'] = commit
+
+    def _reset(self, slot: Dict[str, Any]):
+        """Back to the pool's commit with no local changes or untracked files"""
+        self._git(['clean', '-ffdxq'], cwd=slot['path'])
+        self._checkout(slot, self.commit or slot['commit'])
+        with self._lock:
+            self._stats['resets'] += 1
+
+    def _discard(self, slot: Dict[str, Any]):
+        self._git(['worktree', 'remove', '--force', str(slot['path'])], check=False)
+        if slot['path'].exists():
+            shutil.rmtree(slot['path'], ignore_errors=True)
+        self._unlock_slot(slot)
+        with self._lock:
+            self._slots.pop(slot['name'], None)
+            self._stats['discarded'] += 1
+
+    def _adopt_existing(self):
+        """Take over slots a previous process left behind; drop stale directories"""
+        if not self.base_dir.exists():
+            return
+        worktrees = self.manager.list_worktrees()
+        if not worktrees:
+            # The main worktree is always listed: git failed, so nothing is known to be stale
+            logger.warning(f"⚠️ Could not list worktrees, leaving {self.base_dir} untouched")
+            with self._lock:
+                self._adopted = False
+            return
+        registered = {str(Path(wt['path']).resolve()): wt.get('head') for wt in worktrees if 'path' in wt}
+        for path in sorted(self.base_dir.glob('slot-*')):
+            if not path.is_dir():
+                continue
+            head = registered.get(str(path.resolve()))
+            if head is None:
+                stale = {'name': path.name, 'lock_file': None}
+                if self._lock_slot(stale):
+                    shutil.rmtree(path, ignore_errors=True)
+                    self._unlock_slot(stale)
+                continue
+            with self._lock:
+                self._slots[path.name] = {
+                    'name': path.name, 'path': path, 'commit': head, 'busy': False, 'lock_file': None
+                }
+        self._git(['worktree', 'prune'], check=False)
+
+    def _lock_slot(self, slot: Dict[str, Any]) -> bool:
+        """Lock a slot against other processes (always succeeds without fcntl)"""
+        if not FCNTL_AVAILABLE:
+            return True
+        lock_file = open(self.base_dir / f"{slot['name']}.lock", 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        slot['lock_file'] = lock_file
+        return True
+
+    def _unlock_slot(self, slot: Dict[str, Any]):
+        lock_file = slot.get('lock_file')
+        if lock_file is not None:
+            slot['lock_file'] = None
+            lock_file.close()
+
+    def _git(self, args: List[str], cwd: Optional[Path] = None, check: bool = True):
+        return subprocess.run(
+            ['git', *args],
+            cwd=cwd or self.manager.repo_root,
+            capture_output=True,
+            text=True,
+            check=check
+        )
+
+
 class HeroWorktreeContext:
     """
     Context manager for hero worktree operations
@@ -403,10 +778,12 @@ def create_hero_worktree(
 
 def cleanup_hero_worktrees() -> Dict[str, Any]:
     """
-    Clean up all hero worktrees
+    Clean up all hero worktrees, including the idle worktree pool
 
     Returns:
         Cleanup summary
     """
     manager = GitWorktreeManager()
-    return manager.cleanup_all(force=True)
+    summary = manager.cleanup_all(force=True)
+    summary['pooled_removed'] = WorktreePool(manager).close()
+    return summary
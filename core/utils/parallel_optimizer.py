@@ -8,16 +8,26 @@ Oracle analyzes missions and recommends optimal execution strategy:
 - Worktree usage decisions
 - Performance predictions
 
-Version: 1.0.0
+Every decision is made from measured costs kept in the execution profile:
+per-hero and per-task-type duration histograms, the CPU share and slowdown
+observed at each worker count, and what a worktree really costs to create.
+The built-in hero estimates are only priors until a hero has been measured.
+Missions are scheduled longest-expected-first (LPT) to shorten the makespan,
+and every run's actual makespan is compared with the prediction.
+
+Version: 2.0.0
 Created: 2025-10-31
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+from .execution_profile import ExecutionProfile, get_execution_profile
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,9 +47,29 @@ class ParallelRecommendation:
     confidence: float  # 0.0 - 1.0
     reasoning: List[str]
     expected_speedup: float
-    estimated_duration: float
+    estimated_duration: float  # Predicted makespan (seconds)
     benefits: List[str]
     warnings: List[str]
+    mission_order: List[int] = field(default_factory=list)  # Mission indices, longest expected first
+    expected_durations: List[float] = field(default_factory=list)  # Per mission, solo seconds
+    sequential_duration: float = 0.0
+    assumed_slowdown: float = 1.0  # Per-mission slowdown expected at recommended_workers
+
+
+class _Plan(NamedTuple):
+    workers: int
+    makespan: float
+    slowdown: float
+
+
+def lpt_makespan(durations: List[float], workers: int) -> float:
+    """Makespan of longest-processing-time-first list scheduling on `workers` workers"""
+    if not durations:
+        return 0.0
+    loads = [0.0] * max(1, min(workers, len(durations)))
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + duration)
+    return max(loads)
 
 
 class ParallelOptimizer:
@@ -53,16 +83,38 @@ class ParallelOptimizer:
     - What speedup to expect?
     """
 
-    # Decision thresholds (learned from testing)
-    MIN_TASK_DURATION_FOR_PARALLEL = 30.0  # seconds
-    MIN_TASKS_FOR_PARALLEL = 2
+    # Priors, used until the execution profile has measured the real thing
+    HERO_DURATION_PRIORS = {
+        'artemis': 60.0,      # Code generation: ~1 minute
+        'green_arrow': 45.0,  # Validation: ~45 seconds
+        'batman': 50.0,       # Testing: ~50 seconds
+        'oracle': 5.0,        # Analysis: ~5 seconds (fast!)
+        'wonder_woman': 40.0, # Accessibility: ~40 seconds
+        'flash': 35.0,        # Performance: ~35 seconds
+        'aquaman': 30.0,      # Network: ~30 seconds
+    }
+    DEFAULT_TASK_DURATION = 60.0  # seconds
+    DEFAULT_CPU_FRACTION = 0.1  # Heroes mostly wait on Figma, browsers and disk
     WORKTREE_OVERHEAD = 0.8  # seconds per worktree
-    OPTIMAL_WORKERS_DEFAULT = 4
+    DISPATCH_OVERHEAD = 0.05  # seconds to start the pool and collect results
+
+    # Decision rules
+    MIN_TASKS_FOR_PARALLEL = 2
     MAX_WORKERS = 8
+    MAX_WORKTREE_COST = 0.10  # Isolation may lengthen the makespan by at most 10%
+    WORKER_TOLERANCE = 0.05  # Prefer fewer workers within 5% of the best makespan
+    FILE_WRITING_HEROES = ('artemis', 'green_arrow')
 
-    def __init__(self, narrator: Optional[Any] = None):
-        """Initialize optimizer"""
+    def __init__(self, narrator: Optional[Any] = None, profile: Optional[ExecutionProfile] = None):
+        """
+        Initialize optimizer
+
+        Args:
+            narrator: Mission Control narrator for show_recommendation()
+            profile: Measured costs (default: the shared execution profile)
+        """
         self.narrator = narrator
+        self.profile = profile or get_execution_profile()
         self.decision_history: List[Dict[str, Any]] = []
 
     def analyze_missions(
@@ -75,17 +127,29 @@ class ParallelOptimizer:
 
         Args:
             missions: List of mission dicts
-            estimated_task_duration: Optional estimated duration per task (seconds)
+            estimated_task_duration: Optional estimated duration per task (seconds),
+                used instead of the measured histograms
 
         Returns:
-            ParallelRecommendation with strategy and reasoning
+            ParallelRecommendation with strategy, schedule and reasoning
         """
         num_missions = len(missions)
         reasoning = []
         warnings = []
         benefits = []
 
-        # Step 1: Check if we have enough tasks
+        # Step 1: Expected solo duration of every mission, longest first
+        expected, measured = self._expected_durations(missions, estimated_task_duration)
+        order = sorted(range(num_missions), key=lambda i: -expected[i])
+        ordered = [expected[i] for i in order]
+        sequential_duration = sum(expected)
+        schedule = {
+            'mission_order': order,
+            'expected_durations': expected,
+            'sequential_duration': sequential_duration
+        }
+
+        # Step 2: Check if we have enough tasks
         if num_missions < self.MIN_TASKS_FOR_PARALLEL:
             return ParallelRecommendation(
                 strategy=ExecutionStrategy.SEQUENTIAL,
@@ -97,22 +161,65 @@ class ParallelOptimizer:
                     "Parallel overhead > benefit for single tasks"
                 ],
                 expected_speedup=1.0,
-                estimated_duration=estimated_task_duration or 60.0,
+                estimated_duration=sequential_duration,
                 benefits=["Simple execution", "No overhead"],
-                warnings=[]
+                warnings=[],
+                **schedule
             )
 
-        # Step 2: Estimate task duration if not provided
-        if estimated_task_duration is None:
-            estimated_task_duration = self._estimate_task_duration(missions)
-
         reasoning.append(f"Analyzing {num_missions} missions")
-        reasoning.append(f"Estimated task duration: {estimated_task_duration:.1f}s")
+        reasoning.append(
+            f"Expected durations: {ordered[-1]:.2f}s - {ordered[0]:.2f}s "
+            f"({measured}/{num_missions} measured, {sequential_duration:.1f}s total)"
+        )
 
-        # Step 3: Check task duration threshold
-        if estimated_task_duration < self.MIN_TASK_DURATION_FOR_PARALLEL:
+        # Step 3: CPU profile - missions share this process, CPU-bound ones contend for the GIL
+        cpu_fraction = self.profile.cpu_share({m.get('hero_name', '').lower() for m in missions})
+        if cpu_fraction is None:
+            cpu_fraction = self.DEFAULT_CPU_FRACTION
+            reasoning.append(f"CPU share {cpu_fraction * 100:.0f}% (prior - not measured yet)")
+        else:
+            reasoning.append(f"CPU share {cpu_fraction * 100:.0f}% (measured)")
+
+        # Step 4: Best worker count without worktrees
+        best = self._best_plan(ordered, cpu_fraction, setup=0.0)
+        reasoning.append(f"Optimal workers: {best.workers} ({best.makespan:.1f}s makespan)")
+
+        # Step 5: Decide on worktrees from their measured creation cost
+        use_worktrees = False
+        needs_isolation = any(
+            mission.get('hero_name', '').lower() in self.FILE_WRITING_HEROES
+            for mission in missions
+        )
+        if not needs_isolation:
+            reasoning.append("No file-writing heroes - worktree isolation not needed")
+        elif best.workers > 1:
+            worktree_cost, samples = self.profile.worktree_seconds()
+            source = f"measured over {samples}" if samples else "prior"
+            if worktree_cost is None:
+                worktree_cost = self.WORKTREE_OVERHEAD
+            isolated = self._best_plan(ordered, cpu_fraction, setup=worktree_cost)
+            extra = isolated.makespan / best.makespan - 1 if best.makespan > 0 else float('inf')
+
+            if isolated.workers > 1 and extra <= self.MAX_WORKTREE_COST:
+                use_worktrees = True
+                best = isolated
+                reasoning.append(
+                    f"Worktrees cost {worktree_cost:.2f}s each ({source}), "
+                    f"+{extra * 100:.0f}% makespan for isolation"
+                )
+                benefits.append("Isolated workspaces prevent conflicts")
+                benefits.append("Atomic operations per task")
+            else:
+                reasoning.append(
+                    f"Worktree overhead not justified ({worktree_cost:.2f}s each, {source})"
+                )
+                warnings.append("Tasks may not benefit from workspace isolation")
+
+        # Step 6: Parallel only if it beats running the missions back to back
+        if best.workers == 1 or best.makespan >= sequential_duration * (1 - self.WORKER_TOLERANCE):
             reasoning.append(
-                f"Tasks too fast ({estimated_task_duration:.1f}s < {self.MIN_TASK_DURATION_FOR_PARALLEL}s threshold)"
+                f"Parallel makespan {best.makespan:.1f}s does not beat sequential {sequential_duration:.1f}s"
             )
             reasoning.append("Overhead would exceed benefit")
 
@@ -120,55 +227,32 @@ class ParallelOptimizer:
                 strategy=ExecutionStrategy.SEQUENTIAL,
                 recommended_workers=1,
                 use_worktrees=False,
-                confidence=0.90,
+                confidence=self._calculate_confidence(
+                    num_missions, sequential_duration / num_missions, 1.0, measured / num_missions
+                ),
                 reasoning=reasoning,
                 expected_speedup=1.0,
-                estimated_duration=num_missions * estimated_task_duration,
+                estimated_duration=sequential_duration,
                 benefits=["Minimal overhead"],
-                warnings=["Consider batching tasks for parallel execution"]
+                warnings=["Consider batching tasks for parallel execution"],
+                **schedule
             )
 
-        # Step 4: Calculate optimal workers
-        optimal_workers = min(num_missions, self.OPTIMAL_WORKERS_DEFAULT, self.MAX_WORKERS)
-        reasoning.append(f"Optimal workers: {optimal_workers}")
-
-        # Step 5: Decide on worktrees
-        use_worktrees = True
-        worktree_benefit = self._analyze_worktree_benefit(missions, estimated_task_duration)
-
-        if worktree_benefit < 1.2:  # Less than 20% benefit
-            use_worktrees = False
-            reasoning.append("Worktree overhead not justified for these tasks")
-            warnings.append("Tasks may not benefit from workspace isolation")
-        else:
-            reasoning.append(f"Worktrees provide {worktree_benefit:.1f}x benefit from isolation")
-            benefits.append("Isolated workspaces prevent conflicts")
-            benefits.append("Atomic operations per task")
-
-        # Step 6: Calculate expected speedup
-        expected_speedup = self._calculate_expected_speedup(
-            num_missions,
-            optimal_workers,
-            estimated_task_duration,
-            use_worktrees
-        )
-
+        # Step 7: Expected speedup and duration of the LPT schedule
+        expected_speedup = sequential_duration / best.makespan
         reasoning.append(f"Expected speedup: {expected_speedup:.1f}x")
-
-        # Step 7: Calculate estimated duration
-        sequential_duration = num_missions * estimated_task_duration
-        parallel_duration = sequential_duration / expected_speedup
-        estimated_duration = parallel_duration
-
+        if best.slowdown > 1.0:
+            reasoning.append(f"Missions expected {best.slowdown:.2f}x slower from contention")
         reasoning.append(
-            f"Duration: {parallel_duration:.1f}s vs {sequential_duration:.1f}s sequential"
+            f"Duration: {best.makespan:.1f}s vs {sequential_duration:.1f}s sequential "
+            f"(longest-expected-first schedule)"
         )
 
         # Step 8: Build benefits list
         benefits.extend([
             f"{expected_speedup:.1f}x faster execution",
-            f"Save {sequential_duration - parallel_duration:.1f}s",
-            f"{optimal_workers} heroes working simultaneously"
+            f"Save {sequential_duration - best.makespan:.1f}s",
+            f"{best.workers} heroes working simultaneously"
         ])
 
         # Step 9: Determine strategy
@@ -182,116 +266,82 @@ class ParallelOptimizer:
         # Step 10: Calculate confidence
         confidence = self._calculate_confidence(
             num_missions,
-            estimated_task_duration,
-            expected_speedup
+            sequential_duration / num_missions,
+            expected_speedup,
+            measured / num_missions
         )
 
         return ParallelRecommendation(
             strategy=strategy,
-            recommended_workers=optimal_workers,
+            recommended_workers=best.workers,
             use_worktrees=use_worktrees,
             confidence=confidence,
             reasoning=reasoning,
             expected_speedup=expected_speedup,
-            estimated_duration=estimated_duration,
+            estimated_duration=best.makespan,
             benefits=benefits,
-            warnings=warnings
+            warnings=warnings,
+            assumed_slowdown=best.slowdown,
+            **schedule
         )
 
-    def _estimate_task_duration(self, missions: List[Dict[str, Any]]) -> float:
-        """Estimate task duration based on mission type"""
-        # Check first mission to determine type
-        if not missions:
-            return 60.0  # Default 1 minute
-
-        first_mission = missions[0]
-        hero_name = first_mission.get('hero_name', '').lower()
-
-        # Hero-specific estimates (learned from experience)
-        duration_estimates = {
-            'artemis': 60.0,      # Code generation: ~1 minute
-            'green_arrow': 45.0,  # Validation: ~45 seconds
-            'batman': 50.0,       # Testing: ~50 seconds
-            'oracle': 5.0,        # Analysis: ~5 seconds (fast!)
-            'wonder_woman': 40.0, # Accessibility: ~40 seconds
-            'flash': 35.0,        # Performance: ~35 seconds
-            'aquaman': 30.0,      # Network: ~30 seconds
-        }
-
-        return duration_estimates.get(hero_name, 60.0)
-
-    def _analyze_worktree_benefit(
+    def _expected_durations(
         self,
         missions: List[Dict[str, Any]],
-        task_duration: float
-    ) -> float:
-        """
-        Analyze benefit of using worktrees
-
-        Returns:
-            Benefit multiplier (> 1.0 means beneficial)
-        """
-        # Worktrees provide benefit through:
-        # 1. Preventing I/O conflicts (file writes)
-        # 2. Clean git context per task
-        # 3. Atomic operations
-
-        # Check if tasks involve file operations
-        has_file_operations = any(
-            mission.get('hero_name', '').lower() in ['artemis', 'green_arrow']
-            for mission in missions
-        )
-
-        if not has_file_operations:
-            return 1.1  # Minimal benefit
-
-        # Calculate overhead vs benefit
-        overhead_ratio = self.WORKTREE_OVERHEAD / task_duration
-
-        if overhead_ratio > 0.1:  # Overhead > 10% of task
-            return 1.1  # Not worth it
-
-        # Significant benefit for file-heavy operations
-        return 1.5
-
-    def _calculate_expected_speedup(
-        self,
-        num_tasks: int,
-        num_workers: int,
-        task_duration: float,
-        use_worktrees: bool
-    ) -> float:
+        estimated_task_duration: Optional[float] = None
+    ) -> Tuple[List[float], int]:
+        """Expected solo seconds per mission and how many came from measurements"""
+        if estimated_task_duration is not None:
+            return [estimated_task_duration] * len(missions), 0
+
+        durations = []
+        measured = 0
+        for mission in missions:
+            duration, samples = self.profile.expected_duration(mission)
+            if duration is None:
+                hero_name = mission.get('hero_name', '').lower()
+                duration = self.HERO_DURATION_PRIORS.get(hero_name, self.DEFAULT_TASK_DURATION)
+            else:
+                measured += 1
+            durations.append(duration)
+        return durations, measured
+
+    def _slowdown(self, workers: int, cpu_fraction: float) -> float:
         """
-        Calculate expected speedup based on task characteristics
+        Per-mission slowdown at a worker count
 
-        Uses Amdahl's Law with overhead adjustment
+        Measured if missions have run on this many workers before; otherwise
+        the GIL model: `workers` threads each needing `cpu_fraction` of one
+        core stretch once they need more than the whole core.
         """
-        # Theoretical max speedup
-        theoretical_max = min(num_tasks, num_workers)
-
-        # Parallel efficiency (70-75% observed)
-        parallel_efficiency = 0.72
-
-        # Overhead adjustments
-        overhead = 0.0
-
-        if use_worktrees:
-            # Worktree overhead
-            overhead += self.WORKTREE_OVERHEAD * num_workers / task_duration
-
-        # Thread coordination overhead
-        overhead += 0.05  # ~5% coordination overhead
-
-        # Actual speedup accounting for efficiency and overhead
-        actual_speedup = theoretical_max * parallel_efficiency * (1 - overhead)
-
-        return max(1.0, actual_speedup)  # Never less than 1.0
+        if workers <= 1:
+            return 1.0
+        measured = self.profile.slowdown(workers)
+        if measured is not None:
+            return measured
+        return max(1.0, workers * cpu_fraction)
+
+    def _best_plan(self, durations: List[float], cpu_fraction: float, setup: float) -> _Plan:
+        """Fewest workers whose predicted makespan is within WORKER_TOLERANCE of the best"""
+        dispatch = self.profile.dispatch_seconds()
+        if dispatch is None:
+            dispatch = self.DISPATCH_OVERHEAD
+
+        plans = [_Plan(1, sum(durations), 1.0)]
+        for workers in range(2, min(len(durations), self.MAX_WORKERS) + 1):
+            slowdown = self._slowdown(workers, cpu_fraction)
+            makespan = lpt_makespan([d * slowdown + setup for d in durations], workers) + dispatch
+            plans.append(_Plan(workers, makespan, slowdown))
+
+        shortest = min(plan.makespan for plan in plans)
+        return next(plan for plan in plans if plan.makespan <= shortest * (1 + self.WORKER_TOLERANCE))
 
     def _calculate_confidence(
         self,
         num_tasks: int,
         task_duration: float,
-        expected_speedup: float
+        expected_speedup: float,
+        measured_share: float = 0.0
     ) -> float:
         """Calculate confidence in recommendation"""
         confidence = 0.5  # Base confidence
@@ -314,6 +364,9 @@ class ParallelOptimizer:
         elif expected_speedup >= 1.5:
             confidence += 0.1
 
+        # Measured durations = higher confidence than priors
+        confidence += 0.1 * measured_share
+
         return min(0.95, confidence)  # Max 95% confidence
 
     def record_decision(
@@ -322,11 +375,17 @@ class ParallelOptimizer:
         actual_result: Optional[Dict[str, Any]] = None
     ):
         """
-        Record decision for learning
+        Record decision and feed the measured run back into the execution profile
 
         Args:
             recommendation: The recommendation made
-            actual_result: Actual execution result (if available)
+            actual_result: Actual execution result (if available):
+                - duration: Wall seconds of the deployment (its makespan)
+                - successful, total_missions, used_worktrees
+                - hero_results: Per-mission results with 'mission', 'duration'
+                  and (in worktrees) 'worktree_setup'
+                - workers: Workers the missions actually ran on
+                - cpu_seconds: Process CPU seconds used during the deployment
         """
         decision_record = {
             'timestamp': str(datetime.now()),
@@ -335,7 +394,8 @@ class ParallelOptimizer:
                 'workers': recommendation.recommended_workers,
                 'worktrees': recommendation.use_worktrees,
                 'confidence': recommendation.confidence,
-                'expected_speedup': recommendation.expected_speedup
+                'expected_speedup': recommendation.expected_speedup,
+                'predicted_makespan': recommendation.estimated_duration
             }
         }
 
@@ -345,9 +405,65 @@ class ParallelOptimizer:
                 'success_rate': actual_result.get('successful', 0) / actual_result.get('total_missions', 1),
                 'used_worktrees': actual_result.get('used_worktrees')
             }
+            if actual_result.get('duration') is not None:
+                decision_record['makespan_report'] = self.makespan_report(
+                    recommendation, actual_result['duration'], actual_result.get('workers')
+                )
+            self._learn(recommendation, actual_result)
 
         self.decision_history.append(decision_record)
 
+    def _learn(self, recommendation: ParallelRecommendation, actual_result: Dict[str, Any]):
+        """Add a finished run's measurements to the execution profile"""
+        workers = actual_result.get('workers') or recommendation.recommended_workers
+        samples = []
+        for result in actual_result.get('hero_results', []):
+            # Failed missions often fail fast - their durations say nothing about the hero
+            if not result.get('success') or not result.get('mission') or result.get('duration') is None:
+                continue
+            setup = result.get('worktree_setup')
+            samples.append({
+                'mission': result['mission'],
+                'duration': max(0.0, result['duration'] - (setup or 0.0)),
+                'worktree_setup': setup
+            })
+        if not samples or actual_result.get('duration') is None:
+            return
+
+        ideal = lpt_makespan(
+            [sample['duration'] + (sample['worktree_setup'] or 0.0) for sample in samples], workers
+        )
+        planned = workers == recommendation.recommended_workers
+        self.profile.observe_run(
+            samples,
+            workers=workers,
+            makespan=actual_result['duration'],
+            cpu_seconds=actual_result.get('cpu_seconds'),
+            ideal_makespan=ideal,
+            slowdown_model=recommendation.assumed_slowdown if planned else 1.0
+        )
+
+    def makespan_report(
+        self,
+        recommendation: ParallelRecommendation,
+        actual_duration: float,
+        workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Predicted vs actual makespan of a run"""
+        predicted = recommendation.estimated_duration
+        error = actual_duration - predicted
+        return {
+            'strategy': recommendation.strategy.value,
+            'workers': workers or recommendation.recommended_workers,
+            'predicted_makespan': round(predicted, 3),
+            'actual_makespan': round(actual_duration, 3),
+            'error': round(error, 3),
+            'error_pct': round(error / predicted * 100, 1) if predicted > 0 else None,
+            'sequential_estimate': round(recommendation.sequential_duration, 3),
+            'actual_speedup': round(recommendation.sequential_duration / actual_duration, 2)
+            if actual_duration > 0 else None
+        }
+
     def show_recommendation(self, rec: ParallelRecommendation):
         """Display recommendation through narrator"""
         if not self.narrator:
@@ -28,6 +28,8 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from core.justice_league.secret_scanner import SecretScanner
+
 
 class SecurityAuditor:
     """Comprehensive security audit for Oracle production deployment."""
@@ -190,40 +192,19 @@ class SecurityAuditor:
         print("\n[3/10] Checking for hardcoded secrets...")
         self.checks_run += 1
 
-        secret_patterns = [
-            'password',
-            'secret',
-            'api_key',
-            'token',
-            'private_key',
-            'access_key'
-        ]
-
-        found_secrets = []
-
         try:
-            for pattern in secret_patterns:
-                result = subprocess.run(
-                    ['grep', '-r', '-i', pattern, 'core/', '--include=*.py'],
-                    capture_output=True,
-                    text=True
-                )
-
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    # Filter out comments and variable names
-                    for line in lines:
-                        if '=' in line and not line.strip().startswith('#'):
-                            # Check if actual value assigned (not just variable name)
-                            if '"' in line or "'" in line:
-                                found_secrets.append(line.strip())
+            # One scan of core/ for every pattern (previously one grep per keyword)
+            found_secrets = SecretScanner(include=('*.py',)).scan(PROJECT_ROOT / 'core')
 
             if found_secrets:
+                locations = ', '.join(f"core/{finding['file']}:{finding['line']}" for finding in found_secrets[:5])
+                if len(found_secrets) > 5:
+                    locations += f" (+{len(found_secrets) - 5} more)"
                 self.add_finding(
                     'high',
                     'Secrets Management',
                     'Potential hardcoded secrets found',
-                    f"Found {len(found_secrets)} potential hardcoded secrets in code",
+                    f"Found {len(found_secrets)} potential hardcoded secrets in code: {locations}",
                     'Move secrets to environment variables or secret management system'
                 )
                 self.checks_failed += 1
@@ -125,6 +125,56 @@ def test_penpot_extractor():
         logger.error(f"✗ Penpot Extractor test failed: {str(e)}")
         return create_mock_penpot_data()  # Return mock data anyway
 
+def create_mock_penpot_archive(archive_path: Path) -> Path:
+    """Write create_mock_penpot_data() out as a .penpot zip archive"""
+    import zipfile
+
+    mock_data = create_mock_penpot_data()
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('manifest.json', json.dumps({'files': [{'name': 'Test Design File', 'features': []}]}))
+        for file_id, file_data in mock_data['files'].items():
+            zf.writestr(f'files/{file_id}/{file_id}.json', json.dumps(file_data['metadata']))
+            for page_id, page_data in file_data['pages'].items():
+                page_dir = f'files/{file_id}/pages/{page_id}'
+                zf.writestr(f'{page_dir}/{page_id}.json', json.dumps(page_data['metadata']))
+                for object_id, object_data in page_data['objects'].items():
+                    zf.writestr(f'{page_dir}/{object_id}.json', json.dumps(object_data))
+    return archive_path
+
+def test_penpot_archive_streaming():
+    """Test zero-extract parsing and page/object streaming of a .penpot archive"""
+    logger.info("Testing Penpot archive streaming...")
+
+    import tempfile
+    from core.penpot_extractor import PenpotExtractor
+
+    mock_data = create_mock_penpot_data()
+    expected_objects = mock_data['files']['test_file_1']['pages']['page_1']['objects']
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = create_mock_penpot_archive(Path(tmp_dir) / 'mock.penpot')
+        extractor = PenpotExtractor(max_workers=2)
+
+        extracted = extractor.extract_penpot_file(str(archive))
+        page = extracted['files']['test_file_1']['pages']['page_1']
+        assert page['objects'] == expected_objects
+        assert page['metadata']['name'] == 'Main Page'
+        assert extracted['total_objects'] == len(expected_objects)
+        assert extracted['extraction_metadata']['extracted_files_count'] == 3 + len(expected_objects)
+        assert extractor.get_file_summary(extracted)['file_name'] == 'Test Design File'
+
+        # Nothing extracted next to the source file
+        assert [p.name for p in Path(tmp_dir).iterdir()] == ['mock.penpot']
+
+        pages = list(extractor.iter_pages(str(archive)))
+        assert [(file_id, page_id) for file_id, page_id, _ in pages] == [('test_file_1', 'page_1')]
+        assert pages[0][2] == page
+
+        objects = {object_id: obj for _, _, object_id, obj in extractor.iter_objects(str(archive))}
+        assert objects == expected_objects
+
+    logger.info(f"✓ Penpot archive streaming test passed: {len(objects)} objects streamed")
+
 def test_component_detector(extracted_data: Dict[str, Any]):
     """Test the component detector"""
     logger.info("Testing Component Detector...")
@@ -342,6 +392,7 @@ def run_integration_test():
     try:
         # Test full pipeline
         extracted_data = test_penpot_extractor()
+        test_penpot_archive_streaming()
         components = test_component_detector(extracted_data)
         persona_results = test_persona_analyzers(extracted_data, components)
         cross_insights = test_analysis_engine(persona_results)
@@ -498,6 +498,57 @@ def test_full_component_analysis():
     return True
 
 
+def test_detect_duplicate_components():
+    """Test 11: Blocked duplicate detection matches the all-pairs scan."""
+    print("\n" + "=" * 70)
+    print("Test 11: Duplicate Component Detection")
+    print("=" * 70)
+
+    import random
+
+    atom = AtomComponentAnalysis()
+    rng = random.Random(7)
+
+    components = {}
+    for index in range(300):
+        component = {
+            'type': rng.choice(['Button', 'button', 'Input', 'Card', '']),
+            'foreground_color': rng.choice(['#FFFFFF', '#000000', '#1A73E8', '']),
+            'background_color': rng.choice(['#FFFFFF', '#E8EAED', '']),
+            'children': [{}] * rng.randint(0, 3)
+        }
+        if rng.random() < 0.8:
+            component['width'] = rng.choice([0, rng.randint(20, 300), rng.uniform(20, 300)])
+            component['height'] = rng.choice([0, rng.randint(16, 64)])
+        components[f'component-{index}'] = component
+
+    component_list = list(components.values())
+
+    for threshold in [0.5, 0.7, 0.85, 0.92]:
+        expected = []
+        for i in range(len(component_list)):
+            for j in range(i + 1, len(component_list)):
+                similarity = atom._calculate_component_similarity(component_list[i], component_list[j])
+                if similarity >= threshold:
+                    expected.append((i, j, similarity))
+
+        pairs, stats = atom._find_similar_pairs(component_list, threshold)
+        assert pairs == expected, f"Blocked pairs should match the all-pairs scan at {threshold}"
+        assert stats['pairs_total'] == 300 * 299 // 2
+
+    result = atom.detect_duplicate_components(components, similarity_threshold=0.85)
+    analysis = result['duplicate_analysis']
+    assert analysis['total_components'] == 300
+    assert analysis['pairs_compared'] < analysis['pairs_total'], "Blocking should skip impossible pairs"
+    scores = [group['similarity_score'] for group in analysis['duplicate_groups']]
+    assert scores == sorted(scores, reverse=True), "Duplicates should be sorted by similarity"
+
+    print("✅ PASSED: Blocked duplicate detection matches the all-pairs scan")
+    print(f"   Pairs compared: {analysis['pairs_compared']:,} of {analysis['pairs_total']:,}")
+    print(f"   Duplicate pairs: {analysis['duplicate_pairs_found']}")
+    return True
+
+
 def run_all_tests():
     """Run complete test suite."""
     print("\n🔬 The Atom - Component Analysis Test Suite")
@@ -516,6 +567,7 @@ def run_all_tests():
         ("Test Accessibility Patterns", test_accessibility_patterns),
         ("Calculate Component Score", test_calculate_component_score),
         ("Full Component Analysis", test_full_component_analysis),
+        ("Duplicate Component Detection", test_detect_duplicate_components),
     ]
 
     passed = 0
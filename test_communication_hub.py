@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+🦸 SUPERMAN COMMUNICATION HUB - Bounded Delivery Test Suite
+===========================================================
+
+Tests for the communication hub's ring-buffered history, indexed
+per-hero inboxes, threaded delivery with backpressure, delivery stats
+and spilling of evicted history to disk.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.superman_communication import HeroCommunicationHub
+from core.justice_league.hero_base import HeroBase, HeroMessage
+
+
+class SlowHero(HeroBase):
+    """Hero whose inbox processing blocks until released"""
+
+    def __init__(self, name, release):
+        super().__init__(name, "🐢")
+        self.release = release
+
+    def receive_message(self, message):
+        self.release.wait(5)
+        super().receive_message(message)
+
+
+def send(hub, from_hero, to_hero, content, message_type="share_finding"):
+    hub.route_message(HeroMessage(from_hero, to_hero, message_type, content))
+
+
+def league(hub, names=("Batman", "Wonder Woman", "Flash")):
+    heroes = {name: HeroBase(name, "🦸") for name in names}
+    for name, hero in heroes.items():
+        hub.register_hero(name, hero)
+    return heroes
+
+
+def test_ring_buffered_history():
+    """Test 1: History, conversations and inboxes are bounded."""
+    print("\n" + "=" * 70)
+    print("Test 1: Ring-Buffered History")
+    print("=" * 70)
+
+    hub = HeroCommunicationHub(history_size=100, inbox_size=20, delivery_workers=0)
+    league(hub)
+
+    for i in range(1000):
+        send(hub, "Batman", "Flash", {"finding": i})
+
+    assert len(hub.message_history) == 100
+    assert hub.message_history[0].content["finding"] == 900
+    assert len(hub.conversations["Batman_Flash"]) == 20
+    assert len(hub.get_all_messages_for_hero("Flash")) == 20
+
+    stats = hub.get_stats()
+    assert stats["total_messages"] == 1000 and stats["retained_messages"] == 100
+    assert stats["message_types"] == {"share_finding": 1000}
+    assert stats["most_active_heroes"] == [{"hero": "Batman", "message_count": 1000}]
+    assert stats["delivery"]["delivered"] == 1000
+    hub.close()
+
+    print("✅ PASSED: 1000 messages kept in 100-slot history")
+    return True
+
+
+def test_indexed_inboxes():
+    """Test 2: Per-hero lookups come from indexes, in routing order."""
+    print("\n" + "=" * 70)
+    print("Test 2: Indexed Inboxes")
+    print("=" * 70)
+
+    hub = HeroCommunicationHub(delivery_workers=0)
+    heroes = league(hub)
+
+    heroes["Batman"].request_help("Wonder Woman", "Check button contrast")
+    hub.broadcast("Flash", "share_finding", {"lcp": 1800})
+    send(hub, "Wonder Woman", "Batman", {"issue": "Missing ARIA label"})
+    heroes["Flash"].request_help("Batman", "Verify slow page")
+
+    ww = [(m["from_hero"], m["message_type"]) for m in hub.get_all_messages_for_hero("Wonder Woman")]
+    assert ww == [("Batman", "request_help"), ("Flash", "share_finding"),
+                  ("Wonder Woman", "share_finding")], ww
+
+    pending = hub.get_pending_requests("Wonder Woman")
+    assert [m["content"]["message"] for m in pending] == ["Check button contrast"]
+    assert hub.get_pending_requests("Flash") == []
+    hub.clear_queue()
+    assert hub.get_pending_requests("Wonder Woman") == []
+
+    assert len(hub.get_conversation("Batman", "Wonder Woman")) == 2
+    assert len(heroes["Wonder Woman"].message_inbox) == 2
+    hub.close()
+
+    print("✅ PASSED: Inboxes merge direct messages and broadcasts")
+    return True
+
+
+def test_threaded_delivery():
+    """Test 3: Senders do not wait for slow recipients; order is preserved."""
+    print("\n" + "=" * 70)
+    print("Test 3: Threaded Delivery")
+    print("=" * 70)
+
+    release = threading.Event()
+    hub = HeroCommunicationHub(delivery_workers=4)
+    heroes = league(hub, ("Batman", "Flash"))
+    slow = SlowHero("Aquaman", release)
+    hub.register_hero("Aquaman", slow)
+
+    start = time.time()
+    for i in range(200):
+        hub.broadcast("Batman", "share_finding", {"sequence": i})
+    routing_time = time.time() - start
+    assert routing_time < 1.0, f"Broadcasts waited on Aquaman ({routing_time:.2f}s)"
+
+    # Flash is not held up by Aquaman
+    assert hub.flush(timeout=0.2) is False
+    deadline = time.time() + 5
+    while len(heroes["Flash"].message_inbox) < 200 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(heroes["Flash"].message_inbox) == 200
+    assert slow.message_inbox == []
+
+    release.set()
+    assert hub.flush(timeout=5)
+    for hero in (heroes["Flash"], slow):
+        assert [m.content["sequence"] for m in hero.message_inbox] == list(range(200))
+    hub.close()
+
+    print(f"✅ PASSED: 200 broadcasts routed in {routing_time * 1000:.1f}ms, delivered in order")
+    return True
+
+
+def test_backpressure_and_stats():
+    """Test 4: A full delivery queue blocks senders and reports its depth."""
+    print("\n" + "=" * 70)
+    print("Test 4: Backpressure and Stats")
+    print("=" * 70)
+
+    release = threading.Event()
+    hub = HeroCommunicationHub(delivery_workers=2, max_pending=10, backpressure_timeout=0.2)
+    hub.register_hero("Batman", HeroBase("Batman", "🦇"))
+    slow = SlowHero("Aquaman", release)
+    hub.register_hero("Aquaman", slow)
+
+    for i in range(10):
+        send(hub, "Batman", "Aquaman", {"sequence": i})
+    assert hub.get_stats()["delivery"]["queue_depth"] == 10
+
+    start = time.time()
+    send(hub, "Batman", "Aquaman", {"sequence": 10})
+    assert time.time() - start >= 0.2, "Sender blocked on the full queue"
+    assert hub.get_stats()["delivery"]["dropped"] == 1
+
+    # A blocked sender proceeds as soon as deliveries drain
+    sender = threading.Thread(target=send, args=(hub, "Batman", "Aquaman", {"sequence": 11}))
+    sender.start()
+    time.sleep(0.05)
+    release.set()
+    sender.join(5)
+    assert hub.flush(timeout=5)
+
+    stats = hub.get_stats()["delivery"]
+    assert stats["queue_depth"] == 0 and stats["delivered"] == 11
+    assert stats["p95_latency_ms"] >= stats["avg_latency_ms"] > 0, stats
+    assert [m.content["sequence"] for m in slow.message_inbox] == list(range(10)) + [11]
+    assert "Delivery Queue Depth: 0" in hub.generate_communication_report()
+    hub.close()
+
+    print(f"✅ PASSED: Backpressure with p95 latency {stats['p95_latency_ms']}ms")
+    return True
+
+
+def test_spill_to_disk():
+    """Test 5: Messages evicted from history are spilled to JSON lines."""
+    print("\n" + "=" * 70)
+    print("Test 5: Spill to Disk")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        hub = HeroCommunicationHub(history_size=50, spill_dir=tmp)
+        league(hub)
+        for i in range(120):
+            hub.broadcast("Flash", "share_finding", {"finding": i})
+        hub.flush()
+
+        spilled = list(hub.iter_spilled())
+        assert len(spilled) == 70
+        assert [m["content"]["finding"] for m in spilled] == list(range(70))
+        assert hub.message_history[0].content["finding"] == 70
+        assert hub.get_stats()["spilled_messages"] == 70
+
+        hub.close()
+        assert len((Path(tmp) / "hero_messages.jsonl").read_text().splitlines()) == 70
+
+        unspilled = HeroCommunicationHub(history_size=5)
+        for i in range(10):
+            unspilled.broadcast("Flash", "share_finding", {"finding": i})
+        assert list(unspilled.iter_spilled()) == []
+        unspilled.close()
+
+    print("✅ PASSED: 70 evicted messages spilled in order")
+    return True
+
+
+def run_all_tests():
+    """Run all communication hub tests."""
+    print("\n" + "=" * 70)
+    print("🦸 SUPERMAN COMMUNICATION HUB - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Ring-Buffered History", test_ring_buffered_history),
+        ("Indexed Inboxes", test_indexed_inboxes),
+        ("Threaded Delivery", test_threaded_delivery),
+        ("Backpressure and Stats", test_backpressure_and_stats),
+        ("Spill to Disk", test_spill_to_disk),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+🎨 FIGMA CLIENT - Shared Figma API Client Test Suite
+====================================================
+
+Tests for the pooled Figma client the heroes share: token-bucket rate
+limiting, the version-keyed memory/disk response cache, in-flight request
+coalescing, retries, and the heroes all fetching through one client.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.figma_client import FigmaClient, FigmaRateLimiter, get_figma_client
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return self._payload
+
+
+class FakeFigmaApi:
+    """Session stand-in serving one file whose version can be bumped"""
+
+    def __init__(self, version='v1', delay=0.0, script=None):
+        self.version = version
+        self.delay = delay
+        self.script = list(script or [])
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def document(self):
+        frame = {'id': '1:2', 'name': 'Card', 'type': 'FRAME',
+                 'absoluteBoundingBox': {'x': 0, 'y': 0, 'width': 320, 'height': 200},
+                 'fills': [{'type': 'SOLID', 'color': {'r': 1, 'g': 0, 'b': 0}}],
+                 'layoutMode': 'VERTICAL', 'paddingTop': 16, 'itemSpacing': 8,
+                 'children': [{'id': '1:3', 'name': 'Title', 'type': 'TEXT'}]}
+        page = {'id': '0:1', 'name': 'Page 1', 'type': 'CANVAS', 'children': [frame]}
+        return {'id': '0:0', 'name': 'Document', 'type': 'DOCUMENT', 'children': [page]}, frame
+
+    def get(self, url, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append(url)
+            scripted = self.script.pop(0) if self.script else None
+        if self.delay:
+            time.sleep(self.delay)
+        if scripted is not None:
+            return scripted
+
+        document, frame = self.document()
+        meta = {'name': 'Design', 'version': self.version, 'lastModified': f"modified-{self.version}"}
+        if '/nodes?' in url:
+            return FakeResponse(payload=dict(meta, nodes={'1:2': {'document': frame}}))
+        if 'depth=1' in url:
+            return FakeResponse(payload=dict(meta, document=dict(document, children=[])))
+        return FakeResponse(payload=dict(meta, document=document))
+
+
+def make_client(api, cache_dir, **kwargs):
+    client = FigmaClient('token', cache_dir=cache_dir, backoff=0.01, **kwargs)
+    client.session = api
+    return client
+
+
+def test_token_bucket():
+    """Test 1: Token bucket pacing, burst and shared pause."""
+    print("\n" + "=" * 70)
+    print("Test 1: Token Bucket Rate Limiter")
+    print("=" * 70)
+
+    limiter = FigmaRateLimiter(rate=20, burst=3)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    burst_time = time.monotonic() - start
+    for _ in range(4):
+        limiter.acquire()
+    paced_time = time.monotonic() - start
+    assert burst_time < 0.05, f"Burst should not wait ({burst_time:.3f}s)"
+    assert paced_time >= 0.18, f"4 more tokens at 20/s take ~0.2s ({paced_time:.3f}s)"
+
+    # min_interval keeps its old meaning: one request per interval
+    legacy = FigmaRateLimiter(min_interval=0.05)
+    start = time.monotonic()
+    for _ in range(3):
+        legacy.acquire()
+    assert time.monotonic() - start >= 0.09
+
+    unlimited = FigmaRateLimiter()
+    unlimited.pause(0.1)
+    assert unlimited.paused and unlimited.rate_limit_hits == 1
+    assert unlimited.acquire() >= 0.09
+    assert not unlimited.paused
+
+    print(f"✅ PASSED: Burst in {burst_time * 1000:.1f}ms, then paced to 20/s")
+    return True
+
+
+def test_version_keyed_cache():
+    """Test 2: Responses are cached by version, revalidated and refreshed."""
+    print("\n" + "=" * 70)
+    print("Test 2: Version-Keyed Response Cache")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFigmaApi()
+        client = make_client(api, tmp)
+        first = client.get_file('FILE')
+        assert client.get_file('FILE') is first
+        assert client.get_document('FILE', '1:2')['name'] == 'Card'
+        assert len(api.calls) == 2, api.calls
+        assert client.stats()['memory_hits'] == 1
+
+        # A new process: disk entry revalidated with one cheap depth=1 request
+        api2 = FakeFigmaApi()
+        fresh = make_client(api2, tmp)
+        assert fresh.get_file('FILE')['document']['children'][0]['name'] == 'Page 1'
+        assert len(api2.calls) == 1 and 'depth=1' in api2.calls[0], api2.calls
+        fresh.get_nodes('FILE', ['1:2'])
+        assert len(api2.calls) == 1, "Version already checked within the interval"
+        assert fresh.stats()['disk_hits'] == 2
+
+        # The file changes: the next revalidation refetches
+        api2.version = 'v2'
+        fresh.invalidate('FILE')
+        assert fresh.get_file('FILE')['version'] == 'v2'
+        assert [url.split('/v1')[1] for url in api2.calls[1:]] == ['/files/FILE?depth=1', '/files/FILE']
+
+        # Responses without a version are never cached
+        api3 = FakeFigmaApi(version=None)
+        plain = make_client(api3, Path(tmp) / 'plain')
+        plain.get_file('FILE')
+        plain.get_file('FILE')
+        assert len(api3.calls) == 2
+        assert not (Path(tmp) / 'plain').exists()
+
+    print("✅ PASSED: Cached by version, one depth=1 check per interval")
+    return True
+
+
+def test_request_coalescing():
+    """Test 3: Concurrent callers share one in-flight fetch."""
+    print("\n" + "=" * 70)
+    print("Test 3: In-Flight Request Coalescing")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFigmaApi(delay=0.2)
+        client = make_client(api, tmp)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def fetch():
+            barrier.wait()
+            results.append(client.get_file('FILE'))
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(api.calls) == 1, api.calls
+        assert len(results) == 8 and all(result is results[0] for result in results)
+        assert client.stats()['coalesced'] == 7
+
+        # A failed fetch propagates to every waiter and is not remembered
+        failing = FakeFigmaApi(delay=0.2, script=[FakeResponse(404)])
+        client.session = failing
+        client.invalidate()
+        errors = []
+
+        def fetch_missing():
+            try:
+                client.get_file('MISSING')
+            except requests.HTTPError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fetch_missing) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(errors) == 4 and len(failing.calls) == 1
+        assert client.get_file('MISSING')['version'] == 'v1'
+
+    print("✅ PASSED: 8 concurrent callers, 1 request")
+    return True
+
+
+def test_retries():
+    """Test 4: 429 pauses the limiter, 5xx backs off, 4xx raises, stale copy on outage."""
+    print("\n" + "=" * 70)
+    print("Test 4: Retries and Outages")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFigmaApi(script=[FakeResponse(429, headers={'Retry-After': '0.1'}), FakeResponse(502)])
+        client = make_client(api, tmp)
+        start = time.monotonic()
+        assert client.get_images('FILE', ['1:2']) == {}
+        assert time.monotonic() - start >= 0.1
+        assert len(api.calls) == 3
+        assert client.rate_limiter.rate_limit_hits == 1
+        assert 'ids=1:2' in api.calls[0] and 'scale=2.0' in api.calls[0]
+
+        api.script = [FakeResponse(403)]
+        try:
+            client.get_file('FILE')
+            assert False, "403 should raise"
+        except requests.HTTPError:
+            pass
+        assert len(api.calls) == 4, "Client errors are not retried"
+
+        # Figma down: the cached copy is served instead of failing
+        client.get_file('FILE')
+        client.invalidate()
+        api.script = [FakeResponse(503)] * client.max_retries
+        assert client.get_file('FILE')['version'] == 'v1'
+        assert client.stats()['stale_served'] == 1
+
+    print("✅ PASSED: Retried, rate-limited and served stale on outage")
+    return True
+
+
+def test_heroes_share_client():
+    """Test 5: Quicksilver, Hawkman, Green Arrow and Superman fetch through one client."""
+    print("\n" + "=" * 70)
+    print("Test 5: Heroes Share One Client")
+    print("=" * 70)
+
+    from core.justice_league import QuicksilverSpeedExport
+    from core.justice_league.hawkman_equipped import HawkmanEquipped
+    from core.justice_league.green_arrow_visual_validator import GreenArrowVisualValidator
+    from core.superman_figma_integration import SupermanFigmaIntegration
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['FIGMA_CACHE_DIR'] = str(Path(tmp) / 'cache')
+        try:
+            token = 'shared-hero-token'
+            quicksilver = QuicksilverSpeedExport(figma_token=token, parsing_data_dir=str(Path(tmp) / 'qs'))
+            hawkman = HawkmanEquipped(figma_token=token, parsing_data_dir=str(Path(tmp) / 'hm'))
+            green_arrow = GreenArrowVisualValidator(validation_data_dir=str(Path(tmp) / 'ga'), figma_token=token)
+            superman = SupermanFigmaIntegration(token)
+
+            client = get_figma_client(token)
+            assert quicksilver.figma_client is hawkman.figma_client is green_arrow.figma_client is client
+            assert superman.client is client and quicksilver.rate_limiter is client.rate_limiter
+            assert client.cache_dir == Path(tmp) / 'cache'
+
+            api = FakeFigmaApi()
+            quicksilver.session = api
+            assert client.session is api
+
+            assert quicksilver.count_frames('FILE') == 1
+            assert hawkman.get_file_metadata('FILE')['total_frames'] == 1
+            assert quicksilver._fetch_figma_structure('FILE', '1:2')['name'] == 'Card'
+            assert superman.get_file_nodes('FILE', ['1:2'])['nodes']['1:2']['document']['type'] == 'FRAME'
+
+            specs = green_arrow.extract_figma_specs('FILE', '1:2')
+            assert specs['measurements']['width'] == 320
+            assert specs['layout']['layoutMode'] == 'VERTICAL' and specs['spacing']['paddingTop'] == 16
+            assert green_arrow.parse_figma_design_tokens(specs)['colors']['fill_0'] == '#ff0000'
+
+            assert len(api.calls) == 2, f"One file and one nodes fetch, got {api.calls}"
+
+            # API errors fall back to the placeholder results
+            specs = green_arrow.extract_figma_specs('FILE', '9:9')
+            assert specs['node_id'] == '9:9' and specs['measurements']['width'] is None
+
+            # No token: construction still works, API calls report the error
+            token_env = os.environ.pop('FIGMA_ACCESS_TOKEN', None)
+            try:
+                assert 'error' in SupermanFigmaIntegration('').get_file_data('FILE')
+            finally:
+                if token_env is not None:
+                    os.environ['FIGMA_ACCESS_TOKEN'] = token_env
+        finally:
+            os.environ.pop('FIGMA_CACHE_DIR', None)
+
+    print(f"✅ PASSED: 5 hero fetches served by {len(api.calls)} API requests")
+    return True
+
+
+def run_all_tests():
+    """Run all Figma client tests."""
+    print("\n" + "=" * 70)
+    print("🎨 FIGMA CLIENT - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Token Bucket Rate Limiter", test_token_bucket),
+        ("Version-Keyed Response Cache", test_version_keyed_cache),
+        ("In-Flight Request Coalescing", test_request_coalescing),
+        ("Retries and Outages", test_retries),
+        ("Heroes Share One Client", test_heroes_share_client),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
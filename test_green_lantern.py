@@ -22,7 +22,7 @@ from core.justice_league.green_lantern_visual import GreenLanternVisual
 
 # Check if PIL and NumPy are available
 try:
-    from PIL import Image
+    from PIL import Image, ImageDraw
     import numpy as np
     PIL_AVAILABLE = True
 except ImportError:
@@ -504,6 +504,153 @@ def test_full_integration():
         shutil.rmtree(source_dir, ignore_errors=True)
 
 
+def test_batch_compare_engine():
+    """Test 11: Batch compare with baseline cache, prechecks and process pool."""
+    if not PIL_AVAILABLE:
+        print("\n⚠️  SKIPPED: Test 11 - PIL not available")
+        return True
+
+    print("\n" + "=" * 70)
+    print("Test 11: Batch Compare Engine")
+    print("=" * 70)
+
+    temp_dir = tempfile.mkdtemp(prefix='gl_test_')
+
+    try:
+        gl = GreenLanternVisual(baseline_dir=temp_dir, use_npy_cache=True)
+
+        baseline_img = Image.new('RGB', (320, 240), color=(0, 255, 0))
+        ImageDraw.Draw(baseline_img).rectangle([40, 40, 200, 120], fill=(0, 0, 255))
+
+        baseline_path = Path(temp_dir) / 'baseline_batch.png'
+        baseline_img.save(baseline_path)
+        gl.store_baseline(str(baseline_path), 'batch-test')
+
+        # Byte-identical copy of the stored baseline
+        identical_path = Path(temp_dir) / 'identical.png'
+        shutil.copy(Path(temp_dir) / 'batch-test.png', identical_path)
+
+        # Same pixels, different encoding (not byte-identical)
+        reencoded_path = Path(temp_dir) / 'reencoded.png'
+        baseline_img.save(reencoded_path, compress_level=1)
+
+        # Clearly different
+        different_path = Path(temp_dir) / 'different.png'
+        Image.new('RGB', (320, 240), color=(255, 0, 0)).save(different_path)
+
+        batch = gl.batch_compare([
+            (str(identical_path), 'batch-test'),
+            (str(reencoded_path), 'batch-test'),
+            (str(different_path), 'batch-test'),
+            (str(Path(temp_dir) / 'missing.png'), 'batch-test'),
+        ], threshold=0.95, max_workers=2)
+
+        results = batch['results']
+        assert [r['test_name'] for r in results] == ['batch-test'] * 4, "Results should keep input order"
+        assert results[0]['comparison']['precheck'] == 'byte_identical'
+        assert results[0]['comparison']['similarity_score'] == 1.0
+        assert results[1]['comparison']['similarity_score'] == 1.0, "Re-encoded identical pixels should score 1.0"
+        assert results[1]['comparison']['precheck'] == 'pixel_identical'
+        assert results[2]['comparison']['is_regression'] == True
+        assert 'error' in results[3]['comparison']
+        assert batch['passed'] == 2 and batch['failed'] == 2
+        assert batch['prechecked'] >= 2
+
+        # A small local change is always scored by SSIM, never shortcut
+        touched_img = baseline_img.copy()
+        ImageDraw.Draw(touched_img).rectangle([250, 180, 270, 200], fill=(255, 0, 0))
+        touched_path = Path(temp_dir) / 'touched.png'
+        touched_img.save(touched_path)
+        touched = gl.compare_to_baseline(str(touched_path), 'batch-test')
+        assert touched['precheck'] is None and touched['similarity_score'] < 1.0
+
+        # Decoded baseline is memory-mapped next to the PNG and invalidated on re-store
+        gl.compare_to_baseline(str(reencoded_path), 'batch-test')
+        assert (Path(temp_dir) / 'batch-test.npy').exists(), "Baseline .npy cache should exist"
+        gl.store_baseline(str(different_path), 'batch-test')
+        assert not (Path(temp_dir) / 'batch-test.npy').exists(), "Re-stored baseline should drop its .npy cache"
+        assert gl.compare_to_baseline(str(different_path), 'batch-test')['similarity_score'] == 1.0
+
+        print(f"✅ PASSED: {batch['total_tests']} comparisons, {batch['prechecked']} settled by prechecks")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_tiled_comparison():
+    """Test 12: Tiled comparison matches whole-image SSIM and renders only changed bands."""
+    if not PIL_AVAILABLE:
+        print("\n⚠️  SKIPPED: Test 12 - PIL not available")
+        return True
+
+    print("\n" + "=" * 70)
+    print("Test 12: Tiled Comparison")
+    print("=" * 70)
+
+    temp_dir = tempfile.mkdtemp(prefix='gl_test_')
+
+    try:
+        gl = GreenLanternVisual(baseline_dir=temp_dir)
+
+        # Tall page with some structure so SSIM varies across bands
+        baseline_img = Image.new('RGB', (200, 1600), color=(255, 255, 255))
+        draw = ImageDraw.Draw(baseline_img)
+        for y in range(0, 1600, 80):
+            draw.rectangle([20, y + 10, 180, y + 40], fill=(30, 60, 200))
+        baseline_path = Path(temp_dir) / 'tall_baseline.png'
+        baseline_img.save(baseline_path)
+        gl.store_baseline(str(baseline_path), 'tall-page')
+
+        # One change in the band covering rows 1000-1100
+        changed_img = baseline_img.copy()
+        ImageDraw.Draw(changed_img).rectangle([50, 1020, 150, 1080], fill=(220, 0, 0))
+        changed_path = Path(temp_dir) / 'tall_changed.png'
+        changed_img.save(changed_path)
+
+        whole = gl.compare_to_baseline(str(changed_path), 'tall-page', tiled=False)
+        tiled = gl.compare_to_baseline(str(changed_path), 'tall-page', tiled=True,
+                                       tile_height=100, early_exit=False)
+
+        assert 'tiles' not in whole
+        assert abs(whole['similarity_score'] - tiled['similarity_score']) < 1e-6, \
+            "Tiled SSIM should equal whole-image SSIM"
+        assert tiled['pixel_difference_percent'] == whole['pixel_difference_percent']
+
+        tiles = tiled['tiles']
+        assert tiles['tiles_total'] == 16 and tiles['tiles_scanned'] == 16
+        assert tiles['changed_regions'] == [(1000, 1100)], "Only the edited band should be reported"
+        assert all(t['score'] == 1.0 for t in tiles['tile_scores'] if t['top'] != 1000)
+
+        # Diff image holds just the changed band (plus its label strip)
+        with Image.open(tiled['diff_image_path']) as diff_img:
+            assert diff_img.size == (600, 130)
+
+        # Early exit stops at the first band below threshold
+        early = gl.compare_to_baseline(str(changed_path), 'tall-page', threshold=0.999,
+                                       tiled=True, tile_height=100)
+        assert early['tiles']['early_exit'] == True
+        assert early['tiles']['tiles_scanned'] == 11
+        assert early['is_regression'] == True
+
+        # A failing band is a regression even when the bands scanned so far average above threshold
+        partial = gl.compare_to_baseline(str(changed_path), 'tall-page', threshold=0.95,
+                                         tiled=True, tile_height=100)
+        assert partial['tiles']['early_exit'] and partial['similarity_score'] > 0.95
+        assert partial['is_regression'] == True
+        assert partial['verdict']['color'] == 'red'
+
+        # Unchanged screenshot: nothing to render
+        identical = gl.compare_to_baseline(str(baseline_path), 'tall-page', tiled=True,
+                                           tile_height=100, pixel_precheck=False)
+        assert identical['similarity_score'] == 1.0
+
+        print(f"✅ PASSED: whole={whole['similarity_score']:.6f} tiled={tiled['similarity_score']:.6f}, "
+              f"early exit after {early['tiles']['tiles_scanned']}/{tiles['tiles_total']} bands")
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def run_all_tests():
     """Run complete test suite."""
     print("\n💚 Green Lantern Visual - Test Suite")
@@ -522,6 +669,8 @@ def run_all_tests():
         ("Generate Willpower Recommendations", test_generate_willpower_recommendations),
         ("Generate Summary Report", test_generate_report),
         ("Full Integration", test_full_integration),
+        ("Batch Compare Engine", test_batch_compare_engine),
+        ("Tiled Comparison", test_tiled_comparison),
     ]
 
     passed = 0
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+🦅 HAWKMAN EXPORT - Batched, Pooled, Resumable Frame Export Test Suite
+======================================================================
+
+Tests for HawkmanEquipped.export_all_frames_as_png: batched image-URL
+requests, concurrent CDN downloads on the shared Figma session, the
+unchanged directory layout and return values, and resuming from the
+export manifest.
+"""
+
+import json
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.hawkman_equipped import HawkmanEquipped
+from core.justice_league.export_manifest import MANIFEST_FILENAME
+from core.justice_league.figma_client import get_figma_client
+
+
+def make_png(width, height):
+    """Minimal RGBA PNG"""
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    row = b'\x00' + b'\x80' * (width * 4)
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b''))
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, content=b''):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return self._payload
+
+
+class FakeFigma:
+    """Figma API + CDN: `frames` frames on 'Home' (one in a SECTION) plus 3 on 'Settings: v2'"""
+
+    def __init__(self, frames=45, cdn_delay=0.0, broken=(), missing=()):
+        self.version = 'v1'
+        self.cdn_delay = cdn_delay
+        self.broken = set(broken)
+        self.missing = set(missing)
+        self.calls = []
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        home = [{'id': f'1:{i}', 'name': f'Frame {i}', 'type': 'FRAME'} for i in range(frames - 1)]
+        home.append({'id': 'S:1', 'name': 'Section', 'type': 'SECTION',
+                     'children': [{'id': f'1:{frames - 1}', 'name': 'Sectioned', 'type': 'COMPONENT'}]})
+        settings = [{'id': f'2:{i}', 'name': f'Settings/{i}', 'type': 'FRAME'} for i in range(3)]
+        settings.append({'id': '2:9', 'name': 'Note', 'type': 'TEXT'})
+        self.document = {'name': 'Design File', 'type': 'DOCUMENT', 'children': [
+            {'name': 'Home', 'type': 'CANVAS', 'children': home},
+            {'name': 'Settings: v2', 'type': 'CANVAS', 'children': settings},
+            {'name': 'Empty', 'type': 'CANVAS', 'children': []},
+        ]}
+
+    def cdn_calls(self):
+        return [url for url in self.calls if 'cdn.test' in url]
+
+    def image_calls(self):
+        return [url for url in self.calls if '/v1/images/' in url]
+
+    def get(self, url, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append(url)
+        if '/v1/files/' in url:
+            return FakeResponse(payload={'version': self.version, 'lastModified': self.version,
+                                         'document': self.document})
+        if '/v1/images/' in url:
+            ids = url.split('ids=')[1].split('&')[0].split(',')
+            return FakeResponse(payload={'images': {
+                node_id: None if node_id in self.missing else f'https://cdn.test/{node_id}.png'
+                for node_id in ids
+            }})
+
+        node_id = url.rsplit('/', 1)[1][:-4]
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.cdn_delay)
+            if node_id in self.broken:
+                return FakeResponse(500)
+            return FakeResponse(content=make_png(8, 6))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def make_hawkman(tmp, name, api):
+    token = f'hawkman-export-{name}'
+    get_figma_client(token, cache_dir=Path(tmp) / 'figma-cache')
+    hawkman = HawkmanEquipped(figma_token=token, parsing_data_dir=str(Path(tmp) / 'hawkman'))
+    hawkman.figma_client.session = api
+    hawkman.export_retries = 1
+    return hawkman
+
+
+def test_batched_layout():
+    """Test 1: Batched URL requests, same layout and return values."""
+    print("\n" + "=" * 70)
+    print("Test 1: Batched Requests and Layout")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFigma(frames=45)
+        hawkman = make_hawkman(tmp, 'layout', api)
+        exported = hawkman.export_all_frames_as_png('FILE', output_dir=str(Path(tmp) / 'out'))
+
+        assert len(exported) == 48
+        assert len(api.image_calls()) == 3, "48 nodes in batches of 20"
+        assert len(api.cdn_calls()) == 48
+
+        # Traversal order, original keys, {file}/{page}/{node}_{id}.png
+        assert exported[0] == {
+            'node_name': 'Frame 0', 'node_type': 'FRAME', 'page_name': 'Home', 'node_id': '1:0',
+            'file_path': str(Path(tmp) / 'out' / 'Design-File' / 'Home' / 'Frame-0_1:0.png')
+        }
+        assert exported[44]['node_type'] == 'COMPONENT' and exported[44]['node_name'] == 'Sectioned'
+        assert exported[45]['file_path'] == str(Path(tmp) / 'out' / 'Design-File' / 'Settings-v2' / 'Settings0_2:0.png')
+        assert not (Path(tmp) / 'out' / 'Design-File' / 'Empty').exists()
+
+        # Frames are written as downloaded (Hawkman does not flatten)
+        assert Path(exported[0]['file_path']).read_bytes() == make_png(8, 6)
+        manifest = json.loads((Path(tmp) / 'out' / 'Design-File' / MANIFEST_FILENAME).read_text())
+        assert manifest['frames']['Home/Frame-0_1:0.png']['width'] == 8
+        assert manifest['meta']['hawkman_export'] == {'file_key': 'FILE', 'version': 'v1', 'scale': 2.0}
+        assert not list(Path(tmp).rglob('*.tmp'))
+
+    print(f"✅ PASSED: 48 frames with {len(api.image_calls())} image-URL requests")
+    return True
+
+
+def test_concurrent_downloads():
+    """Test 2: CDN downloads run concurrently on the pooled session."""
+    print("\n" + "=" * 70)
+    print("Test 2: Concurrent Downloads")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFigma(frames=13, cdn_delay=0.1)
+        hawkman = make_hawkman(tmp, 'concurrent', api)
+        start = time.time()
+        exported = hawkman.export_all_frames_as_png('FILE', output_dir=str(Path(tmp) / 'out'))
+        duration = time.time() - start
+
+        assert len(exported) == 16
+        assert api.max_active > 1, "Downloads overlap"
+        assert api.max_active <= hawkman.export_workers
+        assert duration < 16 * 0.1 * 0.6, f"16 downloads of 100ms took {duration:.2f}s"
+
+    print(f"✅ PASSED: 16 downloads in {duration:.2f}s, {api.max_active} at once")
+    return True
+
+
+def test_failures_and_progress():
+    """Test 3: Failed nodes are skipped, progress reaches the total."""
+    print("\n" + "=" * 70)
+    print("Test 3: Failures and Progress")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFigma(frames=10, broken={'1:3'}, missing={'2:1'})
+        hawkman = make_hawkman(tmp, 'failures', api)
+        progress = []
+        exported = hawkman.export_all_frames_as_png(
+            'FILE', output_dir=str(Path(tmp) / 'out'),
+            progress_callback=lambda current, total, name: progress.append((current, total, name))
+        )
+
+        ids = [item['node_id'] for item in exported]
+        assert len(exported) == 11 and '1:3' not in ids and '2:1' not in ids
+        assert [current for current, _, _ in progress] == list(range(1, 14))
+        assert {total for _, total, _ in progress} == {13}
+        assert {name for _, _, name in progress} >= {'Frame 3', 'Settings/1'}
+
+    print("✅ PASSED: 2 failures skipped, progress 13/13")
+    return True
+
+
+def test_resume_from_manifest():
+    """Test 4: A re-run only downloads what is missing."""
+    print("\n" + "=" * 70)
+    print("Test 4: Resume from Manifest")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / 'out')
+        api = FakeFigma(frames=30, broken={'1:4', '1:17', '2:2'})
+        hawkman = make_hawkman(tmp, 'resume', api)
+        first = hawkman.export_all_frames_as_png('FILE', output_dir=out)
+        assert len(first) == 30
+
+        # A frame deleted by hand is re-exported too
+        Path(first[0]['file_path']).unlink()
+
+        api.broken.clear()
+        api.calls.clear()
+        second = hawkman.export_all_frames_as_png('FILE', output_dir=out)
+        assert len(second) == 33
+        assert sorted(url.rsplit('/', 1)[1] for url in api.cdn_calls()) == ['1:0.png', '1:17.png', '1:4.png', '2:2.png']
+        assert len(api.image_calls()) == 1
+        assert [item['node_id'] for item in second] == [f'1:{i}' for i in range(30)] + ['2:0', '2:1', '2:2']
+
+        # Complete export: nothing to download
+        api.calls.clear()
+        assert len(hawkman.export_all_frames_as_png('FILE', output_dir=out)) == 33
+        assert api.cdn_calls() == [] and api.image_calls() == []
+
+    print("✅ PASSED: Re-run fetched only the 4 missing frames")
+    return True
+
+
+def test_resume_keyed_by_version_and_scale():
+    """Test 5: A new file version or scale re-exports everything."""
+    print("\n" + "=" * 70)
+    print("Test 5: Resume Keyed by Version and Scale")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / 'out')
+        api = FakeFigma(frames=5)
+        hawkman = make_hawkman(tmp, 'version', api)
+        hawkman.export_all_frames_as_png('FILE', output_dir=out)
+
+        api.calls.clear()
+        hawkman.export_all_frames_as_png('FILE', output_dir=out, scale=1.0)
+        assert len(api.cdn_calls()) == 8, "Scale change re-exports"
+        assert 'scale=1.0' in api.image_calls()[0]
+
+        api.version = 'v2'
+        hawkman.figma_client.invalidate('FILE')
+        api.calls.clear()
+        hawkman.export_all_frames_as_png('FILE', output_dir=out, scale=1.0)
+        assert len(api.cdn_calls()) == 8, "New file version re-exports"
+
+        manifest = json.loads((Path(out) / 'Design-File' / MANIFEST_FILENAME).read_text())
+        assert manifest['meta']['hawkman_export']['version'] == 'v2'
+
+        # A partial v3 export: the rerun re-fetches what v3 did not write, not the v2 leftovers
+        api.version = 'v3'
+        api.broken = {'1:1', '2:0'}
+        hawkman.figma_client.invalidate('FILE')
+        assert len(hawkman.export_all_frames_as_png('FILE', output_dir=out, scale=1.0)) == 6
+        api.broken.clear()
+        api.calls.clear()
+        assert len(hawkman.export_all_frames_as_png('FILE', output_dir=out, scale=1.0)) == 8
+        assert sorted(url.rsplit('/', 1)[1] for url in api.cdn_calls()) == ['1:1.png', '2:0.png']
+
+    print("✅ PASSED: Stale exports are not resumed")
+    return True
+
+
+def run_all_tests():
+    """Run all Hawkman export tests."""
+    print("\n" + "=" * 70)
+    print("🦅 HAWKMAN EXPORT - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Batched Requests and Layout", test_batched_layout),
+        ("Concurrent Downloads", test_concurrent_downloads),
+        ("Failures and Progress", test_failures_and_progress),
+        ("Resume from Manifest", test_resume_from_manifest),
+        ("Resume Keyed by Version and Scale", test_resume_keyed_by_version_and_scale),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -67,6 +67,50 @@ def test_basic_mission():
 
     return results
 
+def test_concurrent_assembly():
+    """Concurrent assembly must merge the same reports as the sequential path"""
+    print("\n🦸 Testing concurrent Justice League assembly...")
+
+    mission = {
+        'url': 'https://ui.shadcn.com/examples/dashboard',
+        'mcp_tools': {},
+        'design_data': {
+            'components': {
+                'button-primary': {
+                    'type': 'button',
+                    'text': 'Click me',
+                    'foreground_color': '#FFFFFF',
+                    'background_color': '#3B82F6'
+                }
+            }
+        },
+        'components': {
+            'button-primary': {'type': 'button', 'text': 'Click me'},
+            'input-default': {'type': 'textbox'}
+        },
+        'options': {
+            'test_interactive': False,
+            'test_visual': False,
+            'test_accessibility': True,
+            'test_performance': False,
+            'test_network': False,
+            'test_integrations': True,
+            'test_components': True,
+            'validate_ethics': False,
+        }
+    }
+
+    superman = SupermanCoordinator()
+    sequential = superman.assemble_justice_league(mission)
+    concurrent = superman.assemble_justice_league(mission, concurrent=True, max_workers=3, hero_timeout=60)
+
+    assert list(concurrent['hero_reports']) == list(sequential['hero_reports'])
+    assert concurrent['heroes_deployed'] == sequential['heroes_deployed']
+    assert concurrent['justice_league_score']['individual_scores'] == \
+        sequential['justice_league_score']['individual_scores']
+    assert concurrent['concurrent_assembly']['timed_out'] == []
+    print(f"  ✓ {len(concurrent['heroes_deployed'])} heroes merged in deterministic order")
+
 def test_individual_heroes():
     """Test each hero can be called individually"""
     print("\n🦸 Testing individual hero deployments...")
@@ -139,6 +183,9 @@ if __name__ == '__main__':
     # Test 3: Basic mission
     results = test_basic_mission()
 
+    # Test 4: Concurrent assembly
+    test_concurrent_assembly()
+
     print("\n" + "=" * 60)
     print("🦸 ALL TESTS COMPLETE!")
     print("=" * 60)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+🦸 SUPERMAN KNOWLEDGE BASE - Search & Persistence Test Suite
+============================================================
+
+Tests for the knowledge base's BM25 inverted index, batched access-count
+flushing and the append-only journal that replaced full-file rewrites.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.superman_knowledge_base import JusticeLeagueKnowledgeBase
+from core.justice_league.knowledge_index import BM25Index, document_terms, tokenize
+
+
+def seed(kb):
+    """Knowledge from the module example plus a second contrast entry"""
+    kb.add_knowledge("Batman", "best_practice",
+                     {"practice": "Always wait for dynamic content before testing",
+                      "reason": "Prevents flaky tests and false failures",
+                      "applies_to": ["button_testing", "form_validation"]},
+                     tags=["testing", "reliability", "dynamic_content"])
+    kb.add_knowledge("Wonder Woman", "pattern",
+                     {"issue": "Low contrast ratio", "solution": "Check contrast ratio >= 4.5:1 for normal text",
+                      "wcag_criterion": "1.4.3"},
+                     tags=["accessibility", "wcag", "color_contrast"])
+    kb.add_knowledge("Flash", "solution",
+                     {"problem": "Slow LCP (>2.5s)", "solution": "Optimize images, use CDN, implement lazy loading",
+                      "expected_improvement": "LCP < 2.5s"},
+                     tags=["performance", "lcp", "core_web_vitals"])
+    kb.add_knowledge("Cyborg", "learning",
+                     {"note": "Contrast checks in dark mode need the rendered background"},
+                     tags=["accessibility"])
+
+
+def test_bm25_ranking():
+    """Test 1: Tokenized BM25 ranking with usefulness first."""
+    print("\n" + "=" * 70)
+    print("Test 1: BM25 Ranking")
+    print("=" * 70)
+
+    assert tokenize("button_testing, WCAG-1.4.3") == ['button', 'testing', 'wcag', '1', '4', '3']
+    assert document_terms({"a": "contrast"}, tags=["contrast"])['contrast'] == 4
+
+    index = BM25Index()
+    index.add(0, document_terms("contrast contrast ratio"))
+    index.add(1, document_terms("contrast of images in a long sentence about many other things"))
+    index.add(2, document_terms("lazy loading"))
+    scores = index.search("contrast ratio")
+    assert set(scores) == {0, 1} and scores[0] > scores[1], scores
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb = JusticeLeagueKnowledgeBase(tmp, flush_interval=0)
+        seed(kb)
+
+        results = kb.search("contrast ratio")
+        assert [r['hero'] for r in results] == ["Wonder Woman", "Cyborg"], results
+        assert results[0]['relevance'] > results[1]['relevance'] > 0
+
+        # Prefix terms keep the old substring recall: 'test' finds 'testing'
+        assert [r['hero'] for r in kb.search("test")] == ["Batman"]
+        assert kb.search("nothing-matches-this") == []
+
+        # Usefulness still outranks relevance
+        kb.mark_useful(kb.get_by_hero("Cyborg")[0]['entry_id'], 2)
+        assert [r['hero'] for r in kb.search("contrast ratio")] == ["Cyborg", "Wonder Woman"]
+        kb.close()
+
+    print("✅ PASSED: BM25 relevance ranked behind usefulness score")
+    return True
+
+
+def test_filters():
+    """Test 2: Type and tag filters, empty query."""
+    print("\n" + "=" * 70)
+    print("Test 2: Type and Tag Filters")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb = JusticeLeagueKnowledgeBase(tmp, flush_interval=0)
+        seed(kb)
+
+        assert [r['hero'] for r in kb.search("contrast", knowledge_type="learning")] == ["Cyborg"]
+        assert [r['hero'] for r in kb.search("contrast", tags=["wcag"])] == ["Wonder Woman"]
+        assert len(kb.search("", tags=["accessibility"])) == 2
+        assert len(kb.search("", limit=3)) == 3
+        assert [r['hero'] for r in kb.search("", knowledge_type="solution")] == ["Flash"]
+
+        # Only the returned entries count as accessed
+        before = {e.entry_id: e.times_accessed for e in kb.knowledge}
+        returned = {r['entry_id'] for r in kb.search("contrast", limit=1)}
+        accessed = {e.entry_id for e in kb.knowledge if e.times_accessed > before[e.entry_id]}
+        assert accessed == returned and len(returned) == 1
+        kb.close()
+
+    print("✅ PASSED: Filters applied to index matches")
+    return True
+
+
+def test_append_only_journal():
+    """Test 3: Inserts and upvotes are journaled, not full rewrites."""
+    print("\n" + "=" * 70)
+    print("Test 3: Append-Only Journal")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb = JusticeLeagueKnowledgeBase(tmp, compact_threshold=1000, flush_interval=0)
+        seed(kb)
+        kb.search("contrast")
+        kb.mark_useful(kb.get_by_hero("Flash")[0]['entry_id'], 3)
+
+        assert not kb.knowledge_file.exists(), "No full rewrite before compaction"
+        ops = [json.loads(line)['op'] for line in kb.journal_file.read_text().splitlines()]
+        assert ops == ['add'] * 4 + ['access', 'useful'], ops
+
+        # A torn final write is ignored on replay
+        with open(kb.journal_file, 'a') as f:
+            f.write('{"op": "add", "entry": {"her')
+
+        reloaded = JusticeLeagueKnowledgeBase(tmp, flush_interval=0)
+        assert len(reloaded.knowledge) == 4
+        assert reloaded.get_by_hero("Flash")[0]['usefulness_score'] == 3
+        assert reloaded.get_by_hero("Cyborg")[0]['times_accessed'] == 1
+        assert [r['hero'] for r in reloaded.search("lazy")] == ["Flash"]
+
+        # Compaction folds the journal into the legacy-format snapshot
+        reloaded.close()
+        assert not reloaded.journal_file.exists()
+        snapshot = json.loads(reloaded.knowledge_file.read_text())
+        assert len(snapshot) == 4 and isinstance(snapshot, list)
+
+        small = JusticeLeagueKnowledgeBase(Path(tmp) / 'small', compact_threshold=3, flush_interval=0)
+        seed(small)
+        assert len(json.loads(small.knowledge_file.read_text())) == 3, "Compacted at 3 journal ops"
+        assert len(small.journal_file.read_text().splitlines()) == 1
+        small.close()
+
+    print("✅ PASSED: Journal replayed on load and compacted into the snapshot")
+    return True
+
+
+def test_background_access_flush():
+    """Test 4: Access counts are batched and flushed in the background."""
+    print("\n" + "=" * 70)
+    print("Test 4: Background Access Flush")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb = JusticeLeagueKnowledgeBase(tmp, flush_interval=0.5)
+        seed(kb)
+        journal_size = kb.journal_file.stat().st_size
+
+        for _ in range(50):
+            kb.search("contrast")
+        assert kb.journal_file.stat().st_size == journal_size, "Searches do not write synchronously"
+
+        deadline = time.time() + 5
+        while kb.journal_file.stat().st_size == journal_size and time.time() < deadline:
+            time.sleep(0.01)
+        lines = kb.journal_file.read_text().splitlines()
+        access = [json.loads(line) for line in lines if json.loads(line)['op'] == 'access']
+        assert len(access) == 1, "50 searches flushed as one batch"
+        assert set(access[0]['counts'].values()) == {50}
+
+        # Another instance on the same directory sees the counts and new entries
+        other = JusticeLeagueKnowledgeBase(tmp, flush_interval=0)
+        assert other.get_by_hero("Cyborg")[0]['times_accessed'] == 50
+        other.add_knowledge("Aquaman", "learning", {"note": "Compress contrast-heavy hero images"})
+        results = kb.search("contrast hero images")
+        assert results[0]['hero'] == "Aquaman", results
+        assert "Cyborg" in [r['hero'] for r in results]
+
+        kb.close()
+        other.close()
+        final = JusticeLeagueKnowledgeBase(tmp, flush_interval=0)
+        assert len(final.knowledge) == 5
+        assert final.get_by_hero("Cyborg")[0]['times_accessed'] == 51
+        final.close()
+
+    print("✅ PASSED: Access counts flushed as one batch")
+    return True
+
+
+def test_large_knowledge_base():
+    """Test 5: Search on tens of thousands of entries uses the index."""
+    print("\n" + "=" * 70)
+    print("Test 5: Large Knowledge Base")
+    print("=" * 70)
+
+    topics = ['contrast', 'lazy loading', 'flaky selectors', 'focus order', 'cache headers',
+              'bundle size', 'font swap', 'aria labels', 'layout shift', 'retry budget']
+    entries = [{
+        "entry_id": f"Hero{i % 12}_learning_{i}",
+        "hero": f"Hero{i % 12}",
+        "knowledge_type": "learning",
+        "content": {"topic": topics[i % len(topics)], "detail": f"observation {i} on page {i % 97}"},
+        "tags": [topics[i % len(topics)].replace(' ', '_')],
+        "timestamp": "2025-10-21T00:00:00",
+        "usefulness_score": 0,
+        "times_accessed": 0
+    } for i in range(30_000)]
+    entries.append(dict(entries[0], entry_id="needle", content={"topic": "zebra striping in data tables"}))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "justice_league_knowledge.json").write_text(json.dumps(entries))
+        kb = JusticeLeagueKnowledgeBase(tmp, flush_interval=60)
+        assert len(kb.knowledge) == 30_001
+
+        start = time.time()
+        for _ in range(20):
+            results = kb.search("zebra striping")
+        per_query = (time.time() - start) / 20
+        assert [r['entry_id'] for r in results] == ["needle"]
+        assert per_query < 0.01, f"Rare-term search took {per_query * 1000:.1f}ms"
+
+        assert len(kb.search("font swap", limit=5)) == 5
+        kb.close()
+
+    print(f"✅ PASSED: Rare-term search over 30k entries in {per_query * 1000:.2f}ms")
+    return True
+
+
+def run_all_tests():
+    """Run all knowledge base tests."""
+    print("\n" + "=" * 70)
+    print("🦸 SUPERMAN KNOWLEDGE BASE - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("BM25 Ranking", test_bm25_ranking),
+        ("Type and Tag Filters", test_filters),
+        ("Append-Only Journal", test_append_only_journal),
+        ("Background Access Flush", test_background_access_flush),
+        ("Large Knowledge Base", test_large_knowledge_base),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
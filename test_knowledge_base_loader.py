@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+🧠 KNOWLEDGE BASE LOADER - Compiled Cache Test Suite
+====================================================
+
+Tests for the compiled GLOBAL_BEST_PRACTICES.md cache: parsed sections
+match the markdown, the JSON artifact serves fresh processes, and edits
+to the markdown invalidate it automatically.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.knowledge_base_loader import KnowledgeBaseLoader
+
+PROJECT_KB = Path(__file__).parent / 'knowledge_base' / 'GLOBAL_BEST_PRACTICES.md'
+
+SAMPLE = """# Global Best Practices
+
+## 🪔 Ethical Design (Litty)
+
+✅ DO: Make cancellation as easy as sign-up
+❌ AVOID: Pre-checked consent boxes
+
+| Pattern | Description | Example |
+|---------|-------------|---------|
+| **Confirmshaming** | Guilt-tripping opt-outs | "No thanks, I hate saving money" |
+| **Roach Motel** | Easy in, hard out | Phone-only cancellation |
+
+- [ ] No hidden costs at checkout
+
+## ⚡ Performance (Flash)
+
+**Guidelines**:
+- Preload the LCP image
+- Defer third-party scripts
+
+```html
+<link rel="preload" as="image" href="hero.webp">
+```
+
+- [ ] LCP under 2.5s
+"""
+
+
+def make_kb(tmp, content=SAMPLE):
+    kb_dir = Path(tmp) / 'knowledge_base'
+    kb_dir.mkdir(exist_ok=True)
+    (kb_dir / 'GLOBAL_BEST_PRACTICES.md').write_text(content)
+    return kb_dir
+
+
+def test_sections_parsed():
+    """Test 1: Hero sections and the dark patterns table are parsed."""
+    print("\n" + "=" * 70)
+    print("Test 1: Sections Parsed")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = KnowledgeBaseLoader(make_kb(tmp))
+
+        flash = loader.get_hero_knowledge('Flash')
+        assert flash['guidelines'] == ['- Preload the LCP image', '- Defer third-party scripts']
+        assert flash['examples'][0]['language'] == 'html'
+        assert flash['checklist'] == ['LCP under 2.5s']
+
+        litty = loader.get_hero_knowledge('litty')
+        assert litty['best_practices'][1] == '❌ AVOID: Pre-checked consent boxes'
+        assert [p['pattern'] for p in loader.get_dark_patterns_list()] == ['Confirmshaming', 'Roach Motel']
+
+        assert loader.get_hero_knowledge('batman') == {'error': 'Section not found: 🦇 Interactive Elements (Batman)'}
+        assert 'available_heroes' in loader.get_hero_knowledge('superman')
+
+        # Callers can modify what they get without touching the cache
+        flash['checklist'].append('mutated')
+        assert loader.get_hero_knowledge('flash')['checklist'] == ['LCP under 2.5s']
+
+        missing = KnowledgeBaseLoader(Path(tmp) / 'nowhere')
+        assert missing.get_hero_knowledge('flash')['error'] == 'Knowledge base not found'
+        assert missing.get_dark_patterns_list() == []
+
+    print("✅ PASSED: Sections and dark patterns compiled once")
+    return True
+
+
+def test_artifact_serves_new_process():
+    """Test 2: A fresh loader reads the compiled artifact instead of parsing."""
+    print("\n" + "=" * 70)
+    print("Test 2: Compiled Artifact")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = make_kb(tmp)
+        first = KnowledgeBaseLoader(kb_dir)
+        first.get_wcag_guidelines()
+        artifact = json.loads(first.cache_path.read_text())
+        assert first.cache_path == kb_dir / '.cache' / 'GLOBAL_BEST_PRACTICES.json'
+        assert set(artifact['sections']) == {'litty', 'flash'}
+
+        fresh = KnowledgeBaseLoader(kb_dir)
+        fresh._compile = None  # Any parse would fail
+        assert fresh.get_hero_knowledge('flash')['checklist'] == ['LCP under 2.5s']
+        assert len(fresh.get_dark_patterns_list()) == 2
+
+    print("✅ PASSED: Fresh loader answered from the artifact")
+    return True
+
+
+def test_markdown_edit_invalidates():
+    """Test 3: Editing the markdown recompiles in memory and on disk."""
+    print("\n" + "=" * 70)
+    print("Test 3: Automatic Invalidation")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = make_kb(tmp)
+        loader = KnowledgeBaseLoader(kb_dir)
+        assert loader.get_hero_knowledge('flash')['checklist'] == ['LCP under 2.5s']
+
+        markdown = kb_dir / 'GLOBAL_BEST_PRACTICES.md'
+        markdown.write_text(SAMPLE.replace('LCP under 2.5s', 'LCP under 2.0s'))
+        stat = markdown.stat()
+        os.utime(markdown, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert loader.get_hero_knowledge('flash')['checklist'] == ['LCP under 2.0s']
+        assert KnowledgeBaseLoader(kb_dir).get_hero_knowledge('flash')['checklist'] == ['LCP under 2.0s']
+
+    print("✅ PASSED: Edited markdown recompiled")
+    return True
+
+
+def test_touch_without_change_reuses_artifact():
+    """Test 4: A new mtime with the same content re-validates by hash only."""
+    print("\n" + "=" * 70)
+    print("Test 4: Hash Re-Validation")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = make_kb(tmp)
+        KnowledgeBaseLoader(kb_dir).get_hero_knowledge('flash')
+
+        markdown = kb_dir / 'GLOBAL_BEST_PRACTICES.md'
+        os.utime(markdown, (time.time() + 60, time.time() + 60))
+
+        touched = KnowledgeBaseLoader(kb_dir)
+        touched._compile = None
+        assert touched.get_hero_knowledge('flash')['checklist'] == ['LCP under 2.5s']
+        artifact = json.loads(touched.cache_path.read_text())
+        assert artifact['source_stamp'][0] == markdown.stat().st_mtime_ns
+
+        # Corrupt or outdated artifacts are rebuilt
+        touched.cache_path.write_text('{"version": 0')
+        assert KnowledgeBaseLoader(kb_dir).get_hero_knowledge('litty')['checklist'] == ['No hidden costs at checkout']
+
+        # A read-only location only costs the disk cache
+        unwritable = KnowledgeBaseLoader(kb_dir, cache_path=str(markdown / 'cache.json'))
+        assert unwritable.get_hero_knowledge('flash')['checklist'] == ['LCP under 2.5s']
+
+    print("✅ PASSED: Touched markdown kept its compiled artifact")
+    return True
+
+
+def test_project_knowledge_base():
+    """Test 5: The shipped knowledge base compiles and queries stay cheap."""
+    print("\n" + "=" * 70)
+    print("Test 5: Project Knowledge Base")
+    print("=" * 70)
+
+    if not PROJECT_KB.exists():
+        print("⚠️ knowledge_base/GLOBAL_BEST_PRACTICES.md not found, skipping")
+        return True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = Path(tmp) / 'knowledge_base'
+        kb_dir.mkdir()
+        shutil.copy(PROJECT_KB, kb_dir)
+        loader = KnowledgeBaseLoader(kb_dir)
+
+        assert len(loader.get_dark_patterns_list()) == 15
+        assert loader.get_wcag_guidelines()['checklist']
+
+        start = time.time()
+        for _ in range(1000):
+            for hero in loader.hero_sections:
+                loader.get_hero_knowledge(hero)
+        per_query = (time.time() - start) / (1000 * len(loader.hero_sections))
+        assert per_query < 0.001, f"{per_query * 1000:.3f}ms per query"
+
+    print(f"✅ PASSED: {per_query * 1_000_000:.1f}µs per hero query")
+    return True
+
+
+def run_all_tests():
+    """Run all knowledge base loader tests."""
+    print("\n" + "=" * 70)
+    print("🧠 KNOWLEDGE BASE LOADER - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Sections Parsed", test_sections_parsed),
+        ("Compiled Artifact", test_artifact_serves_new_process),
+        ("Automatic Invalidation", test_markdown_edit_invalidates),
+        ("Hash Re-Validation", test_touch_without_change_reuses_artifact),
+        ("Project Knowledge Base", test_project_knowledge_base),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
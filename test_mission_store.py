@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+🔮 MISSION STORE - Mission Logger Persistence Test Suite
+========================================================
+
+Tests for the SQLite mission store behind Oracle's MissionLogger:
+append-only writes, running counters, indexed history queries, the
+one-time import of the legacy missions JSON file and concurrent writers.
+"""
+
+import json
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.mission_logger import MissionLogger
+from core.justice_league.mission_store import MissionStore
+
+START = datetime(2025, 10, 1, 9, 0, 0)
+
+
+def mission(i, mission_type="conversion", success=True, day=0):
+    """Completed mission dict as MissionLogger builds it"""
+    return {
+        "mission_id": f"mission_{i}",
+        "user_request": f"Request {i}",
+        "mission_type": mission_type,
+        "context": {},
+        "start_time": (START + timedelta(days=day, minutes=i)).isoformat(),
+        "strategy_session": None,
+        "execution": {"heroes_deployed": [], "actions": [], "duration_seconds": 12.5},
+        "outcome": {"success": success, "details": {}, "issues_encountered": []},
+        "learnings": [{"type": "decision_quality"}] * 2
+    }
+
+
+def run_mission(logger, mission_type, success, hero="Artemis"):
+    logger.start_mission(f"Convert the {mission_type} page", mission_type)
+    logger.log_strategy_session("Approach", [hero], [{"hero": hero}], {"choice": "image-to-html"}, {})
+    logger.log_hero_deployment(hero, "🎨", "Generate code")
+    return logger.complete_mission(success, {"accuracy": 92})
+
+
+def append_in_process(db_path, worker, count):
+    logger = MissionLogger(db_path)
+    for i in range(count):
+        run_mission(logger, f"worker_{worker}", i % 2 == 0)
+
+
+def test_append_and_statistics():
+    """Test 1: Completed missions are appended and counted."""
+    print("\n" + "=" * 70)
+    print("Test 1: Append and Statistics")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        logger = MissionLogger(str(Path(tmp) / "missions.json"))
+        run_mission(logger, "conversion", True)
+        run_mission(logger, "conversion", False)
+        run_mission(logger, "analysis", True)
+
+        assert not (Path(tmp) / "missions.json").exists(), "The JSON file is no longer written"
+        assert logger.store.db_path == Path(tmp) / "missions.db"
+
+        stats = logger.get_statistics()
+        assert stats["total_missions"] == 3
+        assert stats["success_count"] == 2 and stats["failure_count"] == 1
+        assert round(stats["success_rate"], 1) == 66.7
+        assert stats["learnings_extracted"] == 3 * 3
+        assert stats["by_mission_type"] == {"conversion": {"total": 2, "success": 1},
+                                            "analysis": {"total": 1, "success": 1}}
+
+        latest = logger.get_mission_history(limit=1)[0]
+        assert latest["mission_type"] == "analysis"
+        assert latest["learnings"][0]["type"] == "methodology_effectiveness"
+
+    print("✅ PASSED: Missions appended, counters maintained in the same transaction")
+    return True
+
+
+def test_indexed_queries():
+    """Test 2: History filters by type, outcome and time range."""
+    print("\n" + "=" * 70)
+    print("Test 2: Indexed Queries")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MissionStore(Path(tmp) / "missions.db")
+        for i in range(30):
+            store.append(mission(i, "conversion" if i % 3 else "analysis", success=i % 4 != 0, day=i))
+
+        recent = store.query(limit=5)
+        assert [m["mission_id"] for m in recent] == [f"mission_{i}" for i in range(29, 24, -1)]
+
+        analysis = store.query(limit=None, mission_type="analysis")
+        assert [m["mission_id"] for m in analysis] == [f"mission_{i}" for i in range(27, -1, -3)]
+
+        failed = store.query(limit=None, success=False)
+        assert len(failed) == 8 and all(not m["outcome"]["success"] for m in failed)
+
+        window = store.query(limit=None, since=START + timedelta(days=10), until=START + timedelta(days=13))
+        assert [m["mission_id"] for m in window] == ["mission_12", "mission_11", "mission_10"]
+
+        plan = " ".join(row[3] for row in store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM missions WHERE mission_type = ? ORDER BY start_time DESC",
+            ("analysis",)))
+        assert "missions_type_time" in plan, plan
+        store.close()
+
+    print("✅ PASSED: Type, outcome and time-range queries use the indexes")
+    return True
+
+
+def test_legacy_json_import():
+    """Test 3: The existing missions JSON database is imported once."""
+    print("\n" + "=" * 70)
+    print("Test 3: Legacy JSON Import")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "missions.json"
+        missions = [mission(i, success=i != 3) for i in range(10)]
+        legacy.write_text(json.dumps({
+            "missions": missions,
+            "total_missions": 10,
+            "success_count": 9,
+            "failure_count": 1,
+            "learnings_extracted": 20,
+            "skills_evolved": 4
+        }, indent=2))
+
+        logger = MissionLogger(str(legacy))
+        stats = logger.get_statistics()
+        assert (stats["total_missions"], stats["success_count"], stats["failure_count"]) == (10, 9, 1)
+        assert stats["learnings_extracted"] == 20 and stats["skills_evolved"] == 4
+        assert logger.get_mission_history(limit=1)[0]["mission_id"] == "mission_9"
+
+        # Reopening does not import again; new missions go to the store only
+        run_mission(logger, "conversion", True)
+        again = MissionLogger(str(legacy))
+        assert again.get_statistics()["total_missions"] == 11
+        assert len(json.loads(legacy.read_text())["missions"]) == 10
+
+        broken = Path(tmp) / "broken" / "missions.json"
+        broken.parent.mkdir()
+        broken.write_text('{"missions": [')
+        assert MissionLogger(str(broken)).get_statistics()["total_missions"] == 0
+
+    print("✅ PASSED: 10 legacy missions imported once")
+    return True
+
+
+def test_concurrent_writers():
+    """Test 4: Threads and processes appending at once lose no missions."""
+    print("\n" + "=" * 70)
+    print("Test 4: Concurrent Writers")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "missions.json")
+
+        # deploy_heroes_parallel-style workers, each with its own logger
+        threads = [threading.Thread(target=append_in_process, args=(db_path, n, 25)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        processes = [multiprocessing.Process(target=append_in_process, args=(db_path, n, 25)) for n in range(4, 7)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+            assert process.exitcode == 0
+
+        logger = MissionLogger(db_path)
+        stats = logger.get_statistics()
+        assert stats["total_missions"] == 175, stats
+        assert stats["success_count"] == 7 * 13 and stats["failure_count"] == 7 * 12
+        assert len(logger.get_mission_history(limit=None)) == 175
+        assert stats["by_mission_type"]["worker_5"] == {"total": 25, "success": 13}
+
+    print("✅ PASSED: 175 missions from 4 threads and 3 processes, none lost")
+    return True
+
+
+def test_append_cost_is_constant():
+    """Test 5: Appending and statistics do not slow down as the log grows."""
+    print("\n" + "=" * 70)
+    print("Test 5: Constant Append Cost")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MissionStore(Path(tmp) / "missions.db")
+
+        def timed_appends(offset, count=200):
+            start = time.time()
+            for i in range(offset, offset + count):
+                store.append(mission(i))
+            return (time.time() - start) / count
+
+        early = timed_appends(0)
+        with store._connect() as conn:
+            for i in range(200, 20_200):
+                store._insert(conn, mission(i))
+        late = timed_appends(20_200)
+        assert late < max(early * 3, 0.002), f"Append went from {early * 1000:.2f}ms to {late * 1000:.2f}ms"
+
+        start = time.time()
+        for _ in range(100):
+            counters = store.counters()
+        stats_time = (time.time() - start) / 100
+        assert counters["total_missions"] == 20_400
+        assert stats_time < 0.005, f"Statistics took {stats_time * 1000:.2f}ms"
+        store.close()
+
+    print(f"✅ PASSED: Append {early * 1000:.2f}ms -> {late * 1000:.2f}ms at 20k missions, "
+          f"statistics {stats_time * 1000:.3f}ms")
+    return True
+
+
+def run_all_tests():
+    """Run all mission store tests."""
+    print("\n" + "=" * 70)
+    print("🔮 MISSION STORE - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Append and Statistics", test_append_and_statistics),
+        ("Indexed Queries", test_indexed_queries),
+        ("Legacy JSON Import", test_legacy_json_import),
+        ("Concurrent Writers", test_concurrent_writers),
+        ("Constant Append Cost", test_append_cost_is_constant),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+🎙️ MISSION CONTROL NARRATOR - Output Sink Test Suite
+====================================================
+
+Tests for the narrator's output sinks: synchronous stdout, the queued
+background writer (coalescing, progress collapsing, verbose sampling),
+record mode and the bounded conversation log.
+"""
+
+import io
+import sys
+import threading
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.mission_control_narrator import MissionControlNarrator, NarratorMode
+from core.justice_league.narrator_sink import QueuedSink, StdoutSink
+
+
+class SlowStream(io.StringIO):
+    """Stream that counts writes and blocks like a backed-up pipe"""
+
+    def __init__(self, delay=0.0):
+        super().__init__()
+        self.delay = delay
+        self.write_calls = 0
+
+    def write(self, text):
+        self.write_calls += 1
+        time.sleep(self.delay)
+        return super().write(text)
+
+
+def test_stdout_sink_default():
+    """Test 1: The default sink still prints synchronously."""
+    print("\n" + "=" * 70)
+    print("Test 1: Stdout Sink Default")
+    print("=" * 70)
+
+    narrator = MissionControlNarrator(mode="narrative")
+    assert isinstance(narrator.sink, StdoutSink)
+
+    captured = io.StringIO()
+    with redirect_stdout(captured):
+        narrator.hero_speaks("🦸 Superman", "Team, we've got a mission", style="tactical")
+        narrator.hero_thinks("🔮 Oracle", "Checking knowledge base")
+    assert captured.getvalue() == ("🦸 Superman: Team, we've got a mission\n"
+                                   "🔮 Oracle: [Step 1] Checking knowledge base\n"), captured.getvalue()
+    assert len(narrator.get_conversation_log()) == 2
+
+    print("✅ PASSED: Output printed before the call returned")
+    return True
+
+
+def test_queued_sink_coalesces():
+    """Test 2: Queued lines reach the stream in order, in few writes."""
+    print("\n" + "=" * 70)
+    print("Test 2: Queued Sink Coalescing")
+    print("=" * 70)
+
+    stream = SlowStream()
+    narrator = MissionControlNarrator(mode="narrative", sink=QueuedSink(stream, flush_interval=0.05))
+
+    for i in range(500):
+        narrator.hero_speaks("⚡ Quicksilver", f"Frame {i}", style="tactical")
+    for i in range(1, 101):
+        narrator.progress_with_commentary(i, 100, "🦅 Hawkman")
+    narrator.completion_summary("✅ MISSION COMPLETE", {"frames": 100})
+    narrator.close()
+
+    output = stream.getvalue()
+    lines = [line for line in output.split("\n") if line.startswith("⚡")]
+    assert lines == [f"⚡ Quicksilver: Frame {i}" for i in range(500)]
+    assert stream.write_calls < 20, f"{stream.write_calls} writes for 600 lines"
+
+    # Superseded progress updates collapse; the final bar always lands
+    stats = narrator.get_output_stats()
+    assert stats["coalesced"] >= 90, stats
+    assert "100/100 (100%)" in output and "MISSION COMPLETE" in output
+
+    print(f"✅ PASSED: 600 lines in {stream.write_calls} writes, {stats['coalesced']} progress updates collapsed")
+    return True
+
+
+def test_slow_stream_does_not_block_heroes():
+    """Test 3: A backed-up stream does not slow hero threads; verbose lines are sampled."""
+    print("\n" + "=" * 70)
+    print("Test 3: Non-Blocking Under Load")
+    print("=" * 70)
+
+    stream = SlowStream(delay=0.2)
+    sink = QueuedSink(stream, max_pending=2_000, verbose_watermark=100, sample_every=10, flush_interval=0.01)
+    narrator = MissionControlNarrator(mode="narrative", sink=sink)
+
+    def worker(hero):
+        for i in range(2_000):
+            narrator.hero_thinks(hero, f"Comparison pass {i}")
+
+    start = time.time()
+    threads = [threading.Thread(target=worker, args=(f"⚛️ Atom {n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+    assert elapsed < 1.0, f"Heroes blocked on output for {elapsed:.2f}s"
+
+    # Essential lines still get through while verbose ones are sampled
+    narrator.hero_speaks("🦸 Superman", "Mission complete")
+    stats = narrator.get_output_stats()
+    assert stats["dropped"] > 0 and stats["queue_depth"] <= 2_000, stats
+    narrator.close()
+    assert 'Superman: "Mission complete"' in stream.getvalue()
+
+    print(f"✅ PASSED: 8000 thoughts in {elapsed * 1000:.0f}ms, {stats['dropped']} sampled away")
+    return True
+
+
+def test_record_mode():
+    """Test 4: Record mode prints nothing but keeps the log."""
+    print("\n" + "=" * 70)
+    print("Test 4: Silent but Recorded")
+    print("=" * 70)
+
+    narrator = MissionControlNarrator(mode="record")
+    assert narrator.mode == NarratorMode.RECORD
+    assert narrator.is_enabled() and narrator.is_verbose()
+
+    captured = io.StringIO()
+    start = time.time()
+    with redirect_stdout(captured):
+        for i in range(20_000):
+            narrator.hero_thinks("⚛️ Atom", f"Pass {i}")
+        narrator.progress_with_commentary(5, 10, "🦅 Hawkman")
+        narrator.debate_evidence("🦇 Batman", "Contrast ratio 3.1:1")
+    elapsed = time.time() - start
+
+    assert captured.getvalue() == ""
+    log = narrator.get_conversation_log()
+    assert log[-1]["hero"] == "🦇 Batman"
+    assert log[-2]["thought"] == "Pass 19999" and log[-2]["step"] == 20_000
+    assert elapsed < 1.0, f"Record mode took {elapsed:.2f}s"
+
+    silent = MissionControlNarrator(mode="silent")
+    with redirect_stdout(captured):
+        silent.hero_speaks("🦸 Superman", "Nobody hears this")
+    assert silent.get_conversation_log() == [] and captured.getvalue() == ""
+
+    print(f"✅ PASSED: 20k thoughts recorded silently in {elapsed * 1000:.0f}ms")
+    return True
+
+
+def test_bounded_log():
+    """Test 5: The conversation log keeps the latest entries."""
+    print("\n" + "=" * 70)
+    print("Test 5: Bounded Conversation Log")
+    print("=" * 70)
+
+    narrator = MissionControlNarrator(mode="record", log_size=1_000)
+    for i in range(10_000):
+        narrator.hero_speaks("🦸 Superman", f"Update {i}")
+        assert len(narrator.conversation_log) <= 1_100
+
+    log = narrator.get_conversation_log()
+    assert log[-1]["message"] == "Update 9999"
+    assert 1_000 <= len(log) <= 1_100
+    assert [entry["message"] for entry in log[-1_000:]] == [f"Update {i}" for i in range(9_000, 10_000)]
+
+    narrator.clear_log()
+    assert narrator.get_conversation_log() == []
+
+    print(f"✅ PASSED: 10k entries held in a {len(log)}-entry log")
+    return True
+
+
+def run_all_tests():
+    """Run all narrator sink tests."""
+    print("\n" + "=" * 70)
+    print("🎙️ MISSION CONTROL NARRATOR - SINK TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Stdout Sink Default", test_stdout_sink_default),
+        ("Queued Sink Coalescing", test_queued_sink_coalesces),
+        ("Non-Blocking Under Load", test_slow_stream_does_not_block_heroes),
+        ("Silent but Recorded", test_record_mode),
+        ("Bounded Conversation Log", test_bounded_log),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+🌊 NETWORK CRITICAL PATH - Request DAG Test Suite
+=================================================
+
+Tests for the dependency-aware critical path: initiator DAG construction,
+longest blocking chain, slack, preload/defer/inline savings simulation and
+scaling on large traces.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.network_critical_path import RequestGraph, render_blocking_mask
+from core.superman_network_analysis import SupermanNetworkAnalysis
+
+PAGE = 'https://example.com/'
+
+
+def request(url, resource_type, start_ms, wait, receive=0, initiator=None, priority='low', size=20_000,
+            dns=0, connect=0):
+    """Request dict starting start_ms into the page load"""
+    return {
+        'url': url,
+        'resourceType': resource_type,
+        'startTime': 1_700_000_000 + start_ms / 1000,
+        'timing': {'dns': dns, 'connect': connect, 'ssl': 0, 'send': 0, 'wait': wait, 'receive': receive},
+        'initiator': initiator or {'type': 'parser', 'url': PAGE},
+        'priority': priority,
+        'size': size
+    }
+
+
+def chained_page():
+    """document -> app.css -> font.woff2 (discovered late), plus parallel work"""
+    return [
+        request(PAGE, 'document', 0, wait=100, receive=100, initiator={'type': 'other'}, dns=20, connect=30),
+        request('https://example.com/app.css', 'stylesheet', 160, wait=200, receive=40),
+        request('https://example.com/font.woff2', 'font', 420, wait=150, receive=50,
+                initiator={'type': 'parser', 'url': 'https://example.com/app.css'}),
+        request('https://example.com/small.css', 'stylesheet', 170, wait=50, receive=10, size=4_000),
+        request('https://example.com/hero.jpg', 'image', 180, wait=900, receive=300),
+    ]
+
+
+def test_multiplexed_requests_not_serialized():
+    """Test 1: Parallel requests count once, not summed."""
+    print("\n" + "=" * 70)
+    print("Test 1: Multiplexed Requests Not Serialized")
+    print("=" * 70)
+
+    requests = [request(PAGE, 'document', 0, wait=100, receive=50, initiator={'type': 'other'})]
+    for i in range(20):
+        requests.append(request(f'https://example.com/part-{i}.css', 'stylesheet', 120 + i, wait=280, receive=20))
+
+    result = SupermanNetworkAnalysis()._detect_critical_path_advanced(requests)
+
+    # Serial sum is 150 + 20 * 300; the real chain is document + one stylesheet
+    assert result['serial_time_ms'] == 6150, result['serial_time_ms']
+    assert result['critical_path_length_ms'] == 439.0, result['critical_path_length_ms']
+    assert [link['type'] for link in result['critical_chain']] == ['document', 'stylesheet']
+    assert result['critical_chain'][-1]['url'] == 'https://example.com/part-19.css'
+
+    print(f"✅ PASSED: {result['critical_path_length_ms']}ms critical path vs {result['serial_time_ms']}ms serial")
+    return True
+
+
+def test_chain_and_slack():
+    """Test 2: Initiator chain, edges and slack."""
+    print("\n" + "=" * 70)
+    print("Test 2: Critical Chain and Slack")
+    print("=" * 70)
+
+    requests = chained_page()
+    graph = RequestGraph(requests)
+
+    assert graph.parent.tolist() == [-1, 0, 1, 0, 0]
+    # app.css starts while the document streams; the font waits for app.css
+    assert graph.finish_to_start.tolist() == [False, False, True, False, False]
+    assert graph.lag_ms[2] == 20.0
+
+    # Replaying the DAG reproduces the observed waterfall
+    es, ef = graph.schedule()
+    assert abs(es - graph.start_ms).max() < 1e-6
+    assert abs(ef - graph.end_ms).max() < 1e-6
+
+    analysis = graph.analyze(render_blocking_mask(graph.store))
+    assert analysis['chain'] == [0, 1, 2]
+    assert round(analysis['render_time_ms'], 1) == 620.0
+    slack = analysis['slack_ms'].round(1).tolist()
+    assert slack[:3] == [0.0, 0.0, 0.0], slack
+    assert slack[3] == 620.0 - 230.0, slack  # small.css ends at 230ms
+    assert slack[4] == float('inf'), "Images do not block render"
+
+    print("✅ PASSED: Chain document -> app.css -> font with zero slack")
+    return True
+
+
+def test_savings_simulation():
+    """Test 3: Preload, defer and inline are replayed on the DAG."""
+    print("\n" + "=" * 70)
+    print("Test 3: Savings Simulation")
+    print("=" * 70)
+
+    # Preloading the font: discovered at the document head (150ms) instead of 420ms
+    result = SupermanNetworkAnalysis()._detect_critical_path_advanced(chained_page())
+    preload = result['savings_simulation']['preload']
+    assert [r['url'] for r in preload['resources']] == ['https://example.com/font.woff2']
+    # Font now ends at 150 + 200 = 350ms, so app.css (400ms) ends render
+    assert preload['savings_ms'] == 220.0, preload
+
+    # A late synchronous script: deferring it leaves the stylesheet as the last blocker
+    requests = chained_page()[:2] + [
+        request('https://example.com/app.js', 'script', 300, wait=500, receive=100, priority='high')
+    ]
+    defer = SupermanNetworkAnalysis()._detect_critical_path_advanced(requests)['savings_simulation']['defer']
+    assert defer['savings_ms'] == 500.0, defer
+
+    # A small stylesheet on the chain is inlined into the document
+    requests = [
+        request(PAGE, 'document', 0, wait=100, receive=100, initiator={'type': 'other'}),
+        request('https://example.com/tiny.css', 'stylesheet', 150, wait=300, receive=10, size=2_000),
+    ]
+    result = SupermanNetworkAnalysis()._detect_critical_path_advanced(requests)
+    inline = result['savings_simulation']['inline']
+    assert inline['savings_ms'] == 260.0, inline  # render at the document end (200ms)
+    assert result['optimization_potential_ms'] == result['savings_simulation']['combined_savings_ms']
+    assert result['optimization_potential_ms'] >= inline['savings_ms']
+
+    print("✅ PASSED: Simulated savings match hand-computed schedules")
+    return True
+
+
+def test_script_initiator_without_url():
+    """Test 4: Script-initiated requests attach to the last finished script."""
+    print("\n" + "=" * 70)
+    print("Test 4: Script Initiator Inference")
+    print("=" * 70)
+
+    requests = [
+        request(PAGE, 'document', 0, wait=100, receive=50, initiator={'type': 'other'}),
+        request('https://example.com/a.js', 'script', 120, wait=100),
+        request('https://example.com/b.js', 'script', 130, wait=200),
+        request('https://api.example.com/data', 'fetch', 260, wait=100, initiator={'type': 'script'}),
+        request('https://api.example.com/late', 'fetch', 400, wait=100,
+                initiator={'type': 'script', 'stack': {'callFrames': [{'url': 'https://example.com/a.js'}]}}),
+    ]
+    graph = RequestGraph(requests)
+
+    # a.js ended at 220ms, b.js at 330ms: /data (260ms) came from a.js
+    assert graph.parent.tolist() == [-1, 0, 0, 1, 1]
+
+    print("✅ PASSED: Initiators resolved from stacks and end times")
+    return True
+
+
+def test_large_trace_scaling():
+    """Test 5: 10k-request traces are analyzed in O(n log n)."""
+    print("\n" + "=" * 70)
+    print("Test 5: Large Trace Scaling")
+    print("=" * 70)
+
+    def trace(count):
+        rng = random.Random(count)
+        requests = [request(PAGE, 'document', 0, wait=100, receive=200, initiator={'type': 'other'})]
+        for i in range(1, count):
+            parent = requests[rng.randrange(max(0, i - 200), i)]['url']
+            requests.append(request(
+                f'https://example.com/r{i}', ('stylesheet', 'script', 'image', 'font', 'fetch')[i % 5],
+                50 + i * 0.5, wait=20 + i % 300, receive=i % 40,
+                initiator={'type': 'script', 'url': parent}, priority='high' if i % 3 else 'low'
+            ))
+        return requests
+
+    timings = {}
+    for count in (2_500, 10_000):
+        requests = trace(count)
+        start = time.time()
+        result = SupermanNetworkAnalysis()._detect_critical_path_advanced(requests)
+        timings[count] = time.time() - start
+        assert result['critical_path_length_ms'] < result['serial_time_ms']
+        print(f"   {count:,} requests: {timings[count]:.3f}s, chain of {len(result['critical_chain'])}")
+
+    assert timings[10_000] < 10, f"10k-request trace took {timings[10_000]:.1f}s"
+    # 4x the requests: near-linear, far from the 16x of a quadratic pass
+    assert timings[10_000] < max(timings[2_500], 0.05) * 10, timings
+
+    print("✅ PASSED: Large traces scale near-linearly")
+    return True
+
+
+def run_all_tests():
+    """Run all network critical path tests."""
+    print("\n" + "=" * 70)
+    print("🌊 NETWORK CRITICAL PATH - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Multiplexed Requests Not Serialized", test_multiplexed_requests_not_serialized),
+        ("Critical Chain and Slack", test_chain_and_slack),
+        ("Savings Simulation", test_savings_simulation),
+        ("Script Initiator Inference", test_script_initiator_without_url),
+        ("Large Trace Scaling", test_large_trace_scaling),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+🌊 NETWORK REQUEST STORE - Shared Request Log Test Suite
+========================================================
+
+Tests for the paginated request log shared by Aquaman and Superman's
+network timing analysis, concurrent detail fetching and HAR import/export.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.network_request_store import (
+    NetworkRequestStore, get_request_store, load_har_tools
+)
+from core.justice_league.aquaman_network import AquamanNetwork
+from core.superman_network_analysis import SupermanNetworkAnalysis
+
+
+def make_requests(count):
+    """Synthetic request log on a first-party and two third-party domains"""
+    types = ['document', 'stylesheet', 'script', 'image', 'xhr', 'fetch', 'font']
+    hosts = ['example.com', 'cdn.example.net', 'analytics.tracker.io']
+    requests = []
+    for i in range(count):
+        requests.append({
+            'url': f'https://{hosts[0] if i == 0 else hosts[i % 3]}/resource-{i}',
+            'method': 'GET',
+            'status': 200,
+            'resourceType': types[i % len(types)],
+            'size': 512 * (i % 9),
+            'priority': 'high' if i % 4 == 0 else 'low',
+            'fromCache': i % 5 == 0,
+            'startTime': 1_700_000_000 + i * 0.01,
+            'timing': {'dns': i % 3, 'connect': 10, 'ssl': 5 * (i % 2), 'send': 1,
+                       'wait': 100 * (i % 13), 'receive': 20 * (i % 7)},
+            'initiator': {'type': 'parser'}
+        })
+    return requests
+
+
+class PagedLister:
+    """list_network_requests mock that honours pageIdx/pageSize and counts calls"""
+
+    def __init__(self, requests):
+        self.requests = requests
+        self.calls = 0
+
+    def __call__(self, pageIdx=0, pageSize=100, resourceTypes=None):
+        self.calls += 1
+        start = pageIdx * pageSize
+        return {'requests': self.requests[start:start + pageSize], 'total': len(self.requests)}
+
+
+def test_single_collection_shared():
+    """Test 1: One collection serves every Aquaman and Superman analysis."""
+    print("\n" + "=" * 70)
+    print("Test 1: Single Collection Shared Across Analyses")
+    print("=" * 70)
+
+    requests = make_requests(250)
+    lister = PagedLister(requests)
+    mcp_tools = {'list_network_requests': lister}
+
+    aquaman = AquamanNetwork()
+    traffic = aquaman.analyze_network_traffic(mcp_tools)
+    third_party = aquaman.detect_third_party_resources(mcp_tools)
+    compression = aquaman.validate_resource_compression(mcp_tools)
+    slow = aquaman.analyze_slow_responses(mcp_tools)
+    superman = SupermanNetworkAnalysis().analyze_network_complete(
+        mcp_tools, 'https://example.com', store_baseline=False
+    )
+
+    # 250 requests in pages of 100 = 3 list calls, made once
+    assert lister.calls == 3, f"Expected 3 list calls, got {lister.calls}"
+    assert traffic['total_requests'] == 250
+    assert superman['status'] == 'success', superman.get('error')
+    assert superman['total_requests'] == 250
+    assert third_party['third_party_analysis']['total_requests'] == 250
+    assert compression['compression_analysis']['total_resources'] == 250
+    assert slow['slow_response_analysis']['total_api_requests'] == len(
+        [r for r in requests if r['resourceType'] in ('xhr', 'fetch')]
+    )
+
+    # Resource type filter is applied to the shared log
+    scripts = aquaman.analyze_network_traffic(mcp_tools, resource_types=['script'])
+    assert scripts['total_requests'] == len([r for r in requests if r['resourceType'] == 'script'])
+    assert lister.calls == 3, "Filtering should not re-list requests"
+
+    # refresh=True re-reads a page that is still loading
+    get_request_store(mcp_tools, refresh=True)
+    assert lister.calls == 6
+
+    print("✅ PASSED: One request collection shared by 5 analyses")
+    return True
+
+
+def test_vectorized_results_match_request_lists():
+    """Test 2: Analyses give the same answers for a store and a plain list."""
+    print("\n" + "=" * 70)
+    print("Test 2: Store and List Inputs Agree")
+    print("=" * 70)
+
+    requests = make_requests(120)
+    aquaman = AquamanNetwork()
+    store = NetworkRequestStore(requests)
+
+    for helper in ('_analyze_request_types', '_analyze_timing_waterfall', '_detect_blocking_resources',
+                   '_identify_critical_path', '_analyze_cache_efficiency', '_track_third_party_resources'):
+        assert getattr(aquaman, helper)(requests) == getattr(aquaman, helper)(store), helper
+
+    types = aquaman._analyze_request_types(requests)
+    assert types['total_size'] == sum(r['size'] for r in requests)
+    assert list(types['type_counts']) == ['document', 'stylesheet', 'script', 'image', 'xhr', 'fetch', 'font']
+
+    waterfall = aquaman._analyze_timing_waterfall(requests)
+    times = [sum(r['timing'].values()) for r in requests]
+    assert waterfall['total_time_ms'] == sum(times)
+    assert [e['time'] for e in waterfall['slowest_5_requests']] == sorted(times, reverse=True)[:5]
+
+    superman = SupermanNetworkAnalysis()
+    phases = superman._analyze_timing_phases(store)
+    assert phases['phase_totals_ms']['wait'] == sum(r['timing']['wait'] for r in requests)
+    assert phases['phase_counts']['ssl'] == len([r for r in requests if r['timing']['ssl'] > 0])
+
+    print("✅ PASSED: Vectorized analyses match the request list")
+    return True
+
+
+def test_pagination_guards():
+    """Test 3: Pagination stops on list functions that ignore pageIdx."""
+    print("\n" + "=" * 70)
+    print("Test 3: Pagination Guards")
+    print("=" * 70)
+
+    requests = make_requests(100)
+    calls = []
+
+    def ignores_page_idx(pageIdx=0, pageSize=100, resourceTypes=None):
+        calls.append(pageIdx)
+        return {'requests': requests}
+
+    collected = NetworkRequestStore.collect_pages(ignores_page_idx)
+    assert len(collected) == 100, f"Repeated page should not be collected twice, got {len(collected)}"
+    assert calls == [0, 1]
+
+    def no_pagination():
+        return {'requests': requests[:7]}
+
+    assert len(NetworkRequestStore.collect_pages(no_pagination)) == 7
+
+    print("✅ PASSED: Pagination terminates on repeated and unpaginated lists")
+    return True
+
+
+def test_concurrent_detail_fetch():
+    """Test 4: Request details are fetched concurrently on a bounded pool."""
+    print("\n" + "=" * 70)
+    print("Test 4: Concurrent Detail Fetch")
+    print("=" * 70)
+
+    requests = make_requests(32)
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def get_network_request(url):
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return {'responseHeaders': {'content-encoding': 'br' if url.endswith('0') else ''}}
+
+    mcp_tools = {'list_network_requests': PagedLister(requests), 'get_network_request': get_network_request}
+    result = AquamanNetwork().validate_resource_compression(mcp_tools)
+
+    assert 2 <= active[1] <= 8, f"Expected bounded concurrency, peak was {active[1]}"
+    analysis = result['compression_analysis']
+    assert analysis['compression_types']['br'] == len([r for r in requests if r['url'].endswith('0')])
+
+    # Details already merged - a second run fetches nothing
+    store = get_request_store(mcp_tools)
+    assert store.fetch_details(get_network_request, missing='responseHeaders') == 0
+
+    print(f"✅ PASSED: Details fetched with peak concurrency {active[1]}")
+    return True
+
+
+def test_har_round_trip():
+    """Test 5: HAR export/import round trip and offline analysis."""
+    print("\n" + "=" * 70)
+    print("Test 5: HAR Round Trip")
+    print("=" * 70)
+
+    requests = make_requests(40)
+    for req in requests:
+        req['responseHeaders'] = {'content-encoding': 'gzip'}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        har_path = Path(tmp) / 'page.har'
+        NetworkRequestStore(requests).save_har(har_path)
+
+        restored = NetworkRequestStore.load_har(har_path)
+        assert len(restored) == 40
+        for original, loaded in zip(requests, restored.requests):
+            assert loaded['url'] == original['url']
+            assert loaded['resourceType'] == original['resourceType']
+            assert loaded['size'] == original['size']
+            assert loaded['timing'] == original['timing'], (loaded['timing'], original['timing'])
+            assert abs(loaded['startTime'] - original['startTime']) < 1e-3
+
+        # Offline: no browser, just the recording
+        offline = AquamanNetwork().analyze_network_traffic(load_har_tools(har_path))
+        live = AquamanNetwork().analyze_network_traffic({'list_network_requests': PagedLister(requests)})
+        assert offline['total_requests'] == 40
+        assert offline['timing_analysis'] == live['timing_analysis']
+        assert offline['request_types'] == live['request_types']
+
+        superman = SupermanNetworkAnalysis().analyze_network_complete(
+            load_har_tools(har_path), 'https://example.com', store_baseline=False
+        )
+        assert superman['status'] == 'success', superman.get('error')
+
+    print("✅ PASSED: HAR round trip preserves the request log")
+    return True
+
+
+def run_all_tests():
+    """Run all network request store tests."""
+    print("\n" + "=" * 70)
+    print("🌊 NETWORK REQUEST STORE - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Single Collection Shared", test_single_collection_shared),
+        ("Store and List Inputs Agree", test_vectorized_results_match_request_lists),
+        ("Pagination Guards", test_pagination_guards),
+        ("Concurrent Detail Fetch", test_concurrent_detail_fetch),
+        ("HAR Round Trip", test_har_round_trip),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
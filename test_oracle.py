@@ -470,6 +470,93 @@ def test_oracle_comprehensive_report():
     return True
 
 
+def test_oracle_store_persistence():
+    """Test 11: Journaled store persists incrementally and replays on reload."""
+    print("\n" + "=" * 70)
+    print("Test 11: Oracle Store Journal & Compaction")
+    print("=" * 70)
+
+    from core.justice_league.oracle_store import OracleStore
+
+    temp_dir = tempfile.mkdtemp(prefix='oracle_test_')
+    oracle = OracleMeta(knowledge_base_dir=temp_dir)
+
+    oracle.store_error_solution('flash', 'timeout', {'message': 'LCP trace timed out'},
+                                'Retry trace', {'mission_type': 'performance'})
+    oracle.track_agent_performance('flash', {'success': True, 'score': 92})
+
+    # Changes go to the journal, not a full rewrite of the snapshot
+    journal = oracle.errors_db.with_name(oracle.errors_db.name + '.journal')
+    assert journal.exists(), "Error should be journaled"
+    with open(oracle.errors_db, 'r') as f:
+        assert json.load(f)['errors'] == [], "Snapshot should not be rewritten per change"
+
+    # A fresh store replays snapshot + journal
+    fresh = OracleStore()
+    assert len(fresh.load(oracle.errors_db)['errors']) == 1, "Journal should replay on load"
+    assert fresh.load(oracle.metrics_db)['agents']['flash']['total_missions'] == 1
+
+    # Index lookups
+    fresh.register_index(oracle.errors_db, 'by_agent', ['errors'], lambda e: e['agent'])
+    assert len(fresh.lookup(oracle.errors_db, 'by_agent', 'flash')) == 1
+    assert fresh.lookup(oracle.errors_db, 'by_agent', 'batman') == []
+
+    # Compaction folds the journal into the snapshot
+    oracle.store.compact(oracle.errors_db)
+    assert not journal.exists(), "Compaction should truncate the journal"
+    with open(oracle.errors_db, 'r') as f:
+        assert len(json.load(f)['errors']) == 1, "Snapshot should contain compacted error"
+
+    # Trimming learning sessions journals the dropped keys, not the whole dict
+    from core.justice_league.oracle_meta_agent import LearningSession
+    oracle.project_patterns_db = Path(temp_dir) / 'oracle_project_patterns.json'
+    oracle.store.create(oracle.project_patterns_db, {'learning_sessions': {}})
+    for i in range(52):
+        oracle._store_learning_session(LearningSession(f"LS{i:03d}", 'request', 'intent', 'test'))
+    patterns_journal = oracle.project_patterns_db.with_name(oracle.project_patterns_db.name + '.journal')
+    ops = [json.loads(line) for line in patterns_journal.read_text().splitlines()]
+    assert [op['keys'] for op in ops if op['op'] == 'delete'] == [
+        ['learning_sessions', 'LS000'], ['learning_sessions', 'LS001']]
+    assert not any(op['keys'] == ['learning_sessions'] for op in ops), "Sessions dict should not be rewritten"
+    sessions = OracleStore().load(oracle.project_patterns_db)['learning_sessions']
+    assert len(sessions) == 50 and 'LS000' not in sessions and 'LS051' in sessions
+
+    print("✅ PASSED: Oracle store persists incrementally")
+    return True
+
+
+def test_error_near_duplicate_index():
+    """Test 12: Near-duplicate error detection tolerates shifted text."""
+    print("\n" + "=" * 70)
+    print("Test 12: Near-Duplicate Error Index")
+    print("=" * 70)
+
+    temp_dir = tempfile.mkdtemp(prefix='oracle_test_')
+    oracle = OracleMeta(knowledge_base_dir=temp_dir)
+
+    message = 'Request timeout after 30s while loading https://example.com/dashboard'
+    oracle.store_error_solution('batman', 'timeout', {'message': message},
+                                'Increased timeout to 60s', {})
+    # Same error, shifted by a prefix and a different duration
+    oracle.store_error_solution('batman', 'timeout', {'message': '[retry 2] ' + message.replace('30s', '45s')},
+                                'Increased timeout to 60s', {})
+    # Same text but a different agent is a different bucket
+    oracle.store_error_solution('flash', 'timeout', {'message': message},
+                                'Increased timeout to 60s', {})
+
+    errors = oracle.store.load(oracle.errors_db)['errors']
+    assert len(errors) == 2, "Shifted duplicate should update the existing error"
+    assert errors[0]['times_encountered'] == 2, "Duplicate should bump times_encountered"
+
+    # Full error messages find their near-duplicates
+    results = oracle.query_knowledge_base('Request timeout after 5s while loading https://example.com/dashboard',
+                                          agent_name='batman')
+    assert len(results) == 1, "Near-duplicate query should match the stored error"
+
+    print("✅ PASSED: Near-duplicate index deduplicates errors")
+    return True
+
+
 def run_all_tests():
     """Run complete Oracle test suite."""
     print("\n🔮 Oracle - Meta-Agent Test Suite")
@@ -488,6 +575,8 @@ def run_all_tests():
         ("Version Control", test_version_control),
         ("MCP Integration Manager", test_mcp_integration_manager),
         ("Oracle Comprehensive Report", test_oracle_comprehensive_report),
+        ("Oracle Store Persistence", test_oracle_store_persistence),
+        ("Near-Duplicate Error Index", test_error_near_duplicate_index),
     ]
 
     passed = 0
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+📸 PAGE SNAPSHOT - Shared Capture Test Suite
+============================================
+
+Tests for the single-capture page snapshot shared by Litty, Zatanna and
+Plastic Man, including offline runs from a saved snapshot file.
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.page_snapshot import (
+    CAPTURE_SCRIPT, PageCapture, PageSnapshot, get_page_capture, load_offline_tools
+)
+from core.justice_league.litty_ethics import LittyEthics
+from core.justice_league.zatanna_seo import ZatannaSEO
+from core.justice_league.plastic_man_responsive import PlasticManResponsive
+
+DEFAULT_STYLE = {
+    'display': 'block', 'visibility': 'visible', 'fontSize': '16px', 'opacity': '1',
+    'backgroundColor': 'rgba(0, 0, 0, 0)', 'outline': 'rgb(0, 0, 0) none 0px', 'boxShadow': 'none'
+}
+
+
+class SnapshotBuilder:
+    """Builds capture-script output by hand (elements must be added in document order)"""
+
+    def __init__(self):
+        self.elements = []
+
+    def add(self, tag, parent=-1, attrs=None, text=None, style=None, rect=None, props=None, text_length=None):
+        index = len(self.elements)
+        entry = {
+            'tag': tag, 'parent': parent, 'attrs': attrs or {}, 'nodes': [],
+            'style': {**DEFAULT_STYLE, **(style or {})}, 'rect': rect or [0, 0, 100, 48]
+        }
+        if text is not None:
+            entry['nodes'].append(text)
+        if props:
+            entry['props'] = props
+        if text_length is not None:
+            entry['text_length'] = text_length
+        self.elements.append(entry)
+        if parent >= 0:
+            self.elements[parent]['nodes'].append(index)
+        return index
+
+
+def build_store_page(width=1280, height=800):
+    """A small store page with a few ethics, SEO and touch target problems"""
+    page = SnapshotBuilder()
+    html = page.add('html', attrs={'lang': 'en'})
+    head = page.add('head', html)
+    page.add('title', head, text='Pricing - Example Store: plans for every team size')
+    page.add('meta', head, attrs={'name': 'description', 'content': 'Compare plans.'})
+    page.add('meta', head, attrs={'name': 'viewport', 'content': 'width=device-width, initial-scale=1'})
+    page.add('meta', head, attrs={'property': 'og:title', 'content': 'Pricing'})
+    page.add('link', head, attrs={'rel': 'canonical', 'href': '/pricing'},
+             props={'href': 'https://example.com/pricing'})
+    page.add('script', head, attrs={'type': 'application/ld+json'},
+             text='{"@type": "Organization", "name": "Example"}', props={'src': ''})
+    page.add('style', head, text_length=120)
+    page.add('script', head, attrs={'src': '/app.js'}, props={'src': 'https://example.com/app.js'}, text_length=0)
+
+    body = page.add('body', html)
+    page.add('h1', body, text='Pricing')
+    nav = page.add('nav', body)
+    page.add('a', nav, attrs={'href': '/'}, text='Home', rect=[0, 0, 40, 20],
+             props={'href': 'https://example.com/'})
+    page.add('a', nav, attrs={'href': '#content'}, text='Skip to content',
+             props={'href': 'https://example.com/pricing#content'})
+    page.add('p', body, text='Only 2 left! Hurry, this crazy deal ends soon for all of you.',
+             style={'fontSize': '12px'})
+    page.add('button', body, text="No thanks, I don't want to save money", rect=[0, 0, 120, 30])
+    page.add('img', body, attrs={'alt': 'image', 'width': '10', 'height': '10'},
+             props={'src': 'https://example.com/a.png', 'naturalWidth': 10, 'naturalHeight': 10})
+    page.add('img', body, attrs={'src': 'b.png'},
+             props={'src': 'https://example.com/b.png', 'naturalWidth': 64, 'naturalHeight': 32})
+    page.add('a', body, attrs={'href': '/account/cancel'}, text='Cancel subscription',
+             style={'fontSize': '10px'}, props={'href': 'https://example.com/account/cancel'})
+    page.add('input', body, attrs={'type': 'checkbox', 'name': 'newsletter'}, props={'checked': True})
+    banner = page.add('div', body, attrs={'class': 'cookie-banner fixed'})
+    page.add('button', banner, text='Accept')
+    page.add('a', body, attrs={'href': 'https://other.com/', 'rel': 'nofollow'}, text='Partner',
+             props={'href': 'https://other.com/'})
+
+    return {
+        'version': 1,
+        'url': 'https://example.com/pricing',
+        'hostname': 'example.com',
+        'title': 'Pricing - Example Store: plans for every team size',
+        'lang': 'en',
+        'viewport': {'width': width, 'height': height},
+        'scroll_width': width,
+        'media': {'touch': False, 'hover': True, 'pointer_fine': True},
+        'body_text': ('Pricing\nHome\nSkip to content\nOnly 2 left! Hurry, this crazy deal ends soon for all of you.\n'
+                      "No thanks, I don't want to save money\nCancel subscription\nAccept\nPartner"),
+        'elements': page.elements
+    }
+
+
+def make_browser(snapshot_data):
+    """evaluate_script stand-in that only understands the capture script"""
+    calls = []
+
+    def evaluate_script(function):
+        calls.append(function)
+        assert function == CAPTURE_SCRIPT, "Heroes should query the shared snapshot"
+        return json.loads(json.dumps(snapshot_data))
+
+    return evaluate_script, calls
+
+
+def test_selector_engine():
+    """Test 1: Selector subset and textContent"""
+    print("\n" + "=" * 70)
+    print("Test 1: Selector Engine")
+    print("=" * 70)
+
+    snapshot = PageSnapshot(build_store_page())
+
+    assert len(snapshot.query_selector_all('a')) == 4
+    assert len(snapshot.query_selector_all('button, a, [role="button"]')) == 6
+    assert len(snapshot.query_selector_all('nav a')) == 2
+    assert len(snapshot.query_selector_all('body > a')) == 2
+    assert len(snapshot.query_selector_all('meta[property^="og:"]')) == 1
+    assert len(snapshot.query_selector_all('[class*="cookie"]')) == 1
+    assert len(snapshot.query_selector_all('div.fixed')) == 1
+    assert len(snapshot.query_selector_all('script:not([async]):not([defer])')) == 2
+    assert len(snapshot.query_selector_all('a[href="#content"]')) == 1
+    assert snapshot.query_selector('link[rel="canonical"]').prop('href') == 'https://example.com/pricing'
+
+    banner = snapshot.query_selector('[class*="cookie"]')
+    assert [el.tag_name for el in banner.query_selector_all('button')] == ['BUTTON']
+
+    # textContent joins descendant text; inline script/style source is left out
+    nav = snapshot.query_selector('nav')
+    assert nav.text_content == 'HomeSkip to content'
+    assert snapshot.query_selector('head').text_content.startswith('Pricing - Example Store')
+    assert '"@type"' in snapshot.query_selector('script[type="application/ld+json"]').text_content
+
+    print("✅ PASSED: Selectors and textContent match the DOM")
+    return True
+
+
+def test_single_capture_across_heroes():
+    """Test 2: Litty, Zatanna and Plastic Man share one capture"""
+    print("\n" + "=" * 70)
+    print("Test 2: Single Capture Across Heroes")
+    print("=" * 70)
+
+    evaluate_script, calls = make_browser(build_store_page())
+    mcp_tools = {'evaluate_script': evaluate_script}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        litty = LittyEthics().validate_ethics('https://example.com/pricing', mcp_tools)
+        zatanna = ZatannaSEO(reports_dir=tmp_dir).analyze_seo_magic(mcp_tools, 'https://example.com/pricing')
+        plastic = PlasticManResponsive().test_all_breakpoints(mcp_tools, ['mobile'])
+
+    assert len(calls) == 1, f"Expected one capture, got {len(calls)} evaluate_script calls"
+    assert get_page_capture(mcp_tools).stats()['captures'] == 1
+
+    dark_patterns = litty['checks']['dark_patterns']['details']
+    assert len(dark_patterns['confirmshaming']) == 1
+    assert [p['phrase'] for p in dark_patterns['urgency_manipulation']] == ['only', 'left', 'hurry']
+    assert dark_patterns['obstruction'][0]['fontSize'] == 10.0
+    assert dark_patterns['misdirection'][0]['count'] == 1
+    assert litty['checks']['user_respect']['details'][0]['type'] == 'cookie_dark_pattern'
+    assert [i['term'] for i in litty['checks']['ethical_language']['details']] == ['crazy']
+
+    assert zatanna['meta_tags']['extracted']['canonical'] == 'https://example.com/pricing'
+    assert zatanna['meta_tags']['extracted']['open_graph'] == {'title': 'Pricing'}
+    assert zatanna['structured_data'][0]['schema'] == 'Organization'
+    assert zatanna['headings']['counts']['h1_count'] == 1
+    assert zatanna['images']['stats']['alt_coverage_percent'] == '50.0'
+    assert zatanna['images']['seo_friendly'] is False
+    assert zatanna['links']['stats'] == {
+        'total_links': 4, 'internal_links': 3, 'external_links': 1, 'broken_links': 0, 'nofollow_links': 1
+    }
+    assert zatanna['core_web_vitals_impact']['stats']['blocking_scripts'] == 1
+    assert zatanna['core_web_vitals_impact']['stats']['inline_css_size'] == 120
+
+    assert plastic['viewport_analysis']['viewport_meta_present'] is True
+    assert plastic['device_specific']['hover_supported'] is True
+    assert plastic['touch_target_analysis']['interactive_elements_checked'] == 7
+    assert plastic['touch_target_analysis']['too_small_targets'] == 2
+
+    print(f"✅ PASSED: 3 heroes, {len(calls)} evaluate_script call")
+    return True
+
+
+def test_legacy_scripts_fallback():
+    """Test 3: Tools that can't capture keep the per-check scripts"""
+    print("\n" + "=" * 70)
+    print("Test 3: Legacy Script Fallback")
+    print("=" * 70)
+
+    calls = []
+
+    def evaluate_script(function):
+        calls.append(function)
+        return 'width=device-width, initial-scale=1' if 'viewport' in function else False
+
+    mcp_tools = {'evaluate_script': evaluate_script}
+    pm = PlasticManResponsive()
+    pm.test_all_breakpoints(mcp_tools, ['mobile'])
+    result = pm.test_all_breakpoints(mcp_tools, ['mobile'])
+
+    assert calls.count(CAPTURE_SCRIPT) == 1, "Capture should only be attempted once"
+    assert get_page_capture(mcp_tools).supported is False
+    assert result['viewport_analysis']['viewport_content'] == 'width=device-width, initial-scale=1'
+
+    print(f"✅ PASSED: Fell back to {len(calls) - 1} legacy script calls")
+    return True
+
+
+def test_offline_round_trip():
+    """Test 4: Saved snapshots reproduce the live results without a browser"""
+    print("\n" + "=" * 70)
+    print("Test 4: Offline Round Trip")
+    print("=" * 70)
+
+    evaluate_script, _ = make_browser(build_store_page())
+    live_tools = {'evaluate_script': evaluate_script}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        live_litty = LittyEthics().validate_ethics('https://example.com/pricing', live_tools)
+        live_zatanna = ZatannaSEO(reports_dir=tmp_dir).analyze_seo_magic(live_tools, 'https://example.com/pricing')
+
+        capture_path = Path(tmp_dir) / 'captures' / 'pricing.json'
+        get_page_capture(live_tools).save(capture_path)
+
+        offline_tools = load_offline_tools(capture_path)
+        offline_litty = LittyEthics().validate_ethics('https://example.com/pricing', offline_tools)
+        offline_zatanna = ZatannaSEO(reports_dir=tmp_dir).analyze_seo_magic(offline_tools, 'https://example.com/pricing')
+
+        assert offline_litty['checks'] == live_litty['checks']
+        for key in ('meta_tags', 'structured_data', 'headings', 'images', 'links', 'mobile', 'core_web_vitals_impact'):
+            assert offline_zatanna[key] == live_zatanna[key], key
+
+        # A bare snapshot file works too; unknown viewports have no snapshot
+        bare_path = Path(tmp_dir) / 'bare.json'
+        bare_path.write_text(json.dumps(build_store_page(375, 667)))
+        capture = PageCapture.load(bare_path)
+        assert capture.snapshot().viewport == (375, 667)
+        capture.set_viewport(1920, 1080)
+        assert capture.snapshot() is None
+
+    print("✅ PASSED: Offline results match the live capture")
+    return True
+
+
+def test_coordinator_offline_assembly():
+    """Test 5: Superman runs the browser-driven heroes from a saved capture"""
+    print("\n" + "=" * 70)
+    print("Test 5: Coordinator Offline Assembly")
+    print("=" * 70)
+
+    from core.justice_league.superman_coordinator import SupermanCoordinator
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        capture_path = Path(tmp_dir) / 'capture.json'
+        capture_path.write_text(json.dumps({'version': 1, 'snapshots': [build_store_page()]}))
+
+        options = {key: False for key, _, _, _ in SupermanCoordinator.ASSEMBLY_ROSTER}
+        options.update(test_seo=True, validate_ethics=True)
+
+        superman = SupermanCoordinator()
+        superman.zatanna = ZatannaSEO(reports_dir=tmp_dir)
+        results = superman.assemble_justice_league({
+            'url': 'https://example.com/pricing',
+            'page_capture_file': str(capture_path),
+            'options': options
+        })
+
+    assert results['page_capture']['mode'] == 'offline'
+    assert results['hero_reports']['zatanna']['headings']['counts']['h1_count'] == 1
+    assert results['hero_reports']['litty']['checks']['dark_patterns']['dark_patterns_found'] == 6
+
+    print("✅ PASSED: Offline assembly used the saved capture")
+    return True
+
+
+def run_all_tests():
+    """Run all page snapshot tests."""
+    print("\n" + "=" * 70)
+    print("📸 PAGE SNAPSHOT - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Selector Engine", test_selector_engine),
+        ("Single Capture Across Heroes", test_single_capture_across_heroes),
+        ("Legacy Script Fallback", test_legacy_scripts_fallback),
+        ("Offline Round Trip", test_offline_round_trip),
+        ("Coordinator Offline Assembly", test_coordinator_offline_assembly),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+📸 PAGE SNAPSHOT PARITY - Snapshot Ports vs Page Scripts
+========================================================
+
+Every Litty, Zatanna and Plastic Man check exists twice: as the script the
+hero evaluates in the page (used when evaluate_script can't return a
+snapshot) and as a Python port over the shared PageSnapshot. These tests
+load one fixture page in a real browser and run both versions of every
+check against it, so the two can't drift apart.
+
+Requires Playwright with Chromium (pip install playwright && playwright
+install chromium); without it the tests report a skip.
+"""
+
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+from core.justice_league.page_snapshot import PageCapture, get_page_snapshot
+from core.justice_league.litty_ethics import LittyEthics
+from core.justice_league.zatanna_seo import ZatannaSEO
+from core.justice_league.plastic_man_responsive import PlasticManResponsive
+
+FIXTURE_URL = 'https://shop.example.com/plans/pro'
+
+# One page that trips (almost) every branch of every check
+FIXTURE_HTML = """<!DOCTYPE html>
+<html lang="en-GB">
+<head>
+  <meta charset="utf-8">
+  <title>Pro plan - Example Shop: everything your team needs, billed monthly</title>
+  <meta name="description" content="The Pro plan.">
+  <meta name="viewport" content="width=device-width, initial-scale=1, maximum-scale=1">
+  <meta name="robots" content="index, nofollow">
+  <meta name="author" content="Example Shop">
+  <meta property="og:title" content="Pro plan">
+  <meta property="og:image" content="/og/pro.png">
+  <meta name="twitter:card" content="summary">
+  <link rel="canonical" href="/plans/pro">
+  <link rel="alternate" hreflang="de" href="https://shop.example.com/de/plans/pro">
+  <link rel="alternate" hreflang="x-default" href="/plans/pro">
+  <link rel="next" href="/plans/pro?page=2">
+  <script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "Product", "name": "Pro plan",
+     "offers": {"@type": "Offer", "price": "49.00"}}
+  </script>
+  <script type="application/ld+json">{"@type": "Organization", "name": "Example Shop"}</script>
+  <script type="application/ld+json">{ not json }</script>
+  <style>
+    body { font-size: 16px; margin: 0; }
+    .tiny { font-size: 11px; }
+    .cta { font-size: 20px; background-color: rgb(0, 90, 200); color: white; }
+    .hidden { display: none; }
+    .ghost { visibility: hidden; }
+    .faint { opacity: 0.3; }
+    .no-focus { outline: none; }
+    .wide { width: 1500px; }
+    .big { display: inline-block; width: 48px; height: 48px; }
+  </style>
+  <script>window.analytics = [];</script>
+  <script src="/static/app.js" defer></script>
+  <script src="/static/vendor.js"></script>
+</head>
+<body>
+  <nav role="navigation">
+    <a href="#main">Skip navigation and go straight to the main content</a>
+    <a href="/">Home</a>
+    <a href="/plans">Plans</a>
+    <a href="https://blog.example.org/" rel="nofollow noopener">Blog</a>
+    <a href="">Empty</a>
+  </nav>
+  <main id="main">
+    <h1>Pro plan</h1>
+    <h2>What you get</h2>
+    <h2>Pricing</h2>
+    <h4>Small print</h4>
+    <p>Hurry - only 3 seats left at this price, and the offer expires tonight!
+       Our crazy launch deal will crush the competition, guys.</p>
+    <p class="tiny">Prices exclude VAT and the onboarding fee charged in the first month.</p>
+    <div class="price">49</div><div class="price">59</div><div class="cost">5</div>
+    <div class="total">54</div><span class="price-old">69</span><span class="total-due">54</span>
+    <ul><li>Unlimited projects with OAuth SSO and a JSON API</li><li>Priority support</li></ul>
+    <table><tr><td class="tiny">Billed monthly, cancel within the first thirty days</td></tr></table>
+    <button class="cta">Upgrade now</button>
+    <button class="cta" aria-label="Go">Go</button>
+    <button aria-label="button">X</button>
+    <a href="/plans/pro/checkout" class="cta big">Buy</a>
+    <button>No thanks, I don't want premium benefits</button>
+    <a href="/account/cancel" class="tiny">Cancel subscription</a>
+    <a href="/account/unsubscribe" class="faint">Unsubscribe from emails</a>
+    <div role="button" onclick="void 0" class="no-focus">Compare plans</div>
+    <span tabindex="0" class="no-focus">Details</span>
+    <span tabindex="-1">Not focusable</span>
+    <div class="hidden"><a href="/hidden">Hidden link</a></div>
+    <div class="ghost">Invisible text</div>
+    <img src="/img/team.png" alt="Our support team answering calls" width="120" height="80">
+    <img src="/img/logo.png" alt="Image">
+    <img src="/img/hero.png" loading="lazy" width="10" height="10">
+    <img src="/img/badge.png" alt="">
+    <video src="/media/intro.mp4" autoplay></video>
+    <video src="/media/muted.mp4" autoplay muted></video>
+    <audio src="/media/jingle.mp3" autoplay></audio>
+    <div role="dialog">Dialog</div><div class="modal">Modal</div>
+    <div class="popup-promo">Popup</div><div class="overlay">Overlay</div>
+    <div class="cookie-consent"><p>We use cookies</p><button>Accept all</button></div>
+    <div id="cookie-settings"><button>Accept</button><button>Decline</button></div>
+    <form action="/signup" method="post">
+      <p>You must sign up to continue.</p>
+      <input type="email" name="email">
+      <input type="checkbox" name="marketing_emails" checked>
+      <input type="checkbox" name="accept_terms">
+      <input type="checkbox" name="newsletter" checked>
+      <select name="seats"><option>1</option></select>
+      <textarea name="notes"></textarea>
+      <input type="submit" value="Sign up">
+      <input type="button" value="Later">
+    </form>
+    <div itemscope itemtype="https://schema.org/Review"><span itemprop="author">Ann</span></div>
+    <div class="wide">Wide banner</div>
+  </main>
+</body>
+</html>
+"""
+
+LITTY_CHECKS = (
+    '_detect_dark_patterns', '_check_inclusive_design', '_analyze_cognitive_load',
+    '_evaluate_user_respect', '_check_accessibility_empathy', '_validate_ethical_language'
+)
+
+ZATANNA_CHECKS = (
+    '_backwards_spell_meta_reveal', '_backwards_spell_structured_data', '_backwards_spell_crawlability',
+    '_analyze_heading_hierarchy', '_analyze_images_seo', '_analyze_internal_links',
+    '_analyze_mobile_seo', '_analyze_cwv_impact'
+)
+
+PLASTIC_MAN_CHECKS = ('_shapeshift_device_test', '_malleable_viewport_test', '_extensible_touch_target_test')
+
+
+@contextmanager
+def fixture_page(width=1280, height=800):
+    """MCP-style tools for the fixture page in headless Chromium (None without a browser)"""
+    if not PLAYWRIGHT_AVAILABLE:
+        yield None
+        return
+
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            print(f"  ⚠️ Chromium not available ({str(e).splitlines()[0]})")
+            yield None
+            return
+
+        try:
+            page = browser.new_page(viewport={'width': width, 'height': height})
+
+            def serve(route):
+                if route.request.url == FIXTURE_URL:
+                    route.fulfill(status=200, content_type='text/html', body=FIXTURE_HTML)
+                else:
+                    route.fulfill(status=404, body='')
+
+            page.route('**/*', serve)
+            page.goto(FIXTURE_URL)
+
+            yield {
+                'evaluate_script': lambda function: page.evaluate(function),
+                'resize_page': lambda width, height: page.set_viewport_size({'width': width, 'height': height})
+            }
+        finally:
+            browser.close()
+
+
+def assert_same(name, from_script, from_snapshot):
+    """Both versions of a check ran cleanly and agree"""
+    assert 'error' not in from_script, f"{name} script failed: {from_script.get('error')}"
+    assert from_script == from_snapshot, (
+        f"{name} differs:\n  script:   {from_script}\n  snapshot: {from_snapshot}"
+    )
+
+
+def test_litty_parity():
+    """Test 1: Litty's snapshot ports match its page scripts"""
+    print("\n" + "=" * 70)
+    print("Test 1: Litty Parity")
+    print("=" * 70)
+
+    with fixture_page() as tools:
+        if tools is None:
+            print("  ⚠️ Playwright/Chromium not available, skipping test")
+            return True
+
+        snapshot = get_page_snapshot(tools, FIXTURE_URL)
+        assert snapshot is not None, "Capture script did not return a snapshot"
+
+        litty = LittyEthics()
+        for name in LITTY_CHECKS:
+            check = getattr(litty, name)
+            assert_same(name, check(tools, None), check(tools, snapshot))
+
+        dark_patterns = litty._detect_dark_patterns(tools, snapshot)['details']
+        # (nothing detects forced continuity yet)
+        tripped = [kind for kind, found in dark_patterns.items() if found]
+        assert tripped == ['confirmshaming', 'hidden_costs', 'urgency_manipulation', 'obstruction', 'misdirection'], tripped
+
+    print(f"✅ PASSED: {len(LITTY_CHECKS)} checks agree on the fixture page")
+    return True
+
+
+def test_zatanna_parity():
+    """Test 2: Zatanna's snapshot ports match her page scripts"""
+    print("\n" + "=" * 70)
+    print("Test 2: Zatanna Parity")
+    print("=" * 70)
+
+    with fixture_page() as tools:
+        if tools is None:
+            print("  ⚠️ Playwright/Chromium not available, skipping test")
+            return True
+
+        snapshot = get_page_snapshot(tools, FIXTURE_URL)
+        assert snapshot is not None, "Capture script did not return a snapshot"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zatanna = ZatannaSEO(reports_dir=tmp_dir)
+            for name in ZATANNA_CHECKS:
+                check = getattr(zatanna, name)
+                from_script = check(tools, None)
+                from_snapshot = check(tools, snapshot)
+                if isinstance(from_script, list):
+                    # JSON parse errors are worded by each parser
+                    for item in from_script + from_snapshot:
+                        if item['schema'] == 'Parse Error':
+                            assert item.pop('error')
+                    from_script, from_snapshot = {'items': from_script}, {'items': from_snapshot}
+                assert_same(name, from_script, from_snapshot)
+
+            structured = zatanna._backwards_spell_structured_data(tools, snapshot)
+            assert [item['schema'] for item in structured] == ['Product', 'Organization', 'Parse Error', 'Review']
+
+    print(f"✅ PASSED: {len(ZATANNA_CHECKS)} checks agree on the fixture page")
+    return True
+
+
+def test_plastic_man_parity():
+    """Test 3: Plastic Man's snapshot ports match his page scripts at each size"""
+    print("\n" + "=" * 70)
+    print("Test 3: Plastic Man Parity")
+    print("=" * 70)
+
+    with fixture_page() as tools:
+        if tools is None:
+            print("  ⚠️ Playwright/Chromium not available, skipping test")
+            return True
+
+        pm = PlasticManResponsive()
+        sizes = [(bp['width'], bp['height']) for bp in pm.BREAKPOINTS.values()]
+        for width, height in sizes:
+            tools['resize_page'](width=width, height=height)
+            capture = PageCapture(tools['evaluate_script'])
+            capture.set_viewport(width, height)
+            assert capture.snapshot(FIXTURE_URL) is not None
+
+            for name in PLASTIC_MAN_CHECKS:
+                check = getattr(pm, name)
+                assert_same(f"{name} @ {width}x{height}", check(tools, None), check(tools, capture))
+
+            # The scroll check reuses the capture at this size
+            page = capture.snapshot(capture=False)
+            scrolls = tools['evaluate_script']("() => document.body.scrollWidth > window.innerWidth")
+            assert (page.scroll_width > page.viewport[0]) == scrolls, f"scroll check @ {width}x{height}"
+
+    print(f"✅ PASSED: {len(PLASTIC_MAN_CHECKS)} checks agree at {len(sizes)} sizes")
+    return True
+
+
+def run_all_tests():
+    """Run all page snapshot parity tests."""
+    print("\n" + "=" * 70)
+    print("📸 PAGE SNAPSHOT PARITY - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Litty Parity", test_litty_parity),
+        ("Zatanna Parity", test_zatanna_parity),
+        ("Plastic Man Parity", test_plastic_man_parity),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
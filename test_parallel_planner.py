@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+🔮 PARALLEL PLANNER - Measured, Adaptive Execution Planning Test Suite
+======================================================================
+
+Tests for Oracle's planner behind deploy_heroes_smart: decayed duration
+histograms per hero and task type, longest-expected-first scheduling,
+worker counts from the measured CPU profile and contention, worktree use
+from measured creation cost, and the predicted vs actual makespan report.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.utils.execution_profile import DurationHistogram, ExecutionProfile, task_type
+from core.utils.parallel_optimizer import ExecutionStrategy, ParallelOptimizer, lpt_makespan
+
+
+def mission(hero, name):
+    return {'hero_name': hero, 'task_name': name, 'params': {}}
+
+
+def teach(profile, samples, workers=1, cpu_seconds=None):
+    """Record a finished run: samples are (mission, seconds) or (mission, seconds, worktree_setup)"""
+    samples = [{'mission': s[0], 'duration': s[1], 'worktree_setup': s[2] if len(s) > 2 else None}
+               for s in samples]
+    makespan = lpt_makespan([s['duration'] for s in samples], workers)
+    profile.observe_run(samples, workers=workers, makespan=makespan,
+                        cpu_seconds=cpu_seconds, ideal_makespan=makespan)
+
+
+def test_histograms_and_persistence():
+    """Test 1: Decayed histograms per hero and task type, saved between runs."""
+    print("\n" + "=" * 70)
+    print("Test 1: Duration Histograms")
+    print("=" * 70)
+
+    assert task_type(mission('artemis', 'convert-component-12')) == 'convert-component'
+    assert task_type({'task_name': 'Export_3', 'task_type': 'Frames'}) == 'frames'
+
+    histogram = DurationHistogram()
+    for _ in range(20):
+        histogram.add(10.0)
+    assert abs(histogram.mean - 10.0) < 1e-9
+    assert 7.0 < histogram.quantile(0.5) < 14.0
+    for _ in range(20):
+        histogram.add(40.0)
+    assert histogram.mean > 30.0, "Recent runs outweigh old ones"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'profile.json'
+        profile = ExecutionProfile(path)
+        teach(profile, [(mission('artemis', 'convert-1'), 90.0), (mission('artemis', 'convert-2'), 110.0),
+                        (mission('artemis', 'review-1'), 20.0)], cpu_seconds=11.0)
+
+        reloaded = ExecutionProfile(path)
+        duration, samples = reloaded.expected_duration(mission('artemis', 'convert-7'))
+        assert samples == 2 and 100.0 < duration < 101.0, "Decay weights the newer run slightly more"
+        assert reloaded.expected_duration(mission('artemis', 'review-9')) == (20.0, 1)
+        # Unknown task type falls back to the hero's histogram
+        duration, samples = reloaded.expected_duration(mission('artemis', 'brand-new'))
+        assert samples == 3 and 70.0 < duration < 75.0
+        assert reloaded.expected_duration(mission('batman', 'test-1')) == (None, 0)
+        assert abs(reloaded.cpu_share(['artemis']) - 0.05) < 1e-9
+        assert not list(Path(tmp).glob('*.tmp'))
+
+    print("✅ PASSED: Per-task-type histograms persisted and reloaded")
+    return True
+
+
+def test_longest_first_schedule():
+    """Test 2: Measured durations drive an LPT schedule and its makespan."""
+    print("\n" + "=" * 70)
+    print("Test 2: Longest-Expected-First Schedule")
+    print("=" * 70)
+
+    assert lpt_makespan([3, 3, 2, 2, 2], 2) == 7
+    assert lpt_makespan([5, 1, 1, 1, 1, 1], 2) == 5
+    assert lpt_makespan([], 4) == 0.0
+
+    profile = ExecutionProfile(False)
+    teach(profile, [(mission('batman', 'test-1'), 50.0), (mission('flash', 'audit-1'), 10.0),
+                    (mission('aquaman', 'trace-1'), 30.0), (mission('oracle', 'analyze-1'), 5.0)],
+          cpu_seconds=0.0)
+    optimizer = ParallelOptimizer(profile=profile)
+
+    missions = [mission('oracle', 'analyze-2'), mission('flash', 'audit-2'),
+                mission('batman', 'test-2'), mission('aquaman', 'trace-2'), mission('zatanna', 'seo-1')]
+    rec = optimizer.analyze_missions(missions)
+    assert rec.expected_durations == [5.0, 10.0, 50.0, 30.0, 60.0]
+    assert rec.mission_order == [4, 2, 3, 1, 0], rec.mission_order
+    assert "4/5 measured" in rec.reasoning[1]
+    assert rec.sequential_duration == 155.0
+    assert rec.recommended_workers == 3, rec.reasoning
+    assert abs(rec.estimated_duration - (60.0 + optimizer.DISPATCH_OVERHEAD)) < 1e-9
+    assert abs(rec.expected_speedup - 155.0 / rec.estimated_duration) < 1e-9
+
+    # A caller-supplied estimate overrides measurements
+    assert ParallelOptimizer(profile=profile).analyze_missions(missions, 20.0).expected_durations == [20.0] * 5
+
+    print(f"✅ PASSED: {rec.recommended_workers} workers, {rec.estimated_duration:.1f}s predicted makespan")
+    return True
+
+
+def test_workers_from_cpu_profile():
+    """Test 3: Worker count follows the measured CPU share and contention."""
+    print("\n" + "=" * 70)
+    print("Test 3: Workers from CPU Profile and Contention")
+    print("=" * 70)
+
+    missions = [mission('flash', f'audit-{i}') for i in range(8)]
+
+    io_bound = ExecutionProfile(False)
+    teach(io_bound, [(m, 30.0) for m in missions], cpu_seconds=2.4)
+    rec = ParallelOptimizer(profile=io_bound).analyze_missions(missions)
+    assert rec.recommended_workers == 8 and rec.assumed_slowdown == 1.0, rec.reasoning
+
+    # Half of every mission is Python CPU: threads beyond 2 only queue on the GIL
+    cpu_bound = ExecutionProfile(False)
+    teach(cpu_bound, [(m, 30.0) for m in missions], cpu_seconds=120.0)
+    rec = ParallelOptimizer(profile=cpu_bound).analyze_missions(missions)
+    assert rec.recommended_workers == 2, rec.reasoning
+    assert "CPU share 50% (measured)" in rec.reasoning
+
+    # Fully CPU-bound: parallel never wins
+    serial = ExecutionProfile(False)
+    teach(serial, [(m, 30.0) for m in missions], cpu_seconds=240.0)
+    rec = ParallelOptimizer(profile=serial).analyze_missions(missions)
+    assert rec.strategy == ExecutionStrategy.SEQUENTIAL and rec.estimated_duration == 240.0
+
+    # Observed contention at 8 workers (missions ran 3x slower, 5s lost to dispatch) overrides the model
+    optimizer = ParallelOptimizer(profile=io_bound)
+    rec = optimizer.analyze_missions(missions)
+    optimizer.record_decision(rec, {
+        'duration': 95.0, 'successful': 8, 'total_missions': 8, 'workers': 8, 'cpu_seconds': 2.4,
+        'hero_results': [{'success': True, 'mission': m, 'duration': 90.0} for m in missions]
+    })
+    assert abs(io_bound.slowdown(8) - 3.0) < 1e-9
+    assert abs(io_bound.expected_duration(missions[0])[0] - 30.0) < 1e-9, "Histograms stay solo-equivalent"
+    assert abs(io_bound.dispatch_seconds() - 5.0) < 1e-9
+    rec = optimizer.analyze_missions(missions)
+    assert rec.recommended_workers == 4, rec.reasoning
+    assert rec.assumed_slowdown == 1.0 and rec.estimated_duration == 65.0
+
+    print("✅ PASSED: 8 workers I/O-bound, 2 at 50% CPU, sequential at 100%, 4 after 8-way contention")
+    return True
+
+
+def test_worktrees_from_measured_cost():
+    """Test 4: Worktrees are used only when their measured cost is small."""
+    print("\n" + "=" * 70)
+    print("Test 4: Worktrees from Measured Creation Cost")
+    print("=" * 70)
+
+    missions = [mission('artemis', f'convert-{i}') for i in range(4)]
+
+    # Prior 0.8s per worktree against 60s missions: isolate
+    rec = ParallelOptimizer(profile=ExecutionProfile(False)).analyze_missions(missions)
+    assert rec.strategy == ExecutionStrategy.PARALLEL_WITH_WORKTREES and rec.use_worktrees
+    assert "(prior)" in rec.reasoning[4]
+
+    # This repository's worktrees take 12s to check out: not worth it for 60s missions
+    slow_repo = ExecutionProfile(False)
+    teach(slow_repo, [(m, 60.0, 12.0) for m in missions], workers=4, cpu_seconds=0.0)
+    rec = ParallelOptimizer(profile=slow_repo).analyze_missions(missions)
+    assert rec.strategy == ExecutionStrategy.PARALLEL_NO_WORKTREES and not rec.use_worktrees
+    assert "measured over 4" in rec.reasoning[4], rec.reasoning
+
+    # ...but they are for 10-minute missions
+    long_missions = [dict(m, task_type='full-page') for m in missions]
+    teach(slow_repo, [(m, 600.0, 12.0) for m in long_missions], workers=4, cpu_seconds=0.0)
+    rec = ParallelOptimizer(profile=slow_repo).analyze_missions(long_missions)
+    assert rec.use_worktrees, rec.reasoning
+
+    # Heroes that don't write files never need worktrees
+    rec = ParallelOptimizer(profile=ExecutionProfile(False)).analyze_missions(
+        [mission('batman', f'test-{i}') for i in range(4)])
+    assert not rec.use_worktrees
+
+    print("✅ PASSED: Worktree use follows the measured checkout cost")
+    return True
+
+
+def test_smart_deployment_reports_makespan():
+    """Test 5: deploy_heroes_smart learns from its runs and reports the makespan error."""
+    print("\n" + "=" * 70)
+    print("Test 5: Smart Deployment Learns and Reports")
+    print("=" * 70)
+
+    from core.justice_league import SupermanCoordinator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PARALLEL_PLANNER_PROFILE'] = str(Path(tmp) / 'profile.json')
+        try:
+            superman = SupermanCoordinator()
+            missions = [{'hero_name': 'oracle', 'task_name': f'analyze-{i}', 'params': {'file_key': f'k{i}'}}
+                        for i in range(3)]
+
+            first = superman.deploy_heroes_smart(missions, show_recommendation=False)
+            assert first['successful'] == 3
+            report = first['makespan_report']
+            assert report['strategy'] == 'parallel' and report['workers'] == 3
+            assert report['predicted_makespan'] == round(first['oracle_recommendation']['estimated_duration'], 3)
+            assert report['actual_makespan'] == round(first['actual_duration'], 3)
+            assert report['error_pct'] < 0, "Prior of 5s per Oracle mission is pessimistic"
+            assert all(result['mission'] in missions for result in first['hero_results'])
+
+            # Millisecond missions measured: parallel overhead no longer pays off
+            second = superman.deploy_heroes_smart(missions, show_recommendation=False)
+            reasoning = second['oracle_recommendation']['reasoning']
+            assert second['oracle_recommendation']['strategy'] == 'sequential', reasoning
+            assert any('3/3 measured' in reason for reason in reasoning)
+            assert second['makespan_report']['workers'] == 1
+            assert second['makespan_report']['predicted_makespan'] < 1.0
+
+            profile = ExecutionProfile(Path(tmp) / 'profile.json')
+            assert profile.runs == 2 and profile.expected_duration(missions[0])[1] == 6
+        finally:
+            os.environ.pop('PARALLEL_PLANNER_PROFILE', None)
+
+    print(f"✅ PASSED: Predicted {report['predicted_makespan']}s, actual {report['actual_makespan']}s, then sequential")
+    return True
+
+
+def run_all_tests():
+    """Run all parallel planner tests."""
+    print("\n" + "=" * 70)
+    print("🔮 PARALLEL PLANNER - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Duration Histograms", test_histograms_and_persistence),
+        ("Longest-Expected-First Schedule", test_longest_first_schedule),
+        ("Workers from CPU Profile and Contention", test_workers_from_cpu_profile),
+        ("Worktrees from Measured Creation Cost", test_worktrees_from_measured_cost),
+        ("Smart Deployment Learns and Reports", test_smart_deployment_reports_makespan),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
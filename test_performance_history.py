@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+📈 PERFORMANCE HISTORY - Metrics Store Test Suite
+=================================================
+
+Tests for the SQLite performance history shared by Flash and Superman:
+history listing, percentile/trend queries, rolling median ± MAD
+regression detection and migration of the legacy JSON history files.
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.performance_history import PerformanceHistory, percentile
+from core.justice_league.flash_performance import FlashPerformance
+from core.superman_performance_profiler import SupermanPerformanceProfiler
+
+START = datetime(2025, 1, 1, 2, 0, 0)
+
+
+def superman_result(score, lcp=2000.0, cls=0.05, day=0, test_name='homepage'):
+    """Superman result dict of a nightly run"""
+    return {
+        'test_name': test_name,
+        'url': 'https://example.com',
+        'timestamp': (START + timedelta(days=day)).isoformat(),
+        'superman_performance_score': {'score': score, 'grade': 'A' if score >= 90 else 'B'},
+        'core_web_vitals': {
+            'LCP': {'value': lcp, 'source': 'reported'},
+            'CLS': {'value': cls, 'source': 'trace'},
+            'FID': {'value': 0, 'source': 'missing'},
+        },
+        'raw_trace_data': {'insights': [{'name': 'LCPBreakdown'}] * 50}
+    }
+
+
+def test_record_and_list():
+    """Test 1: Runs are listed newest first without loading result blobs."""
+    print("\n" + "=" * 70)
+    print("Test 1: Record and List")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = PerformanceHistory(Path(tmp) / 'history.db')
+        ids = [history.record('homepage', superman_result(80 + day, day=day)) for day in range(5)]
+        history.record('homepage_mobile', superman_result(50, day=9, test_name='homepage_mobile'))
+
+        entries = history.history('homepage', limit=3)
+        assert [e['score'] for e in entries] == [84.0, 83.0, 82.0], entries
+        assert [e['run_id'] for e in entries] == ids[::-1][:3]
+        assert entries[0]['timestamp'] == (START + timedelta(days=4)).isoformat()
+
+        # Missing vitals are not stored as zeros
+        assert history.series('homepage', 'fid') == []
+        assert [v for _, v in history.series('homepage', 'lcp')] == [2000.0] * 5
+
+        full = history.get_run(ids[0])
+        assert full['raw_trace_data']['insights'][0]['name'] == 'LCPBreakdown'
+        assert history.list_tests() == ['homepage', 'homepage_mobile']
+
+    print("✅ PASSED: History listed from indexed columns, blobs on request")
+    return True
+
+
+def test_percentiles_and_trend():
+    """Test 2: Percentile and trend queries."""
+    print("\n" + "=" * 70)
+    print("Test 2: Percentiles and Trend")
+    print("=" * 70)
+
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([10], 95) == 10
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = PerformanceHistory(Path(tmp) / 'history.db')
+        # LCP creeps up 10ms per night
+        for day in range(30):
+            history.record('homepage', superman_result(85, lcp=2000 + 10 * day, day=day))
+
+        summary = history.percentiles('homepage', 'lcp', percentiles=(50, 95))
+        assert summary['count'] == 30
+        assert summary['p50'] == 2145.0, summary
+        assert summary['p95'] == 2275.5, summary
+
+        recent = history.percentiles('homepage', 'lcp', limit=10)
+        assert recent['min'] == 2200.0
+
+        lcp_trend = history.trend('homepage', 'lcp', window=30)
+        assert lcp_trend['direction'] == 'degrading', lcp_trend
+        assert abs(lcp_trend['slope_per_day'] - 10.0) < 1e-6
+        assert history.trend('homepage', 'score')['direction'] == 'flat'
+
+        empty = history.percentiles('unknown', 'lcp')
+        assert empty['count'] == 0 and 'p50' not in empty
+
+    print(f"✅ PASSED: p50={summary['p50']}, trend {lcp_trend['slope_per_day']}ms/day")
+    return True
+
+
+def test_median_mad_regression():
+    """Test 3: Regressions are judged against rolling median ± MAD."""
+    print("\n" + "=" * 70)
+    print("Test 3: Rolling Median ± MAD Regression")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = PerformanceHistory(Path(tmp) / 'history.db')
+
+        assert history.check_regression('homepage', 'score', 50)['status'] == 'insufficient_history'
+
+        noise = [0, 1, -1, 2, -2, 1, 0, -1, 1, 0, 2, -1, 0, 1, -2, 0, 1, -1, 0, 1]
+        for day, delta in enumerate(noise):
+            history.record('homepage', superman_result(85 + delta, lcp=2000 + 20 * delta, day=day))
+
+        drop = history.check_regression('homepage', 'score', 78)
+        assert drop['status'] == 'regression' and drop['is_regression'], drop
+        assert drop['median'] == 85.0
+
+        # Within the run-to-run spread
+        assert history.check_regression('homepage', 'score', 83)['status'] == 'stable'
+        assert history.check_regression('homepage', 'score', 95)['status'] == 'improvement'
+
+        # Lower is better for timings
+        assert history.check_regression('homepage', 'lcp', 2400)['status'] == 'regression'
+        assert history.check_regression('homepage', 'lcp', 1700)['status'] == 'improvement'
+
+        # Only earlier runs form the window
+        early = history.check_regression('homepage', 'score', 78, before=START + timedelta(days=3))
+        assert early['status'] == 'insufficient_history'
+
+        checks = history.check_run('homepage', superman_result(70, lcp=2600))
+        assert set(checks) == {'score', 'lcp', 'cls'}
+        assert checks['score']['is_regression'] and checks['lcp']['is_regression']
+
+    print(f"✅ PASSED: Score 78 is {drop['deviation_mads']} MADs from median {drop['median']}")
+    return True
+
+
+def test_legacy_json_migration():
+    """Test 4: Legacy JSON history and Flash baselines are imported once."""
+    print("\n" + "=" * 70)
+    print("Test 4: Legacy JSON Migration")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history_dir = Path(tmp) / 'history'
+        history_dir.mkdir()
+        for day in range(365):
+            run = superman_result(80 + day % 7, day=day, test_name='check_out')
+            stamp = (START + timedelta(days=day)).strftime('%Y%m%d_%H%M%S')
+            with open(history_dir / f"check_out_{stamp}.json", 'w') as f:
+                json.dump(run, f, indent=2)
+        (history_dir / 'check_out_20250101_000000.json').write_text('{truncated')
+        with open(Path(tmp) / 'landing_baseline.json', 'w') as f:
+            json.dump({'test_name': 'landing', 'timestamp': START.isoformat(),
+                       'flash_speed_score': {'score': 90, 'grade': 'S+'}}, f)
+
+        start = time.time()
+        profiler = SupermanPerformanceProfiler(baseline_dir=tmp)
+        migration_time = time.time() - start
+
+        start = time.time()
+        listed = profiler.get_performance_history('check_out', limit=10)
+        list_time = time.time() - start
+        assert len(listed) == 10
+        assert listed[0]['timestamp'] == (START + timedelta(days=364)).isoformat()
+        assert profiler.history.percentiles('check_out')['count'] == 365
+
+        # Re-opening skips everything already imported
+        counts = profiler.history.migrate_json_files(history_dir.glob('*.json'))
+        assert counts == {'imported': 0, 'skipped': 365, 'failed': 1}, counts
+        SupermanPerformanceProfiler(baseline_dir=tmp)
+        assert profiler.history.percentiles('check_out')['count'] == 365
+
+        # Flash seeds its history from its baseline files only
+        flash = FlashPerformance(baseline_dir=tmp)
+        assert [e['score'] for e in flash.history.history('landing', hero='flash')] == [90.0]
+        assert flash.history.history('check_out', hero='flash') == []
+
+    print(f"✅ PASSED: 365 runs migrated in {migration_time:.2f}s, listed in {list_time * 1000:.1f}ms")
+    return True
+
+
+def test_heroes_use_history():
+    """Test 5: Superman and Flash archive runs and flag regressions from history."""
+    print("\n" + "=" * 70)
+    print("Test 5: Heroes Use History")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler = SupermanPerformanceProfiler(baseline_dir=tmp)
+        for day in range(10):
+            stored = profiler._store_to_history('homepage', superman_result(88 + day % 2, day=day))
+        assert stored['path'] == str(profiler.history.db_path)
+        assert profiler.get_history_run(stored['run_id'])['superman_performance_score']['score'] == 89
+
+        # No baseline file, but the history shows a drop
+        check = profiler._check_regression('homepage', superman_result(80))
+        assert check['is_regression'], check
+        assert check['history_check']['score']['status'] == 'regression'
+
+        trend = profiler.get_performance_trend('homepage')
+        assert trend['percentiles']['count'] == 10
+
+        # Flash keeps its scores apart from Superman's
+        flash = FlashPerformance(baseline_dir=tmp)
+        mcp_tools = {'start_trace': lambda **kwargs: {}, 'stop_trace': lambda: {'lcp': 1500, 'insights': []}}
+        for _ in range(3):
+            result = flash.profile_performance(mcp_tools, 'homepage', 'https://example.com')
+        assert result['history_run_id'] is not None
+        assert len(flash.history.history('homepage', hero='flash')) == 3
+
+        # A new instance does not import the rewritten baseline file as another run
+        FlashPerformance(baseline_dir=tmp)
+        FlashPerformance(baseline_dir=tmp)
+        assert len(flash.history.history('homepage', hero='flash')) == 3
+
+        # ...while a legacy baseline still seeds a test with no runs
+        legacy = {'test_name': 'pricing', 'timestamp': '2025-01-01T00:00:00', 'flash_speed_score': {'score': 90}}
+        (Path(tmp) / 'pricing_baseline.json').write_text(json.dumps(legacy))
+        FlashPerformance(baseline_dir=tmp)
+        FlashPerformance(baseline_dir=tmp)
+        assert len(flash.history.history('pricing', hero='flash')) == 1
+        assert len(profiler.get_performance_history('homepage', limit=100)) == 10
+
+    print("✅ PASSED: Heroes archive to and check against the shared history")
+    return True
+
+
+def run_all_tests():
+    """Run all performance history tests."""
+    print("\n" + "=" * 70)
+    print("📈 PERFORMANCE HISTORY - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Record and List", test_record_and_list),
+        ("Percentiles and Trend", test_percentiles_and_trend),
+        ("Rolling Median ± MAD Regression", test_median_mad_regression),
+        ("Legacy JSON Migration", test_legacy_json_migration),
+        ("Heroes Use History", test_heroes_use_history),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,198 @@
+"""
+Test Quicksilver's Pipelined Export
+
+Demonstrates:
+1. URL batches, CDN downloads and disk writes run as overlapping stages
+2. A 429 pauses every URL worker for the Retry-After period
+3. Progress callbacks and resume_failed_export still work
+4. Frames are flattened and recorded in the export manifest as they are written
+"""
+
+import sys
+import os
+import json
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath('.'))
+
+from core.justice_league import QuicksilverSpeedExport
+from core.justice_league.export_manifest import (
+    MANIFEST_FILENAME, PIL_AVAILABLE, ManifestIndex, read_png_header
+)
+
+
+def make_png(width, height, color_type=6):
+    """Minimal PNG (color type 6 = RGBA, 2 = RGB) without needing Pillow"""
+    channels = {2: 3, 6: 4}[color_type]
+
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+    row = b'\x00' + b'\x80' * (width * channels)
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b''))
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, content=b'', headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return self._payload
+
+
+class FakeFigmaSession:
+    """Stands in for requests.Session: 20 frames, first image call rate limited, frame 0:7 never renders"""
+
+    def __init__(self, frame_count=20, retry_after='0.3'):
+        self.frame_count = frame_count
+        self.retry_after = retry_after
+        self.calls = []
+        self.lock = threading.Lock()
+        self.rate_limited_once = False
+
+    def get(self, url, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append((time.monotonic(), url))
+
+        if '/v1/files/' in url:
+            frames = [{'type': 'FRAME', 'name': f'Frame {i}', 'id': f'0:{i}'} for i in range(self.frame_count)]
+            document = {'name': 'Pipeline Test', 'children': [{'type': 'CANVAS', 'name': 'Page 1', 'children': frames}]}
+            return FakeResponse(payload={'document': document})
+
+        if '/v1/images/' in url:
+            with self.lock:
+                if not self.rate_limited_once:
+                    self.rate_limited_once = True
+                    return FakeResponse(429, headers={'Retry-After': self.retry_after})
+            time.sleep(0.05)
+            ids = url.split('ids=')[1].split('&')[0].split(',')
+            return FakeResponse(payload={'images': {i: f'https://cdn.test/{i}.png' for i in ids if i != '0:7'}})
+
+        time.sleep(0.01)
+        frame_number = int(url.rsplit(':', 1)[1].split('.')[0])
+        return FakeResponse(content=make_png(10 + frame_number, 5))
+
+
+def test_pipelined_export():
+    """Test 1: Export with overlapping stages and a shared rate-limit pause"""
+    print("\n" + "="*80)
+    print("TEST 1: Pipelined Export")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        quicksilver = QuicksilverSpeedExport(figma_token='test', parsing_data_dir=tmp_dir, max_workers=4, batch_size=3)
+        session = FakeFigmaSession()
+        quicksilver.session = session
+
+        progress = []
+        exported = quicksilver.export_all_frames_as_png(
+            'FILE', output_dir=os.path.join(tmp_dir, 'out'),
+            progress_callback=lambda current, total, name: progress.append((current, total))
+        )
+
+        assert len(exported) == 19
+        assert [f['node_id'] for f in exported] == [f'0:{i}' for i in range(20) if i != 7]
+        assert all(os.path.exists(f['file_path']) for f in exported)
+        assert exported[0]['file_structure'] == 'Pipeline-Test/Page-1/Frame-0_0:0.png'
+        assert progress[-1] == (20, 20)
+
+        # Every image request after the 429 waited out the shared Retry-After
+        image_calls = [t for t, url in session.calls if '/v1/images/' in url]
+        assert all(t - image_calls[0] >= 0.29 for t in image_calls[1:])
+        assert quicksilver.rate_limited and quicksilver.rate_limiter.rate_limit_hits == 1
+
+        # Downloads started before the last URL batch resolved
+        first_download = min(t for t, url in session.calls if 'cdn.test' in url)
+        assert first_download < image_calls[-1]
+
+        print(f"\n✅ Exported {len(exported)}/20 frames through the pipeline")
+        return quicksilver
+
+
+def test_resume_failed_export():
+    """Test 2: resume_failed_export runs through the same pipeline"""
+    print("\n" + "="*80)
+    print("TEST 2: Resume Failed Export")
+    print("="*80)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        quicksilver = QuicksilverSpeedExport(figma_token='test', parsing_data_dir=tmp_dir, max_workers=4, batch_size=3)
+        session = FakeFigmaSession(retry_after='0')
+        quicksilver.session = session
+
+        progress = []
+        retried = quicksilver.resume_failed_export(
+            'FILE',
+            [{'node_id': '0:3', 'node_name': 'Frame 3'}, {'node_id': '0:7', 'node_name': 'Frame 7'}],
+            tmp_dir,
+            progress_callback=lambda current, total, name: progress.append((current, total, name))
+        )
+
+        assert [f['node_id'] for f in retried] == ['0:3']
+        assert os.path.exists(retried[0]['file_path'])
+        assert sorted(progress)[-1][:2] == (2, 2)
+
+        print(f"\n✅ Retried {len(retried)}/2 frames ({len(progress)} progress updates)")
+
+
+def test_export_manifest():
+    """Test 3: Export manifest records flattened frame dimensions for PDFCompiler"""
+    print("\n" + "="*80)
+    print("TEST 3: Export Manifest")
+    print("="*80)
+
+    assert read_png_header(make_png(12, 7, 2)) == (12, 7, 'RGB')
+    assert read_png_header(b'not a png') is None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        quicksilver = QuicksilverSpeedExport(figma_token='test', parsing_data_dir=tmp_dir, max_workers=4, batch_size=3)
+        quicksilver.session = FakeFigmaSession(retry_after='0')
+
+        exported = quicksilver.export_all_frames_as_png('FILE', output_dir=os.path.join(tmp_dir, 'out'))
+
+        manifest_path = os.path.join(tmp_dir, 'out', 'Pipeline-Test', MANIFEST_FILENAME)
+        with open(manifest_path) as f:
+            frames = json.load(f)['frames']
+        assert len(frames) == len(exported)
+        assert frames['Page-1/Frame-3_0:3.png']['width'] == 13
+        assert frames['Page-1/Frame-3_0:3.png']['height'] == 5
+
+        index = ManifestIndex(os.path.join(tmp_dir, 'out'))
+        entry = index.entry_for(exported[3]['file_path'])
+        assert entry is not None and entry['width'] == 13
+
+        if PIL_AVAILABLE:
+            assert all(frame['mode'] == 'RGB' and frame['flattened'] for frame in frames.values())
+            # Everything was flattened during export - nothing left to convert
+            assert quicksilver._convert_transparent_pngs_to_white(Path(tmp_dir) / 'out') == 0
+
+        # A frame changed after export is no longer trusted
+        with open(exported[3]['file_path'], 'ab') as f:
+            f.write(b'\x00')
+        assert ManifestIndex(os.path.join(tmp_dir, 'out')).entry_for(exported[3]['file_path']) is None
+
+        print(f"\n✅ Manifest recorded {len(frames)} frames")
+
+
+if __name__ == "__main__":
+    test_pipelined_export()
+    test_resume_failed_export()
+    test_export_manifest()
+    print("\n🎉 All Quicksilver pipeline tests passed!")
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+⚡ TRACE VITALS - Streaming Trace Parser Test Suite
+===================================================
+
+Tests for Core Web Vitals computed from raw Chrome traces: metric
+definitions, the incremental JSON reader (object/array formats, gzip,
+truncated traces), bounded memory and the Flash/Superman fallbacks.
+"""
+
+import gzip
+import io
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.justice_league.trace_vitals import compute_trace_vitals, iter_trace_events, resolve_vitals
+from core.justice_league.flash_performance import FlashPerformance
+from core.superman_performance_profiler import SupermanPerformanceProfiler
+
+NAV_TS = 1_000_000  # microseconds
+MAIN = {'pid': 1, 'tid': 1}
+FRAME = 'F1'
+
+
+def event(name, at_ms, ph='I', dur_ms=None, thread=MAIN, frame=FRAME, data=None, **args):
+    """Chrome trace event at_ms after navigation start"""
+    built = {'name': name, 'ph': ph, 'ts': NAV_TS + int(at_ms * 1000), 'cat': 'test', **thread,
+             'args': dict(args, frame=frame)}
+    if dur_ms is not None:
+        built['dur'] = int(dur_ms * 1000)
+    if data is not None:
+        built['args']['data'] = data
+    return built
+
+
+def page_load_events():
+    """
+    Page load with hand-computed vitals:
+    FCP 800, LCP 1500, CLS 0.3, TTI 2080, TBT 150, INP 240, FID 12
+    """
+    return [
+        {'name': 'thread_name', 'ph': 'M', 'ts': 0, **MAIN, 'args': {'name': 'CrRendererMain'}},
+        # about:blank and an iframe navigation are not the page load
+        event('navigationStart', -500, data={'documentLoaderURL': 'about:blank', 'isLoadingMainFrame': True}),
+        event('navigationStart', 0, data={'documentLoaderURL': 'https://example.com/', 'isLoadingMainFrame': True}),
+        event('navigationStart', 300, frame='F2',
+              data={'documentLoaderURL': 'https://ads.example.net/', 'isLoadingMainFrame': False}),
+        event('firstContentfulPaint', 800),
+        event('largestContentfulPaint::Candidate', 900, data={'candidateIndex': 1}),
+        event('largestContentfulPaint::Candidate', 1500, data={'candidateIndex': 2}),
+        # Session windows: 0.05 + 0.05, then 0.2 + 0.1 after a 2.5s gap
+        event('LayoutShift', 1000, data={'weighted_score_delta': 0.05, 'had_recent_input': False}),
+        event('LayoutShift', 1500, data={'weighted_score_delta': 0.05, 'had_recent_input': False}),
+        event('LayoutShift', 3200, data={'weighted_score_delta': 0.5, 'had_recent_input': True}),
+        event('LayoutShift', 4000, data={'weighted_score_delta': 0.2, 'had_recent_input': False}),
+        event('LayoutShift', 4500, data={'weighted_score_delta': 0.1, 'had_recent_input': False}),
+        # Long tasks: 100ms of the first after FCP, 120ms and 80ms, then 5s+ quiet
+        event('RunTask', 700, ph='X', dur_ms=200),
+        event('RunTask', 1000, ph='X', dur_ms=120),
+        event('RunTask', 1500, ph='X', dur_ms=30),
+        event('RunTask', 2000, ph='X', dur_ms=80),
+        event('RunTask', 1200, ph='X', dur_ms=400, thread={'pid': 1, 'tid': 2}),
+        event('RunTask', 9000, ph='X', dur_ms=300),
+        # Interactions
+        event('EventTiming', 2500, ph='b', data={'interactionId': 1, 'type': 'pointerdown', 'duration': 80,
+                                                 'timeStamp': 2500, 'processingStart': 2512}),
+        event('EventTiming', 2500, ph='b', data={'interactionId': 1, 'type': 'click', 'duration': 64,
+                                                 'timeStamp': 2520, 'processingStart': 2521}),
+        event('EventTiming', 6000, ph='b', data={'interactionId': 2, 'type': 'keydown', 'duration': 240,
+                                                 'timeStamp': 6000, 'processingStart': 6100}),
+    ]
+
+
+EXPECTED = {'fcp': 800.0, 'lcp': 1500.0, 'cls': 0.3, 'tti': 2080.0, 'tbt': 150.0, 'inp': 240.0, 'fid': 12.0}
+
+
+def assert_expected(metrics):
+    for key, expected in EXPECTED.items():
+        assert metrics[key] == expected, f"{key}: {metrics[key]} != {expected}"
+
+
+def test_metric_definitions():
+    """Test 1: Metrics follow the web-vitals definitions."""
+    print("\n" + "=" * 70)
+    print("Test 1: Metric Definitions")
+    print("=" * 70)
+
+    metrics = compute_trace_vitals({'traceEvents': page_load_events()})
+
+    assert_expected(metrics)
+    assert metrics['url'] == 'https://example.com/'
+    assert metrics['long_task_count'] == 4, metrics['long_tasks']
+    assert metrics['layout_shift_count'] == 4, "Shifts after input are excluded"
+    assert metrics['interaction_count'] == 2
+
+    # An invalidated LCP candidate is not reported
+    events = page_load_events() + [event('largestContentfulPaint::Invalidate', 1600)]
+    assert compute_trace_vitals(events)['lcp'] is None
+
+    # ...but an invalidation after the next navigation belongs to that page
+    events = page_load_events() + [
+        event('navigationStart', 10000, data={'documentLoaderURL': 'https://example.com/next', 'isLoadingMainFrame': True}),
+        event('largestContentfulPaint::Invalidate', 10100),
+    ]
+    assert compute_trace_vitals(events)['lcp'] == 1500.0
+
+    print(f"✅ PASSED: {', '.join(f'{k}={metrics[k]}' for k in EXPECTED)}")
+    return True
+
+
+def test_reader_formats():
+    """Test 2: Object, array, missing bracket and gzip traces parse alike."""
+    print("\n" + "=" * 70)
+    print("Test 2: Reader Formats")
+    print("=" * 70)
+
+    events = page_load_events()
+    object_text = json.dumps({'metadata': {'source': 'DevTools', 'startTime': 1234567},
+                              'traceEvents': events, 'tail': [1, {'x': 2.5}]}, indent=1)
+    array_text = json.dumps(events)
+    sources = {
+        'object': object_text.encode(),
+        'array': array_text.encode(),
+        'array without ]': array_text.rstrip()[:-1].encode(),
+        'gzip object': gzip.compress(object_text.encode()),
+        'text stream': io.StringIO(array_text),
+    }
+
+    for label, source in sources.items():
+        # Tiny chunks split every token across reads
+        for chunk_size in (7, 1 << 16):
+            if isinstance(source, io.StringIO):
+                source.seek(0)
+            metrics = compute_trace_vitals(source, chunk_size=chunk_size)
+            assert metrics['events_parsed'] == len(events), (label, chunk_size, metrics['events_parsed'])
+            assert_expected(metrics)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'trace.json.gz'
+        with gzip.open(path, 'wt') as f:
+            f.write(object_text)
+        assert_expected(compute_trace_vitals(path))
+        assert_expected(compute_trace_vitals(str(path)))
+
+        # A caller's binary file object is left open
+        with open(path, 'rb') as f:
+            assert_expected(compute_trace_vitals(f))
+            assert not f.closed
+
+    print(f"✅ PASSED: {len(sources)} formats at 2 chunk sizes")
+    return True
+
+
+def test_truncated_trace():
+    """Test 3: A trace cut off mid-event keeps the complete events."""
+    print("\n" + "=" * 70)
+    print("Test 3: Truncated Trace")
+    print("=" * 70)
+
+    events = page_load_events()
+    text = json.dumps({'traceEvents': events})
+    cut = text.rindex('"name": "EventTiming"') + 10
+    parsed = list(iter_trace_events(text[:cut].encode(), chunk_size=64))
+
+    assert len(parsed) == len(events) - 1, len(parsed)
+    assert parsed == events[:-1]
+
+    try:
+        list(iter_trace_events(b'"not a trace"'))
+        raise AssertionError("A bare string should be rejected")
+    except ValueError:
+        pass
+
+    print("✅ PASSED: Truncated tail ignored, complete events kept")
+    return True
+
+
+def test_bounded_memory():
+    """Test 4: Streaming memory does not grow with the trace."""
+    print("\n" + "=" * 70)
+    print("Test 4: Bounded Memory")
+    print("=" * 70)
+
+    filler = [event('ParseHTML', 10 + i * 0.01, ph='X', dur_ms=0.5, data={'url': f'https://example.com/{i}'})
+              for i in range(60_000)]
+    payload = gzip.compress(json.dumps({'traceEvents': page_load_events() + filler}).encode())
+    del filler
+
+    tracemalloc.start()
+    metrics = compute_trace_vitals(payload, chunk_size=1 << 16)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    raw_size = len(gzip.decompress(payload))
+    assert_expected(metrics)
+    assert metrics['events_parsed'] == 60_000 + len(page_load_events())
+    assert peak < raw_size / 4, f"Peak {peak / 1e6:.1f}MB for a {raw_size / 1e6:.1f}MB trace"
+
+    print(f"✅ PASSED: {raw_size / 1e6:.1f}MB trace parsed with {peak / 1e6:.2f}MB peak")
+    return True
+
+
+def test_hero_fallback_to_raw_trace():
+    """Test 5: Flash and Superman compute missing vitals from traceEvents."""
+    print("\n" + "=" * 70)
+    print("Test 5: Hero Fallback to Raw Trace")
+    print("=" * 70)
+
+    # Reported values win; missing ones come from the trace
+    trace_data = {'traceEvents': page_load_events(), 'lcp': 1234}
+    resolved = resolve_vitals(trace_data)
+    assert resolved['lcp'] == (1234, 'reported')
+    assert resolved['cls'] == (0.3, 'trace')
+    assert trace_data['trace_vitals']['inp'] == 240.0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'trace.json.gz'
+        with gzip.open(path, 'wt') as f:
+            json.dump(page_load_events(), f)
+
+        mcp_tools = {
+            'start_trace': lambda **kwargs: {'success': True},
+            'stop_trace': lambda: {'trace_file': str(path), 'insights': []},
+        }
+
+        flash = FlashPerformance().profile_performance(mcp_tools, 'homepage', 'https://example.com')
+        vitals = flash['core_web_vitals']
+        assert vitals['TBT']['value'] == 150.0 and vitals['TBT']['source'] == 'trace', vitals['TBT']
+        assert vitals['CLS']['status'] == 'poor'  # 0.3 > 0.25
+        assert flash['trace_metrics']['inp'] == 240.0
+
+        superman = SupermanPerformanceProfiler()._extract_core_web_vitals({'trace_file': str(path)})
+        assert superman['LCP']['value'] == 1500.0 and superman['LCP']['source'] == 'trace'
+        assert len(superman) == 6
+
+    # Nothing reported and no raw trace: unknown, and not counted as passing
+    profiler = SupermanPerformanceProfiler()
+    empty = profiler._extract_core_web_vitals({})
+    assert empty['LCP']['value'] is None and empty['LCP']['source'] == 'missing'
+    assert empty['LCP']['status'] == 'unknown' and not empty['LCP']['passed']
+    assert profiler._summarize_core_vitals(empty)['total'] == 0
+
+    flash = FlashPerformance()
+    flash_empty = flash._extract_core_web_vitals({})
+    assert all(v['value'] is None and v['status'] == 'unknown' for v in flash_empty.values())
+    speed = flash._calculate_speed_score({'core_web_vitals': flash_empty})
+    assert speed['core_vitals_passed'] == 0 and speed['core_vitals_total'] == 0
+
+    print("✅ PASSED: Missing vitals computed from the raw trace")
+    return True
+
+
+def run_all_tests():
+    """Run all trace vitals tests."""
+    print("\n" + "=" * 70)
+    print("⚡ TRACE VITALS - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Metric Definitions", test_metric_definitions),
+        ("Reader Formats", test_reader_formats),
+        ("Truncated Trace", test_truncated_trace),
+        ("Bounded Memory", test_bounded_memory),
+        ("Hero Fallback to Raw Trace", test_hero_fallback_to_raw_trace),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+🌳 WORKTREE POOL - Pre-Warmed Git Worktrees Test Suite
+======================================================
+
+Tests for the worktree pool behind Superman's parallel deployments:
+pre-created detached worktrees, resets between missions, misses and
+surplus worktrees, adoption and locking across pools, and reuse across
+deploy_heroes_parallel calls with hit rate and acquisition latency.
+"""
+
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.utils.git_worktree_manager import GitWorktreeManager, WorktreePool
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ['git', '-c', 'user.email=league@example.com', '-c', 'user.name=League', *args],
+        cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def make_repo(tmp):
+    """Small repository with a tracked file, an ignored directory and one commit"""
+    repo = Path(tmp) / 'repo'
+    repo.mkdir()
+    git(repo, 'init', '-q')
+    (repo / 'app.py').write_text("print('v1')\n")
+    (repo / '.gitignore').write_text("build/\n")
+    for i in range(50):
+        (repo / f'module_{i}.py').write_text(f"VALUE = {i}\n")
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-qm', 'v1')
+    return repo
+
+
+class CountingManager(GitWorktreeManager):
+    """Counts HEAD lookups"""
+
+    def __init__(self, repo_root):
+        super().__init__(repo_root)
+        self.head_lookups = 0
+
+    def current_commit(self):
+        self.head_lookups += 1
+        return super().current_commit()
+
+
+def test_warm_pool():
+    """Test 1: warm() pre-creates detached worktrees at HEAD, resolved once."""
+    print("\n" + "=" * 70)
+    print("Test 1: Warm Pool")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp)
+        manager = CountingManager(repo)
+        pool = WorktreePool(manager, max_size=4, base_dir=Path(tmp) / 'pool')
+
+        assert pool.warm(3) == 3
+        assert pool.warm(2) == 0, "Never shrinks"
+        assert pool.warm(10) == 1, "Capped at max_size"
+        head = git(repo, 'rev-parse', 'HEAD')
+        pooled = [wt for wt in manager.list_worktrees() if 'pool' in wt['path']]
+        assert len(pooled) == 4 and all(wt.get('detached') and wt['head'] == head for wt in pooled)
+
+        lookups = manager.head_lookups
+        infos = [pool.acquire(f'task-{i}') for i in range(4)]
+        assert manager.head_lookups == lookups, "No git rev-parse per mission"
+        assert all(info['pooled'] and info['commit'] == head for info in infos)
+        assert (infos[0]['path'] / 'app.py').read_text() == "print('v1')\n"
+        for info in infos:
+            pool.release(info)
+
+        stats = pool.stats()
+        assert stats['hits'] == 4 and stats['misses'] == 0 and stats['created'] == 4
+        pool.close()
+
+    print("✅ PASSED: 4 worktrees pre-created, 4 acquisitions without new checkouts")
+    return True
+
+
+def test_reset_between_missions():
+    """Test 2: Released worktrees come back clean and follow HEAD."""
+    print("\n" + "=" * 70)
+    print("Test 2: Reset Between Missions")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp)
+        pool = WorktreePool(GitWorktreeManager(repo), base_dir=Path(tmp) / 'pool')
+        pool.warm(1)
+
+        with pool.worktree('dirty-mission') as info:
+            path = info['path']
+            (path / 'app.py').write_text("print('hacked')\n")
+            (path / 'generated').mkdir()
+            (path / 'generated' / 'Header.tsx').write_text("export {}\n")
+            (path / 'build').mkdir()
+            (path / 'build' / 'cache.bin').write_bytes(b'\x00')
+            (path / 'module_3.py').unlink()
+
+        with pool.worktree('next-mission') as info:
+            assert info['path'] == path, "Same worktree reused"
+            assert (path / 'app.py').read_text() == "print('v1')\n"
+            assert (path / 'module_3.py').exists()
+            assert not (path / 'generated').exists() and not (path / 'build').exists()
+            assert git(path, 'status', '--porcelain', '--ignored') == ''
+
+        # New commit: the next batch checks it out in the pooled worktree
+        (repo / 'app.py').write_text("print('v2')\n")
+        git(repo, 'commit', '-qam', 'v2')
+        pool.warm(1)
+        with pool.worktree('after-commit') as info:
+            assert info['commit'] == git(repo, 'rev-parse', 'HEAD')
+            assert (info['path'] / 'app.py').read_text() == "print('v2')\n"
+
+        # An explicit ref for one mission
+        with pool.worktree('old-version', branch='HEAD~1') as info:
+            assert (info['path'] / 'app.py').read_text() == "print('v1')\n"
+        with pool.worktree('back-to-head') as info:
+            assert (info['path'] / 'app.py').read_text() == "print('v2')\n"
+
+        assert pool.stats()['created'] == 1
+        pool.close()
+
+    print("✅ PASSED: Tracked, untracked and ignored changes reset; HEAD followed")
+    return True
+
+
+def test_misses_and_concurrency():
+    """Test 3: Concurrent missions hit the pool; extra worktrees are not kept."""
+    print("\n" + "=" * 70)
+    print("Test 3: Misses and Concurrency")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp)
+        pool = WorktreePool(GitWorktreeManager(repo), base_dir=Path(tmp) / 'pool')
+        pool.warm(4)
+
+        barrier = threading.Barrier(4)
+        paths = []
+
+        def mission(i):
+            barrier.wait()
+            with pool.worktree(f'mission-{i}') as info:
+                (info['path'] / f'out_{i}.txt').write_text(str(i))
+                paths.append(info['path'])
+                barrier.wait()
+
+        threads = [threading.Thread(target=mission, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(paths)) == 4, "Each concurrent mission got its own worktree"
+
+        # Pool exhausted: a fifth mission gets a fresh worktree that is removed afterwards
+        held = [pool.acquire(f'held-{i}') for i in range(4)]
+        extra = pool.acquire('overflow')
+        assert extra['path'] not in [info['path'] for info in held]
+        pool.release(extra)
+        assert not extra['path'].exists()
+        for info in held:
+            pool.release(info)
+
+        stats = pool.stats()
+        assert stats['acquisitions'] == 9 and stats['hits'] == 8 and stats['misses'] == 1
+        assert abs(stats['hit_rate'] - 8 / 9) < 1e-9
+        assert stats['worktrees'] == 4 and stats['busy'] == 0 and stats['discarded'] == 1
+        assert 0 < stats['avg_acquire_ms'] <= stats['max_acquire_ms']
+        pool.close()
+
+    print(f"✅ PASSED: Hit rate {stats['hit_rate'] * 100:.0f}%, {stats['avg_acquire_ms']:.1f}ms average acquisition")
+    return True
+
+
+def test_adoption_and_locking():
+    """Test 4: A new pool adopts existing worktrees and skips ones in use."""
+    print("\n" + "=" * 70)
+    print("Test 4: Adoption and Locking")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp)
+        manager = GitWorktreeManager(repo)
+        base_dir = Path(tmp) / 'pool'
+        first = WorktreePool(manager, base_dir=base_dir)
+        first.warm(2)
+        held = first.acquire('long-mission')
+
+        # A stale directory that git no longer knows about is cleared
+        (base_dir / 'slot-7').mkdir()
+
+        # Next process: adopts both worktrees without creating any
+        second = WorktreePool(manager, base_dir=base_dir)
+        assert second.warm(2) == 0
+        assert not (base_dir / 'slot-7').exists()
+        info = second.acquire('other-mission')
+        assert info['path'] != held['path'], "Worktree in use elsewhere is skipped"
+        third = second.acquire('third-mission')
+        assert third['path'] not in (held['path'], info['path'])
+        assert second.stats()['hits'] == 1 and second.stats()['misses'] == 1
+
+        # Closing a third pool leaves worktrees in use by the others alone
+        closer = WorktreePool(manager, base_dir=base_dir)
+        assert closer.close() == 0
+        assert held['path'].exists() and info['path'].exists()
+
+        first.release(held)
+        second.release(info)
+        second.release(third)
+        assert second.stats()['worktrees'] == 2, "Back to the pool size"
+
+        # When git cannot list worktrees nothing is treated as stale
+        unlisted = GitWorktreeManager(repo)
+        unlisted.list_worktrees = lambda: []
+        blind = WorktreePool(unlisted, base_dir=base_dir)
+        assert blind.close() == 0
+        assert held['path'].exists() and third['path'].exists()
+
+        assert second.close() == 2
+        first.close()
+        assert not [wt for wt in manager.list_worktrees() if str(base_dir) in wt['path']]
+
+    print("✅ PASSED: Worktrees adopted across pools, locked ones skipped, close() removes all")
+    return True
+
+
+def test_superman_reuses_pool():
+    """Test 5: deploy_heroes_parallel reuses pooled worktrees across calls."""
+    print("\n" + "=" * 70)
+    print("Test 5: Superman Reuses the Pool")
+    print("=" * 70)
+
+    from core.justice_league.superman_coordinator import SupermanCoordinator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(tmp)
+        superman = SupermanCoordinator()
+        superman.worktree_pool = WorktreePool(GitWorktreeManager(repo), base_dir=Path(tmp) / 'pool')
+
+        missions = [{'hero_name': 'oracle', 'task_name': f'analyze-{i}', 'params': {'file_key': f'k{i}'}}
+                    for i in range(3)]
+        first = superman.deploy_heroes_parallel(missions, max_workers=3, use_worktrees=True)
+        second = superman.deploy_heroes_parallel(missions, max_workers=3, use_worktrees=True)
+
+        assert first['successful'] == second['successful'] == 3
+        assert 'worktree_cleanup' not in second
+        pool_stats = second['worktree_pool']
+        assert pool_stats['created'] == 3 and pool_stats['acquisitions'] == 6
+        assert pool_stats['hit_rate'] == 1.0 and pool_stats['busy'] == 0
+        assert all(result['worktree_setup'] < result['duration'] for result in second['hero_results'])
+        assert {result['worktree_path'] for result in second['hero_results']} == \
+            {result['worktree_path'] for result in first['hero_results']}
+        superman.worktree_pool.close()
+
+    print(f"✅ PASSED: 6 missions on 3 pooled worktrees, {pool_stats['avg_acquire_ms']:.1f}ms average acquisition")
+    return True
+
+
+def run_all_tests():
+    """Run all worktree pool tests."""
+    print("\n" + "=" * 70)
+    print("🌳 WORKTREE POOL - TEST SUITE")
+    print("=" * 70)
+
+    tests = [
+        ("Warm Pool", test_warm_pool),
+        ("Reset Between Missions", test_reset_between_missions),
+        ("Misses and Concurrency", test_misses_and_concurrency),
+        ("Adoption and Locking", test_adoption_and_locking),
+        ("Superman Reuses the Pool", test_superman_reuses_pool),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ FAILED: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ ERROR: {test_name}")
+            print(f"   Error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 70)
+    print(f"📊 RESULTS: {passed} passed, {failed} failed")
+    print("=" * 70)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(run_all_tests())